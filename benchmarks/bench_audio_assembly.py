@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark for morning brief audio assembly
+Joins a ~3 minute brief (intro, four segments, outro) and compares peak
+memory and time of the previous approach (decode every clip to PCM, then
+sum() the AudioSegments) with frame-level concatenation of the encoded clips.
+Decoding needs ffmpeg, so the previous approach is measured from PCM
+segments of the same length; its MP3 decode/re-encode cost is not included.
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pydub import AudioSegment
+
+from generators.mp3 import GTTS_SAMPLE_RATE, concat_frames
+from generators.tts import LocalTTSBackend
+
+
+# Words per clip at 150 wpm: ~3 minutes in total
+CLIP_WORDS = [10, 110, 110, 110, 110, 20]
+PAUSE_MS = 500
+
+
+def legacy_assembly(clip_ms: list) -> AudioSegment:
+    """Previous assembly: list of decoded segments and pauses combined with sum()"""
+    silence = AudioSegment.silent(duration=PAUSE_MS, frame_rate=GTTS_SAMPLE_RATE)
+    audio_segments = []
+    for i, duration in enumerate(clip_ms):
+        if i:
+            audio_segments.append(silence)
+        # Stand-in for AudioSegment.from_mp3(clip): same length of decoded PCM
+        audio_segments.append(AudioSegment.silent(duration=duration, frame_rate=GTTS_SAMPLE_RATE))
+    return sum(audio_segments)
+
+
+def frame_assembly(clips: list) -> bytes:
+    """Frame-level concatenation into a single output stream"""
+    out = io.BytesIO()
+    concat_frames(clips, out, [0] + [PAUSE_MS] * (len(clips) - 1))
+    return out.getvalue()
+
+
+def measure(func, *args):
+    """(seconds, peak traced bytes) of one call; timed without tracing"""
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Run the benchmark and print results"""
+    backend = LocalTTSBackend()
+    clips = [backend.synthesize('word ' * words) for words in CLIP_WORDS]
+    clip_ms = [words * 60000 // backend.words_per_minute for words in CLIP_WORDS]
+
+    print(f"Audio assembly benchmark ({sum(clip_ms) / 1000:.0f} s of speech, {len(clips)} clips)")
+    print("=" * 60)
+    legacy_time, legacy_peak = measure(legacy_assembly, clip_ms)
+    frame_time, frame_peak = measure(frame_assembly, clips)
+    print(f"decode + sum(AudioSegment): {legacy_time * 1000:8.2f} ms  peak {legacy_peak / 1024:8.0f} KiB")
+    print(f"frame concatenation:        {frame_time * 1000:8.2f} ms  peak {frame_peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark for bulk Trading Economics date/time parsing
+Parses a synthetic full calendar scrape with the shared zoneinfo parser and
+compares it against the previous fixed-offset parser
+"""
+
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.timezones import parse_trading_economics_datetime
+
+
+N_ROWS = 20000
+REPEATS = 3
+
+
+def legacy_parse(date_str: str, time_str: str, timezone_str: str) -> datetime:
+    """Previous EconomicCalendar._parse_trading_economics_date (fixed offsets, rebuilt tables)"""
+    parts = date_str.split()
+    month_map = {
+        'January': 1, 'February': 2, 'March': 3, 'April': 4,
+        'May': 5, 'June': 6, 'July': 7, 'August': 8,
+        'September': 9, 'October': 10, 'November': 11, 'December': 12
+    }
+    base_date = datetime(int(parts[-1]), month_map.get(parts[-3], 1), int(parts[-2]))
+
+    if time_str and ':' in time_str:
+        hour, minute = time_str.split()[0].split(':')
+        hour, minute = int(hour), int(minute)
+        if 'PM' in time_str and hour != 12:
+            hour += 12
+        elif 'AM' in time_str and hour == 12:
+            hour = 0
+        event_dt = base_date.replace(hour=hour, minute=minute)
+    else:
+        event_dt = base_date.replace(hour=9, minute=0)
+
+    timezone_offsets = {'ET': -5, 'JST': 9, 'CET': 1, 'GMT': 0, 'UTC': 0}
+    return event_dt - timedelta(hours=timezone_offsets.get(timezone_str, 0))
+
+
+def synthetic_scrape(n_rows: int) -> list:
+    """Rows shaped like a full-year calendar scrape across G3 zones"""
+    zones = ['ET', 'JST', 'CET', 'UTC']
+    rows = []
+    start = date(2025, 1, 1)
+    for i in range(n_rows):
+        day = start + timedelta(days=i % 365)
+        hour = 1 + i % 12
+        rows.append((
+            f"{day.strftime('%A %B')} {day.day} {day.year}",
+            f"{hour:02d}:{(i * 15) % 60:02d} {'AM' if i % 2 else 'PM'}",
+            zones[i % len(zones)]
+        ))
+    return rows
+
+
+def bench(parse, rows) -> float:
+    """Average seconds to parse all rows"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for date_str, time_str, zone in rows:
+            parse(date_str, time_str, zone)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    """Run the benchmark and print results"""
+    rows = synthetic_scrape(N_ROWS)
+
+    # How many rows the fixed-offset parser got wrong (DST)
+    mismatches = sum(
+        1 for row in rows
+        if legacy_parse(*row) != parse_trading_economics_datetime(*row)
+    )
+
+    print(f"Calendar parsing benchmark ({N_ROWS} rows)")
+    print("=" * 60)
+    legacy = bench(legacy_parse, rows)
+    shared = bench(parse_trading_economics_datetime, rows)
+    print(f"fixed-offset parser: {legacy * 1000:8.2f} ms  ({legacy / N_ROWS * 1e6:.2f} us/row)")
+    print(f"zoneinfo parser:     {shared * 1000:8.2f} ms  ({shared / N_ROWS * 1e6:.2f} us/row)")
+    print(f"rows corrected for DST: {mismatches} ({mismatches / N_ROWS:.0%})")
+
+
+if __name__ == "__main__":
+    main()
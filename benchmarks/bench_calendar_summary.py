@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for EconomicCalendar summary building
+Builds a 2-month calendar summary from a synthetic Trading Economics cache
+and compares event memory/serialization against a plain dataclass
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.economic_calendar import EconomicCalendar, EconomicEvent
+
+
+N_EVENTS = 5000
+DAYS_AHEAD = 60
+REPEATS = 5
+
+
+@dataclass
+class PlainEvent:
+    """Pre-optimization event layout, kept here as the comparison baseline"""
+    date: datetime
+    time_local: str
+    event_name: str
+    country: str
+    currency: str
+    importance: int
+    category: str
+    source: str
+    description: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'date': self.date.strftime('%Y-%m-%d'),
+            'time': self.time_local,
+            'event_name': self.event_name,
+            'country': self.country,
+            'currency': self.currency,
+            'importance': self.importance,
+            'category': self.category,
+            'source': self.source,
+            'description': self.description
+        }
+
+
+def _synthetic_calendar(n_events: int) -> Dict[str, Any]:
+    """Build a Selenium-format calendar cache spread over the next 2 months"""
+    countries = [('United States', 'USD'), ('Japan', 'JPY'), ('Euro Area', 'EUR')]
+    categories = ['inflation', 'employment', 'growth', 'manufacturing', 'fixed_income']
+    start = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=3)
+    span_minutes = (DAYS_AHEAD + 3) * 24 * 60
+
+    events = []
+    for i in range(n_events):
+        country, currency = countries[i % len(countries)]
+        event_dt = start + timedelta(minutes=(i * 7919) % span_minutes)
+        events.append({
+            'datetime_utc': event_dt.isoformat(),
+            'time_display': f"{event_dt.strftime('%H:%M')} UTC",
+            # json round-trips strings into fresh objects, like a real cache load
+            'country': country,
+            'currency': currency,
+            'event_name': f"Indicator {i % 400}",
+            'category': categories[i % len(categories)],
+            'importance': 3 + i % 3,
+        })
+    return {'events': events, 'bond_auctions': []}
+
+
+def _field_values(i: int) -> Dict[str, Any]:
+    """Fresh (non-shared) field values, as produced by parsing JSON"""
+    return dict(
+        date=datetime(2025, 9, 1) + timedelta(minutes=i),
+        time_local=f"{i % 24:02d}:30 UTC",
+        event_name=f"Indicator {i % 400}",
+        country=''.join(['United ', 'States']),
+        currency=''.join(['US', 'D']),
+        importance=3 + i % 3,
+        category=''.join(['infla', 'tion']),
+        source=''.join(['trading_economics', '_selenium']),
+        description=f"United States economic data: Indicator {i % 400}",
+    )
+
+
+def bench_memory(cls, n_events: int) -> int:
+    """Return bytes allocated while building n_events instances of cls"""
+    tracemalloc.start()
+    events = [cls(**_field_values(i)) for i in range(n_events)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return current
+
+
+def bench_serialization(cls, n_events: int) -> float:
+    """Serialize every event as get_calendar_summary does (upcoming + high importance)"""
+    events = [cls(**_field_values(i)) for i in range(n_events)]
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        [e.to_dict() for e in events]
+        [e.to_dict() for e in events if e.importance >= 4]
+    return (time.perf_counter() - start) / REPEATS
+
+
+def bench_summary(calendar: EconomicCalendar) -> float:
+    """Time a full 2-month get_calendar_summary"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        calendar.get_calendar_summary(days_ahead=DAYS_AHEAD)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    """Run the benchmark and print results"""
+    test_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(test_dir, 'central_bank_meetings.json'), 'w') as f:
+            json.dump({}, f)
+        with open(os.path.join(test_dir, 'trading_economics_selenium_calendar.json'), 'w') as f:
+            json.dump(_synthetic_calendar(N_EVENTS), f)
+
+        calendar = EconomicCalendar(data_dir=test_dir, config_path=os.path.join(test_dir, 'missing.yaml'))
+
+        print(f"EconomicEvent benchmark ({N_EVENTS} events, {DAYS_AHEAD}-day window)")
+        print("=" * 60)
+        for cls in (PlainEvent, EconomicEvent):
+            memory = bench_memory(cls, N_EVENTS)
+            serialize = bench_serialization(cls, N_EVENTS)
+            print(f"{cls.__name__:14s} memory: {memory / 1024:8.1f} KiB   "
+                  f"serialize: {serialize * 1000:7.2f} ms")
+        print(f"get_calendar_summary({DAYS_AHEAD}d): {bench_summary(calendar) * 1000:.2f} ms")
+    finally:
+        shutil.rmtree(test_dir)
+
+
+if __name__ == "__main__":
+    main()
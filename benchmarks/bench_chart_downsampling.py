@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark for report chart downsampling
+Builds the weekly report's FX and spread history charts from ten years of
+daily data, drawing every point and with LTTB downsampling, and compares
+build time and the size of the chart HTML embedded in the report (plotly.js
+itself comes from the CDN and is not counted). Data is generated locally, so
+no API key or network is needed.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.charts import figures_html, report_figures
+
+DAYS = 3_650
+MAX_POINTS = 400
+
+
+def history(days: int) -> dict:
+    rng = np.random.default_rng(1)
+    dates = np.datetime_as_string(np.datetime64('2015-01-01') + np.arange(days), unit='D')
+
+    def walk(start, scale):
+        return (start + np.cumsum(rng.normal(0, scale, days))).round(4)
+
+    series = {'USD/JPY': walk(120, 0.6), 'EUR/JPY': walk(130, 0.7), 'ust_10y': walk(2.5, 0.04),
+              'bund_10y': walk(0.5, 0.03), 'jgb_10y': walk(0.2, 0.01), 'ust_2y': walk(1.5, 0.04),
+              'jgb_2y': walk(0.0, 0.01)}
+    return {key: [[d, v] for d, v in zip(dates, values.tolist())] for key, values in series.items()}
+
+
+def build(data: dict, max_points: int) -> str:
+    return figures_html(report_figures(data, max_points=max_points))
+
+
+def main():
+    """Run the benchmark and print results"""
+    data = {'history': history(DAYS), 'curves': {}}
+
+    print(f"Chart downsampling benchmark ({DAYS:,} daily points per series)")
+    print("=" * 60)
+    for label, max_points in (('every point', DAYS), (f'LTTB {MAX_POINTS} points', MAX_POINTS)):
+        build(data, max_points)  # Warm up Plotly's validators
+        start = time.perf_counter()
+        html = build(data, max_points)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<20} {elapsed * 1000:9.1f} ms {len(html.encode()) / 1024:9.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for conditional page fetching
+Refreshes a JBOND-style JGB history page 20 times and compares the previous
+approach (download and parse with BeautifulSoup every time) with the
+conditional HTTP cache, for a server that answers 304 and for one that only
+lets the body hash detect that nothing changed. The network is simulated,
+so the numbers are parse/CPU time only.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import requests
+from bs4 import BeautifulSoup
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.http_cache import ConditionalHTTPCache
+
+REFRESHES = 20
+URL = "https://www.bb.jbts.co.jp/ja/historical/main_rate.html"
+
+
+def jgb_page(rows: int = 250) -> str:
+    """A history table shaped like the JBOND page: date plus nine yields per row"""
+    body = ''.join(
+        f"<tr><td>2025/{1 + i // 28 % 12:02d}/{1 + i % 28:02d}</td>"
+        + ''.join(f"<td>{0.1 * j + i / 1000:.3f}</td>" for j in range(9)) + "</tr>"
+        for i in range(rows)
+    )
+    return f"<html><body><table><tr><th>date</th></tr>{body}</table></body></html>"
+
+
+def make_response(status: int, body: str, headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.headers.update(headers)
+    return response
+
+
+class FakeSession:
+    def __init__(self, body: str, etag: bool):
+        self.body = body
+        self.etag = etag
+
+    def get(self, url, headers=None, **kwargs):
+        if self.etag and headers and headers.get('If-None-Match') == '"v1"':
+            return make_response(304, '', {})
+        return make_response(200, self.body, {'ETag': '"v1"'} if self.etag else {})
+
+
+def parse_page(response: requests.Response) -> dict:
+    soup = BeautifulSoup(response.text, 'html.parser')
+    latest = {}
+    for row in soup.find_all('tr'):
+        cells = [cell.get_text(strip=True) for cell in row.find_all('td')]
+        if cells and cells[0].startswith('2025/'):
+            latest = {'date': cells[0], 'jgb_10y': float(cells[4])}
+    return latest
+
+
+def legacy_refreshes(session: FakeSession) -> float:
+    start = time.perf_counter()
+    for _ in range(REFRESHES):
+        parse_page(session.get(URL, timeout=15))
+    return time.perf_counter() - start
+
+
+def conditional_refreshes(session: FakeSession, store_path: str) -> float:
+    cache = ConditionalHTTPCache(session, store_path)
+    start = time.perf_counter()
+    for _ in range(REFRESHES):
+        cache.get_parsed(URL, parse_page, timeout=15)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print results"""
+    body = jgb_page()
+    print(f"Conditional fetch benchmark ({REFRESHES} refreshes of a {len(body) // 1024} KiB page)")
+    print("=" * 60)
+    print(f"parse every time:          {legacy_refreshes(FakeSession(body, etag=False)) * 1000:8.1f} ms")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        etag_time = conditional_refreshes(FakeSession(body, etag=True), os.path.join(temp_dir, 'a.json'))
+        hash_time = conditional_refreshes(FakeSession(body, etag=False), os.path.join(temp_dir, 'b.json'))
+    print(f"conditional, 304 (ETag):   {etag_time * 1000:8.1f} ms")
+    print(f"conditional, body hash:    {hash_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
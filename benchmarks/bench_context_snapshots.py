@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pipeline context snapshots
+Saves a month of pipeline runs whose raw data mostly repeats between runs
+(the economic calendar and the slow-moving series change once a week), once
+as the previous indent-2 JSON files and once through ContextStore, and
+compares save time and disk use. Contexts are generated locally in a
+temporary directory, so no API key or network is needed.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pipeline.context import PipelineContext
+from pipeline.context_store import ContextStore
+
+RUNS = 60  # Two runs a day for a month
+EVENTS = 400
+
+
+def run_context(run: int) -> PipelineContext:
+    week = run // 10
+    start = datetime(2025, 9, 1) + timedelta(hours=12 * run)
+    context = PipelineContext()
+    context.timestamp = start
+    context.raw_data = {
+        'calendar': {'upcoming': [{
+            'date': datetime(2025, 9, 1) + timedelta(hours=7 * week + i), 'country': 'JP',
+            'event_name': f"Indicator {i % 60} (week {week})", 'importance': 'high' if i % 5 == 0 else 'medium',
+            'forecast': f"{i * 0.1:.1f}%", 'previous': f"{i * 0.09:.1f}%", 'actual': None
+        } for i in range(EVENTS)]},
+        'fred': {f"series_{i}": [[str(start.date() - timedelta(days=d)), 4.0 + (d + week) % 7 * 0.01]
+                                 for d in range(120)] for i in range(8)},
+        'fx': {'USD/JPY': 147 + run * 0.05, 'EUR/JPY': 172 - run * 0.03},
+        'repo': {'tonar': 0.477 + run * 0.0001}
+    }
+    context.summary = "Morning summary. " * 200
+    context.final_report = "Report paragraph. " * 2000
+    context.title = f"Run {run}"
+    return context
+
+
+def size_of(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(directory) for name in names)
+
+
+def main():
+    """Run the benchmark and print results"""
+    contexts = [run_context(run) for run in range(RUNS)]
+    with tempfile.TemporaryDirectory() as directory:
+        legacy_dir, store_dir = os.path.join(directory, 'legacy'), os.path.join(directory, 'store')
+        os.makedirs(legacy_dir)
+
+        start = time.perf_counter()
+        for run, context in enumerate(contexts):
+            with open(os.path.join(legacy_dir, f"pipeline_context_{run:04d}.json"), 'w') as f:
+                json.dump(context.to_dict(), f, indent=2, default=str)
+        legacy_time = time.perf_counter() - start
+
+        store = ContextStore(store_dir, keep_runs=0, keep_days=0)
+        start = time.perf_counter()
+        for context in contexts:
+            store.save(context.to_dict(), context.timestamp)
+        store_time = time.perf_counter() - start
+
+        pruned = ContextStore(os.path.join(directory, 'pruned'), keep_runs=20, keep_days=0)
+        for context in contexts:
+            pruned.save(context.to_dict(), context.timestamp)
+            pruned.prune(now=context.timestamp)
+
+        print(f"Pipeline context snapshots ({RUNS} runs, {EVENTS} calendar events each)")
+        print("=" * 60)
+        print(f"{'indent-2 JSON':<28} {legacy_time / RUNS * 1000:7.1f} ms/run {size_of(legacy_dir) / 1e6:8.2f} MB")
+        print(f"{'ContextStore':<28} {store_time / RUNS * 1000:7.1f} ms/run {size_of(store_dir) / 1e6:8.2f} MB")
+        print(f"{'ContextStore, keep 20 runs':<28} {'':14} {size_of(pruned.directory) / 1e6:8.2f} MB")
+        assert store.load(os.path.join(store_dir, store.snapshots()[-1]))['raw_data']['fx'] == \
+            contexts[-1].raw_data['fx']
+
+
+if __name__ == "__main__":
+    main()
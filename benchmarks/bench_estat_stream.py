@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark for decoding large e-Stat responses
+Decodes a getStatsData response with many VALUE objects the previous way
+(json.loads of the whole body, then walking GET_STATS_DATA) and with the
+streaming decoder, and reports time and peak Python memory for each. The
+response is generated locally, so no API key or network is needed.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.estat_client import iter_stats_values
+
+VALUES = 200_000
+CHUNK_SIZE = 64 * 1024
+
+
+def stats_document(count: int) -> str:
+    values = [
+        {'@tab': '1', '@cat01': f'{i % 600:04d}', '@area': '13A01',
+         '@time': f'{2000 + i // 7200}00{1 + i // 600 % 12:02d}{1 + i // 600 % 12:02d}',
+         '@unit': '2020年=100', '$': f'{90 + (i % 400) / 10:.1f}'}
+        for i in range(count)
+    ]
+    return json.dumps({'GET_STATS_DATA': {
+        'RESULT': {'STATUS': 0, 'ERROR_MSG': '正常に終了しました。'},
+        'STATISTICAL_DATA': {'RESULT_INF': {'TOTAL_NUMBER': count}, 'DATA_INF': {'VALUE': values}}
+    }}, ensure_ascii=False)
+
+
+def legacy_decode(body: str) -> float:
+    result = json.loads(body)
+    total = 0.0
+    for item in result['GET_STATS_DATA']['STATISTICAL_DATA']['DATA_INF']['VALUE']:
+        total += float(item['$'])
+    return total
+
+
+def streaming_decode(body: str) -> float:
+    chunks = (body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE))
+    return sum(float(item['$']) for item in iter_stats_values(chunks, {}))
+
+
+def measure(decode, body: str):
+    """Wall time, then peak traced memory in a second run (tracing slows decoding down)"""
+    start = time.perf_counter()
+    decode(body)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Run the benchmark and print results"""
+    body = stats_document(VALUES)
+    print(f"e-Stat decode benchmark ({VALUES:,} values, {len(body.encode('utf-8')) / 1e6:.1f} MB body)")
+    print("=" * 60)
+    for label, decode in (("json.loads whole body", legacy_decode), ("streaming decoder", streaming_decode)):
+        elapsed, peak = measure(decode, body)
+        print(f"{label:<24} {elapsed * 1000:8.1f} ms   peak {peak / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark for event name classification
+Classifies a few thousand synthetic calendar event names with the basic
+scraper's single-pass classifier and compares against the previous
+per-keyword scans (category map, importance lists and auction list checked
+separately)
+"""
+
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.event_classifier import BASIC_RULES, EventClassifier
+
+
+N_NAMES = 5000
+REPEATS = 5
+
+_CATEGORY_MAP = dict(BASIC_RULES.categories)
+
+
+def legacy_classify(event_name: str) -> tuple:
+    """Previous scraper logic: one substring test per keyword, three separate scans"""
+    event_lower = event_name.lower()
+
+    category = 'economic'
+    for keyword, mapped in _CATEGORY_MAP.items():
+        if keyword in event_lower:
+            category = mapped
+            break
+
+    is_bond_auction = any(keyword in event_lower for keyword in BASIC_RULES.auction)
+    if any(keyword in event_lower for keyword in BASIC_RULES.high):
+        importance = 5
+    elif any(keyword in event_lower for keyword in BASIC_RULES.medium) or is_bond_auction:
+        importance = 3
+    else:
+        importance = 1
+
+    return category, importance, is_bond_auction
+
+
+def synthetic_names(n_names: int) -> list:
+    """Event names shaped like a multi-month G3 calendar scrape"""
+    stems = [
+        'Inflation Rate YoY', 'Core Inflation Rate MoM', 'Non Farm Payrolls', 'Unemployment Rate',
+        'GDP Growth Rate QoQ Adv', 'Retail Sales MoM', 'Industrial Production YoY',
+        'Fed Interest Rate Decision', 'BoJ Interest Rate Decision', 'ECB Press Conference',
+        '10-Year Note Auction', '3-Month Bill Auction', '30-Year JGB Auction', 'Bund Auction',
+        'Building Permits Prel', 'Housing Starts', 'Trade Balance', 'Current Account',
+        'Michigan Consumer Sentiment Prel', 'Tankan Large Manufacturers Index',
+        'Initial Jobless Claims', 'ISM Manufacturing PMI', 'Machinery Orders MoM',
+        'ZEW Economic Sentiment Index', 'Ifo Business Climate', 'Consumer Confidence',
+        'Fed Chair Powell Speech', 'BoJ Summary of Opinions', 'Tokyo CPI Ex Food and Energy'
+    ]
+    suffixes = ['', ' Final', ' Prel', ' (Sep)', ' (Q3)', ' 4-Week Average', ' s.a.']
+    return [stems[i % len(stems)] + suffixes[(i // len(stems)) % len(suffixes)] for i in range(n_names)]
+
+
+def bench(classify, names) -> float:
+    """Average seconds to classify all names"""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for name in names:
+            classify(name)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main():
+    """Run the benchmark and print results"""
+    names = synthetic_names(N_NAMES)
+    classifier = EventClassifier()
+
+    mismatches = sum(1 for name in names if tuple(classifier.classify(name)) != legacy_classify(name))
+
+    print(f"Event classification benchmark ({N_NAMES} names)")
+    print("=" * 60)
+    legacy = bench(legacy_classify, names)
+    shared = bench(classifier.classify, names)
+    print(f"per-keyword scans:   {legacy * 1000:8.2f} ms  ({legacy / N_NAMES * 1e6:.2f} us/name)")
+    print(f"single-pass scanner: {shared * 1000:8.2f} ms  ({shared / N_NAMES * 1e6:.2f} us/name)")
+    print(f"speedup: {legacy / shared:.1f}x, mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for report page rendering
+Renders a pipeline-style Markdown report to HTML with the compiled
+templates, first in a fresh environment (compiling from source, then from
+the on-disk bytecode cache) and then warm, and re-renders an archive of
+saved reports as after a template change. Everything runs in a temporary
+directory, so no API key or network is needed.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators import rendering
+from generators.weekly_report import WeeklyReportGenerator
+
+ARCHIVE_SIZE = 520  # Ten years of weekly reports
+SECTION = """## {title}
+
+**USD/JPY** trades at 147.25 after a *0.4%* weekly gain, with the UST-JGB 10Y spread at 265bp
+<span title="Spread between US and Japanese 10-year yields">ℹ️</span>. Policy divergence remains the
+main driver; see [FRED](https://fred.stlouisfed.org/) for the underlying series.
+
+### Drivers
+- BOJ communication on the pace of normalization
+- US data surprises and `fed_funds` repricing
+- Positioning: speculative yen shorts near multi-year extremes
+
+| Indicator | Level | Change |
+|-----------|------:|-------:|
+| USD/JPY | 147.25 | +0.4% |
+| JGB 10Y | 1.58 | +3bp |
+
+"""
+
+
+def report(week: int) -> str:
+    sections = "".join(SECTION.format(title=title) for title in
+                       ('Executive Summary', 'Market Analysis', 'Key Findings', 'Risk Assessment', 'Outlook'))
+    return f"# Yen Weekly, Week {week}\n\n**Date:** week {week}\n\n{sections}---\n*Disclaimer: informational only.*\n"
+
+
+def main():
+    """Run the benchmark and print results"""
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        with open('config.yaml', 'w') as f:
+            yaml.safe_dump({'api_keys': {'openai': 'YOUR_OPENAI_API_KEY'}, 'data': {},
+                            'output': {'weekly_report': {'chart_height': 500}}}, f)
+        generator = WeeklyReportGenerator('config.yaml')
+        generator.output_dir = 'reports'
+        os.makedirs('reports')
+        data = {'history': {}, 'curves': {}}
+
+        print(f"Report rendering benchmark ({len(report(1)):,} character reports)")
+        print("=" * 60)
+        for label in ('first render, compile', 'first render, bytecode'):
+            rendering._environment.cache_clear()
+            start = time.perf_counter()
+            generator._generate_html_wrapper(report(1), data)
+            print(f"{label:<28} {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+        runs = 200
+        start = time.perf_counter()
+        for week in range(runs):
+            generator._generate_html_wrapper(report(week), data)
+        print(f"{'warm render':<28} {(time.perf_counter() - start) / runs * 1000:9.2f} ms")
+
+        for week in range(ARCHIVE_SIZE):
+            with open(f'reports/report_{week:04d}.md', 'w') as f:
+                f.write(report(week))
+        start = time.perf_counter()
+        changed = generator.rerender_archive()
+        print(f"{f'archive of {len(changed)} reports':<28} {(time.perf_counter() - start) * 1000:9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
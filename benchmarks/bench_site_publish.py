@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark for publishing to the GitHub Pages directory
+Builds a docs directory holding years of briefs and reports, then times
+publishing one new brief with a full rebuild (no manifest: every file
+hashed and probed, every page written) against an incremental publish from
+the manifest, which probes only the new MP3. Files are generated locally in
+a temporary directory.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.mp3 import GTTS_FRAME_BYTES, GTTS_FRAME_HEADER
+from generators.site_builder import SITE_MANIFEST, SiteBuilder
+
+DAYS = 750  # About three years of weekday briefs
+AUDIO_BYTES = 400_000
+
+
+def audio(size: int = AUDIO_BYTES) -> bytes:
+    """gTTS-format frames with random payload"""
+    payload = bytearray(os.urandom(size - size % GTTS_FRAME_BYTES))
+    for offset in range(0, len(payload), GTTS_FRAME_BYTES):
+        payload[offset:offset + 4] = GTTS_FRAME_HEADER
+    return bytes(payload)
+
+
+def populate(docs: str):
+    day = date(2023, 1, 2)
+    payload = audio()
+    for i in range(DAYS):
+        stamp = day.strftime('%Y%m%d')
+        with open(os.path.join(docs, f"morning_brief_{stamp}.mp3"), 'wb') as f:
+            f.write(payload[i * GTTS_FRAME_BYTES:] + payload[:i * GTTS_FRAME_BYTES])
+        with open(os.path.join(docs, f"morning_brief_{stamp}.txt"), 'w') as f:
+            f.write(f"Morning brief {stamp}\n" * 40)
+        if day.weekday() == 0:
+            with open(os.path.join(docs, f"report_{stamp}.html"), 'w') as f:
+                f.write(f"<html>report {stamp}</html>" * 500)
+        day += timedelta(days=1 if day.weekday() < 4 else 3)
+    return day
+
+
+def main():
+    """Run the benchmark and print results"""
+    with tempfile.TemporaryDirectory() as directory:
+        docs, output = os.path.join(directory, 'docs'), os.path.join(directory, 'output')
+        os.makedirs(docs)
+        os.makedirs(output)
+        next_day = populate(docs)
+        count = len(os.listdir(docs))
+        size = sum(os.path.getsize(os.path.join(docs, name)) for name in os.listdir(docs))
+
+        def new_brief(day):
+            stamp = day.strftime('%Y%m%d')
+            files = []
+            for name, payload in ((f"morning_brief_{stamp}.mp3", audio()),
+                                  (f"morning_brief_{stamp}.txt", b"Good morning\n" * 40)):
+                with open(os.path.join(output, name), 'wb') as f:
+                    f.write(payload)
+                files.append((os.path.join(output, name), name))
+            return files
+
+        print(f"Site publishing benchmark ({count:,} files, {size / 1e6:,.0f} MB in docs/)")
+        print("=" * 60)
+        start = time.perf_counter()
+        SiteBuilder(docs).publish(new_brief(next_day))
+        print(f"{'full rebuild':<28} {(time.perf_counter() - start) * 1000:9.1f} ms")
+        assert os.path.exists(os.path.join(docs, SITE_MANIFEST))
+
+        start = time.perf_counter()
+        changes = SiteBuilder(docs).publish(new_brief(next_day + timedelta(days=1)))
+        print(f"{'incremental publish':<28} {(time.perf_counter() - start) * 1000:9.1f} ms "
+              f"({len(changes['copied'])} files, {len(changes['pages'])} pages)")
+
+        start = time.perf_counter()
+        changes = SiteBuilder(docs).publish([])
+        print(f"{'nothing changed':<28} {(time.perf_counter() - start) * 1000:9.1f} ms "
+              f"({len(changes['copied'])} files, {len(changes['pages'])} pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark for data fetching while sources are down
+Runs the European yield and Reuters fetchers repeatedly against a session
+whose requests fail after a simulated timeout, with and without circuit
+breakers. Without a breaker (the previous behaviour) every run pays the
+timeout for every request; with one, runs after the breaker opens serve the
+last good value straight away.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.data_fetcher import DataFetcher
+
+
+SIMULATED_TIMEOUT = 0.25  # Stand-in for timeout plus retry backoff (15 s+ in production)
+RUNS = 8
+
+
+def failing_get(*args, **kwargs):
+    time.sleep(SIMULATED_TIMEOUT)
+    raise ConnectionError("simulated outage")
+
+
+def make_fetcher(work_dir: str, failure_threshold: int) -> DataFetcher:
+    config_path = os.path.join(work_dir, f'config_{failure_threshold}.yaml')
+    with open(config_path, 'w') as f:
+        yaml.safe_dump({
+            'api_keys': {},
+            'data': {'cache_expiry_hours': 24, 'retry_attempts': 0,
+                     'circuit_breaker': {'failure_threshold': failure_threshold}},
+            'scraping': {'user_agent': 'bench'}
+        }, f)
+    fetcher = DataFetcher(config_path)
+    for cache_type in fetcher.cache_dirs:
+        fetcher.cache_dirs[cache_type] = work_dir
+    fetcher.session.get = failing_get
+    return fetcher
+
+
+def run(fetcher: DataFetcher) -> list:
+    """Seconds per run of the two fetchers"""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fetcher.fetch_euro_yields()
+        fetcher.fetch_reuters_rss()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    """Run the benchmark and print results"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        legacy = run(make_fetcher(work_dir, failure_threshold=10 ** 9))
+        breaker_fetcher = make_fetcher(work_dir, failure_threshold=3)
+        breaker = run(breaker_fetcher)
+
+    print(f"Source outage benchmark ({RUNS} runs, {SIMULATED_TIMEOUT * 1000:.0f} ms simulated timeout per request)")
+    print("=" * 60)
+    print(f"{'run':>4} {'no breaker (ms)':>18} {'circuit breaker (ms)':>22}")
+    for i, (a, b) in enumerate(zip(legacy, breaker), 1):
+        print(f"{i:>4} {a * 1000:>18.1f} {b * 1000:>22.1f}")
+    print(f"total {sum(legacy):>16.2f} s {sum(breaker):>20.2f} s")
+    print(f"source status: {breaker_fetcher.source_status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark for morning brief TTS synthesis
+Synthesizes the six brief clips (intro, four segments, outro) against the
+local stand-in backend, which simulates service latency and a server-side
+rate limit. Compares the previous sequential loop with a fixed pause after
+each segment against concurrent synthesis under the adaptive token bucket,
+and a re-run of the unchanged brief through the clip cache.
+All times are scaled down 10x from production (1 s latency, 5 s pause).
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.tts import AdaptiveTokenBucket, ClipRequest, LocalTTSBackend, TTSClipCache, synthesize_clips
+
+
+SCALE = 0.1
+LATENCY = 1.0 * SCALE
+LEGACY_PAUSE = 5.0 * SCALE
+SERVER_LIMIT = 3.0 / SCALE  # requests per second the service accepts
+
+CLIPS = [
+    ClipRequest("Good morning. This is your YenSense AI market brief.", 'com'),
+    ClipRequest("JGB yields edged higher overnight. " * 20, 'com'),
+    ClipRequest("The yen weakened against the dollar. " * 20, 'co.uk'),
+    ClipRequest("Repo markets were stable. " * 20, 'ca'),
+    ClipRequest("Machinery orders beat expectations. " * 20, 'com.au'),
+    ClipRequest("That's your morning brief.", 'com')
+]
+
+
+def legacy_synthesis(backend) -> list:
+    """Previous loop: one clip at a time, fixed pause after each domain segment"""
+    results = []
+    for i, clip in enumerate(CLIPS):
+        results.append(backend.synthesize(clip.text, tld=clip.tld))
+        if 0 < i < len(CLIPS) - 1:
+            time.sleep(LEGACY_PAUSE)
+    return results
+
+
+def main():
+    """Run the benchmark and print results"""
+    print(f"TTS synthesis benchmark ({len(CLIPS)} clips, times scaled {SCALE:g}x)")
+    print("=" * 60)
+
+    backend = LocalTTSBackend(latency=LATENCY, max_requests_per_second=SERVER_LIMIT)
+    start = time.perf_counter()
+    legacy_audio = legacy_synthesis(backend)
+    legacy = time.perf_counter() - start
+
+    backend = LocalTTSBackend(latency=LATENCY, max_requests_per_second=SERVER_LIMIT)
+    limiter = AdaptiveTokenBucket(rate=SERVER_LIMIT * 2, burst=4)  # deliberately too optimistic
+    start = time.perf_counter()
+    parallel_audio = synthesize_clips(backend, CLIPS, limiter, max_workers=4)
+    parallel = time.perf_counter() - start
+
+    assert parallel_audio == legacy_audio
+    print(f"sequential + fixed pause: {legacy:6.2f} s")
+    print(f"parallel + token bucket:  {parallel:6.2f} s  "
+          f"({backend.throttled} throttled, rate settled at {limiter.rate:.1f}/s)")
+    print(f"speedup: {legacy / parallel:.1f}x")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        synthesize_clips(backend, CLIPS, limiter, cache=TTSClipCache(cache_dir))
+        calls = backend.calls
+        start = time.perf_counter()
+        synthesize_clips(backend, CLIPS, limiter, cache=TTSClipCache(cache_dir))
+        cached = time.perf_counter() - start
+        print(f"cached re-run:            {cached:6.2f} s  ({backend.calls - calls} TTS calls)")
+
+
+if __name__ == "__main__":
+    main()
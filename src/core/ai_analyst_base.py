@@ -11,6 +11,8 @@ from typing import Dict, Any
 import requests
 import yaml
 
+from .llm_cache import DEFAULT_CACHE_DIR, LLMResponseCache
+
 
 class AIAnalystBase:
     """Base class for AI-powered market analysts"""
@@ -30,6 +32,11 @@ class AIAnalystBase:
             self.use_ai = False
         else:
             self.use_ai = True
+        
+        # Responses to identical requests are reused from disk (replays set this too)
+        cache_config = self.config.get('ai', {}).get('response_cache', {})
+        self.response_cache = (LLMResponseCache(cache_config.get('directory', DEFAULT_CACHE_DIR))
+                               if cache_config.get('enabled') else None)
     
     def _call_openai(self, prompt: str, max_completion_tokens: int = 1000, system_prompt: str = "") -> str:
         """Call OpenAI API for analysis"""
@@ -63,6 +70,12 @@ class AIAnalystBase:
             'max_completion_tokens': max_completion_tokens
         }
         
+        if self.response_cache is not None:
+            cached = self.response_cache.get(data)
+            if cached is not None:
+                self.logger.info(f"Using cached OpenAI response, {len(cached)} characters")
+                return cached
+        
         try:
             response = requests.post(
                 'https://api.openai.com/v1/chat/completions',
@@ -76,6 +89,11 @@ class AIAnalystBase:
                 content = result['choices'][0]['message']['content']
                 
                 self.logger.info(f"OpenAI API call successful, {len(content)} characters")
+                if self.response_cache is not None:
+                    try:
+                        self.response_cache.put(data, content.strip())
+                    except OSError as e:
+                        self.logger.warning(f"Could not cache OpenAI response: {e}")
                 return content.strip()
             else:
                 self.logger.error(f"OpenAI API error: {response.status_code}, {response.text}")
@@ -105,7 +123,25 @@ class AIAnalystBase:
         return f"{number:.{decimals}f}"
     
     def _extract_headlines(self, news_data: Dict[str, Any], limit: int = 5) -> list:
-        """Extract news headlines from various sources"""
+        """
+        Extract news headlines from various sources
+        
+        Reads the news store snapshot in news_data['headlines'] (de-duplicated
+        across sources, headlines new since the last brief first); falls back
+        to the per-source lists of older data.
+        """
+        store_headlines = news_data.get('headlines')
+        if store_headlines:
+            ordered = sorted(store_headlines, key=lambda item: not item.get('new'))  # Stable: keeps recency order
+            return [
+                {
+                    'title': item.get('title', ''),
+                    'source': item.get('source', ''),
+                    'timestamp': item.get('published', '')
+                }
+                for item in ordered[:limit]
+            ]
+        
         headlines = []
         
         for source in ['boj_news', 'reuters_news', 'nikkei_news']:
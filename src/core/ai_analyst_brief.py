@@ -8,6 +8,8 @@ import logging
 from typing import Dict, Any
 
 from .ai_analyst_base import AIAnalystBase
+from .rolling_stats import summarize_stats
+from .yield_curves import analyze_curves, summarize_curves
 
 
 class AIAnalystBrief(AIAnalystBase):
@@ -40,6 +42,11 @@ class AIAnalystBrief(AIAnalystBase):
         us_10y = yields_data.get('ust_10y', 4.05)   # Live data
         bund_10y = yields_data.get('bund_10y', 2.71)  # Live German data
         
+        # Spreads, slopes, flies and daily changes across the three curves (bp)
+        curves = data.get('curves') or analyze_curves(yields_data)
+        curve_lines = summarize_curves(curves)
+        curve_text = "\n".join(f"- {line}" for line in curve_lines) if curve_lines else "- Curve data unavailable"
+        
         headline_text = "\n".join([f"- {h['title']} ({h['source']})" for h in headlines]) if headlines else "No major rate-related headlines"
         
         prompt = f"""Generate podcast commentary about Japan rates markets.
@@ -48,15 +55,18 @@ Current levels:
 - JGB 10Y: {self._format_number(jgb_10y, 2)}%
 - US 10Y: {self._format_number(us_10y, 2)}%
 - German 10Y: {self._format_number(bund_10y, 2)}%
-- US-JGB differential: {self._format_number(us_10y - jgb_10y, 2)}bp
-- Bund-JGB differential: {self._format_number(bund_10y - jgb_10y, 2)}bp
+- US-JGB differential: {self._format_number((us_10y - jgb_10y) * 100, 0)}bp
+- Bund-JGB differential: {self._format_number((bund_10y - jgb_10y) * 100, 0)}bp
+
+Curves (bp):
+{curve_text}
 
 Recent headlines:
 {headline_text}
 
 Cover what matters:
-1. Any notable JGB yield moves overnight/yesterday
-2. US Treasury and German Bund spillover effects (global rates correlation)
+1. Any notable JGB yield moves overnight/yesterday, and what the curve shape (steepening/flattening) says
+2. US Treasury and German Bund spillover effects (global rates correlation, spread moves)
 3. BOJ policy implications or operations
 4. What this means for USD/JPY and EUR/JPY carry dynamics
 
@@ -83,6 +93,10 @@ Be specific about moves, levels, and catalysts. No fluff.
         usd_jpy_chg = usd_jpy - usd_jpy_prev
         eur_jpy_chg = eur_jpy - eur_jpy_prev
         
+        # Level against its rolling window, volatility and drawdown per pair
+        regime_lines = summarize_stats(data.get('fx_stats') or {})
+        regime_text = "\n".join(f"- {line}" for line in regime_lines) if regime_lines else "- Regime statistics unavailable"
+        
         headline_text = "\n".join([f"- {h['title']} ({h['source']})" for h in headlines]) if headlines else "No major FX headlines"
         
         prompt = f"""Generate podcast commentary about Japan FX markets. Cover ALL yen crosses, not just individual pairs.
@@ -91,6 +105,9 @@ Current levels and changes:
 - USD/JPY: {self._format_number(usd_jpy)} ({usd_jpy_chg:+.0f} pips from yesterday)
 - EUR/JPY: {self._format_number(eur_jpy)} ({eur_jpy_chg:+.0f} pips from yesterday)
 
+Regime (rolling daily closes):
+{regime_text}
+
 Recent FX-related news:
 {headline_text}
 
@@ -98,7 +115,7 @@ Discuss:
 1. Main theme across yen crosses (risk on/off, policy divergence, carry dynamics)
 2. Which pairs moved most and WHY (specific catalysts, not just correlation)
 3. Any divergences that tell a story (e.g., USD/JPY up but EUR/JPY down = euro weakness, not just yen weakness)
-4. Positioning or volatility if notable
+4. Positioning or volatility if notable - judge moves against the regime figures (a stretched z-score or a vol pickup matters more than the level itself)
 
 Connect the dots. Show relationships. If FX was quiet, just say "Yen crosses were range-bound overnight with limited volatility."
 
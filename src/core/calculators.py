@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Deterministic market calculators for YenSense AI
+Plain NumPy functions for the arithmetic the analysis pipeline needs:
+percent changes, implied crosses, rate differentials, carry, realized
+volatility and z-scores. All accept scalars or arrays (element-wise), so a
+whole set of pairs, tenors or dates is computed in one call. Results are NaN
+where the inputs do not allow an answer, never a guessed value
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+TRADING_DAYS = 252
+MONEY_MARKET_DAYS = 360
+
+
+def _array(values: ArrayLike) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def _result(values: np.ndarray):
+    """0-d results as plain floats, arrays unchanged"""
+    return float(values) if values.ndim == 0 else values
+
+
+def pct_change(current: ArrayLike, previous: ArrayLike):
+    """Percent change from previous to current"""
+    current, previous = _array(current), _array(previous)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = np.where(previous != 0, (current / previous - 1) * 100, np.nan)
+    return _result(change)
+
+
+def implied_cross(base_quote: ArrayLike, other_quote: ArrayLike):
+    """Cross rate implied by two rates against the same currency, e.g. EUR/USD = EUR/JPY / USD/JPY"""
+    base_quote, other_quote = _array(base_quote), _array(other_quote)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cross = np.where(other_quote != 0, base_quote / other_quote, np.nan)
+    return _result(cross)
+
+
+def rate_differential_bp(rate: ArrayLike, other_rate: ArrayLike):
+    """Difference of two rates quoted in percent, in basis points"""
+    return _result((_array(rate) - _array(other_rate)) * 100)
+
+
+def carry_pct(base_rate: ArrayLike, quote_rate: ArrayLike, days: ArrayLike = MONEY_MARKET_DAYS):
+    """
+    Interest carry of holding the base currency against the quote currency, in percent over days
+
+    Rates in percent per year, simple interest on an actual/360 basis (a long
+    USD/JPY position earns USD rates and pays JPY rates).
+    """
+    return _result((_array(base_rate) - _array(quote_rate)) * _array(days) / MONEY_MARKET_DAYS)
+
+
+def forward_points(spot: ArrayLike, base_rate: ArrayLike, quote_rate: ArrayLike,
+                   days: ArrayLike = 90):
+    """Outright forward minus spot by covered interest parity, in price units (yen for USD/JPY)"""
+    t = _array(days) / MONEY_MARKET_DAYS
+    spot = _array(spot)
+    forward = spot * (1 + _array(quote_rate) / 100 * t) / (1 + _array(base_rate) / 100 * t)
+    return _result(forward - spot)
+
+
+def realized_vol(prices: ArrayLike, periods_per_year: int = TRADING_DAYS, axis: int = -1):
+    """
+    Annualized volatility of log returns, in percent
+
+    prices run oldest first along axis; a 2-D array gives one volatility per
+    series. Fewer than three prices give NaN.
+    """
+    prices = _array(prices)
+    if prices.shape[axis] < 3:
+        return _result(np.full(np.delete(prices.shape, axis if axis >= 0 else prices.ndim + axis), np.nan))
+    returns = np.diff(np.log(prices), axis=axis)
+    return _result(returns.std(axis=axis, ddof=1) * np.sqrt(periods_per_year) * 100)
+
+
+def absolute_vol_bp(levels: ArrayLike, periods_per_year: int = TRADING_DAYS, axis: int = -1):
+    """Annualized volatility of daily changes of a rate quoted in percent, in basis points"""
+    levels = _array(levels)
+    if levels.shape[axis] < 3:
+        return _result(np.full(np.delete(levels.shape, axis if axis >= 0 else levels.ndim + axis), np.nan))
+    changes = np.diff(levels, axis=axis) * 100
+    return _result(changes.std(axis=axis, ddof=1) * np.sqrt(periods_per_year))
+
+
+def zscore(value: ArrayLike, history: ArrayLike, axis: int = -1):
+    """
+    Standard deviations of value from the mean of history
+
+    history runs along axis (one row per series for 2-D input). NaN with
+    fewer than two observations or no variation.
+    """
+    history = _array(history)
+    value = _array(value)
+    if history.shape[axis] < 2:
+        return _result(np.full(np.broadcast(value, history.take(0, axis=axis)).shape, np.nan))
+    mean = history.mean(axis=axis)
+    std = history.std(axis=axis, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(std > 0, (value - mean) / std, np.nan)
+    return _result(scores)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Circuit breakers for YenSense AI data sources
+After repeated failures a source's breaker opens and callers skip the live
+request (and its timeout and retry backoff) until a cool-down has passed;
+then a single probe request decides whether to close it again. Failure
+counts and opening times can be kept in a state file, so a source that is
+down stays skipped across runs (each scheduled run is a new process that
+calls a source only once)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_STATE_FILE = 'data/cache/circuit_breakers.json'
+
+# Where a value in the fetched data came from
+LIVE = 'live'          # Fetched from the source on this run
+CACHED = 'cached'      # Cache within its expiry window
+STALE = 'stale'        # Last good value past its expiry, source unavailable
+FALLBACK = 'fallback'  # Hard-coded default, no good value available
+
+
+class CircuitBreaker:
+    """Closed -> open after failure_threshold consecutive failures -> half-open after reset_seconds"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_seconds: float = 1800,
+                 clock: Callable[[], float] = time.time, on_change: Optional[Callable[[], None]] = None):
+        """
+        clock: wall-clock time by default, so a persisted opened_at means the same in the next process
+        on_change: called after each recorded result that changed the breaker
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.on_change = on_change
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        """Whether a live request may be made now; only one probe is let through when half-open"""
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            changed = self.failures > 0 or self.opened_at is not None
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+        if changed and self.on_change:
+            self.on_change()
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()  # (Re)open; a failed probe restarts the cool-down
+            self._probing = False
+        if self.on_change:
+            self.on_change()
+
+
+class CircuitBreakerRegistry:
+    """One breaker per source name, created on first use, optionally persisted to state_file"""
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 1800,
+                 clock: Callable[[], float] = time.time, state_file: Optional[str] = None):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state_file = state_file
+        self.logger = logging.getLogger(__name__)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._saved = self._load()  # Persisted state of every source not yet at its default
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.state_file:
+            return {}
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read circuit breaker state from {self.state_file}, starting closed: {e}")
+            return {}
+
+    def _save(self):
+        """Write the failure count and opening time of every breaker that is not at its default"""
+        with self._lock:
+            for name, breaker in self._breakers.items():
+                if breaker.failures or breaker.opened_at is not None:
+                    self._saved[name] = {'failures': breaker.failures, 'opened_at': breaker.opened_at}
+                else:
+                    self._saved.pop(name, None)
+            payload = json.dumps(self._saved, indent=2, sort_keys=True)
+            directory = os.path.dirname(self.state_file) or '.'
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        f.write(payload)
+                    os.replace(tmp_path, self.state_file)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                self.logger.warning(f"Could not save circuit breaker state to {self.state_file}: {e}")
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self._breakers:
+                breaker = CircuitBreaker(name, self.failure_threshold, self.reset_seconds, self.clock,
+                                         on_change=self._save if self.state_file else None)
+                saved = self._saved.get(name)
+                if saved:
+                    breaker.failures = saved.get('failures', 0)
+                    breaker.opened_at = saved.get('opened_at')
+                self._breakers[name] = breaker
+            return self._breakers[name]
+
+    def states(self) -> Dict[str, str]:
+        """Current state of every breaker, for logging"""
+        with self._lock:
+            return {name: breaker.state for name, breaker in self._breakers.items()}
@@ -4,15 +4,19 @@ Data fetching module for YenSense AI
 Handles API calls, web scraping, and data caching with clear organization
 """
 
+import copy
 import json
 import logging
 import os
 import pickle
 import re
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
 
 import pandas as pd
 import requests
@@ -21,7 +25,72 @@ from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .circuit_breaker import CACHED, DEFAULT_STATE_FILE, FALLBACK, LIVE, STALE, CircuitBreakerRegistry
 from .economic_calendar import EconomicCalendar
+from .estat_client import EStatClient
+from .http_cache import DEFAULT_STORE_PATH as HTTP_VALIDATORS_PATH, ConditionalHTTPCache
+from .news_engine import DEFAULT_STORE_PATH as NEWS_STORE_PATH, NewsEngine, NewsStore
+from .rolling_stats import RollingStats
+from .snapshot_archive import DEFAULT_ARCHIVE_DIR, SnapshotArchive
+from .yield_curves import analyze_curves
+
+
+# Used when a source fails and there is no previously fetched value to fall back on
+FALLBACK_DATA = {
+    'fred_macro': {'japan_cpi': 106.5, 'japan_gdp': 4231.14, 'us_gdp': 27000.0},
+    'fred_yields': {
+        'ust_1m': 5.50, 'ust_3m': 5.25, 'ust_6m': 5.15, 'ust_1y': 4.85, 'ust_2y': 4.60, 'ust_3y': 4.50,
+        'ust_5y': 4.40, 'ust_7y': 4.35, 'ust_10y': 4.25, 'ust_20y': 4.35, 'ust_30y': 4.40
+    },
+    'fred_fx': {'usdjpy': 147.25, 'usdeur': 0.9050, 'eurjpy': 162.65, 'dxy': 103.5},
+    'alpha_fx': {'USD/JPY': 147.25, 'EUR/JPY': 158.90},
+    'jgb_curve': {
+        'jgb_40y': 3.425, 'jgb_30y': 3.19, 'jgb_20y': 2.63, 'jgb_10y': 1.625, 'jgb_5y': 1.165, 'jgb_2y': 0.875,
+        'data_date': "2025/09/01"
+    },
+    'euro_yields': {
+        'bund_3m': 1.75, 'bund_6m': 1.92, 'bund_1y': 1.94, 'bund_2y': 2.02, 'bund_3y': 2.06, 'bund_5y': 2.31,
+        'bund_7y': 2.45, 'bund_10y': 2.71, 'bund_15y': 3.08, 'bund_20y': 3.20, 'bund_30y': 3.30
+    },
+    'repo_rates': {'gc_on': 0.45, 'gc_1w': 0.477, 'gc_1m': 0.525},
+    'tona': {'tona': 0.477, 'tona_high': 0.480, 'tona_low': 0.471},
+    'boj_news': [{
+        'title': 'BOJ Policy Update - Check Official Website',
+        'link': 'https://www.boj.or.jp/en/',
+        'source': 'Bank of Japan'
+    }],
+    'reuters_news': [{
+        'title': 'Japan Markets Update - Check Reuters for Latest',
+        'link': 'https://www.reuters.com/markets/asia/',
+        'source': 'Reuters'
+    }],
+    'nikkei_news': [{
+        'title': 'Latest Japan Economic News',
+        'link': 'https://asia.nikkei.com/Economy',
+        'source': 'Nikkei Asia'
+    }]
+}
+
+
+# Daily yield snapshots kept for day-over-day curve changes and spread history charts
+YIELD_HISTORY_FILE = 'yield_history.json'
+YIELD_HISTORY_DAYS = 520
+
+# Daily FRED closes behind the rolling FX statistics; EUR/JPY is USD/JPY x EUR/USD per date
+FX_HISTORY_FILE = 'fx_history.json'
+FX_HISTORY_SERIES = {'USD/JPY': 'DEXJPUS', 'EUR/USD': 'DEXUSEU', 'DXY': 'DTWEXBGS'}
+FX_STATS_PAIRS = ('USD/JPY', 'EUR/JPY', 'DXY')
+
+# e-Stat tables fetched by fetch_estat_data unless data.estat.indicators overrides them
+ESTAT_INDICATORS = {
+    'tokyo_cpi': {'stats_data_id': '0003427113', 'name': 'Tokyo CPI'},              # Earlier CPI indicator
+    'machinery_orders': {'stats_data_id': '0003355266', 'name': 'Machinery Orders'}  # Business investment
+}
+
+
+class SourceUnavailable(Exception):
+    """Raised by a live fetch when the source returned nothing usable"""
+    pass
 
 
 class DataFetcher:
@@ -37,13 +106,22 @@ class DataFetcher:
     
     # ========== CORE UTILITIES ========== #
     
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize data fetcher with configuration"""
+    def __init__(self, config_path: str = "config.yaml", persist_state: bool = False):
+        """
+        Initialize data fetcher with configuration
+        
+        persist_state: Keep circuit breakers, news headlines and cursors, and
+        HTTP validators in their state files across runs. Only the scheduled
+        runs (main.py) do; other fetchers (tests, replays, pipeline stages)
+        keep them in memory so they cannot affect the next production run.
+        """
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
         
         self.session = self._create_session()
         self.logger = logging.getLogger(__name__)
+        # Validators and parsed results of scraped pages, for conditional requests
+        self.http_cache = ConditionalHTTPCache(self.session, HTTP_VALIDATORS_PATH if persist_state else None)
         
         # Set up cache directories
         self.cache_dirs = {
@@ -58,6 +136,33 @@ class DataFetcher:
         
         # Initialize economic calendar
         self.calendar = EconomicCalendar()
+        
+        # Cache types to skip on read for the current thread (see bypass_cache)
+        self._local = threading.local()
+        
+        # Per-source circuit breakers and where each source's last result came from
+        breaker_config = self.config['data'].get('circuit_breaker', {})
+        self.breakers = CircuitBreakerRegistry(
+            failure_threshold=breaker_config.get('failure_threshold', 3),
+            reset_seconds=breaker_config.get('reset_minutes', 30) * 60,
+            state_file=breaker_config.get('state_file', DEFAULT_STATE_FILE) if persist_state else None
+        )
+        self.source_status: Dict[str, str] = {}
+        self._fallback_keys: Dict[str, set] = {}  # Keys filled with fallback values on a partial live fetch
+        
+        # News engine: sources polled on their own intervals into one de-duplicated store
+        news_config = self.config['data'].get('news', {})
+        poll_minutes = news_config.get('poll_minutes', {})
+        self.news_store = NewsStore(news_config.get('store_file', NEWS_STORE_PATH) if persist_state else None,
+                                    max_items=news_config.get('max_items', 500))
+        self.news_engine = NewsEngine(self.news_store)
+        for name, source, fetch, default_minutes in (
+            ('boj', 'boj_news', lambda: self.fetch_boj_news(), 30),
+            ('reuters', 'reuters_news', lambda: self.fetch_reuters_rss(), 10),
+            ('nikkei', 'nikkei_news', lambda: self.fetch_nikkei_news(), 15)
+        ):
+            self.news_engine.add_source(source, self._news_poller(source, fetch),
+                                        poll_minutes.get(name, default_minutes))
     
     def _create_session(self) -> requests.Session:
         """Create requests session with retry logic"""
@@ -106,11 +211,26 @@ class DataFetcher:
         
         self.logger.info(f"Cached data to {filepath}")
     
-    def _load_cache(self, cache_type: str, filename: str) -> Optional[Any]:
-        """Load data from cache if valid"""
+    @contextmanager
+    def bypass_cache(self, cache_types: Iterable[str]):
+        """Ignore (but still refresh) the given cache types for fetches in this thread"""
+        previous = getattr(self._local, 'bypass', frozenset())
+        self._local.bypass = previous | frozenset(cache_types)
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+    
+    def _load_cache(self, cache_type: str, filename: str, ignore_expiry: bool = False) -> Optional[Any]:
+        """Load data from cache if valid (or, with ignore_expiry, whatever was last cached)"""
         filepath = self._get_cache_path(cache_type, filename)
         
-        if not self._is_cache_valid(filepath):
+        if ignore_expiry:
+            if not os.path.exists(filepath):
+                return None
+        elif cache_type in getattr(self._local, 'bypass', ()):
+            return None
+        elif not self._is_cache_valid(filepath):
             return None
         
         try:
@@ -126,71 +246,83 @@ class DataFetcher:
             self.logger.error(f"Error loading cache {filepath}: {e}")
             return None
     
+    def _fetch_source(self, source: str, cache_type: str, cache_file: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a source's data: valid cache, else a live fetch, else the last good value, else fallback
+        
+        Only good live results are cached. The live fetch is skipped while the
+        source's circuit breaker is open, so a dead site costs no timeouts.
+        Records where the result came from in source_status.
+        """
+        cached = self._load_cache(cache_type, cache_file)
+        if cached:
+            self.logger.info(f"Using cached {source} data")
+            self.source_status[source] = CACHED
+            return cached
+        
+        breaker = self.breakers.get(source)
+        if breaker.allow_request():
+            self._fallback_keys.pop(source, None)
+            try:
+                data = fetch()
+                breaker.record_success()
+                if not self._fallback_keys.get(source):
+                    self._save_cache(data, cache_type, cache_file)
+                self.source_status[source] = LIVE
+                return data
+            except SourceUnavailable as e:
+                breaker.record_failure()
+                self.logger.warning(f"{source} unavailable: {e}")
+            except Exception as e:
+                breaker.record_failure()
+                self.logger.error(f"Error fetching {source}: {e}")
+            if breaker.state == breaker.OPEN:
+                self.logger.warning(f"Circuit breaker for {source} open after {breaker.failures} consecutive failures")
+        else:
+            self.logger.info(f"Circuit breaker for {source} is open, skipping live fetch")
+        
+        stale = self._load_cache(cache_type, cache_file, ignore_expiry=True)
+        if stale:
+            fetched_at = stale.get('timestamp', 'an earlier run') if isinstance(stale, dict) else 'an earlier run'
+            self.logger.warning(f"Using last good {source} data from {fetched_at}")
+            self.source_status[source] = STALE
+            return stale
+        
+        self.logger.warning(f"No good {source} data available, using fallback values")
+        self.source_status[source] = FALLBACK
+        return self._fallback(source)
+    
+    def _fallback(self, source: str) -> Any:
+        data = copy.deepcopy(FALLBACK_DATA[source])
+        if isinstance(data, dict):
+            data['timestamp'] = datetime.now().isoformat()
+        return data
+    
+    def _tag_values(self, *sources: Tuple[str, Any]) -> Dict[str, str]:
+        """Map each key of each (source name, data) pair to its source's status"""
+        tags = {}
+        for source, values in sources:
+            status = self.source_status.get(source, FALLBACK)
+            fallback_keys = self._fallback_keys.get(source, ()) if status == LIVE else ()
+            for key in values:
+                if key != 'timestamp':
+                    tags[key] = FALLBACK if key in fallback_keys else status
+        return tags
+    
     # ========== FRED API DATA FETCHERS ========== #
     
     def fetch_fred_macro(self) -> Dict[str, Any]:
         """Fetch core macro indicators (CPI, GDP) from FRED"""
-        cache_file = 'fred_macro.json'
-        
-        # Try cache first
-        cached = self._load_cache('macro', cache_file)
-        if cached:
-            self.logger.info("Using cached FRED macro data")
-            return cached
-        
-        api_key = self.config['api_keys']['fred']
-        if api_key == "YOUR_FRED_API_KEY":
-            self.logger.warning("Using demo macro data - please configure FRED API key")
-            data = {
-                'japan_cpi': 106.5,
-                'japan_gdp': 4231.14,
-                'us_gdp': 27000.0,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(data, 'macro', cache_file)
-            return data
-        
         series_ids = {
             'japan_cpi': 'FPCPITOTLZGJPN',   # Japan Consumer Price Inflation (most recent)
             'japan_gdp': 'JPNRGDPEXP',       # Japan GDP
             'us_gdp': 'GDP'                  # US GDP for comparison
         }
-        
-        data = self._fetch_fred_series(series_ids, fallback_values={
-            'japan_cpi': 106.5,
-            'japan_gdp': 4231.14,
-            'us_gdp': 27000.0
-        })
-        
-        self._save_cache(data, 'macro', cache_file)
-        return data
+        return self._fetch_source('fred_macro', 'macro', 'fred_macro.json',
+                                  lambda: self._fetch_fred_series('fred_macro', series_ids))
     
     def fetch_fred_yields(self) -> Dict[str, Any]:
-        """Fetch UST yield curve and JGB 10Y from FRED"""
-        cache_file = 'fred_yields.json'
-        
-        # Try cache first
-        cached = self._load_cache('macro', cache_file)
-        if cached:
-            self.logger.info("Using cached FRED yields data")
-            return cached
-        
-        api_key = self.config['api_keys']['fred']
-        if api_key == "YOUR_FRED_API_KEY":
-            self.logger.warning("Using demo yields data - please configure FRED API key")
-            data = {
-                'ust_3m': 5.25,
-                'ust_6m': 5.15,
-                'ust_1y': 4.85,
-                'ust_2y': 4.60,
-                'ust_5y': 4.40,
-                'ust_10y': 4.25,
-                'ust_30y': 4.40,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(data, 'macro', cache_file)
-            return data
-        
+        """Fetch UST yield curve from FRED"""
         series_ids = {
             # Full UST curve (daily) - FRED is authoritative source for US rates
             'ust_1m': 'DGS1MO',
@@ -206,58 +338,20 @@ class DataFetcher:
             'ust_30y': 'DGS30'
             # JGB yields removed - JBOND is authoritative source for JGB rates
         }
-        
-        data = self._fetch_fred_series(series_ids, fallback_values={
-            'ust_1m': 5.50,
-            'ust_3m': 5.25,
-            'ust_6m': 5.15,
-            'ust_1y': 4.85,
-            'ust_2y': 4.60,
-            'ust_3y': 4.50,
-            'ust_5y': 4.40,
-            'ust_7y': 4.35,
-            'ust_10y': 4.25,
-            'ust_20y': 4.35,
-            'ust_30y': 4.40
-        })
-        
-        self._save_cache(data, 'macro', cache_file)
-        return data
+        return self._fetch_source('fred_yields', 'macro', 'fred_yields.json',
+                                  lambda: self._fetch_fred_series('fred_yields', series_ids))
     
     def fetch_fred_fx(self) -> Dict[str, Any]:
         """Fetch FX rates and dollar index from FRED"""
-        cache_file = 'fred_fx.json'
-        
-        # Try cache first
-        cached = self._load_cache('fx', cache_file)
-        if cached:
-            self.logger.info("Using cached FRED FX data")
-            return cached
-        
-        api_key = self.config['api_keys']['fred']
-        if api_key == "YOUR_FRED_API_KEY":
-            self.logger.warning("Using demo FX data - please configure FRED API key")
-            data = {
-                'usdjpy': 147.25,
-                'usdeur': 0.9050,
-                'eurjpy': 162.65,
-                'dxy': 103.5,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(data, 'fx', cache_file)
-            return data
-        
+        return self._fetch_source('fred_fx', 'fx', 'fred_fx.json', self._fetch_fred_fx_live)
+    
+    def _fetch_fred_fx_live(self) -> Dict[str, Any]:
         series_ids = {
             'usdjpy': 'DEXJPUS',    # USD/JPY spot
             'usdeur': 'DEXUSEU',    # USD/EUR spot  
             'dxy': 'DTWEXBGS'       # Dollar index
         }
-        
-        data = self._fetch_fred_series(series_ids, fallback_values={
-            'usdjpy': 147.25,
-            'usdeur': 0.9050,
-            'dxy': 103.5
-        }, include_previous=True)
+        data = self._fetch_fred_series('fred_fx', series_ids, include_previous=True)
         
         # Calculate EUR/JPY from USD rates
         if 'usdjpy' in data and 'usdeur' in data:
@@ -266,15 +360,26 @@ class DataFetcher:
                 eurjpy_prev = data['usdjpy_prev'] / data['usdeur_prev']
                 data['eurjpy_prev'] = eurjpy_prev
                 data['eurjpy_change'] = data['eurjpy'] - eurjpy_prev
+            if {'usdjpy', 'usdeur'} & self._fallback_keys.get('fred_fx', set()):
+                self._fallback_keys['fred_fx'].add('eurjpy')
         
-        self._save_cache(data, 'fx', cache_file)
         return data
     
-    def _fetch_fred_series(self, series_ids: Dict[str, str], fallback_values: Dict[str, float], 
+    def _fetch_fred_series(self, source: str, series_ids: Dict[str, str],
                           include_previous: bool = False) -> Dict[str, Any]:
-        """Helper method to fetch multiple FRED series"""
-        data = {}
+        """
+        Helper method to fetch multiple FRED series
+        
+        Series that fail get the source's fallback value and are recorded in
+        _fallback_keys; raises SourceUnavailable if none could be fetched.
+        """
         api_key = self.config['api_keys']['fred']
+        if api_key == "YOUR_FRED_API_KEY":
+            raise SourceUnavailable("FRED API key not configured")
+        
+        data = {}
+        fallback_values = FALLBACK_DATA[source]
+        fallback_keys = set()
         base_url = "https://api.stlouisfed.org/fred/series/observations"
         
         for name, series_id in series_ids.items():
@@ -291,39 +396,141 @@ class DataFetcher:
                 response.raise_for_status()
                 result = response.json()
                 
-                if 'observations' in result and result['observations']:
-                    obs = result['observations']
-                    # Filter out null values
-                    valid_obs = [o for o in obs if o['value'] != '.']
+                # Filter out null values
+                valid_obs = [o for o in result.get('observations') or [] if o['value'] != '.']
+                
+                if valid_obs:
+                    current_val = float(valid_obs[0]['value'])
+                    data[name] = current_val
                     
-                    if valid_obs:
-                        current_val = float(valid_obs[0]['value'])
-                        data[name] = current_val
-                        
-                        # Add previous value for change calculation
-                        if include_previous and len(valid_obs) > 1:
-                            prev_val = float(valid_obs[1]['value'])
-                            data[f"{name}_prev"] = prev_val
-                            data[f"{name}_change"] = current_val - prev_val
-                        
-                        self.logger.info(f"Fetched {name}: {current_val}")
-                    else:
-                        data[name] = fallback_values.get(name, 100.0)
-                        self.logger.warning(f"No valid data for {name}, using fallback")
+                    # Add previous value for change calculation
+                    if include_previous and len(valid_obs) > 1:
+                        prev_val = float(valid_obs[1]['value'])
+                        data[f"{name}_prev"] = prev_val
+                        data[f"{name}_change"] = current_val - prev_val
+                    
+                    self.logger.info(f"Fetched {name}: {current_val}")
                 else:
-                    data[name] = fallback_values.get(name, 100.0)
-                    self.logger.warning(f"No observations for {name}, using fallback")
+                    self.logger.warning(f"No valid data for {name}, using fallback")
                     
             except Exception as e:
                 self.logger.error(f"Error fetching {name}: {e}")
+            
+            if name not in data:
                 data[name] = fallback_values.get(name, 100.0)
+                fallback_keys.add(name)
             
             # Rate limiting
             time.sleep(0.1)
         
+        if len(fallback_keys) == len(series_ids):
+            raise SourceUnavailable(f"No FRED series could be fetched for {source}")
+        
+        self._fallback_keys[source] = fallback_keys
         data['timestamp'] = datetime.now().isoformat()
         return data
     
+    def fetch_fx_history(self) -> Dict[str, Any]:
+        """
+        Daily FX closes and their rolling statistics, updated incrementally
+        
+        The stored statistics are advanced with only the FRED observations
+        dated after them, so a daily run costs a few points per series rather
+        than a recompute over the window. Returns {'series': pair -> [[date,
+        close], ...] oldest first, 'stats': pair -> RollingStats}.
+        """
+        config = self.config['data'].get('fx_history', {})
+        window = config.get('window_days', 60)
+        ewma_lambda = config.get('ewma_lambda', 0.94)
+        keep_days = max(config.get('keep_days', 520), window)
+        
+        fresh = self._load_cache('fx', FX_HISTORY_FILE)
+        stored = fresh or self._load_cache('fx', FX_HISTORY_FILE, ignore_expiry=True) or {}
+        series = stored.get('series', {})
+        stats = {}
+        for pair in FX_STATS_PAIRS:
+            state = stored.get('stats', {}).get(pair)
+            if state and (state['window'], state['ewma_lambda']) == (window, ewma_lambda):
+                stats[pair] = RollingStats.from_state(state)
+            else:
+                # New pair or changed settings: rebuild from the stored closes
+                stats[pair] = RollingStats(window, ewma_lambda)
+                for date, close in series.get(pair, []):
+                    stats[pair].update(close, date)
+        
+        if fresh:
+            self.source_status['fred_fx_history'] = CACHED
+            return {'series': series, 'stats': stats}
+        
+        closes = None
+        breaker = self.breakers.get('fred_fx_history')
+        if breaker.allow_request():
+            last_dates = [pair_stats.last_date for pair_stats in stats.values()]
+            if all(last_dates):
+                start = min(last_dates)
+            else:
+                start = (datetime.now() - timedelta(days=config.get('lookback_days', 365))).strftime('%Y-%m-%d')
+            try:
+                closes = self._fetch_fx_closes(start)
+                breaker.record_success()
+            except Exception as e:
+                breaker.record_failure()
+                self.logger.warning(f"FX history update failed: {e}")
+        if closes is None:
+            self.source_status['fred_fx_history'] = STALE if series else FALLBACK
+            return {'series': series, 'stats': stats}
+        
+        added = 0
+        for pair in FX_STATS_PAIRS:
+            pair_stats, pair_series = stats[pair], series.setdefault(pair, [])
+            for date in sorted(closes.get(pair, {})):
+                if pair_stats.last_date and date <= pair_stats.last_date:
+                    continue
+                pair_stats.update(closes[pair][date], date)
+                pair_series.append([date, round(closes[pair][date], 4)])
+                added += 1
+            series[pair] = pair_series[-keep_days:]
+        
+        self.source_status['fred_fx_history'] = LIVE
+        try:
+            self._save_cache({
+                'series': series,
+                'stats': {pair: pair_stats.to_state() for pair, pair_stats in stats.items()},
+                'timestamp': datetime.now().isoformat()
+            }, 'fx', FX_HISTORY_FILE)
+        except OSError as e:
+            self.logger.warning(f"Could not save FX history: {e}")
+        self.logger.info(f"FX history: {added} new daily closes since {start}")
+        return {'series': series, 'stats': stats}
+    
+    def _fetch_fx_closes(self, start: str) -> Dict[str, Dict[str, float]]:
+        """FRED daily closes from start (inclusive): pair -> {date: close}"""
+        api_key = self.config['api_keys']['fred']
+        if api_key == "YOUR_FRED_API_KEY":
+            raise SourceUnavailable("FRED API key not configured")
+        
+        raw = {}
+        for name, series_id in FX_HISTORY_SERIES.items():
+            params = {
+                'series_id': series_id,
+                'api_key': api_key,
+                'file_type': 'json',
+                'observation_start': start
+            }
+            response = self.session.get("https://api.stlouisfed.org/fred/series/observations",
+                                        params=params, timeout=10)
+            response.raise_for_status()
+            raw[name] = {o['date']: float(o['value'])
+                         for o in response.json().get('observations') or [] if o['value'] != '.'}
+            time.sleep(0.1)
+        
+        usdjpy, eurusd = raw['USD/JPY'], raw['EUR/USD']
+        return {
+            'USD/JPY': usdjpy,
+            'EUR/JPY': {date: usdjpy[date] * eurusd[date] for date in usdjpy.keys() & eurusd.keys()},
+            'DXY': raw['DXY']
+        }
+    
     # ========== E-STAT JAPAN STATISTICS ========== #
     
     def fetch_estat_data(self) -> Dict[str, Any]:
@@ -338,620 +545,369 @@ class DataFetcher:
                 self.logger.info("Using cached e-stat data")
                 return cached_data
         
-        data = {}
-        
-        # 1. Consumer Price Index (Tokyo - earlier indicator)
-        try:
-            cpi_data = self._fetch_estat_dataset('0003427113', 'Tokyo CPI')
-            if cpi_data:
-                data['tokyo_cpi'] = cpi_data
-        except Exception as e:
-            self.logger.error(f"Failed to fetch Tokyo CPI from e-stat: {e}")
-        
-        # 2. Machinery Orders (business investment indicator)
-        try:
-            machinery_data = self._fetch_estat_dataset('0003355266', 'Machinery Orders')
-            if machinery_data:
-                data['machinery_orders'] = machinery_data
-        except Exception as e:
-            self.logger.error(f"Failed to fetch Machinery Orders from e-stat: {e}")
+        app_id = self.config['api_keys'].get('estat')
+        if not app_id:
+            self.logger.warning("No e-stat API key configured")
+            return {'timestamp': datetime.now().isoformat(), 'source': 'e-stat API'}
+        
+        # Indicators are fetched concurrently, each pulling only periods newer than its last pull
+        estat_config = self.config['data'].get('estat', {})
+        client = EStatClient(
+            self.session, app_id,
+            cache_dir=os.path.join(self.cache_dirs['macro'], 'estat'),
+            page_size=estat_config.get('page_size', 10000),
+            keep_values=estat_config.get('keep_values', 120),
+            meta_ttl_days=estat_config.get('meta_ttl_days', 7),
+            max_workers=estat_config.get('max_workers', 4),
+            initial_months=estat_config.get('initial_months', 24)
+        )
+        data, errors = client.fetch_many(estat_config.get('indicators', ESTAT_INDICATORS))
         
         # Add timestamp
         data['timestamp'] = datetime.now().isoformat()
         data['source'] = 'e-stat API'
         
-        # Cache the data
-        if data:
+        # Cache the data (a partial result is retried on the next call)
+        if not errors:
             self._save_cache(data, 'macro', cache_file)
-            self.logger.info(f"Fetched e-stat data with {len(data)} indicators")
+        self.logger.info(f"Fetched e-stat data with {len(data) - 2} indicators")
         
         return data
     
-    def _fetch_estat_dataset(self, stats_data_id: str, dataset_name: str) -> Optional[Dict[str, Any]]:
-        """Fetch specific dataset from e-stat API"""
-        app_id = self.config['api_keys'].get('estat')
-        if not app_id:
-            self.logger.warning("No e-stat API key configured")
-            return None
-        
-        base_url = "http://api.e-stat.go.jp/rest/3.0/app/json/getStatsData"
-        params = {
-            'appId': app_id,
-            'statsDataId': stats_data_id,
-            'limit': 10  # Get latest 10 data points
-        }
-        
-        try:
-            response = self.session.get(base_url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # Check API status
-            if 'GET_STATS_DATA' in result:
-                api_result = result['GET_STATS_DATA'].get('RESULT', {})
-                if api_result.get('STATUS') != 0:
-                    self.logger.error(f"e-stat API error for {dataset_name}: {api_result.get('ERROR_MSG', 'Unknown error')}")
-                    return None
-                
-                # Extract data
-                if 'STATISTICAL_DATA' in result['GET_STATS_DATA']:
-                    stat_data = result['GET_STATS_DATA']['STATISTICAL_DATA']
-                    
-                    # Handle title - can be string or dict
-                    title_field = stat_data.get('TABLE_INF', {}).get('TITLE', dataset_name)
-                    if isinstance(title_field, dict):
-                        title = title_field.get('$', dataset_name)
-                    else:
-                        title = title_field
-                    
-                    dataset_info = {
-                        'name': dataset_name,
-                        'title': title,
-                        'updated': stat_data.get('TABLE_INF', {}).get('UPDATED_DATE', 'N/A'),
-                        'values': []
-                    }
-                    
-                    # Extract actual values
-                    if 'DATA_INF' in stat_data and 'VALUE' in stat_data['DATA_INF']:
-                        values = stat_data['DATA_INF']['VALUE']
-                        # Handle both single value and list of values
-                        if isinstance(values, list):
-                            values_to_process = values
-                        else:
-                            values_to_process = [values]  # Single value, wrap in list
-                        
-                        for value_item in values_to_process:
-                            try:
-                                value_data = {
-                                    'value': float(value_item.get('$', 0)),
-                                    'time': value_item.get('@time', 'N/A'),
-                                    'area': value_item.get('@area', 'N/A'),
-                                    'category': value_item.get('@cat01', 'N/A'),
-                                    'unit': value_item.get('@unit', '')
-                                }
-                                dataset_info['values'].append(value_data)
-                            except (ValueError, KeyError) as e:
-                                continue
-                        
-                        # Get latest value for easy access
-                        if dataset_info['values']:
-                            latest = dataset_info['values'][0]
-                            dataset_info['latest_value'] = latest['value']
-                            dataset_info['latest_time'] = latest['time']
-                    
-                    self.logger.info(f"Fetched {dataset_name}: {len(dataset_info['values'])} values")
-                    return dataset_info
-                else:
-                    self.logger.warning(f"No statistical data found for {dataset_name}")
-                    return None
-            else:
-                self.logger.error(f"Invalid response structure for {dataset_name}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Network error fetching {dataset_name} from e-stat: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error processing {dataset_name} data from e-stat: {e}")
-            return None
-    
     # ========== JAPANESE MARKET DATA SCRAPERS ========== #
     
     def fetch_jgb_curve(self) -> Dict[str, Any]:
         """Scrape full JGB curve from JBOND historical rates"""
-        cache_file = 'jgb_curve.json'
-        
-        # Try cache first
-        cached = self._load_cache('macro', cache_file)
-        if cached:
-            self.logger.info("Using cached JGB curve data")
-            return cached
-        
+        return self._fetch_source('jgb_curve', 'macro', 'jgb_curve.json', self._scrape_jgb_curve)
+    
+    def _scrape_jgb_curve(self) -> Dict[str, Any]:
         url = "https://www.bb.jbts.co.jp/ja/historical/main_rate.html"
+        jgb_data = self.http_cache.get_parsed(url, self._parse_jgb_curve, timeout=15)
+        jgb_data['timestamp'] = datetime.now().isoformat()
+        return jgb_data
+    
+    def _parse_jgb_curve(self, response: requests.Response) -> Dict[str, Any]:
+        soup = BeautifulSoup(response.text, 'html.parser')
         
-        try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the main table with yield data
-            tables = soup.find_all('table')
-            jgb_data = {}
+        # Find the main table with yield data
+        tables = soup.find_all('table')
+        jgb_data = {}
+        
+        # Look for the JGB data table
+        for table in tables:
+            rows = table.find_all('tr')
             
-            # Look for the JGB data table
-            for table in tables:
-                rows = table.find_all('tr')
-                
-                # Table 2 has the data - it has 9 rows with dates
-                if len(rows) >= 7:
-                    # Process each row
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 7:
-                            # Get all cell texts
-                            cell_texts = [cell.get_text(strip=True) for cell in cells]
+            # Table 2 has the data - it has 9 rows with dates
+            if len(rows) >= 7:
+                # Process each row
+                for row in rows:
+                    cells = row.find_all('td')
+                    if len(cells) >= 7:
+                        # Get all cell texts
+                        cell_texts = [cell.get_text(strip=True) for cell in cells]
+                        
+                        # Check if first cell is a 2025 date
+                        if cell_texts[0].startswith('2025/'):
+                            date_str = cell_texts[0]
                             
-                            # Check if first cell is a 2025 date
-                            if cell_texts[0].startswith('2025/'):
-                                date_str = cell_texts[0]
-                                
-                                # Extract all yields: 40Y, 30Y, 20Y, 10Y, 5Y, 2Y, TDB(1Y), TDB(6M), TDB(3M)
-                                yields = cell_texts[1:10] if len(cell_texts) >= 10 else cell_texts[1:]
-                                
-                                # Parse main JGB yields
-                                if len(yields) > 0 and yields[0]:  # 40Y
-                                    try:
-                                        jgb_data['jgb_40y'] = float(yields[0])
-                                    except: pass
-                                if len(yields) > 1 and yields[1]:  # 30Y
-                                    try:
-                                        jgb_data['jgb_30y'] = float(yields[1])
-                                    except: pass
-                                if len(yields) > 2 and yields[2]:  # 20Y
-                                    try:
-                                        jgb_data['jgb_20y'] = float(yields[2])
-                                    except: pass
-                                if len(yields) > 3 and yields[3]:  # 10Y
-                                    try:
-                                        jgb_data['jgb_10y'] = float(yields[3])
-                                    except: pass
-                                if len(yields) > 4 and yields[4]:  # 5Y
-                                    try:
-                                        jgb_data['jgb_5y'] = float(yields[4])
-                                    except: pass
-                                if len(yields) > 5 and yields[5]:  # 2Y
-                                    try:
-                                        jgb_data['jgb_2y'] = float(yields[5])
-                                    except: pass
-                                        
-                                # Parse TDB yields if available
-                                if len(yields) > 6 and yields[6]:  # TDB 1Y
-                                    try:
-                                        jgb_data['tdb_1y'] = float(yields[6])
-                                    except: pass
-                                if len(yields) > 7 and yields[7]:  # TDB 6M
-                                    try:
-                                        jgb_data['tdb_6m'] = float(yields[7])
-                                    except: pass
-                                if len(yields) > 8 and yields[8]:  # TDB 3M
-                                    try:
-                                        jgb_data['tdb_3m'] = float(yields[8])
-                                    except: pass
-                                
-                                if jgb_data:
-                                    jgb_data['data_date'] = date_str
-                                    self.logger.info(f"Parsed JGB data from {date_str}")
-                                    # Don't break - keep going to get the latest date
-                
-                # If we found data, stop
-                if jgb_data:
-                    break
-            
-            if not jgb_data:
-                # Fallback data
-                self.logger.warning("Could not parse JGB data, using fallback")
-                jgb_data = {
-                    'jgb_40y': 3.425,
-                    'jgb_30y': 3.19,
-                    'jgb_20y': 2.63,
-                    'jgb_10y': 1.625,
-                    'jgb_5y': 1.165,
-                    'jgb_2y': 0.875,
-                    'data_date': "2025/09/01",
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                jgb_data['timestamp'] = datetime.now().isoformat()
-            self._save_cache(jgb_data, 'macro', cache_file)
-            return jgb_data
+                            # Extract all yields: 40Y, 30Y, 20Y, 10Y, 5Y, 2Y, TDB(1Y), TDB(6M), TDB(3M)
+                            yields = cell_texts[1:10] if len(cell_texts) >= 10 else cell_texts[1:]
+                            
+                            # Parse main JGB yields
+                            if len(yields) > 0 and yields[0]:  # 40Y
+                                try:
+                                    jgb_data['jgb_40y'] = float(yields[0])
+                                except: pass
+                            if len(yields) > 1 and yields[1]:  # 30Y
+                                try:
+                                    jgb_data['jgb_30y'] = float(yields[1])
+                                except: pass
+                            if len(yields) > 2 and yields[2]:  # 20Y
+                                try:
+                                    jgb_data['jgb_20y'] = float(yields[2])
+                                except: pass
+                            if len(yields) > 3 and yields[3]:  # 10Y
+                                try:
+                                    jgb_data['jgb_10y'] = float(yields[3])
+                                except: pass
+                            if len(yields) > 4 and yields[4]:  # 5Y
+                                try:
+                                    jgb_data['jgb_5y'] = float(yields[4])
+                                except: pass
+                            if len(yields) > 5 and yields[5]:  # 2Y
+                                try:
+                                    jgb_data['jgb_2y'] = float(yields[5])
+                                except: pass
+                                    
+                            # Parse TDB yields if available
+                            if len(yields) > 6 and yields[6]:  # TDB 1Y
+                                try:
+                                    jgb_data['tdb_1y'] = float(yields[6])
+                                except: pass
+                            if len(yields) > 7 and yields[7]:  # TDB 6M
+                                try:
+                                    jgb_data['tdb_6m'] = float(yields[7])
+                                except: pass
+                            if len(yields) > 8 and yields[8]:  # TDB 3M
+                                try:
+                                    jgb_data['tdb_3m'] = float(yields[8])
+                                except: pass
+                            
+                            if jgb_data:
+                                jgb_data['data_date'] = date_str
+                                self.logger.info(f"Parsed JGB data from {date_str}")
+                                # Don't break - keep going to get the latest date
             
-        except Exception as e:
-            self.logger.error(f"Error scraping JGB curve: {e}")
-            # Return fallback data
-            fallback_data = {
-                'jgb_40y': 3.425,
-                'jgb_30y': 3.19,
-                'jgb_20y': 2.63,
-                'jgb_10y': 1.625,
-                'jgb_5y': 1.165,
-                'jgb_2y': 0.875,
-                'data_date': "2025/09/01",
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(fallback_data, 'macro', cache_file)
-            return fallback_data
+            # If we found data, stop
+            if jgb_data:
+                break
+        
+        if not jgb_data:
+            raise SourceUnavailable("Could not parse JGB data")
+        return jgb_data
     
     def fetch_euro_yields(self) -> Dict[str, Any]:
         """Scrape European government bond yields from Investing.com"""
-        cache_file = 'euro_yields.json'
-        
-        # Try cache first
-        cached = self._load_cache('macro', cache_file)
-        if cached:
-            self.logger.info("Using cached European yield data")
-            return cached
-        
+        return self._fetch_source('euro_yields', 'macro', 'euro_yields.json', self._scrape_euro_yields)
+    
+    def _scrape_euro_yields(self) -> Dict[str, Any]:
         url = "https://www.investing.com/rates-bonds/germany-government-bonds"
-        
-        try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            euro_data = {}
-            
-            # Find the main data table with bond yields
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                if len(rows) > 10:  # Main data table has many rows
-                    for row in rows[1:]:  # Skip header row
-                        cells = row.find_all('td')
-                        if len(cells) >= 3:
-                            # Column indices: 0=checkbox, 1=Name, 2=Yield, 3=Prev
-                            name = cells[1].get_text(strip=True) if len(cells) > 1 else ''
-                            yield_text = cells[2].get_text(strip=True) if len(cells) > 2 else ''
-                            
-                            if 'Germany' in name:
-                                # Parse maturity from name (e.g., "Germany 3M" -> "3m")
-                                import re
-                                match = re.search(r'(\d+)(M|Y)', name)
-                                if match:
-                                    value = match.group(1)
-                                    unit = match.group(2).lower()
-                                    maturity = f'{value}{unit}'
-                                    
-                                    try:
-                                        # Clean and convert yield value
-                                        yield_val = float(yield_text.replace('%', '').replace(',', '.'))
-                                        key = f'bund_{maturity}'
-                                        euro_data[key] = yield_val
-                                        self.logger.info(f"Found {key}: {yield_val}%")
-                                    except (ValueError, TypeError):
-                                        continue
-                    break  # Found our table, stop looking
-            
-            if not euro_data:
-                # Fallback data if scraping fails
-                self.logger.warning("Could not parse European yield data, using fallback")
-                euro_data = {
-                    'bund_3m': 1.75,
-                    'bund_6m': 1.92,
-                    'bund_1y': 1.94,
-                    'bund_2y': 2.02,
-                    'bund_3y': 2.06,
-                    'bund_5y': 2.31,
-                    'bund_7y': 2.45,
-                    'bund_10y': 2.71,
-                    'bund_15y': 3.08,
-                    'bund_20y': 3.20,
-                    'bund_30y': 3.30,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                euro_data['timestamp'] = datetime.now().isoformat()
-                self.logger.info(f"Successfully scraped {len(euro_data)-1} European yield points")
-            
-            self._save_cache(euro_data, 'macro', cache_file)
-            return euro_data
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping European yields: {e}")
-            # Return fallback data
-            fallback_data = {
-                'bund_3m': 1.75,
-                'bund_6m': 1.92,
-                'bund_1y': 1.94,
-                'bund_2y': 2.02,
-                'bund_3y': 2.06,
-                'bund_5y': 2.31,
-                'bund_7y': 2.45,
-                'bund_10y': 2.71,
-                'bund_15y': 3.08,
-                'bund_20y': 3.20,
-                'bund_30y': 3.30,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(fallback_data, 'macro', cache_file)
-            return fallback_data
+        euro_data = self.http_cache.get_parsed(url, self._parse_euro_yields, timeout=15)
+        euro_data['timestamp'] = datetime.now().isoformat()
+        self.logger.info(f"Successfully scraped {len(euro_data)-1} European yield points")
+        return euro_data
+    
+    def _parse_euro_yields(self, response: requests.Response) -> Dict[str, Any]:
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        euro_data = {}
+        
+        # Find the main data table with bond yields
+        tables = soup.find_all('table')
+        for table in tables:
+            rows = table.find_all('tr')
+            if len(rows) > 10:  # Main data table has many rows
+                for row in rows[1:]:  # Skip header row
+                    cells = row.find_all('td')
+                    if len(cells) >= 3:
+                        # Column indices: 0=checkbox, 1=Name, 2=Yield, 3=Prev
+                        name = cells[1].get_text(strip=True) if len(cells) > 1 else ''
+                        yield_text = cells[2].get_text(strip=True) if len(cells) > 2 else ''
+                        
+                        if 'Germany' in name:
+                            # Parse maturity from name (e.g., "Germany 3M" -> "3m")
+                            import re
+                            match = re.search(r'(\d+)(M|Y)', name)
+                            if match:
+                                value = match.group(1)
+                                unit = match.group(2).lower()
+                                maturity = f'{value}{unit}'
+                                
+                                try:
+                                    # Clean and convert yield value
+                                    yield_val = float(yield_text.replace('%', '').replace(',', '.'))
+                                    key = f'bund_{maturity}'
+                                    euro_data[key] = yield_val
+                                    self.logger.info(f"Found {key}: {yield_val}%")
+                                except (ValueError, TypeError):
+                                    continue
+                break  # Found our table, stop looking
+        
+        if not euro_data:
+            raise SourceUnavailable("Could not parse European yield data")
+        return euro_data
     
     def fetch_repo_rates(self) -> Dict[str, Any]:
         """Scrape Tokyo repo rates from Tokyo Tanshi"""
-        cache_file = 'repo_rates.json'
+        return self._fetch_source('repo_rates', 'repo', 'repo_rates.json', self._scrape_repo_rates)
+    
+    def _scrape_repo_rates(self) -> Dict[str, Any]:
+        url = "https://www.tokyotanshi.co.jp/market_report/daily_d.html"
+        repo_data = self.http_cache.get_parsed(url, self._parse_repo_rates, timeout=15)
+        repo_data['timestamp'] = datetime.now().isoformat()
+        self.logger.info("Repo data scraped successfully from website")
+        return repo_data
+    
+    def _parse_repo_rates(self, response: requests.Response) -> Dict[str, Any]:
+        soup = BeautifulSoup(response.text, 'html.parser')
         
-        # Try cache first
-        cached = self._load_cache('repo', cache_file)
-        if cached:
-            self.logger.info("Using cached repo rates data")
-            return cached
+        repo_data = {}
         
-        url = "https://www.tokyotanshi.co.jp/market_report/daily_d.html"
+        # Parse repo rates from the well-structured HTML tables
+        tables = soup.find_all('table')
         
-        try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+        for table in tables:
+            rows = table.find_all('tr')
+            if len(rows) < 2:
+                continue
             
-            repo_data = {}
+            # Look for table with Japanese tenor labels
+            table_text = table.get_text()
             
-            # Parse repo rates from the well-structured HTML tables
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                rows = table.find_all('tr')
-                if len(rows) < 2:
-                    continue
-                
-                # Look for table with Japanese tenor labels
-                table_text = table.get_text()
-                
-                if '東京レポ・レート' in table_text:  # Look specifically for Tokyo Repo Rate table
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 2:
-                            continue
-                        
-                        cell_texts = [cell.get_text(strip=True) for cell in cells]
-                        row_label = cell_texts[0] if cell_texts else ""
-                        
-                        # Look for overnight rates (翌日物)
-                        if '翌日物' in row_label:
-                            # Find numeric rate in this row
-                            for cell_text in cell_texts[1:]:
-                                if self._is_numeric_rate(cell_text):
-                                    try:
-                                        rate = float(cell_text)
-                                        if 0.1 <= rate <= 2.0:
-                                            repo_data['gc_on'] = rate
-                                            self.logger.info(f"Found overnight repo rate: {rate}%")
-                                            break
-                                    except (ValueError, TypeError):
-                                        continue
-                        
-                        # Look for 1 week rates (1週間物)
-                        elif '1週間物' in row_label:
-                            for cell_text in cell_texts[1:]:
-                                if self._is_numeric_rate(cell_text):
-                                    try:
-                                        rate = float(cell_text)
-                                        if 0.1 <= rate <= 2.0:
-                                            repo_data['gc_1w'] = rate
-                                            self.logger.info(f"Found 1W repo rate: {rate}%")
-                                            break
-                                    except (ValueError, TypeError):
-                                        continue
-                        
-                        # Look for 1 month rates (1ヶ月物)
-                        elif '1ヶ月物' in row_label:
-                            for cell_text in cell_texts[1:]:
-                                if self._is_numeric_rate(cell_text):
-                                    try:
-                                        rate = float(cell_text)
-                                        if 0.1 <= rate <= 2.0:
-                                            repo_data['gc_1m'] = rate
-                                            self.logger.info(f"Found 1M repo rate: {rate}%")
-                                            break
-                                    except (ValueError, TypeError):
-                                        continue
+            if '東京レポ・レート' in table_text:  # Look specifically for Tokyo Repo Rate table
+                for row in rows:
+                    cells = row.find_all(['td', 'th'])
+                    if len(cells) < 2:
+                        continue
                     
-                    # If we found some rates, we can break
-                    if repo_data:
-                        break
-            
-            # If no data found, use fallback based on user's data
-            if not repo_data:
-                self.logger.warning("Could not parse repo data, using fallback")
-                repo_data = {
-                    'gc_on': 0.45,
-                    'gc_1w': 0.477,
-                    'gc_1m': 0.525,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                repo_data['timestamp'] = datetime.now().isoformat()
-            
-            # Add data freshness warning for scraped repo data
-            if repo_data and not any(k.startswith('gc_') for k in repo_data.keys() if isinstance(repo_data.get(k), float) and repo_data[k] != 0.489):
-                self.logger.warning("Repo data may be using fallback values - website may not have current data")
-            elif repo_data:
-                self.logger.info("Repo data scraped successfully from website")
+                    cell_texts = [cell.get_text(strip=True) for cell in cells]
+                    row_label = cell_texts[0] if cell_texts else ""
+                    
+                    # Look for overnight rates (翌日物)
+                    if '翌日物' in row_label:
+                        # Find numeric rate in this row
+                        for cell_text in cell_texts[1:]:
+                            if self._is_numeric_rate(cell_text):
+                                try:
+                                    rate = float(cell_text)
+                                    if 0.1 <= rate <= 2.0:
+                                        repo_data['gc_on'] = rate
+                                        self.logger.info(f"Found overnight repo rate: {rate}%")
+                                        break
+                                except (ValueError, TypeError):
+                                    continue
+                    
+                    # Look for 1 week rates (1週間物)
+                    elif '1週間物' in row_label:
+                        for cell_text in cell_texts[1:]:
+                            if self._is_numeric_rate(cell_text):
+                                try:
+                                    rate = float(cell_text)
+                                    if 0.1 <= rate <= 2.0:
+                                        repo_data['gc_1w'] = rate
+                                        self.logger.info(f"Found 1W repo rate: {rate}%")
+                                        break
+                                except (ValueError, TypeError):
+                                    continue
+                    
+                    # Look for 1 month rates (1ヶ月物)
+                    elif '1ヶ月物' in row_label:
+                        for cell_text in cell_texts[1:]:
+                            if self._is_numeric_rate(cell_text):
+                                try:
+                                    rate = float(cell_text)
+                                    if 0.1 <= rate <= 2.0:
+                                        repo_data['gc_1m'] = rate
+                                        self.logger.info(f"Found 1M repo rate: {rate}%")
+                                        break
+                                except (ValueError, TypeError):
+                                    continue
                 
-            self._save_cache(repo_data, 'repo', cache_file)
-            return repo_data
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping repo rates: {e}")
-            # Return fallback data
-            fallback_data = {
-                'gc_on': 0.45,
-                'gc_1w': 0.477,
-                'gc_1m': 0.525,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(fallback_data, 'repo', cache_file)
-            return fallback_data
+                # If we found some rates, we can break
+                if repo_data:
+                    break
+        
+        if not repo_data:
+            raise SourceUnavailable("Could not parse repo data - website may not have current data")
+        return repo_data
     
     def fetch_tona_rate(self) -> Dict[str, Any]:
         """Scrape TONA overnight rate from Tokyo Tanshi"""
-        cache_file = 'tona_rate.json'
+        return self._fetch_source('tona', 'repo', 'tona_rate.json', self._scrape_tona_rate)
+    
+    def _scrape_tona_rate(self) -> Dict[str, Any]:
+        url = "https://www.tokyotanshi.co.jp/market_report/market_data/tona/mkinfo.html"
+        tona_data = self.http_cache.get_parsed(url, self._parse_tona_rate, timeout=15)
+        tona_data['timestamp'] = datetime.now().isoformat()
+        return tona_data
+    
+    def _parse_tona_rate(self, response: requests.Response) -> Dict[str, Any]:
+        soup = BeautifulSoup(response.text, 'html.parser')
         
-        # Try cache first
-        cached = self._load_cache('repo', cache_file)
-        if cached:
-            self.logger.info("Using cached TONA rate data")
-            return cached
+        tona_data = {}
         
-        url = "https://www.tokyotanshi.co.jp/market_report/market_data/tona/mkinfo.html"
+        # Look for TONA rate data in text content
+        page_text = soup.get_text()
         
-        try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            tona_data = {}
-            
-            # Look for TONA rate data in text content
-            page_text = soup.get_text()
-            
-            # Look for patterns like "加重平均値 0.477" (Weighted Average Value)
-            import re
-            patterns = [
-                r'加重平均値\s*([0-9]+\.?[0-9]*)',  # Japanese: Weighted Average Value
-                r'weighted average\s*([0-9]+\.?[0-9]*)',  # English
-                r'TONA\s*([0-9]+\.?[0-9]*)',  # Direct TONA reference
-                r'([0-9]+\.?[0-9]*)\s*%',  # Any percentage
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    rate = self._parse_japanese_number(match)
-                    if rate is not None and 0 <= rate < 10:
-                        if 'tona' not in tona_data:
-                            tona_data['tona'] = rate
-                            self.logger.info(f"Found TONA rate: {rate}%")
-                            break
-                if 'tona' in tona_data:
-                    break
-            
-            # Also try table-based parsing as fallback
-            if not tona_data:
-                tables = soup.find_all('table')
-                for table in tables:
-                    table_text = table.get_text()
-                    if 'TONA' in table_text or '無担保コール' in table_text:
-                        rows = table.find_all('tr')
-                        for row in rows:
-                            cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
-                            for cell_text in cells:
-                                rate = self._parse_japanese_number(cell_text.replace('%', ''))
-                                if rate is not None and 0 <= rate < 10:
-                                    tona_data['tona'] = rate
-                                    self.logger.info(f"Found TONA rate from table: {rate}%")
-                                    break
-                            if tona_data:
+        # Look for patterns like "加重平均値 0.477" (Weighted Average Value)
+        import re
+        patterns = [
+            r'加重平均値\s*([0-9]+\.?[0-9]*)',  # Japanese: Weighted Average Value
+            r'weighted average\s*([0-9]+\.?[0-9]*)',  # English
+            r'TONA\s*([0-9]+\.?[0-9]*)',  # Direct TONA reference
+            r'([0-9]+\.?[0-9]*)\s*%',  # Any percentage
+        ]
+        
+        for pattern in patterns:
+            matches = re.findall(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                rate = self._parse_japanese_number(match)
+                if rate is not None and 0 <= rate < 10:
+                    if 'tona' not in tona_data:
+                        tona_data['tona'] = rate
+                        self.logger.info(f"Found TONA rate: {rate}%")
+                        break
+            if 'tona' in tona_data:
+                break
+        
+        # Also try table-based parsing as fallback
+        if not tona_data:
+            tables = soup.find_all('table')
+            for table in tables:
+                table_text = table.get_text()
+                if 'TONA' in table_text or '無担保コール' in table_text:
+                    rows = table.find_all('tr')
+                    for row in rows:
+                        cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
+                        for cell_text in cells:
+                            rate = self._parse_japanese_number(cell_text.replace('%', ''))
+                            if rate is not None and 0 <= rate < 10:
+                                tona_data['tona'] = rate
+                                self.logger.info(f"Found TONA rate from table: {rate}%")
                                 break
-            
-            # If no data found, use fallback
-            if not tona_data:
-                self.logger.warning("Could not parse TONA data, using fallback")
-                tona_data = {
-                    'tona': 0.477,
-                    'tona_high': 0.480,
-                    'tona_low': 0.471,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                tona_data['timestamp'] = datetime.now().isoformat()
-            self._save_cache(tona_data, 'repo', cache_file)
-            return tona_data
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping TONA rate: {e}")
-            # Return fallback data
-            fallback_data = {
-                'tona': 0.477,
-                'tona_high': 0.480,
-                'tona_low': 0.471,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(fallback_data, 'repo', cache_file)
-            return fallback_data
+                        if tona_data:
+                            break
+        
+        if not tona_data:
+            raise SourceUnavailable("Could not parse TONA data")
+        return tona_data
     
     # ========== NEWS SCRAPERS (EXISTING) ========== #
     
     def fetch_boj_news(self) -> List[Dict[str, str]]:
         """Scrape BOJ website for policy news"""
-        cache_file = 'boj_news.json'
-        
-        # Try cache first
-        cached = self._load_cache('news', cache_file)
-        if cached:
-            self.logger.info("Using cached BOJ news")
-            return cached
-        
-        news = []
+        return self._fetch_source('boj_news', 'news', 'boj_news.json', self._scrape_boj_news)
+    
+    def _scrape_boj_news(self) -> List[Dict[str, str]]:
         url = "https://www.boj.or.jp/en/index.htm"
-        
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for news items - BOJ structure may vary
-            news_items = soup.find_all('div', class_='news-item', limit=5)
-            if not news_items:
-                # Try alternative selectors
-                news_items = soup.find_all(['article', 'li'], limit=5)
-            
-            for item in news_items[:3]:  # Get top 3 items
-                title_elem = item.find('h2') or item.find('h3') or item.find('a')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    link = item.find('a')
-                    href = link.get('href', '') if link else ''
-                    if href and not href.startswith('http'):
-                        href = f"https://www.boj.or.jp{href}"
-                    
-                    news.append({
-                        'title': title[:200],  # Limit title length
-                        'link': href,
-                        'source': 'Bank of Japan'
-                    })
-            
-            self.logger.info(f"Scraped {len(news)} BOJ news items")
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping BOJ: {e}")
-            # Use fallback news
-            news = [{
-                'title': 'BOJ Maintains Current Monetary Policy Stance',
-                'link': 'https://www.boj.or.jp/en/',
-                'source': 'Bank of Japan'
-            }]
+        news = self.http_cache.get_parsed(url, self._parse_boj_news, timeout=10)
+        self.logger.info(f"Scraped {len(news)} BOJ news items")
+        return news
+    
+    def _parse_boj_news(self, response: requests.Response) -> List[Dict[str, str]]:
+        news = []
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # Look for news items - BOJ structure may vary
+        news_items = soup.find_all('div', class_='news-item', limit=5)
+        if not news_items:
+            # Try alternative selectors
+            news_items = soup.find_all(['article', 'li'], limit=5)
+        
+        for item in news_items[:3]:  # Get top 3 items
+            title_elem = item.find('h2') or item.find('h3') or item.find('a')
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                link = item.find('a')
+                href = link.get('href', '') if link else ''
+                if href and not href.startswith('http'):
+                    href = f"https://www.boj.or.jp{href}"
+                
+                news.append({
+                    'title': title[:200],  # Limit title length
+                    'link': href,
+                    'source': 'Bank of Japan'
+                })
         
         if not news:
-            # Fallback if no news found
-            news = [{
-                'title': 'BOJ Policy Update - Check Official Website',
-                'link': 'https://www.boj.or.jp/en/',
-                'source': 'Bank of Japan'
-            }]
-        
-        self._save_cache(news, 'news', cache_file)
+            raise SourceUnavailable("No BOJ news items found")
         return news
     
     def fetch_reuters_rss(self) -> List[Dict[str, str]]:
         """Fetch Reuters Japan news via RSS"""
-        cache_file = 'reuters_news.json'
-        
-        # Try cache first
-        cached = self._load_cache('news', cache_file)
-        if cached:
-            self.logger.info("Using cached Reuters news")
-            return cached
-        
+        return self._fetch_source('reuters_news', 'news', 'reuters_news.json', self._fetch_reuters_live)
+    
+    def _fetch_reuters_live(self) -> List[Dict[str, str]]:
         news = []
         # Reuters RSS feeds
         rss_urls = [
@@ -961,124 +917,93 @@ class DataFetcher:
         
         for rss_url in rss_urls:
             try:
-                response = self.session.get(rss_url, timeout=10)
-                response.raise_for_status()
-                
-                root = ET.fromstring(response.content)
-                items = root.findall('.//item')[:3]  # Get top 3 items per feed
-                
-                for item in items:
-                    title = item.find('title')
-                    link = item.find('link')
-                    
-                    if title is not None and link is not None:
-                        title_text = title.text or ""
-                        link_text = link.text or ""
-                        news.append({
-                            'title': title_text[:200],
-                            'link': link_text,
-                            'source': 'Reuters'
-                        })
-                
+                news.extend(self.http_cache.get_parsed(rss_url, self._parse_reuters_feed, timeout=10))
             except Exception as e:
                 self.logger.error(f"Error fetching Reuters RSS: {e}")
         
         if not news:
-            # Fallback news
-            news = [{
-                'title': 'Japan Markets Update - Check Reuters for Latest',
-                'link': 'https://www.reuters.com/markets/asia/',
-                'source': 'Reuters'
-            }]
+            raise SourceUnavailable("No Reuters news items found")
         
         self.logger.info(f"Fetched {len(news)} Reuters news items")
-        self._save_cache(news, 'news', cache_file)
         return news
     
-    def fetch_nikkei_news(self) -> List[Dict[str, str]]:
-        """Scrape Nikkei Asia for Japan economy news"""
-        cache_file = 'nikkei_news.json'
-        
-        # Try cache first
-        cached = self._load_cache('news', cache_file)
-        if cached:
-            self.logger.info("Using cached Nikkei news")
-            return cached
-        
+    def _parse_reuters_feed(self, response: requests.Response) -> List[Dict[str, str]]:
         news = []
-        url = "https://asia.nikkei.com/Economy"
+        root = ET.fromstring(response.content)
+        items = root.findall('.//item')[:3]  # Get top 3 items per feed
         
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+        for item in items:
+            title = item.find('title')
+            link = item.find('link')
             
-            # Look for article elements
-            articles = soup.find_all('article', limit=5)
-            if not articles:
-                articles = soup.find_all('div', class_='story', limit=5)
-            
-            for article in articles[:3]:
-                title_elem = article.find('h2') or article.find('h3') or article.find('a')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    link = article.find('a')
-                    href = link.get('href', '') if link else ''
-                    if href and not href.startswith('http'):
-                        href = f"https://asia.nikkei.com{href}"
-                    
-                    news.append({
-                        'title': title[:200],
-                        'link': href,
-                        'source': 'Nikkei Asia'
-                    })
-            
-            self.logger.info(f"Scraped {len(news)} Nikkei news items")
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping Nikkei: {e}")
-            # Fallback
-            news = [{
-                'title': 'Japan Economy Update - Visit Nikkei Asia',
-                'link': 'https://asia.nikkei.com/Economy',
-                'source': 'Nikkei Asia'
-            }]
+            if title is not None and link is not None:
+                title_text = title.text or ""
+                link_text = link.text or ""
+                entry = {
+                    'title': title_text[:200],
+                    'link': link_text,
+                    'source': 'Reuters'
+                }
+                pub_date = item.findtext('pubDate')
+                if pub_date:
+                    try:
+                        entry['published'] = parsedate_to_datetime(pub_date).isoformat()
+                    except (TypeError, ValueError):
+                        pass
+                news.append(entry)
+        return news
+    
+    def fetch_nikkei_news(self) -> List[Dict[str, str]]:
+        """Scrape Nikkei Asia for Japan economy news"""
+        return self._fetch_source('nikkei_news', 'news', 'nikkei_news.json', self._scrape_nikkei_news)
+    
+    def _scrape_nikkei_news(self) -> List[Dict[str, str]]:
+        url = "https://asia.nikkei.com/Economy"
+        news = self.http_cache.get_parsed(url, self._parse_nikkei_news, timeout=10)
+        self.logger.info(f"Scraped {len(news)} Nikkei news items")
+        return news
+    
+    def _parse_nikkei_news(self, response: requests.Response) -> List[Dict[str, str]]:
+        news = []
+        soup = BeautifulSoup(response.text, 'html.parser')
+        
+        # Look for article elements
+        articles = soup.find_all('article', limit=5)
+        if not articles:
+            articles = soup.find_all('div', class_='story', limit=5)
+        
+        for article in articles[:3]:
+            title_elem = article.find('h2') or article.find('h3') or article.find('a')
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                link = article.find('a')
+                href = link.get('href', '') if link else ''
+                if href and not href.startswith('http'):
+                    href = f"https://asia.nikkei.com{href}"
+                
+                news.append({
+                    'title': title[:200],
+                    'link': href,
+                    'source': 'Nikkei Asia'
+                })
         
         if not news:
-            news = [{
-                'title': 'Latest Japan Economic News',
-                'link': 'https://asia.nikkei.com/Economy',
-                'source': 'Nikkei Asia'
-            }]
-        
-        self._save_cache(news, 'news', cache_file)
+            raise SourceUnavailable("No Nikkei news items found")
         return news
     
     # ========== ALPHA VANTAGE FALLBACK ========== #
     
     def fetch_fx_rates_alpha(self) -> Dict[str, float]:
         """Fallback FX from Alpha Vantage if FRED fails"""
-        rates = {}
-        cache_file = 'alpha_fx_rates.json'
-        
-        # Try cache first
-        cached = self._load_cache('fx', cache_file)
-        if cached:
-            self.logger.info("Using cached Alpha Vantage FX rates")
-            return cached
-        
+        return self._fetch_source('alpha_fx', 'fx', 'alpha_fx_rates.json', self._fetch_fx_rates_alpha_live)
+    
+    def _fetch_fx_rates_alpha_live(self) -> Dict[str, float]:
         api_key = self.config['api_keys']['alpha_vantage']
         if api_key == "YOUR_ALPHA_VANTAGE_API_KEY":
-            # Fallback data for demo
-            self.logger.warning("Using demo FX rates - please configure Alpha Vantage API key")
-            rates = {
-                'USD/JPY': 147.25,
-                'EUR/JPY': 158.90,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache(rates, 'fx', cache_file)
-            return rates
+            raise SourceUnavailable("Alpha Vantage API key not configured")
         
+        rates = {}
+        fallback_keys = set()
         for pair in self.config['data']['fx_pairs']:
             from_currency, to_currency = pair.split('/')
             url = f"https://www.alphavantage.co/query"
@@ -1100,36 +1025,43 @@ class DataFetcher:
                     self.logger.info(f"Fetched {pair}: {rate}")
                 else:
                     self.logger.error(f"Invalid response for {pair}")
-                    # Use fallback
-                    rates[pair] = 147.25 if pair == 'USD/JPY' else 158.90
                     
                 time.sleep(1)  # Rate limiting
                 
             except Exception as e:
                 self.logger.error(f"Error fetching {pair}: {e}")
-                # Use fallback
+            
+            if pair not in rates:
                 rates[pair] = 147.25 if pair == 'USD/JPY' else 158.90
+                fallback_keys.add(pair)
         
+        if len(fallback_keys) == len(self.config['data']['fx_pairs']):
+            raise SourceUnavailable("No Alpha Vantage FX rates could be fetched")
+        
+        self._fallback_keys['alpha_fx'] = fallback_keys
         rates['timestamp'] = datetime.now().isoformat()
-        self._save_cache(rates, 'fx', cache_file)
         return rates
     
     # ========== DATA AGGREGATION METHODS ========== #
     
-    def fetch_morning_brief_data(self) -> Dict[str, Any]:
-        """Fetch all data needed for morning brief"""
+    def fetch_morning_brief_data(self, news_consumer: str = 'morning_brief') -> Dict[str, Any]:
+        """
+        Fetch all data needed for morning brief
+        
+        data['provenance'] tags every fetched value (per section and key) as
+        live, cached, stale or fallback. Headlines are flagged new since
+        news_consumer's last committed run (see commit_news_cursor).
+        """
         self.logger.info("Fetching morning brief data")
         
         data: Dict[str, Any] = {
             'timestamp': datetime.now().isoformat()
         }
+        provenance: Dict[str, Any] = {}
         
         # Fetch market data - use Alpha Vantage for FX
-        try:
-            data['fx'] = self.fetch_fx_rates_alpha()
-        except Exception as e:
-            self.logger.error(f"Failed to fetch Alpha Vantage FX data: {e}")
-            data['fx'] = {'USD/JPY': 147.0, 'EUR/JPY': 163.0}  # Fallback
+        data['fx'], provenance['fx'] = self._fetch_fx_section()
+        data['fx_stats'] = self._fx_stats_section(data['fx'], provenance['fx'])
         
         try:
             yield_data = self.fetch_fred_yields()
@@ -1137,46 +1069,41 @@ class DataFetcher:
             euro_data = self.fetch_euro_yields()
             # Merge yield curves
             data['yields'] = {**yield_data, **jgb_data, **euro_data}
+            provenance['yields'] = self._tag_values(
+                ('fred_yields', yield_data), ('jgb_curve', jgb_data), ('euro_yields', euro_data)
+            )
         except Exception as e:
             self.logger.error(f"Failed to fetch yield data: {e}")
             data['yields'] = {'ust_10y': 4.25, 'jgb_10y': 0.25, 'bund_10y': 2.71}
+            provenance['yields'] = dict.fromkeys(data['yields'], FALLBACK)
+        data['curves'] = self._curve_section(data['yields'], provenance['yields'])
         
-        try:
-            repo_data = self.fetch_repo_rates()
-            tona_data = self.fetch_tona_rate()
-            data['repo'] = {**repo_data, **tona_data}
-        except Exception as e:
-            self.logger.error(f"Failed to fetch repo data: {e}")
-            data['repo'] = {'gc_on': 0.489, 'tona': 0.477}
+        data['repo'], provenance['repo'] = self._fetch_repo_section()
         
         # Fetch macro context
         try:
             data['macro'] = self.fetch_fred_macro()
+            provenance['macro'] = self._tag_values(('fred_macro', data['macro']))
         except Exception as e:
             self.logger.error(f"Failed to fetch macro data: {e}")
             data['macro'] = {'japan_cpi': 106.5, 'japan_gdp': 4231.14}
+            provenance['macro'] = dict.fromkeys(data['macro'], FALLBACK)
         
         
         # Fetch news (limit to recent)
         try:
-            data['news'] = {
-                'boj': self.fetch_boj_news()[:2],
-                'reuters': self.fetch_reuters_rss()[:2], 
-                'nikkei': self.fetch_nikkei_news()[:2]
-            }
+            data['news'], provenance['news'], data['headlines'], data['news_cursor'] = \
+                self._news_section(news_consumer)
         except Exception as e:
             self.logger.error(f"Failed to fetch news: {e}")
             data['news'] = {'boj': [], 'reuters': [], 'nikkei': []}
+            data['headlines'] = []
+            provenance['news'] = dict.fromkeys(data['news'], FALLBACK)
+        
+        data['provenance'] = provenance
         
         # Calculate sentiment
-        try:
-            data['sentiment_score'] = self.calculate_sentiment_score(
-                data.get('fx', {}), 
-                data.get('macro', {})
-            )
-        except Exception as e:
-            self.logger.error(f"Failed to calculate sentiment: {e}")
-            data['sentiment_score'] = 50
+        data['sentiment_score'] = self._sentiment_section(data)
         
         # Add economic calendar data
         try:
@@ -1191,15 +1118,202 @@ class DataFetcher:
                 'high_importance_upcoming': []
             }
         
+        self._log_source_summary()
         self.logger.info("Morning brief data fetch complete")
         return data
     
-    def fetch_weekly_report_data(self) -> Dict[str, Any]:
+    def _fetch_fx_section(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        try:
+            fx_data = self.fetch_fx_rates_alpha()
+            return fx_data, self._tag_values(('alpha_fx', fx_data))
+        except Exception as e:
+            self.logger.error(f"Failed to fetch Alpha Vantage FX data: {e}")
+            fx_data = {'USD/JPY': 147.0, 'EUR/JPY': 163.0}  # Fallback
+            return fx_data, dict.fromkeys(fx_data, FALLBACK)
+    
+    def _fx_stats_section(self, fx_data: Dict[str, Any], tags: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Rolling statistics per pair, with today's live or cached spot scored against the window"""
+        try:
+            stats = self.fetch_fx_history()['stats']
+        except Exception as e:
+            self.logger.warning(f"FX statistics unavailable: {e}")
+            return {}
+        snapshots = {}
+        for pair, pair_stats in stats.items():
+            if not pair_stats.count:
+                continue
+            spot = fx_data.get(pair) if tags.get(pair) in (LIVE, CACHED) else None
+            snapshots[pair] = pair_stats.snapshot(spot if isinstance(spot, (int, float)) else None)
+        return snapshots
+    
+    def _fetch_repo_section(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        try:
+            repo_data = self.fetch_repo_rates()
+            tona_data = self.fetch_tona_rate()
+            return {**repo_data, **tona_data}, self._tag_values(('repo_rates', repo_data), ('tona', tona_data))
+        except Exception as e:
+            self.logger.error(f"Failed to fetch repo data: {e}")
+            repo_data = {'gc_on': 0.489, 'tona': 0.477}
+            return repo_data, dict.fromkeys(repo_data, FALLBACK)
+    
+    def _curve_section(self, yields: Dict[str, Any], tags: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Curve analytics, with changes against the last snapshot from an earlier day
+        
+        Today's live and cached points are added to a short yield history so
+        that tomorrow's run has a previous curve; fallback values never are.
+        Changes against a snapshot older than the last business day are
+        labelled with its date rather than as d/d.
+        """
+        history = self._load_cache('macro', YIELD_HISTORY_FILE, ignore_expiry=True) or {}
+        today = datetime.now().strftime('%Y-%m-%d')
+        earlier = sorted(day for day in history if day < today)
+        previous = history[earlier[-1]] if earlier else None
+        change_label = 'd/d'
+        if earlier and len(pd.bdate_range(earlier[-1], today)) > 2:
+            change_label = f"since {earlier[-1]}"
+        
+        snapshot = {key: value for key, value in yields.items()
+                    if isinstance(value, (int, float)) and tags.get(key) in (LIVE, CACHED)}
+        if snapshot:
+            history[today] = snapshot
+            history = {day: history[day] for day in sorted(history)[-YIELD_HISTORY_DAYS:]}
+            try:
+                self._save_cache(history, 'macro', YIELD_HISTORY_FILE)
+            except OSError as e:
+                self.logger.warning(f"Could not save yield history: {e}")
+        
+        try:
+            return analyze_curves(yields, previous, change_label=change_label)
+        except Exception as e:
+            self.logger.warning(f"Curve analytics failed: {e}")
+            return {}
+    
+    def fetch_yield_history(self, before: Optional[str] = None) -> Dict[str, List[List[Any]]]:
+        """Daily yield snapshots before a date (default today) as series: key -> [[date, value], ...] oldest first"""
+        history = self._load_cache('macro', YIELD_HISTORY_FILE, ignore_expiry=True) or {}
+        before = before or datetime.now().strftime('%Y-%m-%d')
+        series: Dict[str, List[List[Any]]] = {}
+        for day in sorted(day for day in history if day < before):
+            for key, value in history[day].items():
+                series.setdefault(key, []).append([day, value])
+        return series
+    
+    def _news_poller(self, source: str, fetch: Callable[[], List[Dict[str, str]]]) -> Callable[[], List[Dict[str, str]]]:
+        """Wrap a news fetcher for the engine: always a live request, and stale or fallback items count as a failed poll"""
+        def poll():
+            with self.bypass_cache(['news']):
+                items = fetch()
+            if self.source_status.get(source) != LIVE:
+                raise SourceUnavailable(f"no live items ({self.source_status.get(source, 'unknown')})")
+            return items
+        return poll
+    
+    def _news_section(self, consumer: str, per_source: int = 2, max_headlines: int = 12
+                      ) -> Tuple[Dict[str, List], Dict[str, str], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Poll due news sources and read the store
+        
+        Returns the latest items per source, their provenance, the headlines
+        snapshot for the analysts (items new since the consumer's cursor
+        first, flagged 'new', then the most recent others) and the consumer's
+        next cursor. The cursor is not moved here: commit_news_cursor does
+        that once the output has been produced.
+        """
+        poll_status = self.news_engine.poll()
+        
+        news, provenance = {}, {}
+        for name, source in (('boj', 'boj_news'), ('reuters', 'reuters_news'), ('nikkei', 'nikkei_news')):
+            items = self.news_store.latest(per_source, source=source)
+            if not items:
+                news[name], provenance[name] = self._fallback(source)[:per_source], FALLBACK
+                continue
+            news[name] = [{'title': item['title'], 'link': item['link'], 'source': item['source']} for item in items]
+            provenance[name] = {'live': LIVE, 'cached': CACHED}.get(poll_status.get(source), STALE)
+        
+        new_items, cursor = self.news_store.since(self.news_store.cursor(consumer), limit=max_headlines)
+        new_ids = {item['id'] for item in new_items}
+        older = [item for item in self.news_store.latest(max_headlines) if item['id'] not in new_ids]
+        headlines = [
+            {
+                'title': item['title'],
+                'link': item['link'],
+                'source': item['source'],
+                'sources': item['sources'],
+                'published': item['published'],
+                'new': item['id'] in new_ids
+            }
+            for item in (new_items + older)[:max_headlines]
+        ]
+        self.news_store.save()
+        self.logger.info(f"News: {len(new_items)} new headlines for {consumer}, {len(self.news_store)} in store")
+        return news, provenance, headlines, {'consumer': consumer, 'cursor': cursor}
+    
+    def commit_news_cursor(self, data: Dict[str, Any]):
+        """Mark the headlines in data as seen by their consumer, after its brief or report is saved"""
+        pending = data.get('news_cursor')
+        if not pending:
+            return
+        self.news_store.set_cursor(pending['consumer'], pending['cursor'])
+        self.news_store.save()
+    
+    def _sentiment_section(self, data: Dict[str, Any]) -> int:
+        try:
+            return self.calculate_sentiment_score(
+                data.get('fx', {}), 
+                data.get('macro', {}),
+                data.get('fx_stats')
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to calculate sentiment: {e}")
+            return 50
+    
+    def _log_source_summary(self):
+        """One line on where this run's data came from, naming anything not live or cached"""
+        counts = {status: 0 for status in (LIVE, CACHED, STALE, FALLBACK)}
+        degraded = []
+        for source, status in sorted(self.source_status.items()):
+            counts[status] += 1
+            if status in (STALE, FALLBACK):
+                degraded.append(f"{source}={status}")
+        summary = ', '.join(f"{count} {status}" for status, count in counts.items())
+        self.logger.info(f"Data sources: {summary}" + (f" ({', '.join(degraded)})" if degraded else ""))
+    
+    def refresh_morning_brief_data(self, data: Dict[str, Any],
+                                   sources: Iterable[str] = ('fx', 'repo')) -> Dict[str, Any]:
+        """
+        Re-fetch fast-moving sources in pre-fetched morning brief data
+        
+        Used when data was collected ahead of the brief time; the refreshed
+        sources skip their cache so the brief reflects the latest prints.
+        """
+        sections = {
+            'fx': self._fetch_fx_section,
+            'repo': self._fetch_repo_section
+        }
+        refreshed = [source for source in sources if source in sections]
+        unknown = set(sources) - set(refreshed)
+        if unknown:
+            self.logger.warning(f"Cannot refresh unknown sources: {sorted(unknown)}")
+        
+        provenance = data.setdefault('provenance', {})
+        with self.bypass_cache(refreshed):
+            for source in refreshed:
+                data[source], provenance[source] = sections[source]()
+        if 'fx' in refreshed:
+            data['fx_stats'] = self._fx_stats_section(data['fx'], provenance['fx'])
+            data['sentiment_score'] = self._sentiment_section(data)
+        
+        data['refreshed_at'] = datetime.now().isoformat()
+        self.logger.info(f"Refreshed {', '.join(refreshed) or 'no'} sources in pre-fetched data")
+        return data
+    
+    def fetch_weekly_report_data(self, news_consumer: str = 'weekly_report') -> Dict[str, Any]:
         """Fetch comprehensive data for weekly report"""
         self.logger.info("Fetching weekly report data")
         
         # Start with morning brief data and extend it
-        data = self.fetch_morning_brief_data()
+        data = self.fetch_morning_brief_data(news_consumer)
         
         # Add any weekly-specific data here
         # For now, weekly reports can use the same data structure
@@ -1207,8 +1321,8 @@ class DataFetcher:
         self.logger.info("Weekly report data fetch complete")
         return data
     
-    def fetch_all_data(self) -> Dict[str, Any]:
-        """Legacy method for backward compatibility"""
+    def fetch_all_data(self, news_consumer: str = 'weekly_report') -> Dict[str, Any]:
+        """Legacy method for backward compatibility; used by the weekly pipeline"""
         self.logger.info("Starting comprehensive data fetch (legacy format)")
         
         # Maintain old structure for backward compatibility
@@ -1223,7 +1337,7 @@ class DataFetcher:
         }
         
         # Get new structured data
-        new_data = self.fetch_morning_brief_data()
+        new_data = self.fetch_morning_brief_data(news_consumer)
         
         # Add economic calendar data
         try:
@@ -1254,23 +1368,62 @@ class DataFetcher:
             all_data['nikkei_news'] = new_data['news'].get('nikkei', [])
         
         all_data['sentiment_score'] = new_data.get('sentiment_score', 50)
+        all_data['yields'] = new_data.get('yields', {})
+        all_data['curves'] = new_data.get('curves', {})
+        all_data['fx_stats'] = new_data.get('fx_stats', {})
+        all_data['history'] = self.fetch_yield_history()
+        try:
+            all_data['history'].update(self.fetch_fx_history()['series'])
+        except Exception as e:
+            self.logger.warning(f"FX history unavailable: {e}")
+        all_data['provenance'] = new_data.get('provenance', {})
+        all_data['headlines'] = new_data.get('headlines', [])
+        if 'news_cursor' in new_data:
+            all_data['news_cursor'] = new_data['news_cursor']
+        
+        # Keep what this run knew for point-in-time replays (history is rebuilt from its own stores)
+        archive_config = self.config['data'].get('archive', {})
+        if archive_config.get('enabled', True):
+            try:
+                SnapshotArchive(archive_config.get('directory', DEFAULT_ARCHIVE_DIR)).save(
+                    {key: value for key, value in all_data.items() if key not in ('history', 'news_cursor')})
+            except (OSError, TypeError, ValueError) as e:
+                self.logger.warning(f"Could not archive data snapshot: {e}")
         
         self.logger.info("Legacy data fetch complete")
         return all_data
     
     # ========== HELPER METHODS ========== #
     
-    def calculate_sentiment_score(self, fx_data: Any, macro_data: Any) -> int:
-        """Calculate yen sentiment score (0-100)"""
+    def calculate_sentiment_score(self, fx_data: Any, macro_data: Any,
+                                  fx_stats: Optional[Dict[str, Dict[str, Any]]] = None) -> int:
+        """
+        Calculate yen sentiment score (0-100)
+        
+        With rolling statistics for USD/JPY (see fetch_fx_history) the FX
+        factor is the level's z-score against its recent window, plus the
+        depth of any pullback from the window high, so the score tracks the
+        regime rather than fixed levels; without them it falls back to
+        fixed USD/JPY ranges.
+        """
         score = 50  # Neutral baseline
         
         try:
-            # FX momentum (compare to typical ranges)
-            usd_jpy = fx_data.get('usdjpy', fx_data.get('USD/JPY', 147.0))
-            if usd_jpy < 145:
-                score += 10  # Yen strengthening
-            elif usd_jpy > 150:
-                score -= 10  # Yen weakening
+            usdjpy_stats = (fx_stats or {}).get('USD/JPY') or {}
+            zscore = usdjpy_stats.get('zscore')
+            if zscore is not None:
+                # Up to 10 points either way; USD/JPY high for its window = yen weak
+                score -= round(max(-2.0, min(2.0, zscore)) * 5)
+                drawdown = usdjpy_stats.get('drawdown_pct')
+                if drawdown is not None and drawdown <= -3:
+                    score += 5  # Yen rally off the window high
+            else:
+                # FX momentum (compare to typical ranges)
+                usd_jpy = fx_data.get('usdjpy', fx_data.get('USD/JPY', 147.0))
+                if usd_jpy < 145:
+                    score += 10  # Yen strengthening
+                elif usd_jpy > 150:
+                    score -= 10  # Yen weakening
             
             # CPI factor
             cpi = macro_data.get('japan_cpi', 106)
@@ -5,30 +5,40 @@ Loads calendar data from JSON files and calculates recurring events
 All times stored and processed in UTC with proper timezone conversion
 """
 
+import bisect
 import json
 import logging
 import os
+import sys
 import requests
 import yaml
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+
+from .timezones import parse_trading_economics_datetime, utc_to_local_display
 
 # Import the Trading Economics scrapers
 try:
     from ..scrapers.trading_economics_scraper import TradingEconomicsScraper
     from ..scrapers.trading_economics_selenium_scraper import TradingEconomicsSeleniumScraper
+    from ..scrapers.event_classifier import FRED_RULES, EventClassifier
 except ImportError:
     # Fallback for when running as standalone script
     import sys
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
     from scrapers.trading_economics_scraper import TradingEconomicsScraper
     from scrapers.trading_economics_selenium_scraper import TradingEconomicsSeleniumScraper
+    from scrapers.event_classifier import FRED_RULES, EventClassifier
+
+# Importance of FRED releases by category; everything else is 3
+FRED_IMPORTANCE = {'inflation': 5, 'employment': 5, 'growth': 5, 'monetary_policy': 5,
+                   'manufacturing': 4, 'retail': 4, 'housing': 4}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EconomicEvent:
-    """Represents a single economic event"""
+    """Represents a single economic event (immutable, slotted)"""
     date: datetime  # Always stored in UTC
     time_local: str  # Local time display (e.g., "12:00 JST")
     event_name: str
@@ -39,19 +49,42 @@ class EconomicEvent:
     source: str
     description: Optional[str] = None
     
+    # Memoized serialized forms (not part of equality/hash)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Intern low-cardinality strings so large calendars share one copy of each"""
+        for name in ('country', 'currency', 'category', 'source'):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'date': self.date.strftime('%Y-%m-%d'),
-            'time': self.time_local,
-            'event_name': self.event_name,
-            'country': self.country,
-            'currency': self.currency,
-            'importance': self.importance,
-            'category': self.category,
-            'source': self.source,
-            'description': self.description
-        }
+        """Convert to dictionary (memoized - treat the result as read-only)"""
+        cached = self._dict_cache
+        if cached is None:
+            cached = {
+                'date': self.date.strftime('%Y-%m-%d'),
+                'time': self.time_local,
+                'event_name': self.event_name,
+                'country': self.country,
+                'currency': self.currency,
+                'importance': self.importance,
+                'category': self.category,
+                'source': self.source,
+                'description': self.description
+            }
+            object.__setattr__(self, '_dict_cache', cached)
+        return cached
+    
+    def to_json(self) -> str:
+        """Convert to JSON string (memoized)"""
+        cached = self._json_cache
+        if cached is None:
+            cached = json.dumps(self.to_dict(), ensure_ascii=False)
+            object.__setattr__(self, '_json_cache', cached)
+        return cached
 
 
 class EconomicCalendar:
@@ -70,6 +103,8 @@ class EconomicCalendar:
             
         # Cache for loaded data
         self._central_bank_cache = None
+        self._fred_index_cache = None  # (file mtime, index)
+        self.fred_classifier = EventClassifier(FRED_RULES)
         
         # Load config for future API integrations
         self.config_path = config_path
@@ -112,18 +147,8 @@ class EconomicCalendar:
     
     
     def _convert_utc_to_local_display(self, utc_dt: datetime, timezone: str) -> str:
-        """Convert UTC datetime to local time display string"""
-        # This is a simplified conversion - for production, use pytz
-        timezone_offsets = {
-            'JST': 9,  # Japan Standard Time
-            'ET': -5,  # Eastern Time (standard)
-            'CET': 1,  # Central European Time
-            'GMT': 0   # Greenwich Mean Time
-        }
-        
-        offset = timezone_offsets.get(timezone, 0)
-        local_dt = utc_dt + timedelta(hours=offset)
-        return f"{local_dt.strftime('%H:%M')} {timezone}"
+        """Convert UTC datetime to local time display string (DST-aware)"""
+        return utc_to_local_display(utc_dt, timezone)
     
     def get_first_friday(self, year: int, month: int) -> datetime:
         """Calculate first Friday of month (NFP release date) in UTC"""
@@ -232,6 +257,13 @@ class EconomicCalendar:
         
         return events
     
+
+    def _classify_fred_release(self, release_name: str) -> Tuple[str, int, str]:
+        """Category, importance and usual release time of a FRED release"""
+        category = self.fred_classifier.classify(release_name).category
+        time_local = '14:00 ET' if category == 'monetary_policy' else '08:30 ET'
+        return category, FRED_IMPORTANCE.get(category, 3), time_local
+
     def update_fred_calendar(self, months_ahead: int = 6):
         """Fetch and store FRED economic releases calendar"""
         fred_api_key = self.config.get('api_keys', {}).get('fred')
@@ -268,32 +300,7 @@ class EconomicCalendar:
                 release_date = item['date']
                 
                 # Map to our format
-                importance = 3
-                category = 'economic'
-                time_local = '08:30 ET'
-                
-                if 'Consumer Price Index' in release_name or 'CPI' in release_name:
-                    importance = 5
-                    category = 'inflation'
-                elif 'Employment' in release_name or 'Payroll' in release_name:
-                    importance = 5
-                    category = 'employment'
-                elif 'GDP' in release_name or 'Gross Domestic' in release_name:
-                    importance = 5
-                    category = 'growth'
-                elif 'Industrial Production' in release_name:
-                    importance = 4
-                    category = 'manufacturing'
-                elif 'Retail' in release_name:
-                    importance = 4
-                    category = 'retail'
-                elif 'Housing' in release_name or 'Building' in release_name:
-                    importance = 4
-                    category = 'housing'
-                elif 'FOMC' in release_name or 'Federal Funds' in release_name:
-                    importance = 5
-                    category = 'monetary_policy'
-                    time_local = '14:00 ET'
+                category, importance, time_local = self._classify_fred_release(release_name)
                 
                 if release_date not in fred_calendar:
                     fred_calendar[release_date] = []
@@ -306,50 +313,96 @@ class EconomicCalendar:
                     'source': 'FRED'
                 })
             
-            # Save to file
+            # Save pre-indexed (sorted, flattened) so loading needs no re-sorting
             fred_file = os.path.join(self.data_dir, 'fred_economic_releases.json')
             with open(fred_file, 'w') as f:
-                json.dump(fred_calendar, f, indent=2)
+                json.dump(self._build_fred_index(fred_calendar), f, indent=2)
+            self._fred_index_cache = None
             
             self.logger.info(f"Stored {len(fred_calendar)} dates of FRED releases to {fred_file}")
             
         except Exception as e:
             self.logger.error(f"Error updating FRED calendar: {e}")
     
-    def _load_fred_calendar(self) -> Dict[str, Any]:
-        """Load FRED economic releases from JSON file"""
+    @staticmethod
+    def _build_fred_index(fred_calendar: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Build the pre-indexed FRED release format
+        
+        Releases for dates[i] are releases[offsets[i]:offsets[i + 1]]. ISO date
+        strings sort chronologically, so dates can be bisected directly.
+        """
+        dates = sorted(fred_calendar)
+        offsets = [0]
+        releases = []
+        for date_str in dates:
+            releases.extend(fred_calendar[date_str])
+            offsets.append(len(releases))
+        
+        return {
+            'format': 'indexed',
+            'dates': dates,
+            'offsets': offsets,
+            'releases': releases
+        }
+    
+    def _load_fred_index(self) -> Optional[Dict[str, Any]]:
+        """Load FRED economic releases as a sorted date index (cached until the file changes)"""
+        fred_file = os.path.join(self.data_dir, 'fred_economic_releases.json')
         try:
-            fred_file = os.path.join(self.data_dir, 'fred_economic_releases.json')
-            if os.path.exists(fred_file):
-                with open(fred_file, 'r') as f:
-                    return json.load(f)
+            if not os.path.exists(fred_file):
+                return None
+            
+            mtime = os.path.getmtime(fred_file)
+            if self._fred_index_cache is not None and self._fred_index_cache[0] == mtime:
+                return self._fred_index_cache[1]
+            
+            with open(fred_file, 'r') as f:
+                data = json.load(f)
+            
+            # Legacy files map date -> releases; index them on load
+            if data.get('format') != 'indexed':
+                data = self._build_fred_index(data)
+            
+            self._fred_index_cache = (mtime, data)
+            return data
         except Exception as e:
             self.logger.error(f"Error loading FRED calendar: {e}")
-        return {}
+        return None
     
     def get_fred_events(self, start_date: datetime, end_date: datetime) -> List[EconomicEvent]:
         """Get FRED economic events from stored data"""
         events = []
-        fred_data = self._load_fred_calendar()
-        
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime('%Y-%m-%d')
-            if date_str in fred_data:
-                for event_data in fred_data[date_str]:
-                    event = EconomicEvent(
-                        date=current_date,
-                        time_local=event_data['time_local'],
-                        event_name=event_data['release_name'],
-                        country='United States',
-                        currency='USD',
-                        importance=event_data['importance'],
-                        category=event_data['category'],
-                        source='FRED',
-                        description=f"US economic data release: {event_data['release_name']}"
-                    )
-                    events.append(event)
-            current_date += timedelta(days=1)
+        index = self._load_fred_index()
+        if not index or end_date < start_date:
+            return events
+        
+        # Whole days from start_date that still fall on or before end_date
+        first_day = start_date.date()
+        last_day = first_day + timedelta(days=(end_date - start_date).days)
+        
+        dates = index['dates']
+        offsets = index['offsets']
+        releases = index['releases']
+        lo = bisect.bisect_left(dates, first_day.isoformat())
+        hi = bisect.bisect_right(dates, last_day.isoformat())
+        
+        for i in range(lo, hi):
+            # Event keeps start_date's time of day, as with a day-by-day walk
+            event_day = date.fromisoformat(dates[i])
+            event_dt = start_date + timedelta(days=(event_day - first_day).days)
+            for event_data in releases[offsets[i]:offsets[i + 1]]:
+                events.append(EconomicEvent(
+                    date=event_dt,
+                    time_local=event_data['time_local'],
+                    event_name=event_data['release_name'],
+                    country='United States',
+                    currency='USD',
+                    importance=event_data['importance'],
+                    category=event_data['category'],
+                    source='FRED',
+                    description=f"US economic data release: {event_data['release_name']}"
+                ))
         
         return events
     
@@ -502,75 +555,9 @@ class EconomicCalendar:
             return []
     
     def _parse_trading_economics_date(self, date_str: str, time_str: str, timezone_str: str) -> Optional[datetime]:
-        """Parse date from Trading Economics format"""
+        """Parse date from Trading Economics format into naive UTC (DST-aware)"""
         try:
-            # Handle different date formats
-            if 'Today' in date_str:
-                base_date = datetime.now()
-            elif 'Tomorrow' in date_str:
-                base_date = datetime.now() + timedelta(days=1)
-            else:
-                # Parse date string like "Thursday September 11 2025"
-                # Remove day of week and parse the rest
-                parts = date_str.split()
-                if len(parts) >= 3:
-                    # Find month, day, year
-                    month_str = parts[-3] if len(parts) >= 3 else parts[1]
-                    day_str = parts[-2] if len(parts) >= 3 else parts[2]
-                    year_str = parts[-1] if len(parts) >= 3 else "2025"
-                    
-                    # Parse month name to number
-                    month_map = {
-                        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-                        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-                        'September': 9, 'October': 10, 'November': 11, 'December': 12
-                    }
-                    
-                    month_num = month_map.get(month_str, 1)
-                    day_num = int(day_str)
-                    year_num = int(year_str)
-                    
-                    base_date = datetime(year_num, month_num, day_num)
-                else:
-                    # Fallback to current date
-                    base_date = datetime.now()
-            
-            # Parse time if provided
-            if time_str and ':' in time_str:
-                # Parse time like "08:30 AM" or "14:00"
-                time_part = time_str.split()[0]  # Get just the time part
-                if 'AM' in time_str or 'PM' in time_str:
-                    hour, minute = time_part.split(':')
-                    hour = int(hour)
-                    minute = int(minute)
-                    if 'PM' in time_str and hour != 12:
-                        hour += 12
-                    elif 'AM' in time_str and hour == 12:
-                        hour = 0
-                else:
-                    hour, minute = time_part.split(':')
-                    hour = int(hour)
-                    minute = int(minute)
-                
-                event_dt = base_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            else:
-                # Default to 9 AM if no time specified
-                event_dt = base_date.replace(hour=9, minute=0, second=0, microsecond=0)
-            
-            # Convert to UTC based on timezone
-            timezone_offsets = {
-                'ET': -5,   # Eastern Time (EST)
-                'JST': 9,   # Japan Standard Time
-                'CET': 1,   # Central European Time
-                'GMT': 0,   # Greenwich Mean Time
-                'UTC': 0    # UTC
-            }
-            
-            offset_hours = timezone_offsets.get(timezone_str, 0)
-            utc_dt = event_dt - timedelta(hours=offset_hours)
-            
-            return utc_dt
-            
+            return parse_trading_economics_datetime(date_str, time_str, timezone_str)
         except Exception as e:
             self.logger.warning(f"Error parsing date '{date_str}' '{time_str}': {e}")
             return None
@@ -647,6 +634,7 @@ class EconomicCalendar:
         upcoming_events = self.get_upcoming_events(days_ahead)
         recent_events = self.get_recent_events(3)
         
+        # to_dict() is memoized, so events shared between sections serialize once
         return {
             "today": [event.to_dict() for event in today_events],
             "upcoming": [event.to_dict() for event in upcoming_events],
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+e-Stat API client for YenSense AI
+Fetches statistics tables from the e-Stat REST API (v3.0, JSON). Value pages
+are requested without metadata and decoded one VALUE object at a time from
+the response stream, following NEXT_KEY until the table is exhausted. Table
+metadata (TABLE_INF and the CLASS_INF code lists) is cached separately and
+only refreshed every few days. Each table remembers its latest @time so the
+next pull only asks for newer periods; a table with no stored @time is
+pulled from a recent window (initial_months) rather than from its start
+"""
+
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+BASE_URL = "https://api.e-stat.go.jp/rest/3.0/app/json"
+
+# RESULT.STATUS values that are not errors: OK, no matching data, partial data
+OK_STATUSES = (0, 1, 2)
+
+_VALUE_RE = re.compile(r'"VALUE"\s*:\s*')
+_STATUS_RE = re.compile(r'"STATUS"\s*:\s*"?(\d+)')
+_ERROR_MSG_RE = re.compile(r'"ERROR_MSG"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_NEXT_KEY_RE = re.compile(r'"NEXT_KEY"\s*:\s*"?(\d+)')
+_TOTAL_RE = re.compile(r'"TOTAL_NUMBER"\s*:\s*"?(\d+)')
+
+
+class EStatError(Exception):
+    """Raised when the e-Stat API reports an error"""
+    pass
+
+
+def _text(field: Any, default: str = '') -> str:
+    """e-Stat text fields are either a string or {'@no': ..., '$': text}"""
+    if isinstance(field, dict):
+        return field.get('$', default)
+    return default if field is None else str(field)
+
+
+def _as_list(field: Any) -> List[Any]:
+    """e-Stat collapses single-element arrays to the bare element"""
+    if field is None:
+        return []
+    return field if isinstance(field, list) else [field]
+
+
+def iter_stats_values(chunks: Iterable[str], page: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Decode the VALUE objects of a getStatsData JSON response as they arrive
+
+    Only the current object is held in memory. The response header (which
+    precedes DATA_INF) is scanned for STATUS, ERROR_MSG, TOTAL_NUMBER and
+    NEXT_KEY, and those are written into page before the first value is
+    yielded. Raises EStatError for an error status.
+    """
+    chunks = iter(chunks)
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        match = _VALUE_RE.search(buffer)
+        if match:
+            header, buffer = buffer[:match.start()], buffer[match.end():]
+            break
+    else:
+        header, buffer = buffer, ''
+
+    status = _STATUS_RE.search(header)
+    page['status'] = int(status.group(1)) if status else None
+    error_msg = _ERROR_MSG_RE.search(header)
+    page['error_msg'] = json.loads(f'"{error_msg.group(1)}"') if error_msg else ''
+    next_key = _NEXT_KEY_RE.search(header)
+    page['next_key'] = int(next_key.group(1)) if next_key else None
+    total = _TOTAL_RE.search(header)
+    page['total'] = int(total.group(1)) if total else 0
+    if page['status'] not in OK_STATUSES:
+        raise EStatError(f"status {page['status']}: {page['error_msg'] or 'invalid response'}")
+    if not match:
+        return
+
+    decoder = json.JSONDecoder()
+    pos = 0
+    in_array = None
+    while True:
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos == len(buffer):
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            buffer, pos = chunk, 0
+            continue
+        if in_array is None:
+            in_array = buffer[pos] == '['
+            pos += in_array
+            continue
+        if buffer[pos] == ']':
+            return
+        try:
+            value, pos = decoder.raw_decode(buffer, pos)
+        except ValueError:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield value
+        if not in_array:
+            return
+
+
+class EStatClient:
+    """Streaming, paginated and incremental access to e-Stat tables"""
+
+    def __init__(self, session: requests.Session, app_id: str, cache_dir: str = 'data/input/macro/estat',
+                 page_size: int = 10000, keep_values: int = 120, meta_ttl_days: int = 7,
+                 max_workers: int = 4, chunk_size: int = 64 * 1024, initial_months: int = 24):
+        """
+        Args:
+            session: Session used for all requests
+            app_id: e-Stat application ID
+            cache_dir: Directory for the metadata and value caches
+            page_size: Values requested per page (the API allows up to 100000)
+            keep_values: Most recent values kept per table
+            meta_ttl_days: Age after which table metadata is fetched again
+            max_workers: Tables fetched at the same time
+            chunk_size: Bytes read from the response stream at a time
+            initial_months: Periods requested when a table has no stored @time (0 for the whole table)
+        """
+        self.session = session
+        self.app_id = app_id
+        self.cache_dir = cache_dir
+        self.page_size = page_size
+        self.keep_values = keep_values
+        self.meta_ttl = timedelta(days=meta_ttl_days)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.initial_months = initial_months
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ---------- Cache files ---------- #
+
+    def _path(self, kind: str, stats_data_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{kind}_{stats_data_id}.json")
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable e-Stat cache {path}: {e}")
+            return None
+
+    def _write(self, path: str, data: Dict[str, Any]):
+        partial_path = path + '.part'
+        try:
+            with open(partial_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(partial_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not save e-Stat cache {path}: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    # ---------- Metadata ---------- #
+
+    def get_metadata(self, stats_data_id: str) -> Dict[str, Any]:
+        """
+        Table title, update date and code-to-name maps per class (cat01, area, time, ...)
+
+        Served from the metadata cache unless it is older than meta_ttl.
+        """
+        path = self._path('meta', stats_data_id)
+        cached = self._read(path)
+        if cached and datetime.now() - datetime.fromisoformat(cached['fetched_at']) < self.meta_ttl:
+            return cached
+
+        response = self.session.get(f"{BASE_URL}/getMetaInfo",
+                                    params={'appId': self.app_id, 'statsDataId': stats_data_id}, timeout=30)
+        response.raise_for_status()
+        result = response.json().get('GET_META_INFO', {})
+        status = result.get('RESULT', {}).get('STATUS')
+        if status not in OK_STATUSES:
+            raise EStatError(f"status {status}: {result.get('RESULT', {}).get('ERROR_MSG', 'invalid response')}")
+
+        metadata_inf = result.get('METADATA_INF', {})
+        table_inf = metadata_inf.get('TABLE_INF', {})
+        classes = {}
+        for class_obj in _as_list(metadata_inf.get('CLASS_INF', {}).get('CLASS_OBJ')):
+            classes[class_obj.get('@id')] = {
+                'name': class_obj.get('@name', ''),
+                'codes': {item.get('@code'): item.get('@name', '') for item in _as_list(class_obj.get('CLASS'))}
+            }
+        metadata = {
+            'stats_data_id': stats_data_id,
+            'title': _text(table_inf.get('TITLE'), stats_data_id),
+            'stat_name': _text(table_inf.get('STAT_NAME')),
+            'updated': table_inf.get('UPDATED_DATE', 'N/A'),
+            'classes': classes,
+            'fetched_at': datetime.now().isoformat()
+        }
+        self._write(path, metadata)
+        return metadata
+
+    # ---------- Values ---------- #
+
+    def _stream_page(self, params: Dict[str, Any], page: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        response = self.session.get(f"{BASE_URL}/getStatsData", params=params, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            response.encoding = 'utf-8'
+            yield from iter_stats_values(response.iter_content(self.chunk_size, decode_unicode=True), page)
+        finally:
+            response.close()
+
+    def iter_values(self, stats_data_id: str, since_time: Optional[str] = None,
+                    filters: Optional[Dict[str, str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Raw VALUE objects of a table, page by page
+
+        Args:
+            stats_data_id: Table ID
+            since_time: Only periods with a time code at or after this one (cdTimeFrom)
+            filters: Extra getStatsData narrowing parameters, e.g. {'cdCat01': '0001'}
+        """
+        params = {
+            'appId': self.app_id,
+            'statsDataId': stats_data_id,
+            'metaGetFlg': 'N',
+            'cntGetFlg': 'N',
+            'limit': self.page_size,
+            **(filters or {})
+        }
+        if since_time:
+            params['cdTimeFrom'] = since_time
+
+        start = 1
+        while start:
+            page = {}
+            yield from self._stream_page({**params, 'startPosition': start}, page)
+            start = page['next_key']
+
+    def _initial_time_from(self) -> Optional[str]:
+        """cdTimeFrom of a first pull, in the API's yyyymm form; None when initial_months is 0"""
+        if not self.initial_months:
+            return None
+        now = datetime.now()
+        months = now.year * 12 + now.month - 1 - self.initial_months
+        return f"{months // 12:04d}{months % 12 + 1:02d}"
+
+    def _row(self, item: Dict[str, Any], classes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """A VALUE object as a flat row; None for suppressed or missing values ('-', '***', ...)"""
+        try:
+            value = float(item.get('$'))
+        except (TypeError, ValueError):
+            return None
+        category = item.get('@cat01', 'N/A')
+        time_code = item.get('@time', 'N/A')
+        return {
+            'value': value,
+            'time': time_code,
+            'time_name': classes.get('time', {}).get('codes', {}).get(time_code, time_code),
+            'area': item.get('@area', 'N/A'),
+            'category': category,
+            'category_name': classes.get('cat01', {}).get('codes', {}).get(category, category),
+            'unit': item.get('@unit', '')
+        }
+
+    def fetch_dataset(self, stats_data_id: str, name: str,
+                      filters: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Latest values of a table, pulling only periods since the previous pull
+
+        The new rows are merged into the cached ones (a re-published period
+        replaces the old row) and the keep_values most recent are returned,
+        newest first, in the shape _fetch_estat_dataset used to return.
+        """
+        try:
+            metadata = self.get_metadata(stats_data_id)
+        except (requests.exceptions.RequestException, EStatError, ValueError) as e:
+            self.logger.warning(f"e-Stat metadata for {name} unavailable, values will be unlabelled: {e}")
+            metadata = {'title': name, 'updated': 'N/A', 'classes': {}}
+
+        path = self._path('values', stats_data_id)
+        state = self._read(path) or {}
+        if state.get('filters', {}) != (filters or {}):
+            state = {}
+        latest_time = state.get('latest_time')
+
+        rows = {(row['time'], row['area'], row['category']): row for row in state.get('values', [])}
+        fetched = 0
+        # Without a stored @time (first run, changed filters, no cache on CI) only a recent window is pulled
+        since_time = latest_time or self._initial_time_from()
+        for item in self.iter_values(stats_data_id, since_time=since_time, filters=filters):
+            row = self._row(item, metadata['classes'])
+            if row is not None:
+                rows[(row['time'], row['area'], row['category'])] = row
+                fetched += 1
+                if len(rows) > 2 * self.keep_values:
+                    rows = dict(sorted(rows.items(), key=lambda kv: kv[1]['time'], reverse=True)[:self.keep_values])
+
+        values = sorted(rows.values(), key=lambda row: row['time'], reverse=True)[:self.keep_values]
+        if values:
+            latest_time = values[0]['time']
+        self._write(path, {'filters': filters or {}, 'latest_time': latest_time, 'values': values})
+        self.logger.info(f"Fetched {name}: {fetched} new values since {since_time or 'start'}")
+
+        dataset = {
+            'name': name,
+            'title': metadata['title'],
+            'updated': metadata['updated'],
+            'values': values
+        }
+        if values:
+            dataset['latest_value'] = values[0]['value']
+            dataset['latest_time'] = values[0]['time']
+        return dataset
+
+    def fetch_many(self, indicators: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Fetch several tables concurrently
+
+        Args:
+            indicators: key -> {'stats_data_id', 'name', optional 'filters'}
+
+        Returns:
+            (key -> dataset for the tables that succeeded, key -> error message for the rest)
+        """
+        results, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(indicators)))) as executor:
+            futures = {
+                key: executor.submit(self.fetch_dataset, spec['stats_data_id'], spec.get('name', key),
+                                     spec.get('filters'))
+                for key, spec in indicators.items()
+            }
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    errors[key] = str(e)
+                    self.logger.error(f"Failed to fetch {indicators[key].get('name', key)} from e-stat: {e}")
+        return results, errors
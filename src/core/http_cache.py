@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Conditional HTTP fetching for YenSense AI
+Remembers each page's validators (ETag, Last-Modified and a hash of the
+body) together with the result of parsing it. Requests are sent with
+If-None-Match / If-Modified-Since, and when the server answers 304 or the
+body hash is unchanged the previous parsed result is reused without parsing
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+DEFAULT_STORE_PATH = 'data/cache/http_validators.json'
+
+
+class ConditionalHTTPCache:
+    """Per-URL validators and parsed results, persisted to a JSON file"""
+
+    def __init__(self, session: requests.Session, store_path: Optional[str] = None):
+        """
+        Args:
+            session: Session used for all requests
+            store_path: JSON file to persist entries in; None keeps them in memory only
+        """
+        self.session = session
+        self.store_path = store_path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self.not_modified = 0  # 304 responses
+        self.unchanged = 0     # 200 responses with the same body as last time
+        self.parsed = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.store_path or not os.path.exists(self.store_path):
+            return {}
+        try:
+            with open(self.store_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable HTTP validator store {self.store_path}: {e}")
+            return {}
+
+    def _save(self):
+        if not self.store_path:
+            return
+        partial_path = self.store_path + '.part'
+        try:
+            os.makedirs(os.path.dirname(self.store_path) or '.', exist_ok=True)
+            with open(partial_path, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(partial_path, self.store_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not save HTTP validator store: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    def get_parsed(self, url: str, parse: Callable[[requests.Response], Any], **kwargs) -> Any:
+        """
+        GET url and return parse(response), reusing the last result if the page has not changed
+
+        parse must return JSON-serialisable data; if it raises, nothing is
+        stored and the exception propagates. Extra kwargs go to session.get.
+        """
+        key = f"{url}|{parse.__name__}"
+        with self._lock:
+            entry = self._entries.get(key)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.session.get(url, headers=headers, **kwargs)
+        if entry and response.status_code == 304:
+            self.not_modified += 1
+            self.logger.info(f"{url} not modified, reusing parsed result")
+            return copy.deepcopy(entry['result'])
+        response.raise_for_status()
+
+        body_hash = hashlib.sha256(response.text.encode('utf-8')).hexdigest()
+        if entry and entry.get('hash') == body_hash:
+            self.unchanged += 1
+            self.logger.info(f"{url} unchanged, reusing parsed result")
+            result = entry['result']
+        else:
+            result = parse(response)
+            self.parsed += 1
+
+        new_entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'hash': body_hash,
+            'result': result
+        }
+        with self._lock:
+            self._entries[key] = new_entry
+            self._save()
+        return copy.deepcopy(result)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+LLM response cache for YenSense AI
+Chat completion responses stored on disk under a hash of the full request
+(model, messages, token limit), one file per response written atomically,
+so several processes can share the cache. A replayed prompt is answered
+from disk instead of the API
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = 'data/cache/llm'
+
+
+class LLMResponseCache:
+    """Disk cache of chat completion responses keyed by request"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(request: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(request, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, request: Dict[str, Any]) -> Optional[str]:
+        try:
+            with open(self._path(self.key(request)), 'r', encoding='utf-8') as f:
+                content = json.load(f)['content']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return content
+
+    def put(self, request: Dict[str, Any], content: str):
+        path = self._path(self.key(request))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'model': request.get('model'), 'content': content}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+News ingestion for YenSense AI
+Polls news sources concurrently, each on its own interval, into one bounded
+store of headlines keyed by normalized URL (or title). Near-identical
+headlines from different sources are merged, and every item gets a sequence
+number so consumers can ask for only what is new since their last cursor
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_STORE_PATH = 'data/cache/news_store.json'
+
+# Headlines whose word sets overlap at least this much are treated as the same story
+DUPLICATE_SIMILARITY = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_SOURCE_SUFFIX_RE = re.compile(r'\s+[-|–]\s+(reuters|nikkei asia|nikkei|bloomberg|bank of japan)\s*$', re.IGNORECASE)
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has in is it its of on or over says said than that the to was were '
+    'will with after amid into new'.split()
+)
+_TRACKING_PARAMS = ('utm_', 'ref', 'taid', 'mod')
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme/host, drop fragments, tracking parameters and trailing slashes"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith(_TRACKING_PARAMS)]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+def title_words(title: str) -> frozenset:
+    """Content words of a headline, ignoring case, punctuation and a trailing source name"""
+    title = _SOURCE_SUFFIX_RE.sub('', title)
+    return frozenset(w for w in _WORD_RE.findall(title.lower()) if w not in _STOPWORDS)
+
+
+def item_key(title: str, link: str = '') -> str:
+    """Store key: hash of the normalized URL, or of the headline's words when there is no link"""
+    basis = normalize_url(link) if link else ' '.join(sorted(title_words(title)))
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()[:16]
+
+
+class NewsStore:
+    """Bounded, de-duplicated headline store with sequence-number cursors"""
+
+    def __init__(self, path: Optional[str] = None, max_items: int = 500):
+        """
+        Args:
+            path: JSON file to persist the store in; None keeps it in memory only
+            max_items: Oldest items are dropped beyond this
+        """
+        self.path = path
+        self.max_items = max_items
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._items: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()  # key -> item, oldest first
+        self._word_index: Dict[str, set] = {}  # word -> keys of items whose title contains it
+        self._words: Dict[str, frozenset] = {}
+        self._seq = 0
+        self._cursors: Dict[str, int] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable news store {self.path}: {e}")
+            return
+        self._seq = state.get('seq', 0)
+        self._cursors = state.get('cursors', {})
+        for item in state.get('items', []):
+            self._index(item)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            state = {'seq': self._seq, 'cursors': dict(self._cursors), 'items': list(self._items.values())}
+        partial_path = self.path + '.part'
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(partial_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(partial_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not save news store: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    def _index(self, item: Dict[str, Any]):
+        key = item['id']
+        words = title_words(item['title'])
+        self._items[key] = item
+        self._words[key] = words
+        for word in words:
+            self._word_index.setdefault(word, set()).add(key)
+
+    def _evict_oldest(self):
+        key, _ = self._items.popitem(last=False)
+        for word in self._words.pop(key):
+            keys = self._word_index.get(word)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._word_index[word]
+
+    def _find_duplicate(self, words: frozenset) -> Optional[str]:
+        """Key of a stored item whose headline is nearly the same, if any"""
+        if not words:
+            return None
+        overlap: Dict[str, int] = {}
+        for word in words:
+            for key in self._word_index.get(word, ()):
+                overlap[key] = overlap.get(key, 0) + 1
+        for key, shared in overlap.items():
+            union = len(words) + len(self._words[key]) - shared
+            if shared / union >= DUPLICATE_SIMILARITY:
+                return key
+        return None
+
+    def add(self, source: str, entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add a source's scraped entries; returns the ones that were not already known"""
+        added = []
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            for entry in entries:
+                title = (entry.get('title') or '').strip()
+                if not title:
+                    continue
+                link = entry.get('link') or ''
+                key = item_key(title, link)
+                duplicate = key if key in self._items else self._find_duplicate(title_words(title))
+                if duplicate is not None:
+                    sources = self._items[duplicate]['sources']
+                    if source not in sources:
+                        sources.append(source)
+                    continue
+
+                self._seq += 1
+                item = {
+                    'id': key,
+                    'seq': self._seq,
+                    'title': title,
+                    'link': link,
+                    'source': entry.get('source', source),
+                    'sources': [source],
+                    'published': entry.get('published') or now,
+                    'first_seen': now
+                }
+                self._index(item)
+                added.append(item)
+                while len(self._items) > self.max_items:
+                    self._evict_oldest()
+        return added
+
+    def since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Items added after cursor, newest first, and the cursor to pass next time"""
+        with self._lock:
+            items = [dict(item) for item in reversed(self._items.values()) if item['seq'] > cursor]
+            return items[:limit], self._seq
+
+    def latest(self, limit: int = 10, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recently added items, optionally from one source"""
+        with self._lock:
+            items = (item for item in reversed(self._items.values()) if source is None or source in item['sources'])
+            return [dict(item) for _, item in zip(range(limit), items)]
+
+    def cursor(self, consumer: str) -> int:
+        with self._lock:
+            return self._cursors.get(consumer, 0)
+
+    def set_cursor(self, consumer: str, cursor: int):
+        with self._lock:
+            self._cursors[consumer] = cursor
+
+    def __len__(self):
+        return len(self._items)
+
+
+class NewsSource:
+    """A pollable source: fetch() returns [{'title', 'link', 'source', ...}]; raising marks the poll failed"""
+
+    def __init__(self, name: str, fetch: Callable[[], List[Dict[str, Any]]], interval_seconds: float):
+        self.name = name
+        self.fetch = fetch
+        self.interval_seconds = interval_seconds
+        self.last_poll: Optional[float] = None
+        self.last_ok = False
+
+
+class NewsEngine:
+    """Polls due sources concurrently into a NewsStore"""
+
+    def __init__(self, store: NewsStore, clock: Callable[[], float] = time.monotonic):
+        self.store = store
+        self.clock = clock
+        self.sources: Dict[str, NewsSource] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def add_source(self, name: str, fetch: Callable[[], List[Dict[str, Any]]], interval_minutes: float):
+        self.sources[name] = NewsSource(name, fetch, interval_minutes * 60)
+
+    def _due(self, source: NewsSource) -> bool:
+        return source.last_poll is None or self.clock() - source.last_poll >= source.interval_seconds
+
+    def _poll_source(self, source: NewsSource) -> List[Dict[str, Any]]:
+        source.last_poll = self.clock()
+        try:
+            entries = source.fetch()
+        except Exception as e:
+            source.last_ok = False
+            self.logger.warning(f"News source {source.name} failed: {e}")
+            return []
+        source.last_ok = True
+        added = self.store.add(source.name, entries)
+        self.logger.info(f"Polled {source.name}: {len(entries)} items, {len(added)} new")
+        return added
+
+    def poll(self, force: bool = False) -> Dict[str, str]:
+        """
+        Poll every source whose interval has elapsed (all of them with force)
+
+        Returns each source's status for this call: live (polled), cached
+        (not due, store used as is), or failed.
+        """
+        due = [source for source in self.sources.values() if force or self._due(source)]
+        if due:
+            with ThreadPoolExecutor(max_workers=len(due)) as executor:
+                list(executor.map(self._poll_source, due))
+            self.store.save()
+
+        status = {}
+        for name, source in self.sources.items():
+            if source in due:
+                status[name] = 'live' if source.last_ok else 'failed'
+            else:
+                status[name] = 'cached'
+        return status
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Point-in-time data access for YenSense AI
+A DataFetcher that answers as of a past moment from stored data only: the
+archived fetch_all_data snapshot (market data, news, calendar) taken at or
+before that moment, plus the date-indexed stores (FX closes and their
+rolling statistics, yield history) cut off at what had been published by
+then. It never makes a live request, so a replayed run cannot see data from
+after its as-of time
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from .data_fetcher import FX_HISTORY_FILE, FX_STATS_PAIRS, DataFetcher, SourceUnavailable
+from .rolling_stats import RollingStats
+from .snapshot_archive import DEFAULT_ARCHIVE_DIR, SnapshotArchive
+
+# FRED daily FX closes are published after the day they are dated
+FX_PUBLICATION_LAG_DAYS = 1
+
+
+class PointInTimeDataFetcher(DataFetcher):
+    """DataFetcher reading only data available at as_of"""
+
+    def __init__(self, config_path: str = "config.yaml", as_of: Optional[datetime] = None,
+                 archive: Optional[SnapshotArchive] = None):
+        super().__init__(config_path)
+        self.as_of = as_of or datetime.now()
+        archive_config = self.config['data'].get('archive', {})
+        self.archive = archive or SnapshotArchive(archive_config.get('directory', DEFAULT_ARCHIVE_DIR))
+
+    # ---------- No live data ---------- #
+
+    def _fetch_source(self, source, cache_type, cache_file, fetch):
+        raise SourceUnavailable(f"{source} is not available point-in-time (as of {self.as_of:%Y-%m-%d %H:%M})")
+
+    def _fetch_fx_closes(self, start: str) -> Dict[str, Dict[str, float]]:
+        raise SourceUnavailable("FX closes are not fetched point-in-time")
+
+    # ---------- As-of views of the stores ---------- #
+
+    def fetch_fx_history(self) -> Dict[str, Any]:
+        """Stored FX closes published by as_of, with rolling statistics rebuilt over them"""
+        config = self.config['data'].get('fx_history', {})
+        lag = config.get('publication_lag_days', FX_PUBLICATION_LAG_DAYS)
+        cutoff = (self.as_of.date() - timedelta(days=lag)).isoformat()
+        stored = self._load_cache('fx', FX_HISTORY_FILE, ignore_expiry=True) or {}
+
+        series: Dict[str, List[List[Any]]] = {}
+        stats = {}
+        for pair in FX_STATS_PAIRS:
+            series[pair] = [close for close in stored.get('series', {}).get(pair, []) if close[0] <= cutoff]
+            stats[pair] = RollingStats(config.get('window_days', 60), config.get('ewma_lambda', 0.94))
+            for date, close in series[pair]:
+                stats[pair].update(close, date)
+        return {'series': series, 'stats': stats}
+
+    def fetch_all_data(self, news_consumer: str = 'weekly_report') -> Dict[str, Any]:
+        """
+        The newest archived snapshot at or before as_of, with history, FX
+        statistics and the sentiment score recomputed as of that time
+
+        news_consumer is accepted for the DataFetcher signature; replays never move news cursors.
+
+        Raises SourceUnavailable if nothing had been archived by then.
+        """
+        found = self.archive.latest(self.as_of)
+        if found is None:
+            raise SourceUnavailable(f"No archived data at or before {self.as_of:%Y-%m-%d %H:%M}")
+        fetched_at, data = found
+        self.logger.info(f"Replaying data fetched {fetched_at:%Y-%m-%d %H:%M} as of {self.as_of:%Y-%m-%d %H:%M}")
+
+        fx_history = self.fetch_fx_history()
+        data['history'] = self.fetch_yield_history(before=self.as_of.strftime('%Y-%m-%d'))
+        data['history'].update(fx_history['series'])
+        data['fx_stats'] = {pair: pair_stats.snapshot() for pair, pair_stats in fx_history['stats'].items()
+                            if pair_stats.count}
+
+        data['archived_sentiment_score'] = data.get('sentiment_score')
+        data['sentiment_score'] = self.calculate_sentiment_score(
+            data.get('fx_rates', {}), data.get('macro_data', {}), data['fx_stats']
+        )
+        data['as_of'] = self.as_of.isoformat()
+        data['snapshot_time'] = fetched_at.isoformat()
+        return data
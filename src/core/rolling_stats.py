@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Rolling statistics for YenSense AI
+Incremental rolling-window statistics over a daily price series: mean,
+variance and z-score of the level, realized volatility of log returns, a
+RiskMetrics-style EWMA volatility, momentum and drawdown from the rolling
+high. Each new observation is an O(1) update (amortized for the rolling
+high), and the whole state serializes to JSON so stored history never has
+to be replayed
+"""
+
+import math
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+class _WindowMoments:
+    """Mean and variance of the last `window` values (Welford updates with removal)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: float):
+        self.values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self.m2 += delta * (value - self.mean)
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            n = len(self.values)
+            old_mean = self.mean
+            self.mean = (old_mean * (n + 1) - old) / n
+            self.m2 = max(0.0, self.m2 - (old - old_mean) * (old - self.mean))
+
+    @property
+    def variance(self) -> Optional[float]:
+        n = len(self.values)
+        return self.m2 / (n - 1) if n > 1 else None
+
+    def to_state(self) -> Dict[str, Any]:
+        return {'values': list(self.values), 'mean': self.mean, 'm2': self.m2}
+
+    def load_state(self, state: Dict[str, Any]):
+        self.values = deque(state['values'])
+        self.mean, self.m2 = state['mean'], state['m2']
+
+
+class RollingStats:
+    """Rolling statistics of one daily series, updated one observation at a time"""
+
+    def __init__(self, window: int = 60, ewma_lambda: float = 0.94, periods_per_year: int = 252):
+        """
+        Args:
+            window: Observations in the rolling window
+            ewma_lambda: Decay of the EWMA variance of returns (0.94 is the RiskMetrics daily value)
+            periods_per_year: Used to annualize volatilities
+        """
+        self.window = window
+        self.ewma_lambda = ewma_lambda
+        self.periods_per_year = periods_per_year
+        self.levels = _WindowMoments(window)
+        self.returns = _WindowMoments(window)
+        self._peaks: deque = deque()  # (index, value), decreasing values: front is the window high
+        self.ewma_var: Optional[float] = None
+        self.count = 0
+        self.last: Optional[float] = None
+        self.last_date: Optional[str] = None
+
+    def update(self, value: float, date: Optional[str] = None):
+        """Add the next observation"""
+        value = float(value)
+        if self.last is not None and self.last > 0 and value > 0:
+            r = math.log(value / self.last)
+            self.returns.push(r)
+            self.ewma_var = r * r if self.ewma_var is None else (
+                self.ewma_lambda * self.ewma_var + (1 - self.ewma_lambda) * r * r
+            )
+        self.levels.push(value)
+
+        while self._peaks and self._peaks[-1][1] <= value:
+            self._peaks.pop()
+        self._peaks.append((self.count, value))
+        while self._peaks[0][0] <= self.count - self.window:
+            self._peaks.popleft()
+
+        self.count += 1
+        self.last = value
+        self.last_date = date
+
+    # ---------- Statistics ---------- #
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.levels.mean if self.levels.values else None
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.levels.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def zscore(self, value: Optional[float] = None) -> Optional[float]:
+        """Standard deviations of value (default: the last observation) from the window mean"""
+        value = self.last if value is None else value
+        std = self.std
+        if value is None or not std:
+            return None
+        return (value - self.mean) / std
+
+    def drawdown(self, value: Optional[float] = None) -> Optional[float]:
+        """Percent below the window high (0 at or above it)"""
+        value = self.last if value is None else value
+        if value is None or not self._peaks:
+            return None
+        return min(0.0, (value / self._peaks[0][1] - 1) * 100)
+
+    @property
+    def realized_vol(self) -> Optional[float]:
+        """Annualized volatility of the window's log returns, in percent"""
+        variance = self.returns.variance
+        return math.sqrt(variance * self.periods_per_year) * 100 if variance is not None else None
+
+    @property
+    def ewma_vol(self) -> Optional[float]:
+        """Annualized EWMA volatility, in percent"""
+        return math.sqrt(self.ewma_var * self.periods_per_year) * 100 if self.ewma_var is not None else None
+
+    @property
+    def momentum(self) -> Optional[float]:
+        """Percent change over the window"""
+        if len(self.levels.values) < 2:
+            return None
+        return (self.last / self.levels.values[0] - 1) * 100
+
+    def snapshot(self, current: Optional[float] = None) -> Dict[str, Any]:
+        """
+        All statistics as a dict, rounded for prompts and reports
+
+        current (e.g. today's spot, not yet a daily close) is scored against
+        the window without being added to it.
+        """
+        level = self.last if current is None else float(current)
+
+        def rounded(value, digits):
+            return None if value is None else round(value, digits)
+
+        return {
+            'level': rounded(level, 4),
+            'as_of': self.last_date,
+            'observations': len(self.levels.values),
+            'window': self.window,
+            'mean': rounded(self.mean, 4),
+            'std': rounded(self.std, 4),
+            'zscore': rounded(self.zscore(level), 2),
+            'realized_vol_pct': rounded(self.realized_vol, 2),
+            'ewma_vol_pct': rounded(self.ewma_vol, 2),
+            'momentum_pct': rounded(self.momentum, 2),
+            'drawdown_pct': rounded(self.drawdown(level), 2),
+            'window_high': rounded(self._peaks[0][1] if self._peaks else None, 4)
+        }
+
+    # ---------- Persistence ---------- #
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'window': self.window,
+            'ewma_lambda': self.ewma_lambda,
+            'periods_per_year': self.periods_per_year,
+            'levels': self.levels.to_state(),
+            'returns': self.returns.to_state(),
+            'peaks': [list(peak) for peak in self._peaks],
+            'ewma_var': self.ewma_var,
+            'count': self.count,
+            'last': self.last,
+            'last_date': self.last_date
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'RollingStats':
+        stats = cls(state['window'], state['ewma_lambda'], state['periods_per_year'])
+        stats.levels.load_state(state['levels'])
+        stats.returns.load_state(state['returns'])
+        stats._peaks = deque(tuple(peak) for peak in state['peaks'])
+        stats.ewma_var = state['ewma_var']
+        stats.count = state['count']
+        stats.last = state['last']
+        stats.last_date = state['last_date']
+        return stats
+
+
+def regime(snapshot: Dict[str, Any]) -> str:
+    """Where the level sits in its window: 'stretched high', 'stretched low' or 'in range'"""
+    z = snapshot.get('zscore')
+    if z is None:
+        return 'unknown'
+    if z >= 1.5:
+        return 'stretched high'
+    if z <= -1.5:
+        return 'stretched low'
+    return 'in range'
+
+
+def summarize_stats(stats: Dict[str, Dict[str, Any]]) -> List[str]:
+    """One prompt/report line per series snapshot, e.g. 'USD/JPY 148.20: z +1.6 vs 60d mean 146.10, ...'"""
+    lines = []
+    for name, snap in stats.items():
+        if snap.get('zscore') is None:
+            continue
+        window = f"{snap['window']}d"
+        parts = [f"z {snap['zscore']:+.1f} vs {window} mean {snap['mean']:.2f} ({regime(snap)})"]
+        if snap.get('ewma_vol_pct') is not None:
+            vol = f"EWMA vol {snap['ewma_vol_pct']:.1f}%"
+            if snap.get('realized_vol_pct') is not None:
+                vol += f" ({window} realized {snap['realized_vol_pct']:.1f}%)"
+            parts.append(vol)
+        if snap.get('momentum_pct') is not None:
+            parts.append(f"{window} change {snap['momentum_pct']:+.1f}%")
+        if snap.get('drawdown_pct') is not None:
+            parts.append(f"{abs(snap['drawdown_pct']):.1f}% below {window} high" if snap['drawdown_pct'] < 0
+                         else f"at {window} high")
+        lines.append(f"{name} {snap['level']:.2f}: " + ", ".join(parts))
+    return lines
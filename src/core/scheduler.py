@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Job scheduler for YenSense AI
+Sleeps on asyncio timers until each job's exact next firing time in the
+configured timezone (instead of polling every minute) and runs jobs in a
+worker thread pool, so a long weekly report never delays the daily brief.
+A job can have a prepare step (e.g. data collection) that starts a fixed
+lead time before the firing time and hands its result to the job.
+"""
+
+import asyncio
+import logging
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+# Long waits are split so a suspended host or a wall-clock jump is noticed
+# within this many seconds; the final wait always ends at the exact target
+MAX_SLEEP_SECONDS = 300
+
+
+def parse_time(value: str) -> time:
+    """Parse an "HH:MM" config value"""
+    hour, minute = value.strip().split(':')
+    return time(int(hour), int(minute))
+
+
+def next_fire_time(now: datetime, at: time, zone: ZoneInfo, weekday: Optional[int] = None) -> datetime:
+    """
+    Next wall-clock time at `at` in zone strictly after now
+
+    weekday (0 = Monday) restricts firing to one day of the week. A time that
+    falls in a DST gap is moved forward by the gap (02:30 -> 03:30); a repeated
+    time fires on its first occurrence.
+    """
+    local_now = now.astimezone(zone)
+    day = local_now.date()
+    while True:
+        if weekday is None or day.weekday() == weekday:
+            candidate = datetime.combine(day, at, tzinfo=zone)
+            # Round trip through UTC to normalise times inside a DST gap
+            candidate = candidate.astimezone(ZoneInfo('UTC')).astimezone(zone)
+            if candidate > local_now:
+                return candidate
+        day += timedelta(days=1)
+
+
+class ScheduledJob:
+    """
+    A recurring job and its run state
+
+    If prepare is set and lead_seconds > 0, prepare() runs lead_seconds before
+    each firing time and func is called with its result (None if it failed).
+    """
+
+    def __init__(self, name: str, func: Callable[..., object], at: time, weekday: Optional[int] = None,
+                 prepare: Optional[Callable[[], Any]] = None, lead_seconds: float = 0):
+        self.name = name
+        self.func = func
+        self.at = at
+        self.weekday = weekday
+        self.prepare = prepare
+        self.lead_seconds = lead_seconds if prepare is not None else 0
+        self.running = False
+        self.runs = 0
+        self.skipped = 0
+        self.next_run: Optional[datetime] = None
+
+    def describe(self) -> str:
+        day = 'daily' if self.weekday is None else f"{WEEKDAYS[self.weekday]}s"
+        return f"{self.name} ({day} at {self.at.strftime('%H:%M')})"
+
+
+class AsyncScheduler:
+    """Fires jobs at exact wall-clock times and runs them in worker threads"""
+
+    def __init__(self, timezone: ZoneInfo, max_workers: int = 2,
+                 clock: Callable[[], float] = time_module.time):
+        """
+        Args:
+            timezone: Zone that job times are expressed in
+            max_workers: Jobs that may run at once
+            clock: Wall-clock source in epoch seconds (injectable for tests)
+        """
+        self.timezone = timezone
+        self.clock = clock
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='yensense-job')
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.logger = logging.getLogger(__name__)
+        self._tasks: List[asyncio.Task] = []
+        self._job_runs = set()  # Keeps in-flight run tasks referenced
+        self._stopped: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def every_day(self, name: str, at: str, func: Callable[..., object],
+                  prepare: Optional[Callable[[], Any]] = None, lead_minutes: float = 0) -> ScheduledJob:
+        """Run func every day at "HH:MM" local time, after prepare() started lead_minutes earlier"""
+        return self._add(ScheduledJob(name, func, parse_time(at), None, prepare, lead_minutes * 60))
+
+    def every_week(self, name: str, weekday: str, at: str, func: Callable[..., object],
+                   prepare: Optional[Callable[[], Any]] = None, lead_minutes: float = 0) -> ScheduledJob:
+        """Run func once a week on weekday (e.g. "monday") at "HH:MM" local time"""
+        return self._add(ScheduledJob(name, func, parse_time(at), WEEKDAYS.index(weekday.lower()),
+                                      prepare, lead_minutes * 60))
+
+    def _add(self, job: ScheduledJob) -> ScheduledJob:
+        self.jobs[job.name] = job
+        return job
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.clock(), self.timezone)
+
+    async def sleep_until(self, target: datetime):
+        """Sleep until the wall clock reaches target"""
+        while True:
+            remaining = target.timestamp() - self.clock()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, MAX_SLEEP_SECONDS))
+
+    async def prepare_job(self, job: ScheduledJob) -> Any:
+        """Run a job's prepare step in the worker pool; None if it fails"""
+        started = time_module.perf_counter()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, job.prepare)
+            self.logger.info(f"{job.name} prepared in {time_module.perf_counter() - started:.1f}s")
+            return result
+        except Exception as e:
+            self.logger.warning(f"{job.name} prepare step failed, job will run unprepared: {e}")
+            return None
+
+    async def run_job(self, job: ScheduledJob, prepared: Optional[asyncio.Future] = None) -> bool:
+        """
+        Run one job in the worker pool; returns False if it was still running and was skipped
+
+        prepared is the pending prepare_job() result; the job waits for it if
+        data collection overran the lead time.
+        """
+        if job.running:
+            job.skipped += 1
+            self.logger.warning(f"{job.name} is still running, skipping this run")
+            return False
+
+        job.running = True
+        started = time_module.perf_counter()
+        try:
+            args = (await prepared,) if prepared is not None else ()
+            await asyncio.get_running_loop().run_in_executor(self.executor, job.func, *args)
+            self.logger.info(f"{job.name} finished in {time_module.perf_counter() - started:.1f}s")
+        except Exception as e:
+            self.logger.error(f"{job.name} failed: {e}", exc_info=True)
+        finally:
+            job.running = False
+            job.runs += 1
+        return True
+
+    async def _job_loop(self, job: ScheduledJob):
+        while True:
+            job.next_run = next_fire_time(self.now(), job.at, self.timezone, job.weekday)
+            self.logger.info(f"Next {job.name} run: {job.next_run.strftime('%Y-%m-%d %H:%M %Z')}")
+            prepared = None
+            if job.lead_seconds:
+                await self.sleep_until(job.next_run - timedelta(seconds=job.lead_seconds))
+                prepared = asyncio.ensure_future(self.prepare_job(job))
+            await self.sleep_until(job.next_run)
+            # Started as a task so the next occurrence is timed independently of this run
+            task = asyncio.ensure_future(self.run_job(job, prepared))
+            self._job_runs.add(task)
+            task.add_done_callback(self._job_runs.discard)
+
+    async def run(self):
+        """Run all jobs until stop() is called"""
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._job_loop(job)) for job in self.jobs.values()]
+        for job in self.jobs.values():
+            self.logger.info(f"Scheduled {job.describe()} {self.timezone.key}")
+        try:
+            await self._stopped.wait()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stop(self):
+        """Stop the scheduler loop (safe to call from a job thread; running jobs finish in their threads)"""
+        if self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    def shutdown(self, wait: bool = True):
+        """Release the worker pool"""
+        self.executor.shutdown(wait=wait)
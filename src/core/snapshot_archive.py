@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Snapshot archive for YenSense AI
+Append-only store of fetched pipeline data: every fetch_all_data result is
+written as one gzipped JSON file named by the time it was fetched, so the
+data known at any past moment is the newest file at or before it. The file
+names are the index; finding a snapshot never reads the others
+"""
+
+import bisect
+import gzip
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_ARCHIVE_DIR = 'data/archive'
+
+_NAME_FORMAT = 'snapshot_%Y%m%dT%H%M%S.json.gz'
+
+
+class SnapshotArchive:
+    """Fetched data by fetch time, for point-in-time reads"""
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR):
+        self.directory = directory
+        self.logger = logging.getLogger(__name__)
+
+    def save(self, data: Dict[str, Any], fetched_at: Optional[datetime] = None) -> str:
+        """Write a snapshot (atomically, so concurrent readers never see a partial file)"""
+        fetched_at = fetched_at or datetime.now()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, fetched_at.strftime(_NAME_FORMAT))
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(data, default=str).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def timestamps(self) -> List[datetime]:
+        """Fetch times of all snapshots, oldest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        times = []
+        for name in os.listdir(self.directory):
+            try:
+                times.append(datetime.strptime(name, _NAME_FORMAT))
+            except ValueError:
+                continue
+        return sorted(times)
+
+    def latest(self, as_of: datetime) -> Optional[Tuple[datetime, Dict[str, Any]]]:
+        """The newest snapshot fetched at or before as_of, with its fetch time"""
+        times = self.timestamps()
+        index = bisect.bisect_right(times, as_of)
+        while index > 0:
+            index -= 1
+            fetched_at = times[index]
+            try:
+                return fetched_at, self.load(fetched_at)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Skipping unreadable snapshot from {fetched_at}: {e}")
+        return None
+
+    def load(self, fetched_at: datetime) -> Dict[str, Any]:
+        with gzip.open(os.path.join(self.directory, fetched_at.strftime(_NAME_FORMAT)), 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Time series preparation for YenSense AI charts
+Vectorized helpers that turn stored [[date, value], ...] series into NumPy
+arrays, align them on common dates, compute rolling bands, and downsample
+long series with Largest-Triangle-Three-Buckets (LTTB), which keeps a line's
+visual shape (peaks, troughs, breaks) with a fraction of its points
+"""
+
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def to_arrays(series: Sequence[Sequence[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dates (datetime64[D]) and values (float) of a [[date, value], ...] series
+
+    Sorted by date; non-numeric values are dropped and a repeated date keeps
+    its last value.
+    """
+    if not series:
+        return np.array([], dtype='datetime64[D]'), np.array([], dtype=float)
+    dates = np.array([str(point[0])[:10] for point in series], dtype='datetime64[D]')
+    values = np.array([point[1] if isinstance(point[1], (int, float)) else np.nan for point in series], dtype=float)
+    keep = ~np.isnan(values)
+    dates, values = dates[keep], values[keep]
+
+    order = np.argsort(dates, kind='stable')
+    dates, values = dates[order], values[order]
+    last = np.append(dates[1:] != dates[:-1], True)
+    return dates[last], values[last]
+
+
+def align(*series: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """Common dates of several (dates, values) pairs and each one's values on them"""
+    common = series[0][0]
+    for dates, _ in series[1:]:
+        common = np.intersect1d(common, dates, assume_unique=True)
+    return common, [values[np.searchsorted(dates, common)] for dates, values in series]
+
+
+def rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and sample standard deviation, NaN until the window is full"""
+    mean = np.full(values.shape, np.nan)
+    std = np.full(values.shape, np.nan)
+    if window < 2 or len(values) < window:
+        return mean, std
+    windows = sliding_window_view(values, window)
+    mean[window - 1:] = windows.mean(axis=1)
+    std[window - 1:] = windows.std(axis=1, ddof=1)
+    return mean, std
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the points LTTB keeps to draw y against x with threshold points
+
+    The first and last points are always kept; between them each bucket
+    contributes the point forming the largest triangle with the previously
+    kept point and the next bucket's average. Returns every index when the
+    series is already short enough.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)  # threshold - 2 buckets over the inner points
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
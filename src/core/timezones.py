@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Timezone handling for YenSense AI
+Maps the short zone labels used across the calendar (JST, ET, CET, ...) to
+IANA zones via zoneinfo, so conversions follow daylight saving time, and
+provides a precompiled parser for Trading Economics date/time strings
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+
+# Short labels used in calendar data -> IANA zone names
+ZONE_NAMES = {
+    'JST': 'Asia/Tokyo',
+    'ET': 'America/New_York',
+    'CET': 'Europe/Berlin',
+    'GMT': 'UTC',
+    'UTC': 'UTC'
+}
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# "Thursday September 11 2025", "Sep 11 2025", "September 11, 2025"
+_DATE_RE = re.compile(
+    r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2}),?\s+(\d{4})\b',
+    re.IGNORECASE
+)
+
+# "08:30 AM", "8:30PM", "14:00"
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*([AP]M)?', re.IGNORECASE)
+
+DEFAULT_EVENT_HOUR = 9  # Events without a listed time are placed at 09:00 local
+
+
+@lru_cache(maxsize=None)
+def get_zone(label: str) -> ZoneInfo:
+    """Get the (cached) ZoneInfo for a short label or IANA name; unknown labels map to UTC"""
+    name = ZONE_NAMES.get(label, label)
+    try:
+        return ZoneInfo(name)
+    except (ValueError, KeyError, OSError):
+        return ZoneInfo('UTC')
+
+
+@lru_cache(maxsize=8192)
+def _utc_offset(label: str, local_hour: datetime) -> timedelta:
+    """UTC offset of the labelled zone at a local wall-clock hour (DST changes on the hour)"""
+    return local_hour.replace(tzinfo=get_zone(label)).utcoffset()
+
+
+def local_to_utc(local_dt: datetime, label: str) -> datetime:
+    """Convert a naive wall-clock time in the labelled zone to naive UTC"""
+    local_hour = local_dt.replace(minute=0, second=0, microsecond=0)
+    return local_dt - _utc_offset(label, local_hour)
+
+
+def utc_to_local(utc_dt: datetime, label: str) -> datetime:
+    """Convert a naive (or aware) UTC datetime to naive wall-clock time in the labelled zone"""
+    if utc_dt.tzinfo is None:
+        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
+    return utc_dt.astimezone(get_zone(label)).replace(tzinfo=None)
+
+
+def utc_to_local_display(utc_dt: datetime, label: str) -> str:
+    """Format a UTC datetime as local time display, e.g. "08:30 ET\""""
+    return f"{utc_to_local(utc_dt, label).strftime('%H:%M')} {label}"
+
+
+def parse_event_date(date_str: str, label: str = 'UTC', now: Optional[datetime] = None) -> date:
+    """
+    Parse a Trading Economics date header
+
+    "Today"/"Tomorrow" are resolved against the current date in the labelled
+    zone. Raises ValueError if no date can be found.
+    """
+    lowered = date_str.lower()
+    if 'today' in lowered or 'tomorrow' in lowered:
+        if now is None:
+            now = datetime.now(timezone.utc)
+        elif now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        today = now.astimezone(get_zone(label)).date()
+        return today + timedelta(days=1) if 'tomorrow' in lowered else today
+
+    return _parse_date_header(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_header(date_str: str) -> date:
+    """Parse an absolute date header (cached - a scrape repeats each header per row)"""
+    match = _DATE_RE.search(date_str)
+    if not match:
+        raise ValueError(f"Unrecognized date: {date_str!r}")
+    month, day, year = match.groups()
+    return date(int(year), _MONTHS[month[:3].lower()], int(day))
+
+
+@lru_cache(maxsize=4096)
+def parse_event_time(time_str: str) -> Optional[Tuple[int, int]]:
+    """Parse "08:30 AM" / "14:00" into (hour, minute); None if no time is listed"""
+    if not time_str:
+        return None
+    match = _TIME_RE.search(time_str)
+    if not match:
+        return None
+
+    hour, minute = int(match.group(1)), int(match.group(2))
+    meridiem = (match.group(3) or '').upper()
+    if meridiem == 'PM' and hour != 12:
+        hour += 12
+    elif meridiem == 'AM' and hour == 12:
+        hour = 0
+    return hour, minute
+
+
+def parse_trading_economics_datetime(date_str: str, time_str: str, label: str = 'UTC',
+                                     now: Optional[datetime] = None) -> datetime:
+    """
+    Parse a Trading Economics date header and time cell into naive UTC
+
+    The wall-clock time is interpreted in the labelled zone (DST-aware).
+    Raises ValueError if the date cannot be parsed.
+    """
+    event_date = parse_event_date(date_str, label, now)
+    hour_minute = parse_event_time(time_str)
+    hour, minute = hour_minute if hour_minute else (DEFAULT_EVENT_HOUR, 0)
+
+    local_dt = datetime(event_date.year, event_date.month, event_date.day, hour, minute)
+    return local_to_utc(local_dt, label)
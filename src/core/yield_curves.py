@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Yield curve analytics for YenSense AI
+Turns the merged yields dict (ust_*, jgb_*, tdb_*, bund_* keys, in percent)
+into tenor arrays per market, interpolates each curve onto a common tenor
+grid (linear, or monotone cubic so no spurious humps appear between quoted
+points) and computes cross-market spreads, slopes, butterflies and
+day-over-day changes for all markets in one batched NumPy pass. Everything
+derived is in basis points
+"""
+
+import re
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+MARKETS = ('ust', 'bund', 'jgb')
+MARKET_NAMES = {'ust': 'UST', 'bund': 'Bund', 'jgb': 'JGB'}
+
+# Treasury discount bills complete the JGB curve at the short end
+KEY_PREFIXES = {'ust': 'ust', 'bund': 'bund', 'jgb': 'jgb', 'tdb': 'jgb'}
+
+GRID = ('3m', '6m', '1y', '2y', '3y', '5y', '7y', '10y', '20y', '30y')
+SLOPES = {'2s10s': ('2y', '10y'), '5s30s': ('5y', '30y')}
+BUTTERFLIES = {'2s5s10s': ('2y', '5y', '10y'), '5s10s30s': ('5y', '10y', '30y')}
+SPREADS = tuple(combinations(MARKETS, 2))  # (ust, bund), (ust, jgb), (bund, jgb): first minus second
+
+_KEY_RE = re.compile(r'^([a-z]+)_(\d+)([my])$')
+
+
+def tenor_years(label: str) -> float:
+    """'3m' -> 0.25, '10y' -> 10.0"""
+    number, unit = int(label[:-1]), label[-1]
+    return number / 12 if unit == 'm' else float(number)
+
+
+GRID_YEARS = np.array([tenor_years(label) for label in GRID])
+_GRID_INDEX = {label: i for i, label in enumerate(GRID)}
+
+
+def curve_points(yields: Dict[str, Any]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Per market, tenors in years and yields in percent, sorted by tenor
+
+    Non-numeric entries (timestamps, data_date) are ignored. A jgb_ point
+    wins over a tdb_ point at the same tenor.
+    """
+    points: Dict[str, Dict[float, float]] = {market: {} for market in MARKETS}
+    for key, value in yields.items():
+        match = _KEY_RE.match(key)
+        if not match or match.group(1) not in KEY_PREFIXES or isinstance(value, bool):
+            continue
+        try:
+            rate = float(value)
+        except (TypeError, ValueError):
+            continue
+        market = KEY_PREFIXES[match.group(1)]
+        tenor = tenor_years(match.group(2) + match.group(3))
+        if match.group(1) == market or tenor not in points[market]:
+            points[market][tenor] = rate
+
+    curves = {}
+    for market, market_points in points.items():
+        if market_points:
+            tenors = np.array(sorted(market_points))
+            curves[market] = (tenors, np.array([market_points[t] for t in tenors]))
+    return curves
+
+
+def _pchip_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Fritsch-Carlson derivatives at the knots, which keep the interpolant monotone between them"""
+    h = np.diff(x)
+    delta = np.diff(y) / h
+    if len(x) == 2:
+        return np.array([delta[0], delta[0]])
+
+    d = np.zeros_like(y)
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+    d[1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    def edge(h0, h1, m0, m1):
+        slope = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+        if np.sign(slope) != np.sign(m0):
+            return 0.0
+        if np.sign(m0) != np.sign(m1) and abs(slope) > abs(3 * m0):
+            return 3 * m0
+        return slope
+
+    d[0] = edge(h[0], h[1], delta[0], delta[1])
+    d[-1] = edge(h[-1], h[-2], delta[-1], delta[-2])
+    return d
+
+
+def interpolate(tenors: np.ndarray, rates: np.ndarray, grid: np.ndarray = GRID_YEARS,
+                method: str = 'pchip') -> np.ndarray:
+    """
+    Curve values at the grid tenors; NaN outside the quoted range (no extrapolation)
+
+    Args:
+        method: 'linear' or 'pchip' (monotone piecewise cubic Hermite)
+    """
+    result = np.full(grid.shape, np.nan)
+    if len(tenors) == 0:
+        return result
+    inside = (grid >= tenors[0]) & (grid <= tenors[-1])
+    if len(tenors) == 1 or method == 'linear':
+        result[inside] = np.interp(grid[inside], tenors, rates)
+        return result
+    if method != 'pchip':
+        raise ValueError(f"Unknown interpolation method: {method}")
+
+    d = _pchip_slopes(tenors, rates)
+    g = grid[inside]
+    i = np.clip(np.searchsorted(tenors, g, side='right') - 1, 0, len(tenors) - 2)
+    h = tenors[i + 1] - tenors[i]
+    t = (g - tenors[i]) / h
+    t2, t3 = t * t, t * t * t
+    result[inside] = ((2 * t3 - 3 * t2 + 1) * rates[i] + (t3 - 2 * t2 + t) * h * d[i]
+                      + (-2 * t3 + 3 * t2) * rates[i + 1] + (t3 - t2) * h * d[i + 1])
+    return result
+
+
+def curve_matrix(yields: Dict[str, Any], method: str = 'pchip') -> np.ndarray:
+    """Markets x grid array of interpolated yields (percent), NaN where a curve has no data"""
+    curves = curve_points(yields)
+    matrix = np.full((len(MARKETS), len(GRID)), np.nan)
+    for row, market in enumerate(MARKETS):
+        if market in curves:
+            matrix[row] = interpolate(*curves[market], method=method)
+    return matrix
+
+
+def _metrics(curves: np.ndarray) -> Dict[str, np.ndarray]:
+    """Spreads, slopes and butterflies in bp for a stack of days x markets x grid curves"""
+    first = [MARKETS.index(a) for a, _ in SPREADS]
+    second = [MARKETS.index(b) for _, b in SPREADS]
+    short = [_GRID_INDEX[a] for a, _ in SLOPES.values()]
+    long = [_GRID_INDEX[b] for _, b in SLOPES.values()]
+    wings_short, bellies, wings_long = ([_GRID_INDEX[legs[i]] for legs in BUTTERFLIES.values()] for i in range(3))
+    return {
+        'spreads': (curves[:, first, :] - curves[:, second, :]) * 100,
+        'slopes': (curves[:, :, long] - curves[:, :, short]) * 100,
+        'butterflies': (2 * curves[:, :, bellies] - curves[:, :, wings_short] - curves[:, :, wings_long]) * 100
+    }
+
+
+def _table(array: np.ndarray, rows: List[str], columns: List[str], decimals: int) -> Dict[str, Dict[str, Any]]:
+    """2-D array as {row: {column: value}}, NaN as None, rows with no values dropped"""
+    table = {}
+    for row, values in zip(rows, array):
+        if np.isnan(values).all():
+            continue
+        table[row] = {
+            column: (None if np.isnan(v) else round(float(v), decimals)) for column, v in zip(columns, values)
+        }
+    return table
+
+
+def _tables(levels: np.ndarray, metrics: Dict[str, np.ndarray], level_decimals: int) -> Dict[str, Any]:
+    return {
+        'levels': _table(levels, list(MARKETS), list(GRID), level_decimals),
+        'spreads': _table(metrics['spreads'], [f"{a}_{b}" for a, b in SPREADS], list(GRID), 1),
+        'slopes': _table(metrics['slopes'], list(MARKETS), list(SLOPES), 1),
+        'butterflies': _table(metrics['butterflies'], list(MARKETS), list(BUTTERFLIES), 1)
+    }
+
+
+def analyze_curves(yields: Dict[str, Any], previous: Optional[Dict[str, Any]] = None,
+                   method: str = 'pchip', change_label: str = 'd/d') -> Dict[str, Any]:
+    """
+    Curve analytics for today's yields, with changes against previous if given
+
+    Returns a JSON-serialisable dict: 'levels' (percent on the grid), and in
+    bp 'spreads' (e.g. ust_jgb), 'slopes' (2s10s, 5s30s) and 'butterflies'
+    (2 x belly - wings) per market; 'changes' holds today minus previous for
+    each of these, and 'change_label' what they span ('d/d' unless the
+    previous curve is older than the last business day).
+    """
+    days = [yields] if previous is None else [yields, previous]
+    curves = np.stack([curve_matrix(day, method) for day in days])
+    metrics = _metrics(curves)
+
+    analytics = {'method': method, 'grid': list(GRID),
+                 **_tables(curves[0], {name: values[0] for name, values in metrics.items()}, 3)}
+    if previous is not None:
+        analytics['changes'] = _tables((curves[0] - curves[1]) * 100,
+                                       {name: values[0] - values[1] for name, values in metrics.items()}, 1)
+        analytics['change_label'] = change_label
+    return analytics
+
+
+def _bp(value: Optional[float], change: Optional[float] = None, label: str = 'd/d') -> str:
+    text = f"{value:+.1f}bp"
+    if change is not None:
+        text += f" ({change:+.1f}bp {label})"
+    return text
+
+
+def summarize_curves(analytics: Dict[str, Any], tenors: Tuple[str, ...] = ('2y', '10y', '30y')) -> List[str]:
+    """Prompt/report lines for the headline spreads, slopes, butterflies and 10Y moves"""
+    changes = analytics.get('changes', {})
+    label = analytics.get('change_label', 'd/d')
+
+    def lookup(section, row, column):
+        value = analytics.get(section, {}).get(row, {}).get(column)
+        change = changes.get(section, {}).get(row, {}).get(column)
+        return value, change
+
+    lines = []
+    for a, b in SPREADS:
+        name = f"{a}_{b}"
+        parts = []
+        for tenor in tenors:
+            value, change = lookup('spreads', name, tenor)
+            if value is not None:
+                parts.append(f"{tenor.upper()} {_bp(value, change, label)}")
+        if parts:
+            lines.append(f"{MARKET_NAMES[a]}-{MARKET_NAMES[b]} spread: " + ", ".join(parts))
+    for market in MARKETS:
+        parts = []
+        for section, names in (('slopes', SLOPES), ('butterflies', BUTTERFLIES)):
+            for name in names:
+                value, change = lookup(section, market, name)
+                if value is not None:
+                    parts.append(f"{name} {_bp(value, change, label)}")
+        if parts:
+            lines.append(f"{MARKET_NAMES[market]} curve: " + ", ".join(parts))
+    moves = [
+        f"{MARKET_NAMES[market]} {change:+.1f}bp"
+        for market in MARKETS
+        for change in [changes.get('levels', {}).get(market, {}).get('10y')]
+        if change is not None
+    ]
+    if moves:
+        lines.append(f"10Y moves {label}: " + ", ".join(moves))
+    return lines
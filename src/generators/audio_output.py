@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Audio output profiles for YenSense AI
+Encodes the master brief MP3 into smaller variants (mobile MP3, Opus/OGG for
+the web) with a single ffmpeg decode pass, and writes chapter metadata
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Default output profiles; overridable via output.audio.profiles in config.yaml
+DEFAULT_PROFILES = {
+    'mobile': {'format': 'mp3', 'bitrate': '24k', 'channels': 1, 'sample_rate': 22050},
+    'web': {'format': 'ogg', 'codec': 'libopus', 'bitrate': '16k', 'channels': 1}
+}
+
+_DEFAULT_CODECS = {'mp3': 'libmp3lame', 'ogg': 'libopus', 'opus': 'libopus'}
+
+
+def _encoder_args(profile: Dict[str, Any]) -> List[str]:
+    """ffmpeg output options for one profile"""
+    audio_format = profile.get('format', 'mp3')
+    codec = profile.get('codec', _DEFAULT_CODECS.get(audio_format, 'libmp3lame'))
+
+    args = ['-map', '0:a', '-c:a', codec, '-b:a', str(profile.get('bitrate', '32k'))]
+    if profile.get('channels'):
+        args += ['-ac', str(profile['channels'])]
+    if profile.get('sample_rate'):
+        args += ['-ar', str(profile['sample_rate'])]
+    if codec == 'libopus':
+        args += ['-application', 'voip']  # Tuned for speech
+    return args + ['-f', audio_format]
+
+
+def encode_profiles(master_path: str, profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+                    ffmpeg: Optional[str] = None) -> Dict[str, str]:
+    """
+    Encode master_path into every profile with one ffmpeg run (one decode, many encoders)
+
+    Outputs are written next to the master as <name>_<profile>.<format>.
+    Returns {profile name: path}; empty if ffmpeg is unavailable or fails.
+    """
+    logger = logging.getLogger(__name__)
+    profiles = DEFAULT_PROFILES if profiles is None else profiles
+    ffmpeg = ffmpeg or shutil.which('ffmpeg')
+    if not profiles:
+        return {}
+    if not ffmpeg:
+        logger.warning("ffmpeg not found, skipping audio output profiles")
+        return {}
+
+    stem = os.path.splitext(master_path)[0]
+    outputs = {name: f"{stem}_{name}.{profile.get('format', 'mp3')}" for name, profile in profiles.items()}
+
+    command = [ffmpeg, '-y', '-loglevel', 'error', '-i', master_path]
+    for name, profile in profiles.items():
+        command += _encoder_args(profile) + [outputs[name] + '.part']
+
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+        for path in outputs.values():
+            os.replace(path + '.part', path)
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, 'stderr', '') or ''
+        logger.warning(f"Audio profile encoding failed: {e} {stderr.strip()}")
+        return {}
+    finally:
+        for path in outputs.values():
+            if os.path.exists(path + '.part'):
+                os.remove(path + '.part')
+
+    for name, path in outputs.items():
+        logger.info(f"Encoded {name} profile: {path} ({os.path.getsize(path) // 1024} KiB)")
+    return outputs
+
+
+def write_chapters(chapters_path: str, chapters: List[Tuple[str, float, Optional[str]]]) -> str:
+    """
+    Write chapters as Podcasting 2.0 JSON chapters
+
+    chapters: (title, start seconds, optional url of the standalone segment file)
+    """
+    payload = {'version': '1.2.0', 'chapters': []}
+    for title, start, url in chapters:
+        chapter = {'startTime': round(start, 3), 'title': title}
+        if url:
+            chapter['url'] = url
+        payload['chapters'].append(chapter)
+
+    with open(chapters_path, 'w') as f:
+        json.dump(payload, f, indent=2)
+    return chapters_path
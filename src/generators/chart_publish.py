@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Lazy chart publishing for YenSense AI reports
+Instead of inlining plotly.js and every figure's JSON into each page, the
+published report links one versioned plotly.js bundle shared by all reports
+and stores each figure as its own gzipped JSON file. The page carries only
+sized placeholders and a small loader: its text renders straight away, and
+plotly.js and a chart's data are fetched when the chart scrolls into view
+"""
+
+import gzip
+import os
+import tempfile
+from typing import List, Sequence, Tuple
+
+import plotly.graph_objects as go
+import plotly.offline as pyo
+
+ASSET_DIR = 'assets'
+CHART_DIR = 'charts'
+
+# Fetches plotly.js once, on the first chart near the viewport. Chart files are
+# gunzipped in the browser unless the server already decoded them
+_LOADER = """<script>
+(function () {
+  var charts = document.querySelectorAll('.lazy-chart');
+  var plotly = null;
+  function loadPlotly(src) {
+    if (!plotly) {
+      plotly = new Promise(function (resolve, reject) {
+        var script = document.createElement('script');
+        script.src = src;
+        script.onload = function () { resolve(window.Plotly); };
+        script.onerror = reject;
+        document.head.appendChild(script);
+      });
+    }
+    return plotly;
+  }
+  function loadFigure(src) {
+    return fetch(src).then(function (response) {
+      if (!response.ok) { throw new Error(response.status + ' ' + src); }
+      return response.arrayBuffer();
+    }).then(function (buffer) {
+      var bytes = new Uint8Array(buffer);
+      if (bytes[0] !== 0x1f || bytes[1] !== 0x8b) { return new Blob([bytes]).text(); }
+      var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+      return new Response(stream).text();
+    }).then(JSON.parse);
+  }
+  function draw(el) {
+    Promise.all([loadPlotly(el.dataset.plotly), loadFigure(el.dataset.src)]).then(function (loaded) {
+      el.textContent = '';
+      loaded[0].newPlot(el, loaded[1].data, loaded[1].layout,
+                        {responsive: true, displaylogo: false});
+    }).catch(function () { el.textContent = 'Chart could not be loaded.'; });
+  }
+  if (!('IntersectionObserver' in window)) { charts.forEach(draw); return; }
+  var observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) { observer.unobserve(entry.target); draw(entry.target); }
+    });
+  }, {rootMargin: '200px'});
+  charts.forEach(function (el) { observer.observe(el); });
+})();
+</script>"""
+
+
+def _write_atomic(path: str, payload: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def plotly_bundle(directory: str) -> str:
+    """Path (relative to directory) of the versioned plotly.js bundle, written if missing"""
+    relative = f"{ASSET_DIR}/plotly-{pyo.get_plotlyjs_version()}.min.js"
+    path = os.path.join(directory, relative)
+    if not os.path.exists(path):
+        _write_atomic(path, pyo.get_plotlyjs().encode('utf-8'))
+    return relative
+
+
+def write_chart(directory: str, name: str, fig: go.Figure) -> str:
+    """Save a figure as gzipped JSON; returns its path relative to directory"""
+    relative = f"{CHART_DIR}/{name}.json.gz"
+    # mtime=0 keeps the bytes identical for an unchanged figure
+    _write_atomic(os.path.join(directory, relative),
+                  gzip.compress(fig.to_json().encode('utf-8'), compresslevel=9, mtime=0))
+    return relative
+
+
+def lazy_charts_html(charts: Sequence[Tuple[str, int]], bundle: str) -> str:
+    """Placeholders for (chart file, height) pairs, followed by the loader"""
+    divs = []
+    for src, height in charts:
+        chart_id = os.path.basename(src).split('.')[0]
+        divs.append(f'<div class="lazy-chart" id="{chart_id}" data-src="{src}" data-plotly="{bundle}" '
+                    f'style="min-height: {height}px">'
+                    f'<noscript>Charts need JavaScript.</noscript></div>')
+    return "\n".join(divs) + "\n" + _LOADER
+
+
+def publish_figures(figures: Sequence[Tuple[str, go.Figure]], directory: str,
+                    prefix: str) -> Tuple[str, List[str]]:
+    """
+    Write the bundle and chart files under directory and return the page's
+    placeholder HTML with the loader, plus every file it references
+    (relative to directory, where the page itself is saved)
+    """
+    bundle = plotly_bundle(directory)
+    charts = [(write_chart(directory, f"{prefix}_{name}", fig), fig.layout.height or 450) for name, fig in figures]
+    return lazy_charts_html(charts, bundle), [bundle] + [src for src, _ in charts]
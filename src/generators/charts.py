@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Report charts for YenSense AI
+Plotly figures built from stored data: today's yield curves against the
+previous day's, FX history with rolling bands, and cross-market spread
+history. Long series are downsampled with LTTB before they are handed to
+Plotly, so multi-year charts stay small in the HTML and quick to draw
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.offline as pyo
+from plotly.subplots import make_subplots
+
+from core.timeseries import align, lttb, rolling_mean_std, to_arrays
+from core.yield_curves import GRID, GRID_YEARS, MARKET_NAMES, MARKETS
+
+COLORS = {'ust': '#1f77b4', 'bund': '#ff7f0e', 'jgb': '#d62728', 'USD/JPY': '#1f77b4', 'EUR/JPY': '#2ca02c'}
+SPREAD_SERIES = (('ust_10y', 'jgb_10y', 'UST-JGB 10Y'), ('bund_10y', 'jgb_10y', 'Bund-JGB 10Y'),
+                 ('ust_2y', 'jgb_2y', 'UST-JGB 2Y'))
+BAND_WIDTH = 2  # Standard deviations either side of the rolling mean
+CHART_NAMES = ('yield_curves', 'fx_history', 'spread_history')  # Order in the report
+
+_LAYOUT = dict(
+    template='plotly_white',
+    hovermode='x unified',
+    legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+    margin=dict(l=50, r=30, t=70, b=40)
+)
+
+
+def _labels(dates: np.ndarray) -> List[str]:
+    return np.datetime_as_string(dates, unit='D').tolist()
+
+
+def _downsample(dates: np.ndarray, values: np.ndarray, max_points: int) -> np.ndarray:
+    """LTTB indices, with dates as day numbers for the x axis"""
+    return lttb(dates.astype('int64'), values, max_points)
+
+
+def yield_curve_figure(curves: Dict[str, Any], height: int) -> Optional[go.Figure]:
+    """UST, Bund and JGB curves on the common tenor grid, with the previous day dotted"""
+    levels = curves.get('levels', {})
+    if not levels:
+        return None
+    changes = curves.get('changes', {}).get('levels', {})
+    fig = go.Figure()
+    for market in MARKETS:
+        if market not in levels:
+            continue
+        today = np.array([np.nan if levels[market].get(t) is None else levels[market][t] for t in GRID])
+        fig.add_trace(go.Scatter(
+            x=GRID_YEARS, y=np.round(today, 3), name=MARKET_NAMES[market], customdata=list(GRID),
+            line=dict(color=COLORS[market], width=2), mode='lines+markers',
+            hovertemplate='%{customdata}: %{y:.3f}%<extra>' + MARKET_NAMES[market] + '</extra>'
+        ))
+        if market in changes:
+            change_bp = np.array([np.nan if changes[market].get(t) is None else changes[market][t] for t in GRID])
+            fig.add_trace(go.Scatter(
+                x=GRID_YEARS, y=np.round(today - change_bp / 100, 3), name=f"{MARKET_NAMES[market]} prev",
+                line=dict(color=COLORS[market], width=1, dash='dot'), customdata=list(GRID),
+                hovertemplate='%{customdata}: %{y:.3f}%<extra>previous</extra>'
+            ))
+    fig.update_layout(**_LAYOUT)
+    fig.update_layout(title='Yield Curves', height=height, hovermode='closest',
+                      xaxis=dict(title='Maturity (years)', type='log', tickvals=GRID_YEARS, ticktext=list(GRID)),
+                      yaxis=dict(title='Yield (%)'))
+    return fig
+
+
+def fx_history_figure(history: Dict[str, Sequence], pairs: Sequence[str], window: int,
+                      max_points: int, height: int) -> Optional[go.Figure]:
+    """Daily closes per pair with rolling mean +/- BAND_WIDTH standard deviations, one panel each"""
+    series = [(pair, *to_arrays(history.get(pair, []))) for pair in pairs]
+    series = [(pair, dates, values) for pair, dates, values in series if len(values) >= 2]
+    if not series:
+        return None
+
+    fig = make_subplots(rows=len(series), cols=1, shared_xaxes=True, vertical_spacing=0.08,
+                        subplot_titles=[f"{pair} ({window}d mean ± {BAND_WIDTH}σ)" for pair, _, _ in series])
+    for row, (pair, dates, values) in enumerate(series, 1):
+        mean, std = rolling_mean_std(values, window)
+        keep = _downsample(dates, values, max_points)
+        x = _labels(dates[keep])
+        upper, lower = (mean + BAND_WIDTH * std)[keep], (mean - BAND_WIDTH * std)[keep]
+        fig.add_trace(go.Scatter(x=x, y=np.round(upper, 3), line=dict(width=0), showlegend=False,
+                                 hoverinfo='skip'), row=row, col=1)
+        fig.add_trace(go.Scatter(x=x, y=np.round(lower, 3), line=dict(width=0), fill='tonexty',
+                                 fillcolor='rgba(127,127,127,0.15)', name=f"{pair} band",
+                                 showlegend=False, hoverinfo='skip'), row=row, col=1)
+        fig.add_trace(go.Scatter(x=x, y=np.round(values[keep], 3), name=pair,
+                                 line=dict(color=COLORS.get(pair), width=1.5),
+                                 hovertemplate='%{y:.2f}<extra>' + pair + '</extra>'), row=row, col=1)
+    fig.update_layout(title='FX History', height=max(height, 320 * len(series)), **_LAYOUT)
+    return fig
+
+
+def spread_history_figure(history: Dict[str, Sequence], max_points: int, height: int) -> Optional[go.Figure]:
+    """Cross-market yield spreads over time, in bp"""
+    fig = go.Figure()
+    for first, second, name in SPREAD_SERIES:
+        dates, (a, b) = align(to_arrays(history.get(first, [])), to_arrays(history.get(second, [])))
+        if len(dates) < 2:
+            continue
+        spread = (a - b) * 100
+        keep = _downsample(dates, spread, max_points)
+        fig.add_trace(go.Scatter(x=_labels(dates[keep]), y=np.round(spread[keep], 1), name=name,
+                                 hovertemplate='%{y:.1f}bp<extra>' + name + '</extra>'))
+    if not fig.data:
+        return None
+    fig.update_layout(title='Yield Spreads', height=height, yaxis=dict(title='bp'), **_LAYOUT)
+    return fig
+
+
+def report_figures(data: Dict[str, Any], window: int = 60, max_points: int = 400,
+                   height: int = 500) -> List[Tuple[str, go.Figure]]:
+    """(name, figure) for every chart the data supports"""
+    history = data.get('history', {})
+    figures = [
+        ('yield_curves', yield_curve_figure(data.get('curves', {}), height)),
+        ('fx_history', fx_history_figure(history, ('USD/JPY', 'EUR/JPY'), window, max_points, height)),
+        ('spread_history', spread_history_figure(history, max_points, height))
+    ]
+    return [(name, fig) for name, fig in figures if fig is not None]
+
+
+def figures_html(figures: Sequence[Tuple[str, go.Figure]]) -> str:
+    """Responsive chart divs; plotly.js is loaded once, with the first chart"""
+    divs = []
+    for i, (name, fig) in enumerate(figures):
+        divs.append(pyo.plot(
+            fig,
+            output_type='div',
+            include_plotlyjs='cdn' if i == 0 else False,
+            config={'displayModeBar': True, 'displaylogo': False, 'responsive': True}
+        ))
+    return "\n".join(divs)
@@ -4,21 +4,23 @@ Morning Brief Generator for YenSense AI
 Creates daily TTS-ready scripts with SSML markup
 """
 
+import io
 import logging
 import os
+import subprocess
 import sys
-import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # Add parent directory to path for imports when run directly
 if __name__ == "__main__":
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import yaml
-from gtts import gTTS
 from core.ai_analyst_brief import AIAnalystBrief
-import tempfile
+from generators.audio_output import DEFAULT_PROFILES, encode_profiles, write_chapters
+from generators.mp3 import ConcatResult, Mp3FormatError, concat_to_file
+from generators.tts import AdaptiveTokenBucket, ClipRequest, TTSClipCache, create_tts_backend, synthesize_clips
 
 # Handle pydub import - fallback if not available due to Python 3.13+ issues
 try:
@@ -35,6 +37,25 @@ except ImportError:
             return None
 
 
+# Voice assignments for each domain
+VOICE_CONFIG = {
+    'rates': {'tld': 'com'},      # US English
+    'fx': {'tld': 'co.uk'},       # UK English  
+    'repo': {'tld': 'ca'},        # Canadian English
+    'economist': {'tld': 'com.au'} # Australian English
+}
+
+SEGMENT_TITLES = {
+    'rates': 'RATES MARKETS',
+    'fx': 'FOREIGN EXCHANGE', 
+    'repo': 'REPO MARKETS',
+    'economist': 'ECONOMIC OUTLOOK'
+}
+
+INTRO_TEXT = "Good morning. This is your YenSense AI market brief for"
+OUTRO_TEXT = "That's your morning brief. Sources include FRED, Alpha Vantage, Bank of Japan, and Reuters. This is for informational purposes only."
+
+
 class MorningBriefGenerator:
     """Generate daily morning brief with domain-specific segments and alternating TTS voices"""
     
@@ -49,6 +70,22 @@ class MorningBriefGenerator:
         
         # Initialize AI analyst for brief generation
         self.ai_analyst = AIAnalystBrief(config_path)
+        
+        # TTS backend and shared rate limiter (persists across briefs, so learned backoff carries over)
+        audio_config = self.config.get('output', {}).get('audio', {})
+        self.tts_backend = create_tts_backend(audio_config.get('tts_backend', 'gtts'))
+        self.tts_workers = audio_config.get('tts_workers', 4)
+        self.tts_limiter = AdaptiveTokenBucket(
+            rate=audio_config.get('tts_requests_per_second', 4.0),
+            burst=self.tts_workers
+        )
+        cache_mb = audio_config.get('tts_cache_mb', 50)
+        self.tts_cache = TTSClipCache('data/cache/tts', cache_mb * 1024 * 1024) if cache_mb else None
+        
+        # Output variants written alongside the master MP3
+        self.audio_profiles = audio_config.get('profiles', DEFAULT_PROFILES)
+        self.audio_chapters = audio_config.get('chapters', True)
+        self.audio_outputs = {}
     
     
     def generate_segments(self, data: Dict[str, Any]) -> Dict[str, str]:
@@ -94,82 +131,41 @@ class MorningBriefGenerator:
         """Generate audio with different voices for each segment"""
         self.logger.info(f"Generating multi-voice audio: {output_filename}")
         
-        if not HAS_PYDUB:
-            self.logger.warning("pydub not available, falling back to single voice audio")
-            return self._generate_fallback_audio(segments, output_filename)
-        
-        
-        # Voice assignments for each domain
-        voice_config = {
-            'rates': {'tld': 'com'},      # US English
-            'fx': {'tld': 'co.uk'},       # UK English  
-            'repo': {'tld': 'ca'},        # Canadian English
-            'economist': {'tld': 'com.au'} # Australian English
-        }
-        
-        audio_segments = []
-        
         try:
-            # Generate intro
-            self.logger.info("Starting intro TTS generation")
-            intro_text = f"Good morning. This is your YenSense AI market brief for {datetime.now().strftime('%A, %B %d')}."
-            self.logger.info("Creating intro gTTS object")
-            intro_tts = gTTS(text=intro_text, lang='en', tld='com')
-            intro_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            self.logger.info(f"Saving intro TTS to {intro_file.name}")
-            intro_tts.save(intro_file.name)
-            self.logger.info("Loading intro audio segment")
-            audio_segments.append(AudioSegment.from_mp3(intro_file.name))
-            self.logger.info("Intro TTS completed successfully")
-            
-            # Add brief pause
-            silence = AudioSegment.silent(duration=500)  # 500ms
-            
-            # Generate each domain segment with different voice
+            # Intro (static greeting + date, so both halves are cacheable), one clip
+            # per non-empty domain segment, outro - in playback order
+            clips = [ClipRequest(INTRO_TEXT, 'com'), ClipRequest(f"{datetime.now().strftime('%A, %B %d')}.", 'com')]
+            labels = ['intro', 'intro']
             for domain, text in segments.items():
                 if not text.strip():
                     continue
-                    
-                self.logger.info(f"Starting {domain} segment TTS generation")
-                # Clean text for TTS
-                clean_text = text.strip()
-                
-                # Generate TTS with domain-specific voice
-                voice_settings = voice_config.get(domain, {'tld': 'com'})
-                self.logger.info(f"Creating {domain} gTTS object with {voice_settings['tld']} voice")
-                tts = gTTS(text=clean_text, lang='en', tld=voice_settings['tld'])
-                
-                # Save to temporary file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-                self.logger.info(f"Saving {domain} TTS to {temp_file.name}")
-                tts.save(temp_file.name)
-                # Add longer delay to prevent gTTS rate limiting
-                time.sleep(5)
-                
-                # Load and add to segments
-                self.logger.info(f"Loading {domain} audio segment")
-                segment_audio = AudioSegment.from_mp3(temp_file.name)
-                audio_segments.append(silence)  # Pause between segments
-                audio_segments.append(segment_audio)
-                
-                self.logger.info(f"Generated {domain} segment with {voice_settings['tld']} voice")
+                clips.append(ClipRequest(text.strip(), VOICE_CONFIG.get(domain, {'tld': 'com'})['tld']))
+                labels.append(domain)
+            clips.append(ClipRequest(OUTRO_TEXT, 'com'))
+            labels.append('outro')
             
-            # Add outro
-            outro_text = "That's your morning brief. Sources include FRED, Alpha Vantage, Bank of Japan, and Reuters. This is for informational purposes only."
-            outro_tts = gTTS(text=outro_text, lang='en', tld='com')
-            outro_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            outro_tts.save(outro_file.name)
-            audio_segments.append(silence)
-            audio_segments.append(AudioSegment.from_mp3(outro_file.name))
+            # Synthesize uncached clips concurrently; the limiter only backs off if the service throttles
+            self.logger.info(f"Synthesizing {len(clips)} clips with {self.tts_workers} workers")
+            clip_audio = synthesize_clips(self.tts_backend, clips, self.tts_limiter,
+                                          max_workers=self.tts_workers, cache=self.tts_cache)
+            if self.tts_cache:
+                self.logger.info(f"TTS cache: {self.tts_cache.hits} hits, {self.tts_cache.misses} misses")
             
-            # Combine all segments
-            final_audio = sum(audio_segments)
-            
-            # Save final audio
+            # Pause before each clip: 500ms between clips, none before or inside the intro
+            pauses_ms = [0, 0] + [500] * (len(clip_audio) - 2)
             output_path = os.path.join(self.output_dir, output_filename)
-            final_audio.export(output_path, format="mp3")
             
-            self.logger.info(f"Multi-voice audio saved: {output_path}")
+            # Join encoded frames directly; re-encode only if the clips differ in format
+            try:
+                layout = concat_to_file(clip_audio, output_path, pauses_ms)
+            except Mp3FormatError as e:
+                if not HAS_PYDUB:
+                    raise
+                self.logger.warning(f"Clips cannot be joined frame by frame ({e}), re-encoding")
+                layout = self._encode_clips_single_pass(clip_audio, pauses_ms, output_path)
+            
+            self.logger.info(f"Multi-voice audio saved: {output_path} ({layout.duration:.0f}s)")
+            self.audio_outputs = self._write_audio_variants(output_path, labels, clip_audio, layout)
             return output_path
             
         except Exception as e:
@@ -177,6 +173,77 @@ class MorningBriefGenerator:
             # Fallback to single voice
             return self._generate_fallback_audio(segments, output_filename)
     
+    def _encode_clips_single_pass(self, clip_audio: List[bytes], pauses_ms: List[int], output_path: str) -> ConcatResult:
+        """Decode clips one at a time and stream their PCM through a single MP3 encoder"""
+        first = AudioSegment.from_file(io.BytesIO(clip_audio[0]), format='mp3')
+        frame_rate, channels = first.frame_rate, first.channels
+        
+        partial_path = output_path + '.part'
+        encoder = subprocess.Popen(
+            [AudioSegment.converter, '-y', '-loglevel', 'error', '-f', 's16le', '-ar', str(frame_rate),
+             '-ac', str(channels), '-i', 'pipe:0', '-f', 'mp3', partial_path],
+            stdin=subprocess.PIPE
+        )
+        
+        total_ms = 0
+        spans_ms = []
+        try:
+            for i, audio in enumerate(clip_audio):
+                segment = first if i == 0 else AudioSegment.from_file(io.BytesIO(audio), format='mp3')
+                first = None  # Only one decoded clip alive at a time
+                segment = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(2)
+                if pauses_ms[i]:
+                    pause = AudioSegment.silent(duration=pauses_ms[i], frame_rate=frame_rate).set_channels(channels)
+                    encoder.stdin.write(pause.raw_data)
+                encoder.stdin.write(segment.raw_data)
+                total_ms += pauses_ms[i]
+                spans_ms.append((total_ms, total_ms + len(segment)))
+                total_ms += len(segment)
+            
+            encoder.stdin.close()
+            if encoder.wait() != 0:
+                raise RuntimeError(f"Encoder exited with status {encoder.returncode}")
+            os.replace(partial_path, output_path)
+        finally:
+            if encoder.poll() is None:
+                encoder.kill()
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        
+        return ConcatResult(total_ms / 1000, [(start / 1000, end / 1000) for start, end in spans_ms])
+    
+    def _write_audio_variants(self, output_path: str, labels: List[str], clip_audio: List[bytes],
+                              layout: ConcatResult) -> Dict[str, str]:
+        """Write per-segment files, chapters and encoded profiles for the master audio"""
+        outputs = {}
+        
+        if self.audio_chapters:
+            stem = os.path.splitext(output_path)[0]
+            chapters = []
+            for label, audio, (start, _) in zip(labels, clip_audio, layout.clip_spans):
+                if label == 'intro':
+                    if not chapters:
+                        chapters.append(('Introduction', start, None))
+                elif label == 'outro':
+                    chapters.append(('Sources', start, None))
+                else:
+                    # Standalone segment, cut from the same frames (no re-encode)
+                    segment_path = f"{stem}_{label}.mp3"
+                    try:
+                        concat_to_file([audio], segment_path)
+                        outputs[f"segment_{label}"] = segment_path
+                        url = os.path.basename(segment_path)
+                    except Mp3FormatError as e:
+                        self.logger.warning(f"Could not write {label} segment file: {e}")
+                        url = None
+                    chapters.append((SEGMENT_TITLES.get(label, label.upper()).title(), start, url))
+            
+            outputs['chapters'] = write_chapters(f"{stem}.chapters.json", chapters)
+        
+        # All profiles from one decode of the master
+        outputs.update(encode_profiles(output_path, self.audio_profiles))
+        return outputs
+    
     def _generate_fallback_audio(self, segments: Dict[str, str], output_filename: str) -> str:
         """Generate single-voice audio as fallback"""
         self.logger.info("Generating fallback single-voice audio")
@@ -191,9 +258,10 @@ class MorningBriefGenerator:
         combined_text += "That's your morning brief. This is for informational purposes only."
         
         try:
-            tts = gTTS(text=combined_text, lang='en', slow=False)
+            audio = synthesize_clips(self.tts_backend, [ClipRequest(combined_text)], self.tts_limiter)[0]
             output_path = os.path.join(self.output_dir, output_filename)
-            tts.save(output_path)
+            with open(output_path, 'wb') as f:
+                f.write(audio)
             self.logger.info(f"Fallback audio saved: {output_path}")
             return output_path
         except Exception as e:
@@ -213,16 +281,9 @@ class MorningBriefGenerator:
             f.write("="*60 + "\n\n")
             
             # Write each segment
-            segment_titles = {
-                'rates': 'RATES MARKETS',
-                'fx': 'FOREIGN EXCHANGE', 
-                'repo': 'REPO MARKETS',
-                'economist': 'ECONOMIC OUTLOOK'
-            }
-            
             for domain in ['rates', 'fx', 'repo', 'economist']:
                 if domain in segments and segments[domain].strip():
-                    f.write(f"## {segment_titles[domain]}\n")
+                    f.write(f"## {SEGMENT_TITLES[domain]}\n")
                     f.write(f"{segments[domain]}\n\n")
             
             f.write("---\n")
@@ -235,11 +296,13 @@ class MorningBriefGenerator:
         
         # Generate multi-voice audio
         audio_filename = f"morning_brief_{date_str}.mp3"
+        self.audio_outputs = {}
         audio_path = self.generate_multi_voice_audio(segments, audio_filename)
         
         return {
             'text_file': text_path,
             'audio_file': audio_path,
+            'audio_outputs': self.audio_outputs,
             'date': date_str,
             'segments': list(segments.keys())
         }
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+MP3 frame helpers for YenSense AI
+Parses and concatenates MPEG audio frames directly, without decoding, so
+clips in the same format (everything gTTS returns is MPEG-2 Layer III,
+24 kHz, mono, 32 kbps) can be joined and padded with silence in one pass.
+Also probes a file's duration from its headers for podcast feeds
+"""
+
+import os
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# MPEG-2 Layer III, no CRC, 32 kbps, 24000 Hz, mono
+GTTS_FRAME_HEADER = bytes([0xFF, 0xF3, 0x44, 0xC0])
+GTTS_SAMPLE_RATE = 24000
+GTTS_SAMPLES_PER_FRAME = 576
+GTTS_FRAME_BYTES = 96  # 72 * 32000 / 24000
+
+# Version bits -> version (1, 2, 25 = MPEG 2.5); 01 is reserved
+_VERSIONS = {0b11: 1, 0b10: 2, 0b00: 25}
+_LAYERS = {0b11: 1, 0b10: 2, 0b01: 3}
+_SAMPLE_RATES = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    25: (11025, 12000, 8000)
+}
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+}
+
+
+# A stream only ever uses a handful of distinct headers
+_HEADER_CACHE = {}
+
+# Bytes read from the start of a file to probe it
+PROBE_BYTES = 64 * 1024
+
+
+class Mp3FormatError(ValueError):
+    """Raised when clips cannot be joined at the frame level"""
+    pass
+
+
+class ConcatResult(NamedTuple):
+    """Layout of a concatenated stream"""
+    duration: float  # seconds
+    clip_spans: List[Tuple[float, float]]  # (start, end) seconds of each clip, excluding pauses
+
+
+class Mp3Info(NamedTuple):
+    """Duration and format of an MP3 file, from its headers"""
+    duration: float  # seconds
+    bytes: int  # file size
+    bitrate: int  # kbps, average over the audio
+    sample_rate: int
+    channels: int
+
+
+class FrameHeader(NamedTuple):
+    """Decoded fields of a 4-byte MPEG audio frame header"""
+    version: int
+    layer: int
+    bitrate: int  # kbps
+    sample_rate: int
+    channels: int
+    samples: int  # per frame
+    length: int  # bytes, including header
+    raw: bytes
+
+    @property
+    def stream_format(self) -> Tuple[int, int, int, int]:
+        """Fields that must match for frames to be concatenated"""
+        return self.version, self.layer, self.sample_rate, self.channels
+
+
+def parse_header(data, offset: int = 0) -> Optional[FrameHeader]:
+    """Parse a frame header at offset; None if there is no valid header there"""
+    if offset + 4 > len(data) or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return None
+    raw = bytes(data[offset:offset + 4])
+    if raw not in _HEADER_CACHE:
+        _HEADER_CACHE[raw] = _decode_header(raw)
+    return _HEADER_CACHE[raw]
+
+
+def _decode_header(raw: bytes) -> Optional[FrameHeader]:
+    b1, b2, b3 = raw[1], raw[2], raw[3]
+
+    version = _VERSIONS.get((b1 >> 3) & 0b11)
+    layer = _LAYERS.get((b1 >> 1) & 0b11)
+    bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 0b11
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    bitrate = _BITRATES[(min(version, 2), layer)][bitrate_index]
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    channels = 1 if b3 >> 6 == 0b11 else 2
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    elif layer == 3 and version != 1:
+        samples = 576
+        length = 72 * bitrate * 1000 // sample_rate + padding
+    else:
+        samples = 1152
+        length = 144 * bitrate * 1000 // sample_rate + padding
+
+    return FrameHeader(version, layer, bitrate, sample_rate, channels, samples, length, raw)
+
+
+def _is_info_frame(data, offset: int, header: FrameHeader) -> bool:
+    """Check for a Xing/Info/VBRI tag frame (metadata only, describes a single file)"""
+    if header.layer != 3:
+        return False
+    if header.version == 1:
+        side_info = 17 if header.channels == 1 else 32
+    else:
+        side_info = 9 if header.channels == 1 else 17
+    tag = bytes(data[offset + 4 + side_info:offset + 8 + side_info])
+    return tag in (b'Xing', b'Info') or bytes(data[offset + 36:offset + 40]) == b'VBRI'
+
+
+def _tag_frame_count(data, offset: int, header: FrameHeader) -> Optional[int]:
+    """Frame count from a Xing/Info or VBRI tag frame, if it records one"""
+    if header.version == 1:
+        side_info = 17 if header.channels == 1 else 32
+    else:
+        side_info = 9 if header.channels == 1 else 17
+    tag = offset + 4 + side_info
+    if bytes(data[tag:tag + 4]) in (b'Xing', b'Info'):
+        flags = int.from_bytes(data[tag + 4:tag + 8], 'big')
+        return int.from_bytes(data[tag + 8:tag + 12], 'big') if flags & 1 else None
+    if bytes(data[offset + 36:offset + 40]) == b'VBRI':
+        return int.from_bytes(data[offset + 50:offset + 54], 'big')
+    return None
+
+
+def _id3v2_size(data) -> int:
+    """Size of a leading ID3v2 tag, or 0"""
+    if len(data) < 10 or bytes(data[:3]) != b'ID3':
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _frame_offsets(view: memoryview) -> Iterator[Tuple[int, FrameHeader]]:
+    """Yield (offset, header) of each audio frame, skipping tags and junk"""
+    offset = _id3v2_size(view)
+    end = len(view)
+    if end - offset >= 128 and bytes(view[end - 128:end - 125]) == b'TAG':
+        end -= 128  # ID3v1
+
+    first = True
+    while offset < end:
+        header = parse_header(view, offset)
+        if header is None or offset + header.length > end:
+            offset += 1  # Resync
+            continue
+        if not (first and _is_info_frame(view, offset, header)):
+            yield offset, header
+        first = False
+        offset += header.length
+
+
+def iter_frames(data: bytes) -> Iterator[Tuple[FrameHeader, memoryview]]:
+    """
+    Yield (header, frame bytes) for each audio frame in an MP3 file
+
+    Skips ID3 tags, Xing/Info tag frames and any junk between frames.
+    """
+    view = memoryview(data)
+    for offset, header in _frame_offsets(view):
+        yield header, view[offset:offset + header.length]
+
+
+def silence(duration_ms: int, header: bytes = GTTS_FRAME_HEADER) -> bytes:
+    """
+    Encoded silence of (at least) duration_ms in the format of header
+
+    A frame whose side information and main data are all zero decodes to
+    silence, so no encoder is needed.
+    """
+    # No CRC, no padding, so every frame has the same nominal length
+    template = bytes([header[0], header[1] | 0x01, header[2] & ~0x02 & 0xFF, header[3]])
+    info = parse_header(template)
+    if info is None:
+        raise Mp3FormatError(f"Invalid frame header: {header.hex()}")
+
+    frame = template + bytes(info.length - 4)
+    n_frames = -(-duration_ms * info.sample_rate // (1000 * info.samples))  # ceil
+    return frame * n_frames
+
+
+def concat_frames(clips: Iterable[bytes], out: BinaryIO, pauses_ms: Optional[List[int]] = None) -> ConcatResult:
+    """
+    Write clips back to back as one MP3 stream, with pre-encoded silence
+
+    pauses_ms[i] is the pause inserted before clip i. Raises Mp3FormatError
+    if a clip is not in the same format as the first one.
+    """
+    stream_format = None
+    silence_cache = {}
+    samples = 0
+    sample_rate = 1
+    sample_spans = []
+
+    for i, clip in enumerate(clips):
+        pause = pauses_ms[i] if pauses_ms else 0
+        view = memoryview(clip)
+        frames = _frame_offsets(view)
+
+        first = next(frames, None)
+        if first is None:
+            raise Mp3FormatError(f"Clip {i} contains no MPEG audio frames")
+        header = first[1]
+        if stream_format is None:
+            stream_format, sample_rate = header.stream_format, header.sample_rate
+
+        if pause:
+            if pause not in silence_cache:
+                encoded = silence(pause, header.raw)
+                silence_cache[pause] = (encoded, len(encoded) // parse_header(encoded).length * header.samples)
+            encoded, pause_samples = silence_cache[pause]
+            out.write(encoded)
+            samples += pause_samples
+        clip_start = samples
+
+        # Copy runs of back-to-back frames with one write each
+        run_start = run_end = first[0]
+        for offset, header in chain([first], frames):
+            if header.stream_format != stream_format:
+                raise Mp3FormatError(f"Clip {i} format {header.stream_format} != stream format {stream_format}")
+            if offset != run_end:
+                out.write(view[run_start:run_end])
+                run_start = offset
+            run_end = offset + header.length
+            samples += header.samples
+        out.write(view[run_start:run_end])
+        sample_spans.append((clip_start, samples))
+
+    return ConcatResult(samples / sample_rate, [(start / sample_rate, end / sample_rate) for start, end in sample_spans])
+
+
+def concat_to_file(clips: Iterable[bytes], output_path: str, pauses_ms: Optional[List[int]] = None) -> ConcatResult:
+    """concat_frames into output_path; the file only appears once it is complete"""
+    partial_path = output_path + '.part'
+    try:
+        with open(partial_path, 'wb') as out:
+            result = concat_frames(clips, out, pauses_ms)
+        os.replace(partial_path, output_path)
+        return result
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+
+def probe(path: str) -> Mp3Info:
+    """
+    Duration of an MP3 file without decoding it
+
+    Uses the frame count of a Xing/Info/VBRI tag when there is one; a
+    constant-bitrate stream is timed from its size; otherwise the frame
+    headers are walked, reading 4 bytes per frame. Raises Mp3FormatError if
+    no MPEG audio frames are found.
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        data = f.read(PROBE_BYTES)
+        start = _id3v2_size(data)
+        if start:
+            f.seek(start)
+            data = f.read(PROBE_BYTES)
+        end = size
+        if size - start >= 128:
+            f.seek(size - 128)
+            if f.read(3) == b'TAG':
+                end -= 128  # ID3v1
+
+        view = memoryview(data)
+        frames = []
+        offset = 0
+        while offset + 4 <= len(view) and len(frames) < 64:
+            header = parse_header(view, offset)
+            if header is None:
+                offset = data.find(b'\xff', offset + 1)  # Resync on the next possible frame sync
+                if offset < 0:
+                    break
+                continue
+            frames.append((offset, header))
+            offset += header.length
+        if not frames:
+            raise Mp3FormatError(f"{path} contains no MPEG audio frames")
+
+        first_offset, first = frames[0]
+        count = _tag_frame_count(view, first_offset, first) if first.layer == 3 else None
+        audio_start = start + first_offset
+        if count is not None:
+            audio_start += first.length
+            samples = count * first.samples
+        else:
+            if _is_info_frame(view, first_offset, first):
+                audio_start += first.length
+                frames = frames[1:] or frames
+            bitrates = {header.bitrate for _, header in frames}
+            if len(bitrates) == 1:
+                samples = int(round((end - audio_start) * 8 * first.sample_rate / (first.bitrate * 1000)))
+            else:
+                samples = 0
+                f.seek(audio_start)
+                position = audio_start
+                while position + 4 <= end:
+                    header = parse_header(f.read(4))
+                    if header is None:
+                        break
+                    samples += header.samples
+                    position += header.length
+                    f.seek(position)
+
+    duration = samples / first.sample_rate
+    bitrate = int(round((end - audio_start) * 8 / duration / 1000)) if duration else first.bitrate
+    return Mp3Info(duration, size, bitrate, first.sample_rate, first.channels)
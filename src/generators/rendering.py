@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Template rendering for YenSense AI pages
+One Jinja2 environment over generators/templates, built once per process:
+templates are compiled on first use and kept in memory, and the compiled
+bytecode is cached on disk so new processes skip parsing too. Also a
+single-pass Markdown renderer for the report text (headings, paragraphs,
+lists, tables, quotes, code, rules, emphasis, links). Inline HTML is escaped
+except the glossary tooltips (<span title="...">), and links only keep
+http(s), mailto and relative targets
+"""
+
+import html
+import os
+import re
+from functools import lru_cache
+from typing import Any, List
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+DEFAULT_BYTECODE_DIR = 'data/cache/templates'
+
+
+@lru_cache(maxsize=None)
+def _environment(bytecode_dir: str) -> Environment:
+    os.makedirs(bytecode_dir, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(['html', 'xml']),
+        bytecode_cache=FileSystemBytecodeCache(bytecode_dir),
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+def get_environment(bytecode_dir: str = DEFAULT_BYTECODE_DIR) -> Environment:
+    """Shared template environment; templates are not re-checked on disk once loaded"""
+    return _environment(os.path.abspath(bytecode_dir))
+
+
+def render(template_name: str, **context: Any) -> str:
+    """Render a template from generators/templates"""
+    return get_environment().get_template(template_name).render(**context)
+
+
+# ---------- Markdown ---------- #
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_RULE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+_BULLET = re.compile(r'^\s*[-*+]\s+(.*)$')
+_NUMBERED = re.compile(r'^\s*\d+[.)]\s+(.*)$')
+_QUOTE = re.compile(r'^\s*>\s?(.*)$')
+_FENCE = re.compile(r'^\s*```')
+_TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+
+_CODE_SPAN = re.compile(r'`([^`]+)`')
+_LINK = re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)')
+_BOLD = re.compile(r'\*\*(.+?)\*\*|__(.+?)__')
+_ITALIC = re.compile(r'(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?!\*)|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)')
+# Escape '&' not starting an entity; every '<' and '>' is escaped
+_BARE_AMP = re.compile(r'&(?!#?\w+;)')
+# The only inline HTML the reports emit: glossary tooltips, matched after escaping
+_TOOLTIP = re.compile(r'&lt;span title="([^"]*)"&gt;(.*?)&lt;/span&gt;')
+_URL_SCHEME = re.compile(r'^([A-Za-z][A-Za-z0-9+.-]*):')
+_SAFE_SCHEMES = ('http', 'https', 'mailto')
+
+
+def _link(match) -> str:
+    label, url = match.group(1), match.group(2)
+    # Browsers decode entities and drop control characters before reading the scheme
+    scheme = _URL_SCHEME.match(re.sub(r'[\x00-\x20]', '', html.unescape(url)))
+    if scheme and scheme.group(1).lower() not in _SAFE_SCHEMES:
+        return label
+    return f'<a href="{url.replace(chr(34), "&quot;")}">{label}</a>'
+
+
+def _inline(text: str) -> str:
+    text = _BARE_AMP.sub('&amp;', text).replace('<', '&lt;').replace('>', '&gt;')
+    kept: List[str] = []
+
+    def keep(markup):
+        kept.append(markup)
+        return f"\x00{len(kept) - 1}\x00"
+
+    text = _CODE_SPAN.sub(lambda m: keep(f"<code>{m.group(1)}</code>"), text)
+    # The title is already escaped and holds no '"'; kept aside so emphasis cannot reach into it
+    text = _TOOLTIP.sub(lambda m: keep(f'<span title="{m.group(1)}">') + m.group(2) + keep('</span>'), text)
+    text = _LINK.sub(_link, text)
+    text = _BOLD.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = _ITALIC.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    if kept:
+        text = re.sub(r'\x00(\d+)\x00', lambda m: kept[int(m.group(1))], text)
+    return text
+
+
+def _cells(line: str) -> List[str]:
+    return [cell.strip() for cell in line.strip().strip('|').split('|')]
+
+
+def render_markdown(text: str) -> Markup:
+    """HTML for the Markdown the report stages produce"""
+    out: List[str] = []
+    paragraph: List[str] = []
+    lines = text.splitlines()
+    i = 0
+
+    def flush():
+        if paragraph:
+            out.append(f"<p>{_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            flush()
+            i += 1
+        elif _FENCE.match(line):
+            flush()
+            end = i + 1
+            while end < len(lines) and not _FENCE.match(lines[end]):
+                end += 1
+            out.append(f"<pre><code>{html.escape(chr(10).join(lines[i + 1:end]))}</code></pre>")
+            i = end + 1
+        elif (heading := _HEADING.match(line)):
+            flush()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+            i += 1
+        elif _RULE.match(line):
+            flush()
+            out.append("<hr>")
+            i += 1
+        elif '|' in stripped and i + 1 < len(lines) and _TABLE_SEPARATOR.match(lines[i + 1]):
+            flush()
+            rows = [f"<tr>{''.join(f'<th>{_inline(c)}</th>' for c in _cells(line))}</tr>"]
+            i += 2
+            while i < len(lines) and '|' in lines[i]:
+                rows.append(f"<tr>{''.join(f'<td>{_inline(c)}</td>' for c in _cells(lines[i]))}</tr>")
+                i += 1
+            out.append(f"<table>\n{chr(10).join(rows)}\n</table>")
+        elif _BULLET.match(line) or _NUMBERED.match(line):
+            flush()
+            pattern, tag = (_BULLET, 'ul') if _BULLET.match(line) else (_NUMBERED, 'ol')
+            items = []
+            while i < len(lines) and (item := pattern.match(lines[i])):
+                items.append(f"<li>{_inline(item.group(1))}</li>")
+                i += 1
+            out.append(f"<{tag}>\n{chr(10).join(items)}\n</{tag}>")
+        elif _QUOTE.match(line):
+            flush()
+            quoted = []
+            while i < len(lines) and (quote := _QUOTE.match(lines[i])):
+                quoted.append(quote.group(1))
+                i += 1
+            out.append(f"<blockquote>{render_markdown(chr(10).join(quoted))}</blockquote>")
+        else:
+            paragraph.append(stripped)
+            i += 1
+
+    flush()
+    return Markup("\n".join(out))
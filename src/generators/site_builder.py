@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Incremental static site builder for the GitHub Pages directory
+Keeps a manifest of every published file with its SHA-256, so publishing
+copies only files whose content changed. When something was published, the
+index, the archive index and the brief RSS feed are regenerated, plus the
+archive page of each month touched (entries grouped by type), so the work
+follows the change rather than the size of the archive. Pages are written
+only when their rendered content differs from what is on disk.
+
+The brief feed is a podcast feed: episode duration, enclosure size,
+chapters and summary are read once, when a file is published, and kept in
+the manifest, so new episodes are added without rescanning earlier MP3s
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime, time, timezone, tzinfo
+from email.utils import format_datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from generators.mp3 import Mp3FormatError, probe
+from generators.rendering import render
+
+SITE_MANIFEST = '.site_manifest.json'
+PAGES = ('index.html', 'archive.html', 'feed.xml')
+ARCHIVE_DIR = 'archive'  # One page per month: archive/2025-09.html
+KIND_LABELS = {'weekly': 'Weekly Strategist Report', 'morning': 'Morning Brief'}
+SUMMARY_CHARS = 400
+DESCRIBED = ('duration', 'chapters', 'summary')  # Manifest fields describe() fills in
+DEFAULT_PODCAST = {
+    'title': 'YenSense AI Morning Brief',
+    'description': 'Daily Japan macro and FX audio brief: rates, FX, repo markets and the economic calendar',
+    'author': 'YenSense AI',
+    'category': 'Business',
+    'subcategory': 'Investing',
+    'language': 'en',
+    'image_url': ''
+}
+
+# report_20250915.html, morning_brief_20250915.mp3, morning_brief_20250915_mobile.mp3,
+# morning_brief_20250915.chapters.json
+_DATED = re.compile(r'^(report|morning_brief)_(\d{8})(?:_([A-Za-z0-9-]+))?\.(.+)$')
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def classify(path: str) -> Dict[str, Any]:
+    """Kind (weekly/morning/asset), date and role of a published file, from its name"""
+    match = _DATED.match(path) if '/' not in path else None
+    if not match:
+        return {'kind': 'asset'}
+    prefix, day, variant, extension = match.groups()
+    if extension == 'txt':
+        role = 'transcript'
+    elif extension == 'html':
+        role = 'page'
+    elif extension == 'chapters.json':
+        role = 'chapters'
+    elif extension == 'mp3' and not variant:
+        role = 'audio'
+    else:
+        role = 'alternate'
+    return {
+        'kind': 'weekly' if prefix == 'report' else 'morning',
+        'date': f"{day[:4]}-{day[4:6]}-{day[6:]}",
+        'role': role
+    }
+
+
+def _clock(seconds: float, millis: bool = False) -> str:
+    whole = int(seconds)
+    clock = f"{whole // 3600:02d}:{whole % 3600 // 60:02d}:{whole % 60:02d}"
+    return f"{clock}.{int(round((seconds - whole) * 1000)) % 1000:03d}" if millis else clock
+
+
+def _summary(text: str) -> str:
+    """Opening paragraphs of a brief transcript (below its title and headings), about SUMMARY_CHARS long"""
+    parts = []
+    for paragraph in text.split('\n\n'):
+        lines = [line.strip() for line in paragraph.strip().splitlines()
+                 if line.strip() and not line.startswith(('#', '==', 'YenSense AI Morning Brief'))]
+        parts.extend(lines)
+        if sum(len(part) + 1 for part in parts) >= SUMMARY_CHARS:
+            break
+    summary = ' '.join(parts)
+    if len(summary) > SUMMARY_CHARS:
+        summary = summary[:SUMMARY_CHARS].rsplit(' ', 1)[0] + '...'
+    return summary
+
+
+def describe(path: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Feed metadata of a file being published, given its classify() info:
+    MP3 duration from the frame headers, chapter start times, transcript summary
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        if path.endswith('.mp3'):
+            return {'duration': round(probe(path).duration, 3)}
+        if info.get('role') == 'chapters':
+            with open(path, 'r') as f:
+                chapters = json.load(f).get('chapters', [])
+            return {'chapters': [[chapter['startTime'], chapter['title']] for chapter in chapters]}
+        if info.get('role') == 'transcript' and info.get('kind') == 'morning':
+            with open(path, 'r', encoding='utf-8') as f:
+                return {'summary': _summary(f.read(16 * 1024))}
+    except (OSError, ValueError, KeyError, Mp3FormatError) as e:
+        logger.warning(f"Could not read feed metadata from {path}: {e}")
+    return {}
+
+
+class SiteBuilder:
+    """Publishes files into a site directory and keeps its pages current"""
+
+    def __init__(self, directory: str, base_url: str = "", index_items: int = 10, feed_items: int = 30,
+                 publish_time: time = time(6, 30), tz: tzinfo = timezone.utc,
+                 podcast: Optional[Dict[str, Any]] = None):
+        self.directory = directory
+        self.podcast = {**DEFAULT_PODCAST, **(podcast or {})}
+        self.base_url = base_url.rstrip('/') + '/' if base_url else ''
+        self.index_items = index_items
+        self.feed_items = feed_items
+        self.publish_time = publish_time
+        self.tz = tz
+        self.logger = logging.getLogger(__name__)
+        self.manifest_path = os.path.join(directory, SITE_MANIFEST)
+        self.manifest = self._load_manifest()
+
+    # ---------- Manifest ---------- #
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Site manifest unreadable, rebuilding: {e}")
+            return {}
+
+    def _save_manifest(self):
+        self._write(SITE_MANIFEST, json.dumps(self.manifest, separators=(',', ':'), sort_keys=True).encode('utf-8'))
+
+    def _write(self, relative: str, payload: bytes):
+        path = os.path.join(self.directory, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def scan(self):
+        """Index the files already in the directory (first run without a manifest)"""
+        artifacts = {}
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                relative = os.path.relpath(os.path.join(root, filename), self.directory).replace(os.sep, '/')
+                if (relative == SITE_MANIFEST or relative in PAGES or relative.startswith(ARCHIVE_DIR + '/')
+                        or filename.endswith('.tmp')):
+                    continue
+                path = os.path.join(root, filename)
+                info = classify(relative)
+                artifacts[relative] = {'sha256': file_sha256(path), 'bytes': os.path.getsize(path),
+                                       **info, **describe(path, info)}
+        self.manifest = {'artifacts': artifacts, 'pages': {}}
+        self.logger.info(f"Indexed {len(artifacts)} existing files in {self.directory}")
+
+    # ---------- Publishing ---------- #
+
+    def publish(self, files: Sequence[Tuple[str, str]],
+                metadata: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, List[str]]:
+        """
+        Copy (source path, site path) pairs whose content changed, then
+        update the pages affected
+
+        metadata: extra manifest fields per site path (e.g. title, role).
+        Returns the site paths copied and the pages written.
+        """
+        months: Optional[Set[str]] = set()
+        if not self.manifest:
+            self.scan()
+            months = None  # Every page
+        artifacts = self.manifest.setdefault('artifacts', {})
+        metadata = metadata or {}
+        copied = []
+        for source, relative in files:
+            sha256 = file_sha256(source)
+            entry = artifacts.get(relative, {})
+            destination = os.path.join(self.directory, relative)
+            updated = {**entry, **classify(relative), **metadata.get(relative, {}),
+                       'sha256': sha256, 'bytes': os.path.getsize(source)}
+            if entry.get('sha256') != sha256 or not os.path.exists(destination):
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copy2(source, destination)
+                copied.append(relative)
+                for field in DESCRIBED:
+                    updated.pop(field, None)
+                updated.update(describe(source, updated))
+            elif updated == entry:
+                continue
+            artifacts[relative] = updated
+            if months is not None and 'date' in updated:
+                months.add(updated['date'][:7])
+
+        missing = [page for page in PAGES if not os.path.exists(os.path.join(self.directory, page))]
+        pages = []
+        if months is None or months or missing or copied:
+            pages = self.build_pages(months)
+            if copied or pages:
+                self.manifest['push_pending'] = True  # Cleared by mark_pushed once the site is deployed
+            self._save_manifest()
+        self.logger.info(f"Published {len(copied)} changed file(s) of {len(files)}, {len(pages)} page(s) updated")
+        return {'copied': copied, 'pages': pages}
+
+    @property
+    def push_pending(self) -> bool:
+        """Whether published changes have not been deployed yet (including those of a failed push)"""
+        return bool(self.manifest.get('push_pending'))
+
+    def mark_pushed(self):
+        """Record a successful deploy of the directory"""
+        if self.manifest.pop('push_pending', None):
+            self._save_manifest()
+
+    # ---------- Pages ---------- #
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """One entry per (kind, date) with its files by role, newest first"""
+        grouped: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for relative, artifact in self.manifest.get('artifacts', {}).items():
+            if artifact.get('kind') not in KIND_LABELS:
+                continue
+            key = (artifact['kind'], artifact['date'])
+            entry = grouped.setdefault(key, {'kind': key[0], 'date': key[1], 'files': defaultdict(list)})
+            entry['files'][artifact.get('role', 'alternate')].append(relative)
+            for field in ('title', 'summary', 'chapters'):
+                if artifact.get(field):
+                    entry[field] = artifact[field]
+
+        entries = []
+        for (kind, day), entry in grouped.items():
+            files = {role: sorted(paths) for role, paths in entry['files'].items()}
+            audio = (files.get('audio') or [p for p in files.get('alternate', []) if p.endswith('.mp3')] or [None])[0]
+            duration = self.manifest['artifacts'][audio].get('duration') if audio else None
+            label = datetime.strptime(day, '%Y-%m-%d').strftime('%B %d, %Y')
+            entries.append({
+                'kind': kind,
+                'date': day,
+                'label': label,
+                'title': entry.get('title') or f"{KIND_LABELS[kind]} - {label}",
+                'page': (files.get('page') or files.get('transcript') or [audio])[0],
+                'transcript': (files.get('transcript') or [None])[0],
+                'audio': audio,
+                'audio_bytes': self.manifest['artifacts'][audio]['bytes'] if audio else None,
+                'duration': _clock(duration) if duration is not None else None,
+                'summary': entry.get('summary', ''),
+                'chapters': (files.get('chapters') or [None])[0],
+                'chapter_marks': [(_clock(start, millis=True), title) for start, title in entry.get('chapters', [])]
+            })
+        return sorted(entries, key=lambda e: (e['date'], e['kind']), reverse=True)
+
+    def _pub_date(self, day: str) -> str:
+        return format_datetime(datetime.combine(date.fromisoformat(day), self.publish_time, self.tz))
+
+    def render_pages(self, months: Optional[Set[str]] = None) -> Dict[str, str]:
+        """The index, archive index and feed, plus the given months' archive pages (all if None)"""
+        entries = self.entries()
+        weekly = [e for e in entries if e['kind'] == 'weekly']
+        morning = [e for e in entries if e['kind'] == 'morning']
+        by_month: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            by_month.setdefault(entry['date'][:7], []).append(entry)
+        updated = entries[0]['label'] if entries else ''
+
+        archive = [{
+            'month': month,
+            'label': datetime.strptime(month, '%Y-%m').strftime('%B %Y'),
+            'href': f"{ARCHIVE_DIR}/{month}.html",
+            'counts': {kind: sum(e['kind'] == kind for e in items) for kind in KIND_LABELS}
+        } for month, items in by_month.items()]
+        episodes = [e for e in morning if e['audio']]
+        feed_items = [{**e, 'pub_date': self._pub_date(e['date'])} for e in episodes[:self.feed_items]]
+        pages = {
+            'index.html': render('index.html', root='', updated=updated, weekly=weekly[:self.index_items],
+                                 morning=morning[:self.index_items]),
+            'archive.html': render('archive.html', root='', updated=updated, months=archive,
+                                   kind_labels=KIND_LABELS),
+            'feed.xml': render('feed.xml', base_url=self.base_url, podcast=self.podcast, items=feed_items,
+                               build_date=feed_items[0]['pub_date'] if feed_items else '')
+        }
+        for month in archive:
+            if months is None or month['month'] in months:
+                items = by_month[month['month']]
+                pages[month['href']] = render(
+                    'archive_month.html', root='../', updated=items[0]['label'], heading=month['label'],
+                    sections=[(f"{label}s", [e for e in items if e['kind'] == kind])
+                              for kind, label in KIND_LABELS.items()]
+                )
+        return pages
+
+    def build_pages(self, months: Optional[Set[str]] = None) -> List[str]:
+        """
+        Render the pages affected by changes in the given months (all if
+        None), plus any month page not yet written; returns the pages whose
+        content changed and were written
+        """
+        pages = self.manifest.setdefault('pages', {})
+        if months is not None:
+            published = {artifact['date'][:7] for artifact in self.manifest.get('artifacts', {}).values()
+                         if 'date' in artifact}
+            months = months | {month for month in published if f"{ARCHIVE_DIR}/{month}.html" not in pages}
+
+        written = []
+        for page, content in self.render_pages(months).items():
+            payload = content.encode('utf-8')
+            sha256 = hashlib.sha256(payload).hexdigest()
+            if pages.get(page) == sha256 and os.path.exists(os.path.join(self.directory, page)):
+                continue
+            self._write(page, payload)
+            pages[page] = sha256
+            written.append(page)
+        return written
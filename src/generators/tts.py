@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Text-to-speech backends and parallel synthesis for YenSense AI
+Clips are synthesized concurrently under an adaptive token bucket, which only
+slows down when the TTS service actually throttles
+"""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from generators.mp3 import silence
+
+
+class TTSThrottled(Exception):
+    """Raised by a backend when the TTS service rejects a request for rate limiting"""
+    pass
+
+
+class ClipRequest(NamedTuple):
+    """One clip to synthesize"""
+    text: str
+    tld: str = 'com'
+    lang: str = 'en'
+
+
+class GTTSBackend:
+    """Google Translate TTS via gTTS"""
+
+    name = 'gtts'
+
+    def synthesize(self, text: str, tld: str = 'com', lang: str = 'en') -> bytes:
+        """Synthesize text to MP3 bytes"""
+        from gtts import gTTS, gTTSError
+
+        buffer = io.BytesIO()
+        try:
+            gTTS(text=text, lang=lang, tld=tld).write_to_fp(buffer)
+        except gTTSError as e:
+            rsp = getattr(e, 'rsp', None)
+            if rsp is not None and rsp.status_code in (429, 503):
+                raise TTSThrottled(str(e)) from e
+            raise
+        return buffer.getvalue()
+
+
+class LocalTTSBackend:
+    """
+    Offline stand-in backend for tests and benchmarks
+
+    Returns silent MP3 frames in gTTS's format, timed at words_per_minute.
+    Optionally simulates service latency and a server-side request rate limit.
+    """
+
+    name = 'local'
+
+    def __init__(self, words_per_minute: int = 150, latency: float = 0.0,
+                 max_requests_per_second: Optional[float] = None):
+        self.words_per_minute = words_per_minute
+        self.latency = latency
+        self.max_requests_per_second = max_requests_per_second
+        self.calls = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._last_accepted = float('-inf')
+
+    def synthesize(self, text: str, tld: str = 'com', lang: str = 'en') -> bytes:
+        """Synthesize text to silent MP3 bytes of speech-like duration"""
+        with self._lock:
+            self.calls += 1
+            if self.max_requests_per_second:
+                now = time.monotonic()
+                if now - self._last_accepted < 1.0 / self.max_requests_per_second:
+                    self.throttled += 1
+                    raise TTSThrottled("429 (Too Many Requests) from local TTS")
+                self._last_accepted = now
+
+        if self.latency:
+            time.sleep(self.latency)
+        words = max(1, len(text.split()))
+        return silence(words * 60000 // self.words_per_minute)
+
+
+def create_tts_backend(name: str = 'gtts'):
+    """Create a TTS backend by name ('gtts' or 'local')"""
+    if name == 'local':
+        return LocalTTSBackend()
+    return GTTSBackend()
+
+
+class TTSClipCache:
+    """
+    On-disk cache of synthesized clips keyed by (text, voice tld, lang)
+
+    Total size is capped at max_bytes; the least recently used clips are
+    evicted first. Recency survives restarts via file modification times.
+    """
+
+    def __init__(self, cache_dir: str = 'data/cache/tts', max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # key -> size, least recently used first
+        entries = []
+        for filename in os.listdir(cache_dir):
+            if filename.endswith('.mp3'):
+                stat = os.stat(os.path.join(cache_dir, filename))
+                entries.append((stat.st_mtime, filename[:-4], stat.st_size))
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._total_bytes = sum(self._entries.values())
+
+    @staticmethod
+    def key(clip: ClipRequest) -> str:
+        """Content hash identifying a clip"""
+        return hashlib.sha256(f"{clip.lang}\0{clip.tld}\0{clip.text}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def get(self, clip: ClipRequest) -> Optional[bytes]:
+        """Cached audio for a clip, or None"""
+        key = self.key(clip)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(key), 'rb') as f:
+                    audio = f.read()
+                os.utime(self._path(key))
+            except OSError as e:
+                self.logger.warning(f"Dropping unreadable TTS cache entry {key}: {e}")
+                self._total_bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, clip: ClipRequest, audio: bytes) -> None:
+        """Store audio for a clip, evicting least recently used clips over the size cap"""
+        key = self.key(clip)
+        with self._lock:
+            tmp_path = self._path(key) + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(audio)
+                os.replace(tmp_path, self._path(key))
+            except OSError as e:
+                self.logger.warning(f"Could not cache TTS clip {key}: {e}")
+                return
+
+            self._total_bytes += len(audio) - self._entries.pop(key, 0)
+            self._entries[key] = len(audio)
+
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to observed throttling
+
+    The rate is halved whenever the service throttles (and queued tokens are
+    dropped), and creeps back up by rate_step after each success.
+    """
+
+    def __init__(self, rate: float = 4.0, burst: int = 4, min_rate: float = 0.2,
+                 max_rate: Optional[float] = None, rate_step: float = 0.5):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.rate_step = rate_step
+        self.throttle_events = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_throttled(self) -> None:
+        """Back off after the service throttled a request"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self.throttle_events += 1
+
+    def on_success(self) -> None:
+        """Recover rate after a successful request"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+
+def synthesize_clips(backend, clips: List[ClipRequest], limiter: Optional[AdaptiveTokenBucket] = None,
+                     max_workers: int = 4, max_attempts: int = 6,
+                     cache: Optional[TTSClipCache] = None) -> List[bytes]:
+    """
+    Synthesize clips concurrently, returning MP3 bytes in the same order as clips
+
+    Clips found in cache (and repeats within clips) are not sent to the backend.
+    Raises the last TTSThrottled if a clip is still throttled after max_attempts.
+    """
+    logger = logging.getLogger(__name__)
+    limiter = limiter or AdaptiveTokenBucket()
+
+    def synthesize_one(clip: ClipRequest) -> bytes:
+        for attempt in range(1, max_attempts + 1):
+            limiter.acquire()
+            try:
+                audio = backend.synthesize(clip.text, tld=clip.tld, lang=clip.lang)
+            except TTSThrottled:
+                limiter.on_throttled()
+                logger.warning(f"TTS throttled (attempt {attempt}/{max_attempts}), rate now {limiter.rate:.2f}/s")
+                if attempt == max_attempts:
+                    raise
+                continue
+            limiter.on_success()
+            return audio
+
+    audio_by_clip = {}
+    for clip in clips:
+        if clip not in audio_by_clip:
+            audio_by_clip[clip] = cache.get(clip) if cache else None
+    pending = [clip for clip, audio in audio_by_clip.items() if audio is None]
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for clip, audio in zip(pending, executor.map(synthesize_one, pending)):
+                audio_by_clip[clip] = audio
+                if cache:
+                    cache.put(clip, audio)
+
+    return [audio_by_clip[clip] for clip in clips]
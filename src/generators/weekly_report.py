@@ -7,14 +7,22 @@ Creates comprehensive HTML reports with interactive Plotly charts
 import json
 import logging
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.offline as pyo
 import yaml
+from markupsafe import Markup
 from core.ai_analyst_report import AIAnalystReport
+from core.rolling_stats import summarize_stats
+from core.yield_curves import MARKET_NAMES, MARKETS, summarize_curves
+from generators.chart_publish import CHART_DIR, lazy_charts_html, plotly_bundle, publish_figures
+from generators.charts import CHART_NAMES, figures_html, report_figures
+from generators.rendering import render, render_markdown
+
+CHARTS_UNAVAILABLE_HTML = "<p>Chart data unavailable.</p>"
+# How a markdown_report.html page was rendered (charts: lazy, inline or none), so it can be rebuilt alike
+_RENDER_MARKER = re.compile(r'<meta name="yensense-render" content="markdown_report; charts=(\w+)">')
 
 
 class WeeklyReportGenerator:
@@ -28,6 +36,8 @@ class WeeklyReportGenerator:
         self.logger = logging.getLogger(__name__)
         self.output_dir = "data/output/reports"
         os.makedirs(self.output_dir, exist_ok=True)
+        self.chart_assets: List[str] = []  # Files the last HTML report links to, relative to output_dir
+        self.chart_mode = 'none'  # How the last HTML report's charts were included: lazy, inline or none
         
         # Initialize AI analyst
         self.ai_analyst = AIAnalystReport(config_path)
@@ -108,8 +118,19 @@ while carefully monitoring inflation dynamics.
         usd_jpy = fx.get('USD/JPY', 147.25)
         eur_jpy = fx.get('EUR/JPY', 158.90)
         
-        # Calculate simple momentum
-        usd_momentum = "bullish" if usd_jpy > 148 else "bearish" if usd_jpy < 146 else "range-bound"
+        # Momentum over the rolling window of daily closes, else from fixed ranges
+        fx_stats = data.get('fx_stats', {})
+        window_change = fx_stats.get('USD/JPY', {}).get('momentum_pct')
+        if window_change is not None:
+            usd_momentum = "bullish" if window_change > 1 else "bearish" if window_change < -1 else "range-bound"
+        else:
+            usd_momentum = "bullish" if usd_jpy > 148 else "bearish" if usd_jpy < 146 else "range-bound"
+        
+        regime_lines = summarize_stats(fx_stats)
+        regime = ""
+        if regime_lines:
+            regime = "### Regime\n\n" + "\n".join(f"- {line}" for line in regime_lines) + \
+                '\n\n<span title="z: standard deviations from the rolling mean; EWMA vol: annualized, decay 0.94">ℹ️</span>\n\n'
         
         analysis = f"""## Foreign Exchange Analysis
 
@@ -130,7 +151,7 @@ Euro-yen at {eur_jpy:.2f} indicates relative European currency strength, influen
 - European economic recovery pace
 - Cross-currency flows
 
-### Technical Outlook
+{regime}### Technical Outlook
 
 **Support Levels:** {usd_jpy - 2:.2f}, {usd_jpy - 4:.2f}
 **Resistance Levels:** {usd_jpy + 2:.2f}, {usd_jpy + 4:.2f}
@@ -138,10 +159,43 @@ Euro-yen at {eur_jpy:.2f} indicates relative European currency strength, influen
 <span title="Support: Price level where buying interest typically emerges">ℹ️</span>
 <span title="Resistance: Price level where selling pressure typically increases">ℹ️</span>
 
-**Data Source:** [Alpha Vantage](https://www.alphavantage.co/), Real-time FX rates"""
+**Data Source:** [Alpha Vantage](https://www.alphavantage.co/), Real-time FX rates{"; [FRED](https://fred.stlouisfed.org/), daily closes" if regime else ""}"""
         
         return analysis
     
+    def _generate_rates_analysis(self, data: Dict[str, Any]) -> str:
+        """Generate rates and curve analysis section (empty without curve data)"""
+        curves = data.get('curves', {})
+        levels = curves.get('levels', {})
+        if not levels:
+            return ""
+        
+        tenors = ('2y', '5y', '10y', '30y')
+        header = "| Curve | " + " | ".join(tenor.upper() for tenor in tenors) + " |"
+        rows = [header, "|" + "---|" * (len(tenors) + 1)]
+        for market in MARKETS:
+            if market in levels:
+                cells = [f"{levels[market][tenor]:.3f}%" if levels[market].get(tenor) is not None else "N/A"
+                         for tenor in tenors]
+                rows.append(f"| {MARKET_NAMES[market]} | " + " | ".join(cells) + " |")
+        
+        curve_lines = "\n".join(f"- {line}" for line in summarize_curves(curves))
+        table = "\n".join(rows)
+        
+        return f"""## Rates & Curve Analysis
+
+### Yield Levels
+
+{table}
+
+### Spreads and Curve Shape
+
+{curve_lines}
+
+<span title="2s10s: 10Y minus 2Y yield; 2s5s10s butterfly: 2 x 5Y minus 2Y minus 10Y">ℹ️</span>
+
+**Data Sources:** [FRED](https://fred.stlouisfed.org/), [JBOND](https://www.bb.jbts.co.jp/), [Investing.com](https://www.investing.com/rates-bonds/)"""
+    
     def _generate_news_analysis(self, data: Dict[str, Any]) -> str:
         """Generate news and events analysis"""
         news_items = []
@@ -214,88 +268,29 @@ Based on current market dynamics and our analysis, we expect USD/JPY to trade wi
         
         return outlook
     
-    def _create_interactive_chart(self, data: Dict[str, Any]) -> str:
-        """Create interactive Plotly chart"""
-        # Prepare data for chart
-        dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
-        
-        # Simulate historical data (in production, fetch real historical data)
-        usd_jpy_current = data['fx_rates'].get('USD/JPY', 147.25)
-        usd_jpy_values = [usd_jpy_current + (i-15)*0.1 + (i%3)*0.05 for i in range(30)]
-        
-        cpi_current = data['macro_data'].get('japan_cpi', 106.5)
-        cpi_values = [cpi_current + (i-15)*0.01 for i in range(30)]
-        
-        # Create figure with secondary y-axis
-        fig = go.Figure()
-        
-        # Add USD/JPY trace
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=usd_jpy_values,
-                name='USD/JPY',
-                line=dict(color='#1f77b4', width=2),
-                hovertemplate='Date: %{x|%Y-%m-%d}<br>USD/JPY: %{y:.2f}<extra></extra>'
-            )
+    def _create_interactive_chart(self, data: Dict[str, Any], report_name: str = "report") -> str:
+        """Create interactive Plotly charts from the stored curves and daily history"""
+        report_config = self.config['output']['weekly_report']
+        figures = report_figures(
+            data,
+            window=self.config['data'].get('fx_history', {}).get('window_days', 60),
+            max_points=report_config.get('chart_max_points', 400),
+            height=report_config['chart_height']
         )
-        
-        # Add CPI trace on secondary y-axis
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=cpi_values,
-                name='Japan CPI',
-                line=dict(color='#ff7f0e', width=2, dash='dot'),
-                yaxis='y2',
-                hovertemplate='Date: %{x|%Y-%m-%d}<br>CPI: %{y:.1f}<extra></extra>'
-            )
-        )
-        
-        # Update layout
-        fig.update_layout(
-            title='USD/JPY vs Japan CPI Dynamics',
-            xaxis_title='Date',
-            yaxis=dict(
-                title=dict(
-                    text='USD/JPY Exchange Rate',
-                    font=dict(color='#1f77b4')
-                ),
-                tickfont=dict(color='#1f77b4')
-            ),
-            yaxis2=dict(
-                title=dict(
-                    text='Consumer Price Index',
-                    font=dict(color='#ff7f0e')
-                ),
-                tickfont=dict(color='#ff7f0e'),
-                anchor='x',
-                overlaying='y',
-                side='right'
-            ),
-            hovermode='x unified',
-            height=self.config['output']['weekly_report']['chart_height'],
-            width=self.config['output']['weekly_report']['chart_width'],
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            ),
-            margin=dict(l=50, r=50, t=80, b=50)
-        )
-        
-        # Convert to HTML
-        chart_html = pyo.plot(
-            fig,
-            output_type='div',
-            include_plotlyjs='cdn',
-            config={'displayModeBar': True, 'displaylogo': False}
-        )
-        
-        return chart_html
+        if not figures:
+            self.chart_mode = 'none'
+            return CHARTS_UNAVAILABLE_HTML
+        
+        # "lazy": shared plotly.js bundle and per-chart data files, loaded when scrolled into view
+        if report_config.get('chart_mode', 'inline') == 'lazy':
+            try:
+                chart_html, self.chart_assets = publish_figures(figures, self.output_dir, report_name)
+                self.chart_mode = 'lazy'
+                return chart_html
+            except OSError as e:
+                self.logger.warning(f"Could not write chart files, inlining charts: {e}")
+        self.chart_mode = 'inline'
+        return figures_html(figures)
     
     def _generate_disclaimer(self) -> str:
         """Generate disclaimer section"""
@@ -323,6 +318,8 @@ research and consult with qualified financial advisors before making investment
             "",
             self._generate_fx_analysis(data),
             "",
+            self._generate_rates_analysis(data),
+            "",
             self._generate_news_analysis(data),
             "",
             self._generate_risk_outlook(data.get('sentiment_score', 50)),
@@ -340,175 +337,115 @@ research and consult with qualified financial advisors before making investment
         
         return markdown_content
     
-    def generate_html_report(self, data: Dict[str, Any], markdown_content: str) -> str:
+    def generate_html_report(self, data: Dict[str, Any], markdown_content: str,
+                             report_name: str = "report") -> str:
         """Generate HTML report with embedded chart"""
         self.logger.info("Generating weekly strategist report (HTML)")
         
         # Create interactive chart
-        chart_html = self._create_interactive_chart(data)
-        
-        # Convert markdown to HTML (basic conversion)
-        html_content = markdown_content
-        
-        # Basic markdown to HTML conversion
-        html_content = html_content.replace('# ', '<h1>').replace('\n\n', '</h1>\n\n')
-        html_content = html_content.replace('## ', '<h2>').replace('\n\n', '</h2>\n\n')
-        html_content = html_content.replace('### ', '<h3>').replace('\n', '</h3>\n')
-        html_content = html_content.replace('**', '<strong>').replace('**', '</strong>')
-        html_content = html_content.replace('- ', '<li>').replace('\n', '</li>\n')
-        
-        # Full HTML template
-        html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>YenSense AI Weekly Report - {datetime.now().strftime('%B %d, %Y')}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .container {{
-            background: white;
-            padding: 40px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-            border-bottom: 1px solid #ecf0f1;
-            padding-bottom: 5px;
-        }}
-        h3 {{
-            color: #7f8c8d;
-        }}
-        .metric {{
-            display: inline-block;
-            padding: 10px 20px;
-            margin: 10px;
-            background: #ecf0f1;
-            border-radius: 5px;
-            font-weight: bold;
-        }}
-        .chart-container {{
-            margin: 30px 0;
-            padding: 20px;
-            background: #fafafa;
-            border-radius: 8px;
-        }}
-        span[title] {{
-            cursor: help;
-            text-decoration: underline dotted;
-            color: #3498db;
-        }}
-        .disclaimer {{
-            margin-top: 40px;
-            padding: 20px;
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            font-size: 0.9em;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        ul {{
-            list-style-type: none;
-            padding-left: 0;
-        }}
-        li {{
-            padding: 5px 0;
-            padding-left: 20px;
-            position: relative;
-        }}
-        li:before {{
-            content: "▸";
-            position: absolute;
-            left: 0;
-            color: #3498db;
-        }}
-        .timestamp {{
-            text-align: center;
-            color: #95a5a6;
-            font-style: italic;
-            margin-top: 30px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>YenSense AI Weekly Strategist Report</h1>
-        <p style="text-align: center; color: #7f8c8d;">
-            Japan Macro & FX Intelligence | {datetime.now().strftime('%B %d, %Y')}
-        </p>
-        
-        <h2>Executive Summary</h2>
-        <div class="metric">USD/JPY: {data['fx_rates'].get('USD/JPY', 147.25):.2f}</div>
-        <div class="metric">EUR/JPY: {data['fx_rates'].get('EUR/JPY', 158.90):.2f}</div>
-        <div class="metric">Sentiment: {data.get('sentiment_score', 50)}/100</div>
-        
-        <div class="chart-container">
-            <h3>Interactive Market Analysis</h3>
-            {chart_html}
-        </div>
-        
-        <h2>Macroeconomic Analysis</h2>
-        <p>
-            <strong>Consumer Price Index:</strong> {data['macro_data'].get('japan_cpi', 106.5):.1f} 
-            <span title="CPI measures the average change in prices paid by consumers">ℹ️</span>
-        </p>
-        <p>
-            <strong>GDP:</strong> ${data['macro_data'].get('japan_gdp', 4231.14):.0f} billion
-            <span title="GDP represents the total value of all goods and services produced">ℹ️</span>
-        </p>
-        
-        <h2>Foreign Exchange Analysis</h2>
-        <p>Current market dynamics show USD/JPY trading at {data['fx_rates'].get('USD/JPY', 147.25):.2f}, 
-        reflecting ongoing monetary policy divergence between the Federal Reserve and Bank of Japan.</p>
-        
-        <h2>Market News & Events</h2>
-        <ul>
-            <li>BOJ maintains accommodative stance amid inflation monitoring</li>
-            <li>Fed signals data-dependent approach to rate decisions</li>
-            <li>Japan trade balance shows improvement on export strength</li>
-        </ul>
-        
-        <h2>Risks & Outlook</h2>
-        <p>YenSense Sentiment Score: <strong>{data.get('sentiment_score', 50)}/100</strong></p>
-        <p>Our analysis suggests a {'constructive' if data.get('sentiment_score', 50) >= 60 else 'balanced'} 
-        outlook for yen positioning over the coming week.</p>
-        
-        <div class="disclaimer">
-            <h3>Disclaimer</h3>
-            <p>This report is for informational purposes only and does not constitute financial advice. 
-            All data is sourced from public APIs and web sources. Please consult with qualified 
-            financial advisors before making investment decisions.</p>
-        </div>
-        
-        <p class="timestamp">
-            Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} JST<br>
-            Data sources: FRED, Alpha Vantage, Bank of Japan, Reuters, Nikkei Asia
-        </p>
-    </div>
-</body>
-</html>"""
-        
-        return html_template
+        self.chart_assets = []
+        chart_html = self._create_interactive_chart(data, report_name)
+        
+        now = datetime.now()
+        return render(
+            'weekly_report.html',
+            date_label=now.strftime('%B %d, %Y'),
+            generated_at=now.strftime('%Y-%m-%d %H:%M:%S'),
+            usd_jpy=data['fx_rates'].get('USD/JPY', 147.25),
+            eur_jpy=data['fx_rates'].get('EUR/JPY', 158.90),
+            sentiment=data.get('sentiment_score', 50),
+            cpi=data['macro_data'].get('japan_cpi', 106.5),
+            gdp=data['macro_data'].get('japan_gdp', 4231.14),
+            chart_html=Markup(chart_html)
+        )
+    
+    def _render_markdown_page(self, markdown_content: str, chart_html: str, generated_at: datetime,
+                              chart_mode: str) -> str:
+        """Markdown report as a page, charts placed after its first section"""
+        body = render_markdown(markdown_content)
+        split = body.find('<h2>', body.find('<h2>') + 1)
+        lead, rest = (body[:split], body[split:]) if split > 0 else (body, '')
+        title = next((line[2:].strip() for line in markdown_content.splitlines() if line.startswith('# ')),
+                     "YenSense AI Weekly Strategist Report")
+        return render(
+            'markdown_report.html',
+            title=title,
+            date_label=generated_at.strftime('%B %d, %Y'),
+            generated_at=generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+            lead=Markup(lead),
+            body=Markup(rest),
+            chart_html=Markup(chart_html),
+            chart_mode=chart_mode
+        )
+    
+    def _generate_html_wrapper(self, markdown_content: str, data: Dict[str, Any],
+                               report_name: str = "report") -> str:
+        """HTML page for a pipeline-written Markdown report, with charts from its data"""
+        self.logger.info("Rendering pipeline report (HTML)")
+        self.chart_assets = []
+        chart_html = self._create_interactive_chart(data, report_name)
+        return self._render_markdown_page(markdown_content, chart_html, datetime.now(), self.chart_mode)
+    
+    def rerender_archive(self, directory: str = None) -> List[str]:
+        """
+        Re-render report_*.md in directory (default: output_dir) to HTML
+        
+        For applying template changes to past reports. Only pages that can
+        be rebuilt as they were are re-rendered: pages from the Markdown
+        wrapper whose charts were "lazy" (relinked from their saved files,
+        which must still exist) or unavailable. Pages with inline charts,
+        pages from the weekly_report.html layout and unmarked older pages
+        are left as they are. Returns the HTML files that changed.
+        """
+        directory = directory or self.output_dir
+        chart_dir = os.path.join(directory, CHART_DIR)
+        chart_files = set(os.listdir(chart_dir)) if os.path.isdir(chart_dir) else set()
+        height = self.config['output']['weekly_report']['chart_height']
+        bundle = None
+        changed, skipped = [], []
+        for md_filename in sorted(os.listdir(directory)):
+            if not (md_filename.startswith('report_') and md_filename.endswith('.md')):
+                continue
+            report_name = md_filename[:-3]
+            md_path = os.path.join(directory, md_filename)
+            html_path = os.path.join(directory, report_name + '.html')
+            current = None
+            if os.path.exists(html_path):
+                with open(html_path, 'r') as f:
+                    current = f.read()
+            
+            charts = [(f"{CHART_DIR}/{report_name}_{name}.json.gz", height) for name in CHART_NAMES
+                      if f"{report_name}_{name}.json.gz" in chart_files]
+            if current is None:
+                chart_mode = 'lazy' if charts else 'none'
+            else:
+                marker = _RENDER_MARKER.search(current)
+                chart_mode = marker.group(1) if marker else None  # Unmarked: other layout or older page
+            if chart_mode not in ('lazy', 'none') or (chart_mode == 'lazy' and not charts):
+                skipped.append(html_path)
+                continue
+            
+            if chart_mode == 'lazy':
+                if bundle is None:
+                    bundle = plotly_bundle(directory)
+                chart_html = lazy_charts_html(charts, bundle)
+            else:
+                chart_html = CHARTS_UNAVAILABLE_HTML
+            with open(md_path, 'r') as f:
+                markdown_content = f.read()
+            generated_at = datetime.fromtimestamp(os.path.getmtime(md_path))
+            html_content = self._render_markdown_page(markdown_content, chart_html, generated_at, chart_mode)
+            if html_content == current:
+                continue
+            with open(html_path, 'w') as f:
+                f.write(html_content)
+            changed.append(html_path)
+        
+        if skipped:
+            self.logger.warning(f"Not re-rendering {len(skipped)} report(s) whose charts or layout cannot be "
+                                f"rebuilt: {', '.join(os.path.basename(path) for path in skipped)}")
+        self.logger.info(f"Re-rendered {len(changed)} report(s) in {directory}")
+        return changed
     
     def save_reports(self, data: Dict[str, Any]) -> Dict[str, str]:
         """Save both markdown and HTML reports"""
@@ -516,7 +453,7 @@ research and consult with qualified financial advisors before making investment
         
         # Generate reports
         markdown_content = self.generate_markdown_report(data)
-        html_content = self.generate_html_report(data, markdown_content)
+        html_content = self.generate_html_report(data, markdown_content, f"report_{date_str}")
         
         # Save markdown
         md_filename = f"report_{date_str}.md"
@@ -535,6 +472,7 @@ research and consult with qualified financial advisors before making investment
         return {
             'markdown_file': md_path,
             'html_file': html_path,
+            'assets': [os.path.join(self.output_dir, asset) for asset in self.chart_assets],
             'date': date_str
         }
 
@@ -5,23 +5,25 @@ Coordinates data fetching, report generation, and scheduling
 """
 
 import argparse
+import asyncio
 import logging
 import logging.handlers
 import os
 import sys
-import time
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 import subprocess
 
-import schedule
-import pytz
 import yaml
 
 # Add script directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.data_fetcher import DataFetcher
+from core.scheduler import AsyncScheduler
+from core.timezones import get_zone
 from generators.morning_brief import MorningBriefGenerator
+from generators.site_builder import SiteBuilder
 from generators.weekly_report import WeeklyReportGenerator
 from pipeline.orchestrator import AnalysisPipeline
 
@@ -36,12 +38,14 @@ class YenSenseAI:
         self.setup_logging()
         
         # Initialize components
-        self.data_fetcher = DataFetcher(config_path)
+        self.data_fetcher = DataFetcher(config_path, persist_state=True)
         self.morning_brief = MorningBriefGenerator(config_path)
         self.weekly_report = WeeklyReportGenerator(config_path)
+        self._pipeline = None  # Built on first weekly report, then kept warm
         
         # Set timezone
-        self.timezone = pytz.timezone(self.config['schedule']['timezone'])
+        self.timezone = get_zone(self.config['schedule']['timezone'])
+        self.scheduler = None
         
         self.logger.info("YenSense AI initialized successfully")
     
@@ -85,16 +89,27 @@ class YenSenseAI:
         logging.getLogger('morning_brief').setLevel(logging.INFO)
         logging.getLogger('weekly_report').setLevel(logging.INFO)
     
-    def run_morning_brief(self):
-        """Execute morning brief generation"""
+    def prefetch_morning_brief_data(self) -> Dict[str, Any]:
+        """Collect morning brief data ahead of the scheduled brief time"""
+        self.logger.info("Pre-fetching morning brief data...")
+        return self.data_fetcher.fetch_morning_brief_data()
+    
+    def run_morning_brief(self, data: Optional[Dict[str, Any]] = None):
+        """Execute morning brief generation, optionally from pre-fetched data"""
         self.logger.info("=" * 50)
         self.logger.info("Starting Daily Morning Brief Generation")
         self.logger.info(f"Time: {datetime.now(self.timezone).strftime('%Y-%m-%d %H:%M:%S %Z')}")
         
         try:
-            # Fetch latest data
-            self.logger.info("Fetching latest market data...")
-            data = self.data_fetcher.fetch_morning_brief_data()
+            if data is None:
+                # Fetch latest data
+                self.logger.info("Fetching latest market data...")
+                data = self.data_fetcher.fetch_morning_brief_data()
+            else:
+                # Only fast-moving sources can have moved since the pre-fetch
+                refresh_sources = self.config['schedule'].get('refresh_sources', ['fx', 'repo'])
+                self.logger.info(f"Using pre-fetched data from {data.get('timestamp')}")
+                data = self.data_fetcher.refresh_morning_brief_data(data, refresh_sources)
             
             # Generate morning brief segments
             self.logger.info("Generating domain-specific segments...")
@@ -103,6 +118,7 @@ class YenSenseAI:
             # Save brief and generate multi-voice audio
             self.logger.info("Saving brief and generating multi-voice audio...")
             result = self.morning_brief.save_brief(segments, data)
+            self.data_fetcher.commit_news_cursor(data)
             
             self.logger.info(f"Morning brief completed successfully!")
             self.logger.info(f"Text file: {result['text_file']}")
@@ -110,7 +126,8 @@ class YenSenseAI:
             
             # Deploy to GitHub Pages if enabled
             if self.config['github_pages']['enabled']:
-                self.deploy_to_github_pages(result['text_file'], 'morning')
+                self.deploy_to_github_pages(result['text_file'], 'morning',
+                                            extra_files=self._audio_bundle(result))
             
             return result
             
@@ -118,6 +135,12 @@ class YenSenseAI:
             self.logger.error(f"Error generating morning brief: {e}", exc_info=True)
             return None
     
+    def get_pipeline(self) -> AnalysisPipeline:
+        """Analysis pipeline, reused across runs and sharing the warm DataFetcher"""
+        if self._pipeline is None:
+            self._pipeline = AnalysisPipeline(self.config_path, data_fetcher=self.data_fetcher)
+        return self._pipeline
+    
     def run_weekly_report(self):
         """Execute weekly report generation using new pipeline"""
         self.logger.info("=" * 50)
@@ -127,7 +150,7 @@ class YenSenseAI:
         try:
             # Use new multi-stage pipeline for weekly reports
             self.logger.info("Initializing multi-stage analysis pipeline...")
-            pipeline = AnalysisPipeline(self.config_path)
+            pipeline = self.get_pipeline()
             
             # Run the complete pipeline
             self.logger.info("Running analysis pipeline (8 stages)...")
@@ -156,23 +179,27 @@ class YenSenseAI:
             self.logger.info("Generating HTML version with charts...")
             html_report = self.weekly_report._generate_html_wrapper(
                 context.final_report,
-                context.raw_data
+                context.raw_data,
+                report_name=f"report_{timestamp}"
             )
             
             html_file = f"data/output/reports/report_{timestamp}.html"
             with open(html_file, 'w') as f:
                 f.write(html_report)
             self.logger.info(f"Saved HTML report: {html_file}")
+            self.data_fetcher.commit_news_cursor(context.raw_data)
             
             result = {
                 'markdown_file': md_file,
                 'html_file': html_file,
+                'assets': [os.path.join(os.path.dirname(html_file), asset)
+                           for asset in self.weekly_report.chart_assets],
                 'title': context.title
             }
             
             # Deploy to GitHub Pages if enabled
             if self.config['github_pages']['enabled']:
-                self.deploy_to_github_pages(html_file, 'weekly')
+                self.deploy_to_github_pages(html_file, 'weekly', assets=result['assets'], title=context.title)
             
             return result
             
@@ -187,6 +214,7 @@ class YenSenseAI:
             # Generate reports
             self.logger.info("Generating weekly strategist report...")
             result = self.weekly_report.save_reports(data)
+            self.data_fetcher.commit_news_cursor(data)
             
             self.logger.info(f"Weekly report completed successfully!")
             self.logger.info(f"Markdown file: {result['markdown_file']}")
@@ -194,7 +222,7 @@ class YenSenseAI:
             
             # Deploy to GitHub Pages if enabled
             if self.config['github_pages']['enabled']:
-                self.deploy_to_github_pages(result['html_file'], 'weekly')
+                self.deploy_to_github_pages(result['html_file'], 'weekly', assets=result.get('assets'))
             
             return result
             
@@ -202,8 +230,53 @@ class YenSenseAI:
             self.logger.error(f"Error generating weekly report: {e}", exc_info=True)
             return None
     
-    def deploy_to_github_pages(self, file_path: str, report_type: str):
-        """Deploy reports to GitHub Pages"""
+    def _audio_bundle(self, result: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Audio files to publish and their role in the episode: encoded profiles,
+        segments and chapters (master only if nothing was encoded)
+        """
+        outputs = result.get('audio_outputs') or {}
+        bundle = {}
+        for key, path in outputs.items():
+            if key == 'chapters':
+                bundle[path] = 'chapters'
+            elif key.startswith('segment_'):
+                bundle[path] = 'segment'
+            elif path.endswith('.mp3') and 'audio' not in bundle.values():
+                bundle[path] = 'audio'  # Episode enclosure
+            else:
+                bundle[path] = 'alternate'
+        has_profile = any(role in ('audio', 'alternate') for role in bundle.values())
+        if not has_profile and result.get('audio_file'):
+            bundle[result['audio_file']] = 'audio'
+        return bundle
+    
+    def get_site_builder(self) -> SiteBuilder:
+        """Site builder for the GitHub Pages directory"""
+        pages_config = self.config['github_pages']
+        site_config = pages_config.get('site', {})
+        return SiteBuilder(
+            pages_config['directory'],
+            base_url=site_config.get('base_url', ''),
+            index_items=site_config.get('index_items', 10),
+            feed_items=site_config.get('feed_items', 30),
+            publish_time=datetime.strptime(self.config['schedule']['daily_brief_time'], '%H:%M').time(),
+            tz=self.timezone,
+            podcast=site_config.get('podcast')
+        )
+    
+    def deploy_to_github_pages(self, file_path: str, report_type: str, extra_files: Optional[Dict[str, str]] = None,
+                               assets: Optional[List[str]] = None, title: Optional[str] = None):
+        """
+        Deploy reports (and any accompanying files) to GitHub Pages
+        
+        extra_files ({path: role}) are published next to the report; assets
+        (chart data and the plotly.js bundle) keep their path relative to the
+        report's directory. Only changed files are copied, the index, archive
+        and feed pages are regenerated when something was published, and
+        nothing is pushed if the site did not change since the last
+        successful push (a failed push is retried on the next run).
+        """
         try:
             self.logger.info(f"Deploying {report_type} report to GitHub Pages...")
             
@@ -211,14 +284,20 @@ class YenSenseAI:
             docs_dir = self.config['github_pages']['directory']
             os.makedirs(docs_dir, exist_ok=True)
             
-            # Copy file to docs directory
-            import shutil
             filename = os.path.basename(file_path)
-            dest_path = os.path.join(docs_dir, filename)
-            shutil.copy2(file_path, dest_path)
+            files = [(file_path, filename)]
+            metadata = {filename: {'title': title}} if title else {}
+            for extra_file, role in (extra_files or {}).items():
+                files.append((extra_file, os.path.basename(extra_file)))
+                metadata[os.path.basename(extra_file)] = {'role': role}
+            for asset in assets or []:
+                files.append((asset, os.path.relpath(asset, os.path.dirname(file_path)).replace(os.sep, '/')))
             
-            # Create or update index.html
-            self.update_github_pages_index(docs_dir, report_type, filename)
+            site = self.get_site_builder()
+            site.publish(files, metadata)
+            if not site.push_pending:
+                self.logger.info("GitHub Pages content unchanged and deployed, nothing to push")
+                return
             
             # Use ghp-import to deploy (requires git repository)
             try:
@@ -227,6 +306,7 @@ class YenSenseAI:
                     '-b', self.config['github_pages']['branch'],
                     docs_dir
                 ], check=True, capture_output=True, text=True)
+                site.mark_pushed()
                 
                 self.logger.info(f"Successfully deployed to GitHub Pages")
             except subprocess.CalledProcessError as e:
@@ -236,115 +316,42 @@ class YenSenseAI:
         except Exception as e:
             self.logger.error(f"Error deploying to GitHub Pages: {e}")
     
-    def update_github_pages_index(self, docs_dir: str, report_type: str, filename: str):
-        """Update GitHub Pages index.html with latest reports"""
-        index_path = os.path.join(docs_dir, 'index.html')
-        
-        # Create basic index if it doesn't exist
-        if not os.path.exists(index_path):
-            index_content = """<!DOCTYPE html>
-<html>
-<head>
-    <title>YenSense AI - Japan Macro & FX Intelligence</title>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-        .header {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        h1 { color: #2c3e50; }
-        .reports {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-        }
-        .report-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }
-        .report-card h2 { color: #34495e; }
-        .report-link {
-            display: inline-block;
-            margin: 10px 0;
-            padding: 10px 20px;
-            background: #3498db;
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-        }
-        .report-link:hover { background: #2980b9; }
-        .timestamp { color: #7f8c8d; font-size: 0.9em; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>YenSense AI</h1>
-        <p>Professional Japan Macro & FX Intelligence</p>
-        <p class="timestamp">Updated: """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S JST') + """</p>
-    </div>
-    <div class="reports">
-        <div class="report-card">
-            <h2>Daily Morning Brief</h2>
-            <p>2-3 minute audio brief with Japan macro updates and FX analysis</p>
-            <div id="morning-links"></div>
-        </div>
-        <div class="report-card">
-            <h2>Weekly Strategist Report</h2>
-            <p>Comprehensive analysis with interactive charts and market outlook</p>
-            <div id="weekly-links"></div>
-        </div>
-    </div>
-</body>
-</html>"""
-            
-            with open(index_path, 'w') as f:
-                f.write(index_content)
-        
-        # Update with latest report link (simplified for MVP)
-        self.logger.info(f"GitHub Pages index updated with {report_type} report: {filename}")
-    
     def schedule_jobs(self):
         """Schedule recurring jobs"""
         self.logger.info("Setting up scheduled jobs...")
+        schedule_config = self.config['schedule']
+        self.scheduler = AsyncScheduler(self.timezone, max_workers=schedule_config.get('max_workers', 2))
         
         # Schedule daily morning brief
-        daily_time = self.config['schedule']['daily_brief_time']
-        schedule.every().day.at(daily_time).do(self.run_morning_brief)
-        self.logger.info(f"Daily morning brief scheduled at {daily_time} JST")
+        daily_time = schedule_config['daily_brief_time']
+        prefetch_minutes = schedule_config.get('prefetch_minutes', 0)
+        self.scheduler.every_day('morning_brief', daily_time, self.run_morning_brief,
+                                 prepare=self.prefetch_morning_brief_data, lead_minutes=prefetch_minutes)
+        self.logger.info(f"Daily morning brief scheduled at {daily_time} {schedule_config['timezone']}")
+        if prefetch_minutes:
+            self.logger.info(f"Morning brief data collection starts {prefetch_minutes} minutes earlier")
         
         # Schedule weekly report
-        weekly_day = self.config['schedule']['weekly_report_day']
-        weekly_time = self.config['schedule']['weekly_report_time']
-        getattr(schedule.every(), weekly_day).at(weekly_time).do(self.run_weekly_report)
-        self.logger.info(f"Weekly report scheduled for {weekly_day}s at {weekly_time} JST")
+        weekly_day = schedule_config['weekly_report_day']
+        weekly_time = schedule_config['weekly_report_time']
+        self.scheduler.every_week('weekly_report', weekly_day, weekly_time, self.run_weekly_report)
+        self.logger.info(f"Weekly report scheduled for {weekly_day}s at {weekly_time} {schedule_config['timezone']}")
     
     def run_scheduler(self):
-        """Run the scheduler loop"""
+        """Run the scheduler until interrupted"""
+        if self.scheduler is None:
+            self.schedule_jobs()
         self.logger.info("YenSense AI scheduler started")
         self.logger.info("Press Ctrl+C to stop")
         
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            asyncio.run(self.scheduler.run())
         except KeyboardInterrupt:
             self.logger.info("Scheduler stopped by user")
         except Exception as e:
             self.logger.error(f"Scheduler error: {e}", exc_info=True)
+        finally:
+            self.scheduler.shutdown(wait=False)
 
 
 def main():
@@ -354,6 +361,10 @@ def main():
     parser.add_argument('--weekly', action='store_true', help='Run weekly report now')
     parser.add_argument('--fetch', action='store_true', help='Fetch data only')
     parser.add_argument('--schedule', action='store_true', help='Run scheduled jobs')
+    parser.add_argument('--replay', nargs=2, metavar=('START', 'END'),
+                        help='Replay the analysis pipeline as of each weekday from START to END (YYYY-MM-DD)')
+    parser.add_argument('--workers', type=int, help='Processes for --replay')
+    parser.add_argument('--rerender', action='store_true', help='Re-render saved weekly reports with the current templates')
     parser.add_argument('--config', default='config.yaml', help='Config file path')
     
     args = parser.parse_args()
@@ -375,6 +386,17 @@ def main():
     elif args.schedule:
         yensense.schedule_jobs()
         yensense.run_scheduler()
+    elif args.replay:
+        import json
+        from pipeline.replay import run_replay
+        start, end = (datetime.strptime(day, '%Y-%m-%d').date() for day in args.replay)
+        result = run_replay(args.config, start, end, max_workers=args.workers)
+        print(f"Replayed {len(result['runs'])} dates ({len(result['skipped'])} without archived data)")
+        print(json.dumps(result['summary'], indent=2))
+        print(f"Results: {result['path']}")
+    elif args.rerender:
+        changed = yensense.weekly_report.rerender_archive()
+        print(f"Re-rendered {len(changed)} report(s)")
     else:
         print("YenSense AI - Japan Macro & FX Intelligence")
         print("\nUsage:")
@@ -382,6 +404,8 @@ def main():
         print("  python main.py --weekly     # Run weekly report now")
         print("  python main.py --fetch      # Fetch data only")
         print("  python main.py --schedule   # Start scheduler")
+        print("  python main.py --replay 2025-09-01 2025-09-30  # Backtest the pipeline on archived data")
+        print("  python main.py --rerender   # Apply template changes to saved reports")
         print("\nFor first-time setup:")
         print("  1. Install dependencies: pip install -r requirements.txt")
         print("  2. Configure API keys in config.yaml")
@@ -0,0 +1,209 @@
+"""
+Compact storage of pipeline context snapshots
+Each run's context is streamed as compressed JSON (gzip, or zstd when the
+zstandard package is installed) into logs/pipeline_contexts. Every
+raw_data and enhanced_data source is stored once, as a blob named by the
+hash of its content and shared by all runs that saw the same data, so an
+economic calendar that did not change between runs costs nothing the
+second time. Old runs are pruned by count and age, and blobs no remaining
+run refers to are deleted with them
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Dict, List, Optional
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+DEFAULT_CONTEXT_DIR = 'logs/pipeline_contexts'
+BLOB_DIR = 'blobs'
+INDEX_FILE = 'index.json'  # Snapshot file name -> blobs it refers to
+DEDUPLICATED = ('raw_data', 'enhanced_data')  # Context fields stored as one blob per source
+BLOB_REF = '$blob'
+
+_PREFIX = 'pipeline_context_'
+_TIME_FORMAT = '%Y%m%d_%H%M%S'
+_EXTENSIONS = {'gzip': '.json.gz', 'zstd': '.json.zst'}
+_WRITE_CHARS = 64 * 1024
+_ENCODER = json.JSONEncoder(default=str, ensure_ascii=False, separators=(',', ':'))
+_CANONICAL = json.JSONEncoder(default=str, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+def _compressor(raw: BinaryIO, compression: str) -> BinaryIO:
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=10).stream_writer(raw, closefd=False)
+    return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0)
+
+
+def _read(path: str) -> Any:
+    """Decoded JSON of a snapshot or blob, whatever it was compressed with"""
+    if path.endswith('.zst'):
+        if not HAS_ZSTD:
+            raise ValueError(f"{path} is zstd-compressed and the zstandard package is not installed")
+        with open(path, 'rb') as raw, zstandard.ZstdDecompressor().stream_reader(raw) as f:
+            return json.load(f)
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        return json.load(f)
+
+
+def snapshot_time(name: str) -> Optional[datetime]:
+    """When a snapshot file was saved, from its name; None for other files"""
+    if not name.startswith(_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(_PREFIX):len(_PREFIX) + 15], _TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+class ContextStore:
+    """Pipeline context snapshots with content-addressed source data and a retention policy"""
+
+    def __init__(self, directory: str = DEFAULT_CONTEXT_DIR, keep_runs: int = 60, keep_days: int = 30,
+                 compression: str = 'gzip'):
+        """
+        keep_runs: newest snapshots kept (0 for no limit)
+        keep_days: snapshots older than this are deleted (0 for no limit)
+        """
+        self.directory = directory
+        self.keep_runs = keep_runs
+        self.keep_days = keep_days
+        self.logger = logging.getLogger(__name__)
+        if compression == 'zstd' and not HAS_ZSTD:
+            self.logger.warning("zstandard is not installed, compressing pipeline contexts with gzip")
+            compression = 'gzip'
+        if compression not in _EXTENSIONS:
+            raise ValueError(f"Unknown compression '{compression}', expected one of {sorted(_EXTENSIONS)}")
+        self.compression = compression
+
+    def _atomic(self, path: str, write):
+        """Call write(binary file) on a temporary file, then move it into place"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw:
+                write(raw)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _stream(self, raw: BinaryIO, value: Any):
+        """Encode value into the compressor piece by piece, never holding the whole document"""
+        with _compressor(raw, self.compression) as out:
+            pending, size = [], 0
+            for chunk in _ENCODER.iterencode(value):
+                pending.append(chunk)
+                size += len(chunk)
+                if size >= _WRITE_CHARS:
+                    out.write(''.join(pending).encode('utf-8'))
+                    pending, size = [], 0
+            out.write(''.join(pending).encode('utf-8'))
+
+    def _put_blob(self, value: Any) -> str:
+        """Store a value under the hash of its canonical JSON; returns its path relative to BLOB_DIR"""
+        payload = _CANONICAL.encode(value).encode('utf-8')
+        digest = hashlib.sha256(payload).hexdigest()
+        relative = f"{digest[:2]}/{digest}{_EXTENSIONS[self.compression]}"
+        path = os.path.join(self.directory, BLOB_DIR, relative)
+        if not os.path.exists(path):
+            def write(raw):
+                with _compressor(raw, self.compression) as out:
+                    out.write(payload)
+            self._atomic(path, write)
+        return relative
+
+    def _load_index(self) -> Dict[str, List[str]]:
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Unreadable context index, unreferenced blobs are kept until it is rebuilt: {e}")
+            return {}
+
+    def _save_index(self, index: Dict[str, List[str]]):
+        self._atomic(os.path.join(self.directory, INDEX_FILE),
+                     lambda raw: raw.write(json.dumps(index, separators=(',', ':')).encode('utf-8')))
+
+    def save(self, context: Dict[str, Any], saved_at: Optional[datetime] = None) -> str:
+        """Write a context dict (PipelineContext.to_dict()); returns the snapshot path"""
+        saved_at = saved_at or datetime.now()
+        snapshot = dict(context)
+        blobs = []
+        for field in DEDUPLICATED:
+            section = snapshot.get(field)
+            if isinstance(section, dict):
+                refs = {key: self._put_blob(value) for key, value in section.items()}
+                blobs.extend(refs.values())
+                snapshot[field] = {key: {BLOB_REF: ref} for key, ref in refs.items()}
+
+        name = f"{_PREFIX}{saved_at.strftime(_TIME_FORMAT)}{_EXTENSIONS[self.compression]}"
+        path = os.path.join(self.directory, name)
+        self._atomic(path, lambda raw: self._stream(raw, snapshot))
+
+        index = self._load_index()
+        index[name] = sorted(set(blobs))
+        self._save_index(index)
+        return path
+
+    def load(self, path: str) -> Dict[str, Any]:
+        """A saved context dict with its source data read back from the blobs"""
+        snapshot = _read(path)
+        for field in DEDUPLICATED:
+            section = snapshot.get(field)
+            if isinstance(section, dict):
+                snapshot[field] = {
+                    key: _read(os.path.join(self.directory, BLOB_DIR, value[BLOB_REF]))
+                    if isinstance(value, dict) and BLOB_REF in value else value
+                    for key, value in section.items()
+                }
+        return snapshot
+
+    def snapshots(self) -> List[str]:
+        """Snapshot file names, oldest first (including plain JSON from before compaction)"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted((name for name in os.listdir(self.directory)
+                       if snapshot_time(name) and not name.endswith('.tmp')), key=lambda n: (snapshot_time(n), n))
+
+    def prune(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Delete snapshots beyond keep_runs or older than keep_days, then the
+        blobs only they referred to; returns the snapshot names deleted
+        """
+        names = self.snapshots()
+        expired = set(names[:-self.keep_runs] if self.keep_runs else [])
+        if self.keep_days:
+            cutoff = (now or datetime.now()) - timedelta(days=self.keep_days)
+            expired.update(name for name in names if snapshot_time(name) < cutoff)
+        if not expired:
+            return []
+
+        index = self._load_index()
+        for name in expired:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+        released = {blob for name in expired for blob in index.pop(name, [])}
+        released -= {blob for blobs in index.values() for blob in blobs}
+        for blob in released:
+            try:
+                os.remove(os.path.join(self.directory, BLOB_DIR, blob))
+            except FileNotFoundError:
+                pass
+        self._save_index(index)
+        self.logger.info(f"Pruned {len(expired)} pipeline context(s) and {len(released)} unreferenced blob(s)")
+        return sorted(expired)
@@ -4,11 +4,12 @@ Pipeline orchestrator that manages the multi-stage analysis flow
 
 import logging
 from typing import List, Optional
-import json
-import os
 from datetime import datetime
 
+import yaml
+
 from .context import PipelineContext
+from .context_store import DEFAULT_CONTEXT_DIR, ContextStore
 from .stages import (
     InitialSummaryStage,
     EvidenceGatheringStage,
@@ -20,17 +21,20 @@ from .stages import (
 )
 from core.data_fetcher import DataFetcher
 
+# News cursor of the pipeline, kept apart from the morning brief's so each sees its own new headlines
+NEWS_CONSUMER = 'weekly_report'
+
 
 class AnalysisPipeline:
     """Orchestrates the multi-stage AI analysis pipeline"""
     
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize pipeline with all stages"""
+    def __init__(self, config_path: str = "config.yaml", data_fetcher: Optional[DataFetcher] = None):
+        """Initialize pipeline with all stages (optionally sharing an existing DataFetcher)"""
         self.config_path = config_path
         self.logger = logging.getLogger(__name__)
         
         # Initialize data fetcher (stage 1)
-        self.data_fetcher = DataFetcher(config_path)
+        self.data_fetcher = data_fetcher or DataFetcher(config_path)
         
         # Initialize analysis stages (stages 2-8)
         self.stages = [
@@ -43,14 +47,25 @@ class AnalysisPipeline:
             ReportGenerationStage(config_path)
         ]
         
+        # Debug snapshots of each run's context
+        with open(config_path, 'r') as f:
+            snapshots = (yaml.safe_load(f) or {}).get('pipeline', {}).get('contexts', {})
+        self.context_store = ContextStore(
+            snapshots.get('directory', DEFAULT_CONTEXT_DIR),
+            keep_runs=snapshots.get('keep_runs', 60),
+            keep_days=snapshots.get('keep_days', 30),
+            compression=snapshots.get('compression', 'gzip')
+        )
+        
         self.logger.info(f"Initialized pipeline with {len(self.stages)} stages")
     
-    def run(self, save_context: bool = True) -> PipelineContext:
+    def run(self, save_context: bool = True, as_of: Optional[datetime] = None) -> PipelineContext:
         """
         Run the complete analysis pipeline
         
         Args:
             save_context: Whether to save context to file for debugging
+            as_of: Date the run stands at, for replays (the data fetcher must be point-in-time)
             
         Returns:
             Completed pipeline context with all results
@@ -58,15 +73,19 @@ class AnalysisPipeline:
         self.logger.info("="*50)
         self.logger.info("Starting YenSense AI Analysis Pipeline")
         self.logger.info(f"Timestamp: {datetime.now().isoformat()}")
+        if as_of:
+            self.logger.info(f"As of: {as_of.isoformat()}")
         self.logger.info("="*50)
         
         # Initialize context
         context = PipelineContext()
+        if as_of:
+            context.timestamp = as_of
         
         # Stage 1: Data Collection (using DataFetcher directly)
         self.logger.info(f"\n--- Stage 1/{len(self.stages)+1}: Data Collection ---")
         try:
-            context.raw_data = self.data_fetcher.fetch_all_data()
+            context.raw_data = self.data_fetcher.fetch_all_data(news_consumer=NEWS_CONSUMER)
             self.logger.info(f"Collected data from {len(context.raw_data)} sources")
         except Exception as e:
             self.logger.error(f"Critical error in Data Collection: {e}")
@@ -160,27 +179,15 @@ class AnalysisPipeline:
         return False
     
     def _save_context(self, context: PipelineContext):
-        """Save context to file for debugging"""
+        """Save context to file for debugging, then apply the retention policy"""
         try:
-            # Create logs directory if it doesn't exist
-            os.makedirs("logs/pipeline_contexts", exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"logs/pipeline_contexts/pipeline_context_{timestamp}.json"
-            
-            # Convert context to serializable format
-            context_dict = context.to_dict()
-            
-            # Save to file
-            with open(filename, 'w') as f:
-                json.dump(context_dict, f, indent=2, default=str)
-            
+            filename = self.context_store.save(context.to_dict())
             self.logger.info(f"Saved pipeline context to {filename}")
+            self.context_store.prune()
             
         except Exception as e:
             self.logger.error(f"Failed to save context: {e}")
 
-
 def run_pipeline(config_path: str = "config.yaml") -> PipelineContext:
     """
     Convenience function to run the complete pipeline
@@ -1,21 +1,53 @@
 """
 Stage 6: Calculation
-AI performs actual calculations and analysis
+Deterministic calculators compute the figures; AI only interprets them
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from datetime import date, datetime
 import sys
 import os
-import json
+import re
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import numpy as np
+
 from .base_stage import BaseStage
 from ..context import PipelineContext
 from core.ai_analyst_report import AIAnalystReport
+from core.calculators import (
+    absolute_vol_bp, carry_pct, forward_points, implied_cross, pct_change, rate_differential_bp,
+    realized_vol, zscore
+)
+
+FX_PAIRS = ('USD/JPY', 'EUR/JPY')
+DIFFERENTIAL_TENORS = ('2y', '5y', '10y', '30y')
+
+# Calculators the reasoning plan can name, with a description for the plan prompt and
+# keywords used to map plan items that do not name any
+CALCULATORS = {
+    'fx_changes': ('Percent changes of USD/JPY and EUR/JPY against earlier closes',
+                   ('change', 'move', 'trend', 'momentum', 'performance', 'moved')),
+    'implied_crosses': ('EUR/USD implied from EUR/JPY and USD/JPY', ('cross', 'eur/usd', 'implied', 'euro')),
+    'rate_differentials': ('US-Japan, Germany-Japan and US-Germany yield differentials by tenor (bp)',
+                           ('differential', 'spread', 'yield', 'treasury', 'jgb', 'bund', 'policy divergence')),
+    'carry': ('Carry and 3M forward points of long USD/JPY and EUR/JPY from 3M rates',
+              ('carry', 'interest rate', 'forward', 'funding')),
+    'realized_volatility': ('Annualized realized volatility of FX (%) and yields (bp) over the available history',
+                            ('volatil', 'risk', 'range', 'stability')),
+    'zscores': ('Z-scores of current FX and yield levels against their history',
+                ('historical', 'average', 'unusual', 'z-score', 'extreme', 'compare', 'relative to'))
+}
+DEFAULT_CALCULATORS = ('fx_changes', 'rate_differentials')
+
+# USD/JPY reference closes: lookback in days, and how far the nearest close may be from it
+# (the FRED FX series can be weekly)
+REFERENCE_LOOKBACKS = {'1_month_ago': 30, '3_months_ago': 91, '1_year_ago': 365}
+REFERENCE_TOLERANCE_DAYS = 7
 
 
 class CalculationStage(BaseStage):
-    """AI performs calculations to answer the identified questions"""
+    """Computes the figures each analysis needs and has AI interpret them"""
     
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize with AI analyst"""
@@ -24,10 +56,11 @@ class CalculationStage(BaseStage):
     
     def execute(self, context: PipelineContext) -> PipelineContext:
         """
-        AI performs calculations based on the analysis plan
+        Run the calculators the analysis plan calls for
         
         Returns context with:
-        - calculations: Results of all calculations performed
+        - calculations: basic_metrics, every calculator's results (metrics),
+          and per plan item the figures used plus their interpretation
         """
         self.log_stage_start()
         
@@ -40,11 +73,12 @@ class CalculationStage(BaseStage):
             # Store stage output
             context.add_stage_output('calculation', {
                 'calculations_performed': len(calculations),
-                'calculation_types': list(calculations.keys())
+                'calculation_types': list(calculations.keys()),
+                'calculators_run': list(calculations.get('metrics', {}).keys())
             })
             
             self.logger.info(f"Performed {len(calculations)} calculations")
-            
+        
         except Exception as e:
             return self.handle_error(context, e)
         
@@ -54,54 +88,97 @@ class CalculationStage(BaseStage):
     def _perform_calculations(self, context: PipelineContext) -> Dict[str, Any]:
         """Perform actual calculations based on analysis plan"""
         calculations = {}
-        
-        # Get data for calculations
-        fx_rates = context.raw_data.get('fx_rates', {})
-        macro_data = context.raw_data.get('macro_data', {})
-        enhanced = context.enhanced_data
+        inputs = self._calculation_inputs(context)
         
         # Perform simple calculations that are always useful
-        calculations['basic_metrics'] = self._calculate_basic_metrics(fx_rates, macro_data, enhanced)
+        calculations['basic_metrics'] = self._calculate_basic_metrics(inputs, context)
+        
+        # Every calculator is cheap, so all of them run once and plan items pick their figures
+        metrics = {name: getattr(self, f'_calc_{name}')(inputs) for name in CALCULATORS}
+        calculations['metrics'] = metrics
         
-        # Ask AI to perform specific calculations based on the analysis plan
-        for i, analysis_item in enumerate(context.analysis_plan[:5]):  # Limit to 5 for performance
-            calc_result = self._ai_calculation(analysis_item, context)
-            calculations[f'analysis_{i+1}'] = {
-                'question': analysis_item['question'],
-                'calculation': calc_result
-            }
+        items = []
+        for analysis_item in context.analysis_plan[:5]:  # Limit to 5 for performance
+            names = self._select_calculators(analysis_item)
+            results = {key: value for name in names for key, value in metrics[name].items()}
+            items.append({'question': analysis_item['question'], 'calculators': names, 'results': results})
+        
+        interpretations = self._interpret(items)
+        for i, (item, interpretation) in enumerate(zip(items, interpretations), 1):
+            figures = self._format_results(item['results'])
+            item['calculation'] = f"{figures}\n{interpretation}".strip() if interpretation else figures
+            calculations[f'analysis_{i}'] = item
         
         return calculations
     
-    def _calculate_basic_metrics(self, fx_rates: Dict, macro_data: Dict, enhanced: Dict) -> Dict[str, Any]:
+    def _calculation_inputs(self, context: PipelineContext) -> Dict[str, Any]:
+        """Spot FX, yields and prior observations (oldest first, with their dates) as floats and arrays"""
+        raw = context.raw_data
+        
+        def number(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        
+        fx = raw.get('fx_rates', {})
+        spot = {pair: float(fx[pair]) for pair in FX_PAIRS if number(fx.get(pair))}
+        yields = {key: float(value) for key, value in raw.get('yields', {}).items() if number(value)}
+        
+        history, history_dates = {}, {}
+        for key, points in raw.get('history', {}).items():
+            points = [(day, value) for day, value in points if number(value)]
+            if points:
+                history[key] = np.array([value for _, value in points], dtype=float)
+                history_dates[key] = [day for day, _ in points]
+        
+        as_of = context.timestamp.date()
+        return {'spot': spot, 'yields': yields, 'history': history, 'history_dates': history_dates,
+                'as_of': as_of,
+                'reference_points': self._reference_points(history.get('USD/JPY'), history_dates.get('USD/JPY'),
+                                                           as_of)}
+    
+    @staticmethod
+    def _parse_day(day: Any) -> Optional[date]:
+        try:
+            return datetime.strptime(str(day)[:10], '%Y-%m-%d').date()
+        except ValueError:
+            return None
+    
+    def _reference_points(self, closes: Optional[np.ndarray], days: Optional[List[Any]],
+                          as_of: date) -> Dict[str, float]:
+        """The fetched close nearest each lookback, for lookbacks the history reaches"""
+        if closes is None:
+            return {}
+        dated = [(self._parse_day(day), close) for day, close in zip(days, closes)]
+        dated = [(day, close) for day, close in dated if day and day < as_of]
+        points = {}
+        for point, lookback in REFERENCE_LOOKBACKS.items():
+            if not dated:
+                break
+            day, close = min(dated, key=lambda pair: abs((as_of - pair[0]).days - lookback))
+            if abs((as_of - day).days - lookback) <= REFERENCE_TOLERANCE_DAYS:
+                points[point] = float(close)
+        return points
+    
+    def _calculate_basic_metrics(self, inputs: Dict[str, Any], context: PipelineContext) -> Dict[str, Any]:
         """Calculate basic metrics that are always useful"""
         metrics = {}
+        spot, yields = inputs['spot'], inputs['yields']
         
-        # FX calculations
-        if fx_rates:
-            usd_jpy = fx_rates.get('USD/JPY', 147.25)
-            eur_jpy = fx_rates.get('EUR/JPY', 158.90)
-            
-            # EUR/USD implied
-            if usd_jpy and eur_jpy:
-                metrics['implied_eurusd'] = round(eur_jpy / usd_jpy, 4)
-            
-            # Compare to historical if available
-            if 'historical_usdjpy' in enhanced:
-                hist = enhanced['historical_usdjpy']
-                if '1_month_ago' in hist:
-                    metrics['usdjpy_1m_change'] = round(usd_jpy - hist['1_month_ago'], 2)
-                    metrics['usdjpy_1m_change_pct'] = round((usd_jpy / hist['1_month_ago'] - 1) * 100, 2)
-        
-        # Rate differential if we have yield data
-        if 'us_yields' in enhanced:
-            yields = enhanced['us_yields']
-            jgb_10y = 0.25  # Approximate JGB yield
-            if '10Y' in yields:
-                metrics['rate_differential_10y'] = round(yields['10Y'] - jgb_10y, 2)
+        # EUR/USD implied
+        if 'USD/JPY' in spot and 'EUR/JPY' in spot:
+            metrics['implied_eurusd'] = round(implied_cross(spot['EUR/JPY'], spot['USD/JPY']), 4)
+        
+        # Compare to historical if available
+        month_ago = inputs['reference_points'].get('1_month_ago')
+        if 'USD/JPY' in spot and month_ago:
+            metrics['usdjpy_1m_change'] = round(spot['USD/JPY'] - month_ago, 2)
+            metrics['usdjpy_1m_change_pct'] = round(pct_change(spot['USD/JPY'], month_ago), 2)
+        
+        # Rate differential from the fetched curves (no assumed JGB level)
+        if 'ust_10y' in yields and 'jgb_10y' in yields:
+            metrics['rate_differential_10y_bp'] = round(rate_differential_bp(yields['ust_10y'], yields['jgb_10y']), 1)
         
         # Sentiment vs price alignment
-        sentiment = fx_rates.get('sentiment_score', 50) if fx_rates else 50
+        sentiment = context.raw_data.get('sentiment_score', 50)
         metrics['sentiment_score'] = sentiment
         metrics['sentiment_interpretation'] = (
             'Bullish' if sentiment > 60 else
@@ -111,63 +188,153 @@ class CalculationStage(BaseStage):
         
         return metrics
     
-    def _ai_calculation(self, analysis_item: Dict[str, str], context: PipelineContext) -> str:
-        """Ask AI to perform a specific calculation"""
+    # ---------- Calculators ---------- #
+    
+    @staticmethod
+    def _collect(names: List[str], values: Any, decimals: int = 2) -> Dict[str, float]:
+        """Name the elements of a calculator result, dropping NaNs"""
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        return {name: round(float(value), decimals) for name, value in zip(names, values) if not np.isnan(value)}
+    
+    def _calc_fx_changes(self, inputs: Dict[str, Any]) -> Dict[str, float]:
+        """Changes against the last close and the oldest close, labelled with the days actually spanned"""
+        spot, history, as_of = inputs['spot'], inputs['history'], inputs['as_of']
+        names, current, previous = [], [], []
+        for pair, rate in spot.items():
+            label = pair.replace('/', '').lower()
+            past = history.get(pair)
+            if past is not None:
+                days = [self._parse_day(day) for day in inputs['history_dates'][pair]]
+                for i in (-1, 0):
+                    if days[i] and days[i] < as_of:
+                        names.append(f'{label}_change_{(as_of - days[i]).days}d_pct')
+                        current.append(rate)
+                        previous.append(past[i])
+            if pair == 'USD/JPY':
+                for point, value in inputs['reference_points'].items():
+                    names.append(f'{label}_change_pct_vs_{point}')
+                    current.append(rate)
+                    previous.append(value)
+        if not names:
+            return {}
+        return self._collect(names, pct_change(current, previous))
+    
+    def _calc_implied_crosses(self, inputs: Dict[str, Any]) -> Dict[str, float]:
+        spot = inputs['spot']
+        if 'USD/JPY' not in spot or 'EUR/JPY' not in spot:
+            return {}
+        return self._collect(['implied_eurusd'], implied_cross(spot['EUR/JPY'], spot['USD/JPY']), 4)
+    
+    def _calc_rate_differentials(self, inputs: Dict[str, Any]) -> Dict[str, float]:
+        yields = inputs['yields']
+        names, first, second = [], [], []
+        for a, b in (('ust', 'jgb'), ('bund', 'jgb'), ('ust', 'bund')):
+            for tenor in DIFFERENTIAL_TENORS:
+                if f'{a}_{tenor}' in yields and f'{b}_{tenor}' in yields:
+                    names.append(f'{a}_{b}_{tenor}_bp')
+                    first.append(yields[f'{a}_{tenor}'])
+                    second.append(yields[f'{b}_{tenor}'])
+        if not names:
+            return {}
+        return self._collect(names, rate_differential_bp(first, second), 1)
+    
+    def _calc_carry(self, inputs: Dict[str, Any]) -> Dict[str, float]:
+        spot, yields = inputs['spot'], inputs['yields']
+        jpy_3m = yields.get('tdb_3m')
+        legs = [(pair, yields.get(rate)) for pair, rate in (('USD/JPY', 'ust_3m'), ('EUR/JPY', 'bund_3m'))]
+        legs = [(pair, rate) for pair, rate in legs if pair in spot and rate is not None]
+        if jpy_3m is None or not legs:
+            return {}
         
-        # Build data context for AI
-        data_context = self._build_calculation_context(context)
+        pairs = [pair for pair, _ in legs]
+        base = np.array([rate for _, rate in legs])
+        rates = np.array([spot[pair] for pair in pairs])
+        annual = carry_pct(base, jpy_3m)
+        results = {}
+        for suffix, values, decimals in (('carry_annual_pct', annual, 2),
+                                         ('carry_3m_pct', carry_pct(base, jpy_3m, 90), 3),
+                                         ('forward_points_3m', forward_points(rates, base, jpy_3m, 90), 3)):
+            results.update(self._collect([f"{p.replace('/', '').lower()}_{suffix}" for p in pairs], values, decimals))
         
-        prompt = f"""Perform the following financial calculation/analysis:
-
-Question: {analysis_item['question']}
-Required Analysis: {analysis_item['analysis']}
-Data Needed: {analysis_item['data_needed']}
+        # Carry per unit of realized risk, where there is enough history
+        vol = self._calc_realized_volatility(inputs)
+        for pair, carry in zip(pairs, np.atleast_1d(annual)):
+            label = pair.replace('/', '').lower()
+            if vol.get(f'{label}_realized_vol_pct'):
+                results[f'{label}_carry_to_vol'] = round(float(carry) / vol[f'{label}_realized_vol_pct'], 2)
+        return results
+    
+    def _calc_realized_volatility(self, inputs: Dict[str, Any]) -> Dict[str, float]:
+        spot, yields, history = inputs['spot'], inputs['yields'], inputs['history']
+        results = {}
+        for pair, rate in spot.items():
+            if pair in history:
+                vol = realized_vol(np.append(history[pair], rate))
+                results.update(self._collect([f"{pair.replace('/', '').lower()}_realized_vol_pct"], vol))
+        for key, level in yields.items():
+            if key in history:
+                vol = absolute_vol_bp(np.append(history[key], level))
+                results.update(self._collect([f'{key}_realized_vol_bp'], vol, 1))
+        return results
+    
+    def _calc_zscores(self, inputs: Dict[str, Any]) -> Dict[str, float]:
+        current = {**inputs['spot'], **inputs['yields']}
+        history, dates = inputs['history'], inputs['history_dates']
+        names = [key for key in current if key in history]
+        results = {}
+        for key in names:
+            results.update(self._collect([f"{key.replace('/', '').lower()}_zscore"], zscore(current[key], history[key])))
+        
+        # The 10Y US-Japan differential, on days both curves were recorded
+        if 'ust_10y' in names and 'jgb_10y' in names:
+            jgb = dict(zip(dates['jgb_10y'], history['jgb_10y']))
+            paired = [(ust, jgb[day]) for day, ust in zip(dates['ust_10y'], history['ust_10y']) if day in jgb]
+            if paired:
+                past = rate_differential_bp(*np.array(paired).T)
+                today = rate_differential_bp(current['ust_10y'], current['jgb_10y'])
+                results.update(self._collect(['ust_jgb_10y_zscore'], zscore(today, past)))
+        return results
+    
+    # ---------- Plan mapping and interpretation ---------- #
+    
+    def _select_calculators(self, analysis_item: Dict[str, Any]) -> List[str]:
+        """Calculators named by the plan item, else those its wording points to"""
+        names = [name for name in analysis_item.get('calculations', []) if name in CALCULATORS]
+        if not names:
+            text = ' '.join(str(analysis_item.get(key, '')) for key in ('question', 'analysis', 'data_needed'))
+            text = text.lower()
+            names = [name for name, (_, keywords) in CALCULATORS.items() if any(k in text for k in keywords)]
+        return names or list(DEFAULT_CALCULATORS)
+    
+    def _format_results(self, results: Dict[str, float]) -> str:
+        if not results:
+            return "No figures available for this question"
+        return "; ".join(f"{key}: {value}" for key, value in results.items())
+    
+    def _interpret(self, items: List[Dict[str, Any]]) -> List[str]:
+        """One AI call interpreting every item's precomputed figures; empty strings without AI"""
+        if not items or not self.ai_analyst.use_ai:
+            return [''] * len(items)
+        
+        blocks = "\n\n".join(
+            f"Question {i}: {item['question']}\nFigures: {self._format_results(item['results'])}"
+            for i, item in enumerate(items, 1)
+        )
+        prompt = f"""Interpret these figures for a Japan FX report. They are already calculated and correct:
+do not recalculate them or introduce new numbers. Units are in the names (pct, bp, zscore).
 
-Available Data:
-{data_context}
+{blocks}
 
-Perform the calculation or analysis. Show your work:
-1. State what you're calculating
-2. Show the numbers used
-3. Perform the calculation
-4. Interpret the result
+For each question, give 1-2 sentences on what the figures say, in the format:
+Question 1: [interpretation]
+Question 2: ..."""
 
-Be specific with numbers and show actual calculations."""
-        
-        response = self.ai_analyst._call_openai(prompt, max_tokens=400)
-        
-        return response
-    
-    def _build_calculation_context(self, context: PipelineContext) -> str:
-        """Build data context for calculations"""
-        lines = []
-        
-        # Add raw data
-        if context.raw_data:
-            fx = context.raw_data.get('fx_rates', {})
-            macro = context.raw_data.get('macro_data', {})
-            lines.append(f"Current FX Rates:")
-            lines.append(f"  USD/JPY: {fx.get('USD/JPY', 'N/A')}")
-            lines.append(f"  EUR/JPY: {fx.get('EUR/JPY', 'N/A')}")
-            lines.append(f"Macro Data:")
-            lines.append(f"  Japan CPI: {macro.get('japan_cpi', 'N/A')}")
-            lines.append(f"  Japan GDP: ${macro.get('japan_gdp', 'N/A')} billion")
-            lines.append(f"  Sentiment Score: {context.raw_data.get('sentiment_score', 'N/A')}/100")
-        
-        # Add enhanced data
-        if context.enhanced_data:
-            for key, value in context.enhanced_data.items():
-                if isinstance(value, dict):
-                    lines.append(f"{key}:")
-                    for k, v in value.items():
-                        lines.append(f"  {k}: {v}")
-                else:
-                    lines.append(f"{key}: {value}")
-        
-        # Add basic calculations if available
-        if context.calculations and 'basic_metrics' in context.calculations:
-            lines.append("Calculated Metrics:")
-            for k, v in context.calculations['basic_metrics'].items():
-                lines.append(f"  {k}: {v}")
-        
-        return "\n".join(lines)
\ No newline at end of file
+        response = self.ai_analyst._call_openai(prompt, max_completion_tokens=80 * len(items) + 50)
+        
+        interpretations = [''] * len(items)
+        parts = re.split(r'Question\s+(\d+)\s*:', response)
+        for number, text in zip(parts[1::2], parts[2::2]):
+            index = int(number) - 1
+            if 0 <= index < len(items):
+                interpretations[index] = text.strip()
+        return interpretations
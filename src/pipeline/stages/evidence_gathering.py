@@ -77,7 +77,7 @@ Identify 3-5 specific pieces of additional evidence that would be most valuable.
 
 List the evidence needed (one per line):"""
         
-        response = self.ai_analyst._call_openai(prompt, max_tokens=400)
+        response = self.ai_analyst._call_openai(prompt, max_completion_tokens=400)
         
         # Parse response into list
         evidence_list = [line.strip() for line in response.split('\n') if line.strip() and not line.startswith('#')]
@@ -95,13 +95,8 @@ List the evidence needed (one per line):"""
             
             # Try to gather based on keywords in the evidence request
             if 'historical' in evidence_lower and 'usd/jpy' in evidence_lower:
-                # Get historical FX data (simplified - would need proper implementation)
-                enhanced_data['historical_usdjpy'] = {
-                    '1_month_ago': 145.50,  # Placeholder
-                    '3_months_ago': 142.25,  # Placeholder
-                    '1_year_ago': 135.00  # Placeholder
-                }
-                self.logger.info("Added historical USD/JPY data")
+                # Reference closes are taken from the fetched FX history by the calculation stage
+                self.logger.info("Historical USD/JPY comes from the fetched FX closes")
                 
             elif 'treasury' in evidence_lower or 'yields' in evidence_lower:
                 # Get US Treasury yields (simplified)
@@ -81,7 +81,7 @@ Avoid generic questions. Focus on specific market dynamics that need explanation
 
 List your questions (one per line):"""
         
-        response = self.ai_analyst._call_openai(prompt, max_tokens=600)
+        response = self.ai_analyst._call_openai(prompt, max_completion_tokens=600)
         
         # Parse response into list of questions
         questions = [line.strip() for line in response.split('\n') 
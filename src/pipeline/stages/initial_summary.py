@@ -38,7 +38,7 @@ class InitialSummaryStage(BaseStage):
             prompt = self._build_summary_prompt(data)
             
             # Get AI to generate factual summary
-            summary = self.ai_analyst._call_openai(prompt, max_tokens=800)
+            summary = self.ai_analyst._call_openai(prompt, max_completion_tokens=800)
             
             context.summary = summary
             
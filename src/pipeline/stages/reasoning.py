@@ -6,9 +6,11 @@ AI determines what analysis is needed to answer the questions
 from typing import List, Dict
 import sys
 import os
+import re
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from .base_stage import BaseStage
+from .calculation import CALCULATORS
 from ..context import PipelineContext
 from core.ai_analyst_report import AIAnalystReport
 
@@ -54,6 +56,7 @@ class ReasoningStage(BaseStage):
         """Ask AI to create specific analysis plan for each question"""
         
         questions_text = "\n".join([f"{i+1}. {q}" for i, q in enumerate(context.questions)])
+        calculators_text = "\n".join(f"- {name}: {description}" for name, (description, _) in CALCULATORS.items())
         
         prompt = f"""You are a senior financial analyst. For each question below, determine what SPECIFIC analysis would help answer it.
 
@@ -67,23 +70,28 @@ Available data:
 - Market sentiment indicators
 - News and policy information
 
+Calculations are computed for you (do not plan arithmetic yourself); pick from:
+{calculators_text}
+
 For each question, specify:
-1. What calculation or comparison to perform
-2. What data points to use
-3. What the result would tell us
+1. What comparison to perform
+2. Which of the calculations above it needs
+3. What data points to use
+4. What the result would tell us
 
 Be specific and practical. Focus on simple, meaningful analyses.
 
 Format your response as:
 Question 1: [brief restatement]
 Analysis: [specific analysis to perform]
+Calculations: [comma-separated names from the list above]
 Data needed: [specific data points]
 Insight: [what this tells us]
 
 Question 2: ...
 (continue for all questions)"""
         
-        response = self.ai_analyst._call_openai(prompt, max_tokens=1200)
+        response = self.ai_analyst._call_openai(prompt, max_completion_tokens=1200)
         
         # Parse response into structured analysis plan
         analysis_plan = self._parse_analysis_plan(response, context.questions)
@@ -111,7 +119,10 @@ Question 2: ...
             lines = section.strip().split('\n')
             for line in lines:
                 line_lower = line.lower()
-                if 'analysis:' in line_lower:
+                if line_lower.lstrip(' -*').startswith('calculations:'):
+                    names = re.split(r'[,\s]+', line.split(':', 1)[1].strip(' []'))
+                    analysis_item['calculations'] = [name for name in names if name in CALCULATORS]
+                elif 'analysis:' in line_lower:
                     analysis_item['analysis'] = line.split(':', 1)[1].strip()
                 elif 'data needed:' in line_lower or 'data:' in line_lower:
                     analysis_item['data_needed'] = line.split(':', 1)[1].strip()
@@ -6,7 +6,6 @@ AI generates the final report section by section, with dynamic title
 from typing import Dict, Any
 import sys
 import os
-from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from .base_stage import BaseStage
@@ -91,7 +90,7 @@ Write a brief, professional appendix (150-200 words) covering:
 
 Format with clear sections."""
         
-        appendix = self.ai_analyst._call_openai(prompt, max_tokens=300)
+        appendix = self.ai_analyst._call_openai(prompt, max_completion_tokens=300)
         return appendix
     
     def _generate_sections(self, context: PipelineContext) -> Dict[str, str]:
@@ -143,7 +142,7 @@ Write a professional, evidence-based executive summary (200-250 words) that:
 
 Be specific and data-driven. Avoid generic statements."""
         
-        return self.ai_analyst._call_openai(prompt, max_tokens=400)
+        return self.ai_analyst._call_openai(prompt, max_completion_tokens=400)
     
     def _generate_market_analysis(self, context: PipelineContext) -> str:
         """Generate detailed market analysis section"""
@@ -174,7 +173,7 @@ Write a detailed market analysis (300-400 words) covering:
 
 Use specific numbers and cite data sources. Focus on evidence-based analysis."""
         
-        return self.ai_analyst._call_openai(prompt, max_tokens=600)
+        return self.ai_analyst._call_openai(prompt, max_completion_tokens=600)
     
     def _generate_key_findings(self, context: PipelineContext) -> str:
         """Generate key findings section"""
@@ -199,7 +198,7 @@ Format as:
 • Finding 2: [specific insight with data]
 (etc.)"""
         
-        return self.ai_analyst._call_openai(prompt, max_tokens=400)
+        return self.ai_analyst._call_openai(prompt, max_completion_tokens=400)
     
     def _generate_risk_assessment(self, context: PipelineContext) -> str:
         """Generate risk assessment section"""
@@ -223,7 +222,7 @@ Write 200-250 words. Be specific about:
 
 Format with clear subsections."""
         
-        return self.ai_analyst._call_openai(prompt, max_tokens=400)
+        return self.ai_analyst._call_openai(prompt, max_completion_tokens=400)
     
     def _generate_outlook(self, context: PipelineContext) -> str:
         """Generate market outlook section"""
@@ -249,7 +248,7 @@ Be specific with:
 
 End with one clear, actionable recommendation."""
         
-        return self.ai_analyst._call_openai(prompt, max_tokens=300)
+        return self.ai_analyst._call_openai(prompt, max_completion_tokens=300)
     
     def _compile_report(self, sections: Dict[str, str], appendix: str, context: PipelineContext) -> str:
         """Stage 10: Compile all sections into final report"""
@@ -258,7 +257,7 @@ End with one clear, actionable recommendation."""
         
         # Add header
         report_parts.append(f"# YenSense AI Weekly Strategist Report")
-        report_parts.append(f"**Date:** {datetime.now().strftime('%B %d, %Y')}")
+        report_parts.append(f"**Date:** {context.timestamp.strftime('%B %d, %Y')}")
         report_parts.append("")
         
         # Add sections in order
@@ -325,7 +324,7 @@ Bad examples:
 
 Title:"""
         
-        title = self.ai_analyst._call_openai(prompt, max_tokens=50)
+        title = self.ai_analyst._call_openai(prompt, max_completion_tokens=50)
         
         # Clean up title
         title = title.strip().strip('"').strip("'")
@@ -344,7 +343,7 @@ Title:"""
             metrics = calculations['basic_metrics']
             if 'usdjpy_1m_change_pct' in metrics:
                 summary_parts.append(f"USD/JPY 1M change: {metrics['usdjpy_1m_change_pct']}%")
-            if 'rate_differential_10y' in metrics:
-                summary_parts.append(f"US-Japan 10Y spread: {metrics['rate_differential_10y']}%")
+            if 'rate_differential_10y_bp' in metrics:
+                summary_parts.append(f"US-Japan 10Y spread: {metrics['rate_differential_10y_bp']}bp")
         
         return ", ".join(summary_parts) if summary_parts else "Various calculations performed"
\ No newline at end of file
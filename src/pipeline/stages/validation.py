@@ -78,7 +78,7 @@ Rate the overall analysis:
 
 Be skeptical and thorough. Challenge assumptions."""
         
-        response = self.ai_analyst._call_openai(prompt, max_tokens=800)
+        response = self.ai_analyst._call_openai(prompt, max_completion_tokens=800)
         
         # Parse validation response
         validation_results = self._parse_validation(response)
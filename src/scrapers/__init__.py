@@ -4,5 +4,6 @@ Contains web scrapers for various financial data sources
 """
 
 from .trading_economics_scraper import TradingEconomicsScraper
+from .event_classifier import EventClassifier, EventClassification, KeywordRules
 
-__all__ = ['TradingEconomicsScraper']
\ No newline at end of file
+__all__ = ['TradingEconomicsScraper', 'EventClassifier', 'EventClassification', 'KeywordRules']
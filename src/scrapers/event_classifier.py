@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Economic Event Classifier
+Keyword rules for event category, importance and bond-auction detection.
+Each calendar source keeps its own keyword tables (KeywordRules); each set is
+compiled once into a single trie-shaped regex, so an event name is scanned
+in one pass instead of one substring test per keyword.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+DEFAULT_CATEGORY = 'economic'
+
+# Importance tiers (lower is stronger)
+_TIER_HIGH, _TIER_MEDIUM, _TIER_NONE = 0, 1, 2
+
+
+class EventClassification(NamedTuple):
+    """Result of classifying one event name"""
+    category: str
+    importance: int
+    is_bond_auction: bool
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex matching any of words, factored as a trie
+
+    Longer continuations are tried first, so at any position the longest
+    keyword starting there is matched.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        ends_here = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if ends_here:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+def _is_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is not part of a longer word"""
+    return ((start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum()))
+
+
+class KeywordRules:
+    """One source's keyword tables, compiled once into a single-pass scanner"""
+
+    def __init__(self, categories: Iterable[Tuple[str, str]], high: Iterable[str] = (),
+                 medium: Iterable[str] = (), auction: Iterable[str] = (), whole_words: Iterable[str] = (),
+                 case_sensitive: bool = False):
+        """
+        Args:
+            categories: (keyword, category) in priority order - the earliest matching entry wins
+            high: Keywords of headline releases
+            medium: Keywords of second-tier releases
+            auction: Keywords flagging a bond auction
+            whole_words: Keywords that only count as a separate word ('tap' but not 'tapering')
+            case_sensitive: Match keywords as written instead of against the lowercased name
+        """
+        self.categories = list(categories)
+        self.high = list(high)
+        self.medium = list(medium)
+        self.auction = list(auction)
+        self.whole_words = frozenset(whole_words)
+        self.case_sensitive = case_sensitive
+        self.scanner, self.summary, self.inside_word = self._compile()
+
+    def _contains(self, keyword: str, other: str) -> bool:
+        if other in self.whole_words:
+            return any(_is_word(keyword, m.start(), m.end()) for m in re.finditer(re.escape(other), keyword))
+        return other in keyword
+
+    def _compile(self) -> Tuple['re.Pattern', Dict[str, Tuple[int, int, bool]], Dict[str, Tuple[int, int, bool]]]:
+        """
+        The scanner and per-keyword summaries (category rank, tier, auction flag)
+
+        The scanner reports the longest keyword at every position. Any other
+        keyword occurring at that position is a prefix of it, so each
+        keyword's summary folds in every keyword it contains. A whole-word
+        keyword found inside a longer word uses its inside_word summary,
+        which leaves it out.
+        """
+        no_category = len(self.categories)
+        category_rank = {}
+        for rank, (keyword, _) in enumerate(self.categories):
+            category_rank.setdefault(keyword, rank)
+        high, medium, auction = set(self.high), set(self.medium), set(self.auction)
+
+        def fold(contained: List[str]) -> Tuple[int, int, bool]:
+            return (
+                min((category_rank.get(k, no_category) for k in contained), default=no_category),
+                _TIER_HIGH if high.intersection(contained)
+                else _TIER_MEDIUM if medium.intersection(contained)
+                else _TIER_NONE,
+                bool(auction.intersection(contained))
+            )
+
+        keywords = set(category_rank) | high | medium | auction
+        summary, inside_word = {}, {}
+        for keyword in keywords:
+            contained = [other for other in keywords if self._contains(keyword, other)]
+            summary[keyword] = fold(contained)
+            if keyword in self.whole_words:
+                inside_word[keyword] = fold([k for k in contained if k != keyword and k not in self.whole_words])
+
+        scanner = re.compile('(?=(' + _trie_pattern(sorted(keywords)) + '))')
+        return scanner, summary, inside_word
+
+
+# Basic (requests) Trading Economics scraper
+BASIC_RULES = KeywordRules(
+    categories=[
+        ('cpi', 'inflation'), ('ppi', 'inflation'), ('inflation', 'inflation'), ('gdp', 'growth'),
+        ('retail', 'retail'), ('employment', 'employment'), ('unemployment', 'employment'),
+        ('nfp', 'employment'), ('payroll', 'employment'), ('housing', 'housing'),
+        ('industrial', 'manufacturing'), ('manufacturing', 'manufacturing'), ('fomc', 'monetary_policy'),
+        ('fed', 'monetary_policy'), ('boj', 'monetary_policy'), ('ecb', 'monetary_policy'),
+        ('interest rate', 'monetary_policy'), ('policy rate', 'monetary_policy'), ('bond', 'fixed_income'),
+        ('auction', 'fixed_income'), ('treasury', 'fixed_income'), ('note', 'fixed_income'),
+        ('bill', 'fixed_income')
+    ],
+    high=['cpi', 'inflation', 'gdp', 'employment', 'unemployment', 'nfp', 'payroll',
+          'interest rate', 'policy rate', 'fomc', 'fed fund', 'boj', 'ecb'],
+    medium=['retail', 'manufacturing', 'industrial', 'housing', 'trade balance',
+            'current account', 'consumer confidence', 'business confidence'],
+    auction=['auction', 'bond', 'treasury', 'note', 'bill']
+)
+
+# Selenium Trading Economics scraper (high-impact filtered calendar)
+SELENIUM_RULES = KeywordRules(
+    categories=[
+        ('cpi', 'inflation'), ('ppi', 'inflation'), ('inflation', 'inflation'), ('core inflation', 'inflation'),
+        ('gdp', 'growth'), ('retail', 'retail'), ('employment', 'employment'), ('unemployment', 'employment'),
+        ('nfp', 'employment'), ('payroll', 'employment'), ('housing', 'housing'),
+        ('industrial', 'manufacturing'), ('manufacturing', 'manufacturing'), ('fomc', 'monetary_policy'),
+        ('fed', 'monetary_policy'), ('federal funds', 'monetary_policy'), ('interest rate', 'monetary_policy'),
+        ('policy rate', 'monetary_policy'), ('boj', 'monetary_policy'), ('ecb', 'monetary_policy'),
+        ('bond', 'fixed_income'), ('auction', 'fixed_income'), ('treasury', 'fixed_income'),
+        ('note', 'fixed_income'), ('bill', 'fixed_income'), ('jgb', 'fixed_income'),
+        ('trade balance', 'trade'), ('current account', 'trade'), ('consumer confidence', 'sentiment'),
+        ('business confidence', 'sentiment')
+    ],
+    high=['cpi', 'inflation rate', 'gdp', 'employment', 'unemployment rate', 'nfp',
+          'non-farm payroll', 'fomc', 'federal funds rate', 'ecb interest rate',
+          'boj interest rate', 'policy rate'],
+    auction=['auction', 'bond', 'treasury', 'note', 'bill', 'jgb', 'bund', 'oat',
+             'gilt', 'btp', 'bobl', 'schatz', 'bubill', 'tap', 'syndication',
+             '1-month', '2-month', '3-month', '6-month', '1-year', '2-year',
+             '3-year', '5-year', '7-year', '10-year', '20-year', '30-year',
+             'week bill', 'month bill', 'year note', 'year bond',
+             'fixed rate', 'floating rate', 'inflation-linked'],
+    whole_words=['oat', 'tap']  # French OATs and bond taps, not 'float' or 'tapering'
+)
+
+# FRED release names, matched as written (importance follows the category, see EconomicCalendar)
+FRED_RULES = KeywordRules(
+    categories=[
+        ('Consumer Price Index', 'inflation'), ('CPI', 'inflation'), ('Employment', 'employment'),
+        ('Payroll', 'employment'), ('GDP', 'growth'), ('Gross Domestic', 'growth'),
+        ('Industrial Production', 'manufacturing'), ('Retail', 'retail'), ('Housing', 'housing'),
+        ('Building', 'housing'), ('FOMC', 'monetary_policy'), ('Federal Funds', 'monetary_policy')
+    ],
+    case_sensitive=True
+)
+
+
+class EventClassifier:
+    """Classify event names into category, importance and bond-auction flag"""
+
+    def __init__(self, rules: KeywordRules = BASIC_RULES, high_importance: int = 5,
+                 medium_importance: int = 3, default_importance: int = 1):
+        """
+        Initialize with a source's keyword rules and importance scale
+
+        Args:
+            rules: The source's keyword tables
+            high_importance: Score for headline releases (CPI, GDP, policy rates)
+            medium_importance: Score for second-tier releases and bond auctions
+            default_importance: Score when no keyword matches
+        """
+        self.rules = rules
+        self.high_importance = high_importance
+        self.medium_importance = medium_importance
+        self.default_importance = default_importance
+
+    def classify(self, event_name: str) -> EventClassification:
+        """Classify an event name in a single scan"""
+        rules = self.rules
+        text = event_name if rules.case_sensitive else event_name.lower()
+        category_rank = len(rules.categories)
+        tier = _TIER_NONE
+        is_bond_auction = False
+
+        for match in rules.scanner.finditer(text):
+            keyword = match.group(1)
+            if keyword in rules.whole_words and not _is_word(text, match.start(), match.start() + len(keyword)):
+                rank, keyword_tier, keyword_auction = rules.inside_word[keyword]
+            else:
+                rank, keyword_tier, keyword_auction = rules.summary[keyword]
+            if rank < category_rank:
+                category_rank = rank
+            if keyword_tier < tier:
+                tier = keyword_tier
+            is_bond_auction = is_bond_auction or keyword_auction
+
+        if tier == _TIER_HIGH:
+            importance = self.high_importance
+        elif tier == _TIER_MEDIUM or is_bond_auction:
+            importance = self.medium_importance
+        else:
+            importance = self.default_importance
+
+        category = rules.categories[category_rank][1] if category_rank < len(rules.categories) else DEFAULT_CATEGORY
+        return EventClassification(category, importance, is_bond_auction)
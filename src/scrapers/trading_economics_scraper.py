@@ -13,6 +13,11 @@ from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup
 import time
 
+try:
+    from .event_classifier import BASIC_RULES, EventClassifier
+except ImportError:
+    from scrapers.event_classifier import BASIC_RULES, EventClassifier
+
 
 class TradingEconomicsScraper:
     """Scraper for Trading Economics calendar data"""
@@ -50,32 +55,13 @@ class TradingEconomicsScraper:
             'low': 1
         }
         
-        # Category mapping for events
-        self.category_map = {
-            'cpi': 'inflation',
-            'ppi': 'inflation',
-            'inflation': 'inflation',
-            'gdp': 'growth',
-            'retail': 'retail',
-            'employment': 'employment',
-            'unemployment': 'employment',
-            'nfp': 'employment',
-            'payroll': 'employment',
-            'housing': 'housing',
-            'industrial': 'manufacturing',
-            'manufacturing': 'manufacturing',
-            'fomc': 'monetary_policy',
-            'fed': 'monetary_policy',
-            'boj': 'monetary_policy',
-            'ecb': 'monetary_policy',
-            'interest rate': 'monetary_policy',
-            'policy rate': 'monetary_policy',
-            'bond': 'fixed_income',
-            'auction': 'fixed_income',
-            'treasury': 'fixed_income',
-            'note': 'fixed_income',
-            'bill': 'fixed_income'
-        }
+        # Keyword classifier for category, importance and auctions
+        self.classifier = EventClassifier(
+            BASIC_RULES,
+            high_importance=self.importance_map['high'],
+            medium_importance=self.importance_map['medium'],
+            default_importance=self.importance_map['low']
+        )
         
     def _is_cache_valid(self, cache_file: str) -> bool:
         """Check if cache file is valid and not expired"""
@@ -134,46 +120,11 @@ class TradingEconomicsScraper:
     
     def _categorize_event(self, event_name: str) -> str:
         """Categorize event based on name"""
-        event_lower = event_name.lower()
-        
-        for keyword, category in self.category_map.items():
-            if keyword in event_lower:
-                return category
-                
-        return 'economic'
+        return self.classifier.classify(event_name).category
     
     def _estimate_importance(self, event_name: str) -> int:
         """Estimate event importance based on name"""
-        event_lower = event_name.lower()
-        
-        # High importance events (5)
-        high_importance = [
-            'cpi', 'inflation', 'gdp', 'employment', 'unemployment', 'nfp', 'payroll',
-            'interest rate', 'policy rate', 'fomc', 'fed fund', 'boj', 'ecb'
-        ]
-        
-        # Medium importance events (3) 
-        medium_importance = [
-            'retail', 'manufacturing', 'industrial', 'housing', 'trade balance',
-            'current account', 'consumer confidence', 'business confidence'
-        ]
-        
-        # Check for high importance
-        for keyword in high_importance:
-            if keyword in event_lower:
-                return 5
-        
-        # Check for medium importance  
-        for keyword in medium_importance:
-            if keyword in event_lower:
-                return 3
-        
-        # Bond auctions are generally medium importance
-        if any(word in event_lower for word in ['auction', 'bond', 'treasury', 'note', 'bill']):
-            return 3
-            
-        # Default to low importance
-        return 1
+        return self.classifier.classify(event_name).importance
     
     def _parse_importance(self, importance_element) -> int:
         """Parse importance from HTML element"""
@@ -282,9 +233,8 @@ class TradingEconomicsScraper:
                             if not country:
                                 continue
                             
-                            # Determine if this is a bond auction
-                            is_bond_auction = any(word in event_cell.lower() for word in 
-                                                ['auction', 'bond', 'treasury', 'note', 'bill'])
+                            # Category, importance and bond auction flag in one pass
+                            classification = self.classifier.classify(event_cell)
                             
                             event_data = {
                                 'date': date_header,
@@ -293,13 +243,13 @@ class TradingEconomicsScraper:
                                 'country': country,
                                 'currency': self.g3_countries[country]['currency'],
                                 'event_name': event_cell,
-                                'category': self._categorize_event(event_cell),
-                                'importance': self._estimate_importance(event_cell),
+                                'category': classification.category,
+                                'importance': classification.importance,
                                 'actual': actual_cell if actual_cell not in ['-', 'n/a', 'N/A', ''] else None,
                                 'forecast': forecast_cell if forecast_cell not in ['-', 'n/a', 'N/A', ''] else None,
                                 'previous': previous_cell if previous_cell not in ['-', 'n/a', 'N/A', ''] else None,
                                 'source': 'trading_economics',
-                                'is_bond_auction': is_bond_auction
+                                'is_bond_auction': classification.is_bond_auction
                             }
                             
                             events.append(event_data)
@@ -348,8 +298,7 @@ class TradingEconomicsScraper:
                                 time_match = parts[0]
                                 event_text = ' '.join(parts[1:])
                         
-                        is_bond_auction = any(word in event_text.lower() for word in 
-                                            ['auction', 'bond', 'treasury', 'note', 'bill'])
+                        classification = self.classifier.classify(event_text)
                         
                         event_data = {
                             'date': 'Today',  # Will be updated by caller
@@ -358,13 +307,13 @@ class TradingEconomicsScraper:
                             'country': country,
                             'currency': self.g3_countries[country]['currency'],
                             'event_name': event_text,
-                            'category': self._categorize_event(event_text),
-                            'importance': self._estimate_importance(event_text),
+                            'category': classification.category,
+                            'importance': classification.importance,
                             'actual': None,
                             'forecast': None,
                             'previous': None,
                             'source': 'trading_economics',
-                            'is_bond_auction': is_bond_auction
+                            'is_bond_auction': classification.is_bond_auction
                         }
                         
                         events.append(event_data)
@@ -7,11 +7,22 @@ Uses dynamic filtering for comprehensive G3 economic calendar data
 import os
 import json
 import logging
+import re
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 
+try:
+    from ..core.timezones import parse_trading_economics_datetime
+except ImportError:
+    from core.timezones import parse_trading_economics_datetime
+
+try:
+    from .event_classifier import SELENIUM_RULES, EventClassifier
+except ImportError:
+    from scrapers.event_classifier import SELENIUM_RULES, EventClassifier
+
 # Selenium imports with error handling
 try:
     from selenium import webdriver
@@ -27,6 +38,41 @@ except ImportError:
     print("Warning: Selenium not available. Install with: pip install selenium")
 
 
+# Calendar tables are recognised by a header row with >= 4 cells naming a date and the value columns
+_MONTH_RE = re.compile(r'January|February|March|April|May|June|July|August|September|October|November|December')
+_HEADER_WORDS = frozenset(['Actual', 'Previous', 'Consensus', 'Forecast'])
+_EMPTY_VALUES = frozenset(['-', 'n/a', 'N/A', ''])
+
+# Walks table.rows / row.cells once in the browser and returns
+# [{"date": header, "rows": [[cell text, ...], ...]}, ...] as a JSON string
+_EXTRACT_ROWS_JS = """
+const monthRe = /%s/;
+const text = (cell) => cell.textContent.trim();
+const tables = [];
+for (const table of document.querySelectorAll('table')) {
+    if (!table.rows.length) continue;
+    const header = Array.from(table.rows[0].cells, text);
+    const headerText = header.join(' ');
+    if (header.length < 4 || !headerText.includes('Actual') || !headerText.includes('Previous')
+        || !monthRe.test(headerText)) continue;
+    const rows = [];
+    for (let i = 1; i < table.rows.length; i++) {
+        rows.push(Array.from(table.rows[i].cells, text));
+    }
+    tables.push({date: header[0], rows: rows});
+}
+return JSON.stringify(tables);
+""" % _MONTH_RE.pattern
+
+
+def _is_calendar_header(header: List[str]) -> bool:
+    """Check whether a table's header cells identify a calendar table"""
+    if len(header) < 4:
+        return False
+    header_text = ' '.join(header)
+    return 'Actual' in header_text and 'Previous' in header_text and bool(_MONTH_RE.search(header_text))
+
+
 class TradingEconomicsSeleniumScraper:
     """Advanced Trading Economics scraper with dynamic filtering"""
     
@@ -57,39 +103,9 @@ class TradingEconomicsSeleniumScraper:
             'Euro Area': {'currency': 'EUR', 'aliases': ['Euro Area', 'Eurozone', 'Germany', 'DE', 'EA']},
         }
         
-        # Enhanced category mapping
-        self.category_map = {
-            'cpi': 'inflation',
-            'ppi': 'inflation', 
-            'inflation': 'inflation',
-            'core inflation': 'inflation',
-            'gdp': 'growth',
-            'retail': 'retail',
-            'employment': 'employment',
-            'unemployment': 'employment',
-            'nfp': 'employment',
-            'payroll': 'employment',
-            'housing': 'housing',
-            'industrial': 'manufacturing',
-            'manufacturing': 'manufacturing',
-            'fomc': 'monetary_policy',
-            'fed': 'monetary_policy',
-            'federal funds': 'monetary_policy',
-            'interest rate': 'monetary_policy',
-            'policy rate': 'monetary_policy',
-            'boj': 'monetary_policy',
-            'ecb': 'monetary_policy',
-            'bond': 'fixed_income',
-            'auction': 'fixed_income',
-            'treasury': 'fixed_income',
-            'note': 'fixed_income',
-            'bill': 'fixed_income',
-            'jgb': 'fixed_income',
-            'trade balance': 'trade',
-            'current account': 'trade',
-            'consumer confidence': 'sentiment',
-            'business confidence': 'sentiment'
-        }
+        # Keyword classifier (we filter for high impact, so unmatched events default to 4)
+        self.classifier = EventClassifier(SELENIUM_RULES, high_importance=5, medium_importance=4,
+                                          default_importance=4)
     
     def _setup_driver(self) -> webdriver.Chrome:
         """Setup Chrome WebDriver with optimal settings"""
@@ -230,96 +246,60 @@ class TradingEconomicsSeleniumScraper:
         events = []
         
         try:
-            # Get page source and parse with BeautifulSoup for reliable parsing
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            tables = self._read_calendar_rows(driver)
             
-            # Find all calendar tables
-            tables = soup.find_all('table')
-            self.logger.info(f"Found {len(tables)} tables on filtered page")
-            
-            for i, table in enumerate(tables):
-                # Look for the main calendar table with proper headers
-                headers = table.find('tr')
-                if not headers:
-                    continue
-                    
-                header_cells = headers.find_all(['th', 'td'])
-                if len(header_cells) < 4:
-                    continue
-                    
-                header_text = ' '.join([cell.get_text().strip() for cell in header_cells])
+            for date_header, rows in tables:
+                self.logger.info(f"Processing calendar table for {date_header}")
                 
-                # Identify main calendar table
-                if ('Actual' in header_text and 'Previous' in header_text and 
-                    any(month in header_text for month in 
-                    ['January', 'February', 'March', 'April', 'May', 'June',
-                     'July', 'August', 'September', 'October', 'November', 'December'])):
-                    
-                    self.logger.info(f"Processing calendar table at index {i}")
+                for cells in rows:
+                    if len(cells) < 5:
+                        continue
                     
-                    # Extract date from header
-                    date_header = header_cells[0].get_text().strip()
-                    
-                    # Process all rows in this table
-                    rows = table.find_all('tr')[1:]  # Skip header row
-                    
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) < 5:
+                    try:
+                        # Extract data based on known structure (short rows padded with blanks)
+                        (time_cell, _, _, country_cell, event_cell,
+                         actual_cell, previous_cell, consensus_cell, forecast_cell) = (cells + [''] * 9)[:9]
+                        
+                        # Skip invalid rows
+                        if not event_cell or not country_cell or len(event_cell) < 3:
+                            continue
+                        
+                        if event_cell in _HEADER_WORDS or not time_cell:
                             continue
                         
-                        try:
-                            # Extract data based on known structure
-                            time_cell = cells[0].get_text().strip() if len(cells) > 0 else ""
-                            country_cell = cells[3].get_text().strip() if len(cells) > 3 else ""
-                            event_cell = cells[4].get_text().strip() if len(cells) > 4 else ""
-                            actual_cell = cells[5].get_text().strip() if len(cells) > 5 else ""
-                            previous_cell = cells[6].get_text().strip() if len(cells) > 6 else ""
-                            consensus_cell = cells[7].get_text().strip() if len(cells) > 7 else ""
-                            forecast_cell = cells[8].get_text().strip() if len(cells) > 8 else ""
-                            
-                            # Skip invalid rows
-                            if not event_cell or not country_cell or len(event_cell) < 3:
-                                continue
-                            
-                            if event_cell in ['Actual', 'Previous', 'Consensus', 'Forecast'] or not time_cell:
-                                continue
-                            
-                            # Map country codes to G3 countries
-                            country = self._map_country_code(country_cell)
-                            if not country:
-                                continue
-                            
-                            # Parse datetime in UTC (since we set timezone filter to UTC)
-                            event_datetime = self._parse_event_datetime(date_header, time_cell)
-                            
-                            # Categorize and score importance
-                            category = self._categorize_event(event_cell)
-                            importance = self._estimate_importance(event_cell)
-                            is_bond_auction = self._is_bond_auction(event_cell)
-                            
-                            event_data = {
-                                'datetime_utc': event_datetime.isoformat() if event_datetime else None,
-                                'date_display': date_header,
-                                'time_display': f"{time_cell} UTC" if time_cell else "TBD UTC",
-                                'country': country,
-                                'currency': self.g3_countries[country]['currency'],
-                                'event_name': event_cell,
-                                'category': category,
-                                'importance': importance,
-                                'actual': actual_cell if actual_cell not in ['-', 'n/a', 'N/A', ''] else None,
-                                'previous': previous_cell if previous_cell not in ['-', 'n/a', 'N/A', ''] else None,
-                                'consensus': consensus_cell if consensus_cell not in ['-', 'n/a', 'N/A', ''] else None,
-                                'forecast': forecast_cell if forecast_cell not in ['-', 'n/a', 'N/A', ''] else None,
-                                'source': 'trading_economics_selenium',
-                                'is_bond_auction': is_bond_auction
-                            }
-                            
-                            events.append(event_data)
-                            
-                        except Exception as e:
-                            self.logger.warning(f"Error parsing row: {e}")
+                        # Map country codes to G3 countries
+                        country = self._map_country_code(country_cell)
+                        if not country:
                             continue
+                        
+                        # Parse datetime in UTC (since we set timezone filter to UTC)
+                        event_datetime = self._parse_event_datetime(date_header, time_cell)
+                        
+                        # Categorize, score importance and flag auctions in one pass
+                        category, importance, is_bond_auction = self.classifier.classify(event_cell)
+                        
+                        event_data = {
+                            'datetime_utc': event_datetime.isoformat() if event_datetime else None,
+                            'date_display': date_header,
+                            'time_display': f"{time_cell} UTC" if time_cell else "TBD UTC",
+                            'country': country,
+                            'currency': self.g3_countries[country]['currency'],
+                            'event_name': event_cell,
+                            'category': category,
+                            'importance': importance,
+                            'actual': actual_cell if actual_cell not in _EMPTY_VALUES else None,
+                            'previous': previous_cell if previous_cell not in _EMPTY_VALUES else None,
+                            'consensus': consensus_cell if consensus_cell not in _EMPTY_VALUES else None,
+                            'forecast': forecast_cell if forecast_cell not in _EMPTY_VALUES else None,
+                            'source': 'trading_economics_selenium',
+                            'is_bond_auction': is_bond_auction
+                        }
+                        
+                        events.append(event_data)
+                        
+                    except Exception as e:
+                        self.logger.warning(f"Error parsing row: {e}")
+                        continue
             
             self.logger.info(f"Extracted {len(events)} events from filtered tables")
             return events
@@ -328,6 +308,47 @@ class TradingEconomicsSeleniumScraper:
             self.logger.error(f"Error extracting events: {e}")
             return []
     
+    def _read_calendar_rows(self, driver: webdriver.Chrome) -> List[Tuple[str, List[List[str]]]]:
+        """
+        Read (date header, row cell texts) for each calendar table on the page
+        
+        Runs one in-browser script that walks the table DOM and returns JSON,
+        falling back to parsing page_source if the script fails.
+        """
+        try:
+            payload = driver.execute_script(_EXTRACT_ROWS_JS)
+            if payload is not None:
+                tables = json.loads(payload)
+                self.logger.info(f"Found {len(tables)} calendar tables on filtered page")
+                return [(table['date'], table['rows']) for table in tables]
+        except Exception as e:
+            self.logger.warning(f"In-browser row extraction failed, parsing page source: {e}")
+        
+        return self._read_calendar_rows_from_html(driver.page_source)
+    
+    def _read_calendar_rows_from_html(self, html: str) -> List[Tuple[str, List[List[str]]]]:
+        """Same extraction as _EXTRACT_ROWS_JS, over page HTML"""
+        soup = BeautifulSoup(html, 'html.parser')
+        tables = []
+        
+        for table in soup.find_all('table'):
+            rows = table.find_all('tr')
+            if not rows:
+                continue
+            
+            # Header cells are only read once, to identify the calendar table
+            header = [cell.get_text().strip() for cell in rows[0].find_all(['th', 'td'])]
+            if not _is_calendar_header(header):
+                continue
+            
+            tables.append((header[0], [
+                [cell.get_text().strip() for cell in row.find_all(['td', 'th'])]
+                for row in rows[1:]
+            ]))
+        
+        self.logger.info(f"Found {len(tables)} calendar tables on filtered page")
+        return tables
+    
     def _map_country_code(self, country_code: str) -> Optional[str]:
         """Map country code to G3 country name"""
         country_mapping = {
@@ -345,99 +366,23 @@ class TradingEconomicsSeleniumScraper:
     def _parse_event_datetime(self, date_str: str, time_str: str) -> Optional[datetime]:
         """Parse event datetime to UTC datetime object"""
         try:
-            # Parse date string like "Friday September 13 2024"
-            date_parts = date_str.split()
-            
-            if len(date_parts) >= 3:
-                # Extract month, day, year
-                month_str = date_parts[-3] if len(date_parts) >= 3 else date_parts[1]
-                day_str = date_parts[-2] if len(date_parts) >= 2 else date_parts[2] 
-                year_str = date_parts[-1] if len(date_parts) >= 1 else "2025"
-                
-                # Month name to number mapping
-                month_map = {
-                    'January': 1, 'February': 2, 'March': 3, 'April': 4,
-                    'May': 5, 'June': 6, 'July': 7, 'August': 8,
-                    'September': 9, 'October': 10, 'November': 11, 'December': 12
-                }
-                
-                month_num = month_map.get(month_str, 1)
-                day_num = int(day_str)
-                year_num = int(year_str)
-                
-                base_date = datetime(year_num, month_num, day_num)
-            else:
-                base_date = datetime.now()
-            
-            # Parse time if provided (assuming UTC since we set timezone filter)
-            if time_str and ':' in time_str:
-                time_part = time_str.replace('AM', '').replace('PM', '').strip()
-                if ':' in time_part:
-                    hour_str, minute_str = time_part.split(':')[:2]
-                    hour = int(hour_str)
-                    minute = int(minute_str)
-                    
-                    # Handle AM/PM
-                    if 'PM' in time_str and hour != 12:
-                        hour += 12
-                    elif 'AM' in time_str and hour == 12:
-                        hour = 0
-                    
-                    event_dt = base_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                else:
-                    event_dt = base_date.replace(hour=9, minute=0, second=0, microsecond=0)
-            else:
-                # Default time if not specified
-                event_dt = base_date.replace(hour=9, minute=0, second=0, microsecond=0)
-            
-            # Return as UTC (timezone-naive but representing UTC time)
-            return event_dt
-            
+            # Times are already UTC since we set the timezone filter
+            return parse_trading_economics_datetime(date_str, time_str, 'UTC')
         except Exception as e:
             self.logger.warning(f"Error parsing datetime '{date_str}' '{time_str}': {e}")
             return None
     
     def _categorize_event(self, event_name: str) -> str:
         """Categorize event based on name"""
-        event_lower = event_name.lower()
-        
-        for keyword, category in self.category_map.items():
-            if keyword in event_lower:
-                return category
-                
-        return 'economic'
+        return self.classifier.classify(event_name).category
     
     def _estimate_importance(self, event_name: str) -> int:
         """Estimate event importance (since we're filtering for high impact, default to high)"""
-        event_lower = event_name.lower()
-        
-        # Very high importance events (5)
-        very_high_importance = [
-            'cpi', 'inflation rate', 'gdp', 'employment', 'unemployment rate', 'nfp', 
-            'non-farm payroll', 'fomc', 'federal funds rate', 'ecb interest rate',
-            'boj interest rate', 'policy rate'
-        ]
-        
-        # Since we filtered for high impact, most events should be important
-        for keyword in very_high_importance:
-            if keyword in event_lower:
-                return 5
-        
-        # Default to 4 since we filtered for high importance
-        return 4
+        return self.classifier.classify(event_name).importance
     
     def _is_bond_auction(self, event_name: str) -> bool:
         """Check if event is a bond auction"""
-        auction_keywords = [
-            'auction', 'bond', 'treasury', 'note', 'bill', 'jgb', 'bund', 'oat',
-            'gilt', 'btp', 'bobl', 'schatz', 'bubill', 'tap', 'syndication',
-            '1-month', '2-month', '3-month', '6-month', '1-year', '2-year', 
-            '3-year', '5-year', '7-year', '10-year', '20-year', '30-year',
-            'week bill', 'month bill', 'year note', 'year bond',
-            'fixed rate', 'floating rate', 'inflation-linked'
-        ]
-        event_lower = event_name.lower()
-        return any(keyword in event_lower for keyword in auction_keywords)
+        return self.classifier.classify(event_name).is_bond_auction
     
     def scrape_calendar(self, months_ahead: int = 2) -> Dict[str, Any]:
         """Scrape comprehensive calendar data with dynamic filtering"""
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for morning brief audio outputs
+Tests profile encoding commands, chapters and segment files using the local
+TTS backend and a stand-in ffmpeg, so no network or encoder is needed
+"""
+
+import unittest
+import json
+import stat
+import sys
+import os
+import tempfile
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.audio_output import DEFAULT_PROFILES, encode_profiles
+from generators.morning_brief import MorningBriefGenerator
+from generators.mp3 import iter_frames
+
+
+# Records its arguments and creates every output file (the argument after each "-f <format>")
+FAKE_FFMPEG = """#!/bin/sh
+echo "$@" >> "$(dirname "$0")/calls.log"
+prev=""
+expect_output=""
+for arg in "$@"; do
+    if [ -n "$expect_output" ]; then
+        echo "$expect_output" > "$arg"
+        expect_output=""
+    fi
+    if [ "$prev" = "-f" ]; then expect_output="$arg"; fi
+    prev="$arg"
+done
+"""
+
+
+class TestAudioOutput(unittest.TestCase):
+    """Test suite for audio output profiles and chapters"""
+
+    def setUp(self):
+        """Set up a temporary workspace"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.work_dir = self.temp_dir.name
+
+    def tearDown(self):
+        """Clean up temporary workspace"""
+        self.temp_dir.cleanup()
+
+    def _fake_ffmpeg(self) -> str:
+        path = os.path.join(self.work_dir, 'ffmpeg')
+        with open(path, 'w') as f:
+            f.write(FAKE_FFMPEG)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        return path
+
+    def test_profiles_encoded_in_one_pass(self):
+        """Test all profiles come from a single ffmpeg run over the master"""
+        master = os.path.join(self.work_dir, 'brief.mp3')
+        with open(master, 'wb') as f:
+            f.write(b'master')
+
+        outputs = encode_profiles(master, DEFAULT_PROFILES, ffmpeg=self._fake_ffmpeg())
+
+        self.assertEqual(outputs, {
+            'mobile': os.path.join(self.work_dir, 'brief_mobile.mp3'),
+            'web': os.path.join(self.work_dir, 'brief_web.ogg')
+        })
+        with open(os.path.join(self.work_dir, 'calls.log')) as f:
+            calls = f.read().splitlines()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].count('-i '), 1)
+        self.assertIn('-c:a libopus', calls[0])
+        self.assertIn('-ac 1 -ar 22050', calls[0])
+        self.assertFalse(any(name.endswith('.part') for name in os.listdir(self.work_dir)))
+
+    def test_brief_chapters_and_segments(self):
+        """Test chapters line up with the per-domain segment files"""
+        config_path = os.path.join(self.work_dir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.safe_dump({
+                'api_keys': {},
+                'output': {'audio': {'tts_backend': 'local', 'tts_cache_mb': 0, 'profiles': {}}}
+            }, f)
+
+        generator = MorningBriefGenerator(config_path)
+        generator.output_dir = self.work_dir
+        segments = {
+            'rates': 'JGB yields rose two basis points. ' * 5,
+            'fx': 'The yen weakened. ' * 8,
+            'repo': '',
+            'economist': 'Machinery orders beat expectations. ' * 4
+        }
+
+        master = generator.generate_multi_voice_audio(segments, 'brief.mp3')
+
+        outputs = generator.audio_outputs
+        self.assertEqual(sorted(outputs), ['chapters', 'segment_economist', 'segment_fx', 'segment_rates'])
+        with open(outputs['chapters']) as f:
+            chapters = json.load(f)['chapters']
+        self.assertEqual([c['title'] for c in chapters],
+                         ['Introduction', 'Rates Markets', 'Foreign Exchange', 'Economic Outlook', 'Sources'])
+        starts = [c['startTime'] for c in chapters]
+        self.assertEqual(starts, sorted(starts))
+        self.assertEqual(chapters[1]['url'], 'brief_rates.mp3')
+
+        # Each chapter's segment file is exactly the frames between its start and the next chapter
+        with open(master, 'rb') as f:
+            master_frames = [bytes(frame) for _, frame in iter_frames(f.read())]
+        frame_seconds = 576 / 24000
+        with open(outputs['segment_fx'], 'rb') as f:
+            fx_frames = [bytes(frame) for _, frame in iter_frames(f.read())]
+        first = round(chapters[2]['startTime'] / frame_seconds)
+        self.assertEqual(master_frames[first:first + len(fx_frames)], fx_frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the deterministic calculators and the calculation stage
+Tests the arithmetic, vectorized use, and that plan items get precomputed
+figures with AI used only to interpret them
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.calculators import (
+    carry_pct, forward_points, implied_cross, pct_change, rate_differential_bp, realized_vol, zscore
+)
+from pipeline.context import PipelineContext
+from pipeline.stages.calculation import CalculationStage
+
+
+class TestCalculators(unittest.TestCase):
+    """Test suite for core.calculators"""
+
+    def test_scalar_and_vectorized(self):
+        """Test scalars give floats and arrays are computed element-wise"""
+        self.assertAlmostEqual(pct_change(150.0, 147.0), 2.0408, places=4)
+        np.testing.assert_allclose(pct_change([150.0, 160.0], [147.0, 0.0]), [2.0408163, np.nan], rtol=1e-6)
+        self.assertAlmostEqual(implied_cross(172.68, 147.25), 1.17270, places=5)
+        np.testing.assert_allclose(rate_differential_bp([4.05, 2.71], [1.625, 1.625]), [242.5, 108.5])
+
+    def test_carry_and_forward_points(self):
+        """Test carry accrues on actual/360 and forwards follow covered interest parity"""
+        self.assertAlmostEqual(carry_pct(4.20, 0.50), 3.70)
+        self.assertAlmostEqual(carry_pct(4.20, 0.50, 90), 0.925)
+        points = forward_points(147.0, 4.20, 0.50, 90)
+        self.assertAlmostEqual(points, 147.0 * (1 + 0.005 / 4) / (1 + 0.042 / 4) - 147.0)
+        self.assertLess(points, 0)  # USD at a forward discount against JPY
+
+    def test_realized_vol_and_zscore(self):
+        """Test volatility annualizes log returns and z-scores use the sample deviation"""
+        prices = 100 * np.exp(np.cumsum([0, 0.01, -0.01, 0.01, -0.01]))
+        self.assertAlmostEqual(realized_vol(prices), np.std([0.01, -0.01, 0.01, -0.01], ddof=1) * np.sqrt(252) * 100)
+        self.assertTrue(np.isnan(realized_vol([100.0, 101.0])))
+        np.testing.assert_allclose(realized_vol(np.vstack([prices, prices * 2])), [realized_vol(prices)] * 2)
+
+        self.assertAlmostEqual(zscore(3.0, [1.0, 2.0, 3.0]), 1.0)
+        self.assertTrue(np.isnan(zscore(3.0, [2.0, 2.0])))
+        self.assertTrue(np.isnan(zscore(3.0, [2.0])))
+
+
+class TestCalculationStage(unittest.TestCase):
+    """Test suite for CalculationStage"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.temp_dir.name, 'config.yaml')
+        with open(self.config_path, 'w') as f:
+            yaml.safe_dump({'api_keys': {'openai': 'YOUR_OPENAI_API_KEY'}}, f)
+
+        self.context = PipelineContext()
+        self.context.timestamp = datetime(2025, 9, 10, 6, 0)
+        self.context.raw_data = {
+            'fx_rates': {'USD/JPY': 148.0, 'EUR/JPY': 172.0, 'timestamp': '2025-09-10T06:00:00'},
+            'yields': {'ust_3m': 4.20, 'ust_10y': 4.05, 'jgb_10y': 1.60, 'tdb_3m': 0.50, 'bund_3m': 1.90,
+                       'bund_10y': 2.70, 'data_date': '2025/09/09'},
+            'history': {
+                'USD/JPY': [['2025-09-05', 147.0], ['2025-09-08', 147.5], ['2025-09-09', 146.8]],
+                'ust_10y': [['2025-09-08', 4.10], ['2025-09-09', 4.00]],
+                'jgb_10y': [['2025-09-08', 1.58], ['2025-09-09', 1.62]]
+            },
+            'sentiment_score': 35
+        }
+        self.context.analysis_plan = [
+            {'question': 'Why did the yen weaken?', 'analysis': 'Compare', 'data_needed': '',
+             'calculations': ['carry', 'not_a_calculator']},
+            {'question': 'Is the US-Japan yield spread unusually wide?', 'analysis': '', 'data_needed': ''}
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_figures_are_computed_not_asked_for(self):
+        """Test basic metrics use fetched yields and plan items get their calculators' figures"""
+        stage = CalculationStage(self.config_path)
+        with patch.object(stage.ai_analyst, '_call_openai') as call:
+            calculations = stage._perform_calculations(self.context)
+        call.assert_not_called()  # AI is not configured: figures only
+
+        basic = calculations['basic_metrics']
+        self.assertEqual(basic['rate_differential_10y_bp'], 245.0)
+        self.assertEqual(basic['sentiment_interpretation'], 'Bearish')
+
+        first = calculations['analysis_1']
+        self.assertEqual(first['calculators'], ['carry'])
+        self.assertEqual(first['results']['usdjpy_carry_annual_pct'], 3.70)
+        self.assertIn('usdjpy_carry_to_vol', first['results'])
+
+        second = calculations['analysis_2']
+        self.assertEqual(second['calculators'], ['rate_differentials', 'zscores'])
+        self.assertEqual(second['results']['ust_jgb_10y_bp'], 245.0)
+        self.assertEqual(second['results']['ust_jgb_10y_zscore'], round(float(zscore(245.0, [252.0, 238.0])), 2))
+        self.assertTrue(second['calculation'].startswith('ust_jgb_10y_bp: 245.0'))
+
+    def test_fx_changes_from_weekly_closes(self):
+        """Test changes are labelled by the days since each close and references come from the history"""
+        fridays = [date(2025, 3, 7) + timedelta(weeks=i) for i in range(27)]  # Weekly FRED closes to 2025-09-05
+        self.context.raw_data['history']['USD/JPY'] = [[str(day), 140.0 + i * 0.5] for i, day in enumerate(fridays)]
+        self.context.enhanced_data = {'historical_usdjpy': {'1_month_ago': 145.50, '3_months_ago': 142.25}}
+        stage = CalculationStage(self.config_path)
+        calculations = stage._perform_calculations(self.context)
+
+        changes = calculations['metrics']['fx_changes']
+        self.assertEqual(changes['usdjpy_change_5d_pct'], round(pct_change(148.0, 153.0), 2))  # Friday's close
+        self.assertEqual(changes['usdjpy_change_187d_pct'], round(pct_change(148.0, 140.0), 2))
+        self.assertNotIn('usdjpy_change_1d_pct', changes)
+        # Nearest closes to 30 and 91 days back (2025-08-08 and 2025-06-13); no close near a year back
+        self.assertEqual(changes['usdjpy_change_pct_vs_1_month_ago'], round(pct_change(148.0, 151.0), 2))
+        self.assertEqual(changes['usdjpy_change_pct_vs_3_months_ago'], round(pct_change(148.0, 147.0), 2))
+        self.assertNotIn('usdjpy_change_pct_vs_1_year_ago', changes)
+        self.assertEqual(calculations['basic_metrics']['usdjpy_1m_change'], -3.0)
+
+    def test_single_interpretation_call(self):
+        """Test all items are interpreted in one AI call and the figures stay in the result"""
+        stage = CalculationStage(self.config_path)
+        stage.ai_analyst.use_ai = True
+        reply = "Question 1: Carry keeps USD/JPY supported.\nQuestion 2: The spread is near its recent average."
+        with patch.object(stage.ai_analyst, '_call_openai', return_value=reply) as call:
+            calculations = stage._perform_calculations(self.context)
+
+        self.assertEqual(call.call_count, 1)
+        self.assertIn('usdjpy_carry_annual_pct: 3.7', call.call_args[0][0])
+        self.assertTrue(calculations['analysis_2']['calculation'].endswith('near its recent average.'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for report charts
+Tests the time series helpers, LTTB downsampling, the figures built
+from stored history and lazy chart publishing
+"""
+
+import unittest
+import gzip
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.timeseries import align, lttb, rolling_mean_std, to_arrays
+from generators.chart_publish import publish_figures
+from generators.charts import figures_html, report_figures
+
+
+def _history(days, start='2021-01-04'):
+    dates = np.datetime_as_string(np.datetime64(start) + np.arange(days), unit='D')
+    wave = np.sin(np.arange(days) / 40)
+    return {
+        'USD/JPY': [[d, 140 + 5 * w] for d, w in zip(dates, wave)],
+        'ust_10y': [[d, 4.0 + 0.3 * w] for d, w in zip(dates, wave)],
+        'jgb_10y': [[d, 1.5] for d in dates[::2]]
+    }
+
+
+class TestTimeSeries(unittest.TestCase):
+    """Test suite for core.timeseries"""
+
+    def test_to_arrays_and_align(self):
+        """Test series are sorted, de-duplicated (last wins), cleaned and aligned on common dates"""
+        dates, values = to_arrays([['2025-09-03', 3.0], ['2025-09-01', 1.0], ['2025-09-03', 4.0],
+                                   ['2025-09-02', None]])
+        self.assertEqual(dates.tolist(), list(np.array(['2025-09-01', '2025-09-03'], dtype='datetime64[D]')))
+        self.assertEqual(values.tolist(), [1.0, 4.0])
+
+        common, (a, b) = align((dates, values), to_arrays([['2025-09-03', 10.0], ['2025-09-04', 11.0]]))
+        self.assertEqual(len(common), 1)
+        self.assertEqual((a.tolist(), b.tolist()), ([4.0], [10.0]))
+
+    def test_rolling_mean_std(self):
+        """Test the rolling statistics match a direct computation"""
+        values = np.arange(10, dtype=float) ** 1.5
+        mean, std = rolling_mean_std(values, 4)
+        self.assertTrue(np.isnan(mean[:3]).all())
+        self.assertAlmostEqual(mean[6], values[3:7].mean())
+        self.assertAlmostEqual(std[9], values[6:10].std(ddof=1))
+
+    def test_lttb(self):
+        """Test LTTB keeps the endpoints and a spike, and leaves short series alone"""
+        y = np.sin(np.arange(1000) / 50)
+        y[500] = 5.0
+        keep = lttb(np.arange(1000), y, 100)
+        self.assertEqual(len(keep), 100)
+        self.assertEqual((keep[0], keep[-1]), (0, 999))
+        self.assertIn(500, keep)
+        self.assertTrue((np.diff(keep) > 0).all())
+        self.assertEqual(lttb(np.arange(50), y[:50], 100).tolist(), list(range(50)))
+
+
+class TestReportCharts(unittest.TestCase):
+    """Test suite for generators.charts"""
+
+    def test_figures_from_history(self):
+        """Test charts are built from stored data and long series are downsampled"""
+        curves = {'levels': {'ust': {'2y': 3.9, '10y': 4.1}}, 'changes': {'levels': {'ust': {'2y': -2.0, '10y': 1.0}}}}
+        figures = dict(report_figures({'history': _history(1500), 'curves': curves}, window=20, max_points=200))
+        self.assertEqual(list(figures), ['yield_curves', 'fx_history', 'spread_history'])
+
+        fx = figures['fx_history']
+        self.assertEqual([len(trace.x) for trace in fx.data], [200, 200, 200])
+        self.assertEqual(fx.data[2].x[-1], '2025-02-11')
+        self.assertEqual(len(figures['spread_history'].data[0].x), 200)
+        self.assertAlmostEqual(figures['yield_curves'].data[1].y[7], 4.09)  # Previous day's 10Y
+
+        html = figures_html(list(figures.items()))
+        self.assertEqual(html.count('cdn.plot.ly'), 1)
+
+    def test_no_fabricated_data(self):
+        """Test nothing is drawn without stored data"""
+        self.assertEqual(report_figures({'history': {}, 'curves': {}}), [])
+
+
+class TestChartPublishing(unittest.TestCase):
+    """Test suite for generators.chart_publish"""
+
+    def test_publish_figures(self):
+        """Test charts are written as gzipped JSON beside one shared bundle and the page only references them"""
+        figures = report_figures({'history': _history(300), 'curves': {}}, window=20, max_points=100)
+        with tempfile.TemporaryDirectory() as directory, \
+                patch('generators.chart_publish.pyo.get_plotlyjs', return_value='/* plotly */') as bundle:
+            html, assets = publish_figures(figures, directory, 'report_20250915')
+            html_again, _ = publish_figures(figures, directory, 'report_20250922')
+            bundle.assert_called_once()
+
+            self.assertRegex(assets[0], r'^assets/plotly-[\d.]+\.min\.js$')
+            self.assertEqual(assets[1:], ['charts/report_20250915_fx_history.json.gz',
+                                          'charts/report_20250915_spread_history.json.gz'])
+            with open(os.path.join(directory, assets[1]), 'rb') as f:
+                compressed = f.read()
+            figure = json.loads(gzip.decompress(compressed))
+            self.assertEqual(figure['data'][2]['name'], 'USD/JPY')
+            with open(os.path.join(directory, 'charts/report_20250922_fx_history.json.gz'), 'rb') as f:
+                self.assertEqual(f.read(), compressed)  # Deterministic bytes for an unchanged figure
+
+        self.assertEqual(html.count('class="lazy-chart"'), 2)
+        self.assertIn('IntersectionObserver', html)
+        self.assertNotIn('USD/JPY band', html)  # No figure data inlined
+        self.assertLess(len(html), 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Unit tests for source circuit breakers
+Tests breaker state changes, state persisted across processes, and
+DataFetcher's live/cached/stale/fallback accounting when a source is down
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest.mock import Mock, patch
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from core.data_fetcher import DataFetcher
+
+TONA_PAGE = "<html><body><p>加重平均値 0.478</p></body></html>"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test suite for CircuitBreaker"""
+
+    def test_opens_and_probes(self):
+        """Test the breaker opens after repeated failures and lets one probe through after the cool-down"""
+        clock = FakeClock()
+        breaker = CircuitBreaker('jgb_curve', failure_threshold=2, reset_seconds=60, clock=clock)
+
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        clock.now = 61
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())  # Only one probe at a time
+
+        # A failed probe reopens it for another full cool-down
+        breaker.record_failure()
+        clock.now = 100
+        self.assertFalse(breaker.allow_request())
+
+        clock.now = 122
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.failures, 0)
+
+    def test_state_persists_across_registries(self):
+        """Test a breaker opened by one run is still open in the next run's registry"""
+        clock = FakeClock()
+        clock.now = 1_700_000_000.0
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_file = os.path.join(temp_dir, 'cache', 'circuit_breakers.json')
+            # One failure per run, as in the daily scheduled job
+            for _ in range(3):
+                registry = CircuitBreakerRegistry(failure_threshold=3, reset_seconds=1800, clock=clock,
+                                                  state_file=state_file)
+                breaker = registry.get('jgb_curve')
+                self.assertTrue(breaker.allow_request())
+                breaker.record_failure()
+                registry.get('tona').record_success()
+                clock.now += 60
+
+            restored = CircuitBreakerRegistry(failure_threshold=3, reset_seconds=1800, clock=clock,
+                                              state_file=state_file)
+            self.assertEqual(restored.states(), {})
+            self.assertEqual(restored.get('jgb_curve').state, CircuitBreaker.OPEN)
+            self.assertFalse(restored.get('jgb_curve').allow_request())
+            self.assertEqual(restored.get('tona').state, CircuitBreaker.CLOSED)
+
+            # After the cool-down the next run probes; a success clears the saved state
+            clock.now += 1800
+            probe = CircuitBreakerRegistry(failure_threshold=3, reset_seconds=1800, clock=clock,
+                                           state_file=state_file).get('jgb_curve')
+            self.assertTrue(probe.allow_request())
+            probe.record_success()
+            with open(state_file) as f:
+                self.assertEqual(json.load(f), {})
+
+            with open(state_file, 'w') as f:
+                f.write('{not json')
+            with self.assertLogs('core.circuit_breaker', level='WARNING'):
+                self.assertEqual(CircuitBreakerRegistry(state_file=state_file).get('jgb_curve').state,
+                                 CircuitBreaker.CLOSED)
+
+
+class TestDataFetcherBreakers(unittest.TestCase):
+    """Test suite for DataFetcher source status accounting"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        config_path = os.path.join(self.temp_dir.name, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.safe_dump({
+                'api_keys': {'fred': 'test', 'alpha_vantage': 'test'},
+                'data': {'fx_pairs': ['USD/JPY'], 'cache_expiry_hours': 24, 'retry_attempts': 0,
+                         'circuit_breaker': {'failure_threshold': 2, 'reset_minutes': 30,
+                                             'state_file': os.path.join(self.temp_dir.name, 'breakers.json')},
+                         'news': {'store_file': os.path.join(self.temp_dir.name, 'news.json')}},
+                'scraping': {'user_agent': 'test'}
+            }, f)
+        self.fetcher = self._fetcher()
+
+    def _fetcher(self) -> DataFetcher:
+        """A persisting fetcher (like the scheduled runs') whose state files are all in the temp dir"""
+        with patch('core.data_fetcher.HTTP_VALIDATORS_PATH', os.path.join(self.temp_dir.name, 'validators.json')):
+            fetcher = DataFetcher(os.path.join(self.temp_dir.name, 'config.yaml'), persist_state=True)
+        fetcher.cache_dirs['repo'] = self.temp_dir.name
+        return fetcher
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _expire_cache(self, filename: str):
+        path = os.path.join(self.temp_dir.name, filename)
+        os.utime(path, (0, 0))
+
+    def test_state_is_not_persisted_by_default(self):
+        """Test only fetchers built with persist_state write breaker, news and validator state"""
+        fetcher = DataFetcher(os.path.join(self.temp_dir.name, 'config.yaml'))
+        self.assertIsNone(fetcher.breakers.state_file)
+        self.assertIsNone(fetcher.news_store.path)
+        self.assertIsNone(fetcher.http_cache.store_path)
+        self.assertEqual(self.fetcher.breakers.state_file, os.path.join(self.temp_dir.name, 'breakers.json'))
+
+    def test_live_then_stale(self):
+        """Test a good result is cached, and served as stale once the source is down and the cache expired"""
+        response = Mock(text=TONA_PAGE)
+        with patch.object(self.fetcher.session, 'get', return_value=response):
+            live = self.fetcher.fetch_tona_rate()
+        self.assertEqual(live['tona'], 0.478)
+        self.assertEqual(self.fetcher.source_status['tona'], 'live')
+
+        self.fetcher.fetch_tona_rate()
+        self.assertEqual(self.fetcher.source_status['tona'], 'cached')
+
+        self._expire_cache('tona_rate.json')
+        with patch.object(self.fetcher.session, 'get', side_effect=ConnectionError("down")):
+            stale = self.fetcher.fetch_tona_rate()
+        self.assertEqual(stale['tona'], 0.478)
+        self.assertEqual(self.fetcher.source_status['tona'], 'stale')
+
+    def test_open_breaker_skips_requests(self):
+        """Test a dead source is not requested again once its breaker is open"""
+        with patch.object(self.fetcher.session, 'get', side_effect=ConnectionError("down")) as get:
+            for _ in range(5):
+                result = self.fetcher.fetch_repo_rates()
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(result['gc_on'], 0.45)
+        self.assertEqual(self.fetcher.source_status['repo_rates'], 'fallback')
+        # Fallback values are never cached as if they were good data
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, 'repo_rates.json')))
+
+        # The next run (a new fetcher on the same config) skips the source straight away
+        fetcher = self._fetcher()
+        with patch.object(fetcher.session, 'get', side_effect=ConnectionError("down")) as get:
+            fetcher.fetch_repo_rates()
+        self.assertEqual(get.call_count, 0)
+        self.assertEqual(fetcher.source_status['repo_rates'], 'fallback')
+
+    def test_provenance_tags(self):
+        """Test each value in the repo section is tagged with where it came from"""
+        self.fetcher.fetch_tona_rate = Mock(return_value={'tona': 0.478, 'timestamp': 'now'})
+        self.fetcher.source_status['tona'] = 'live'
+        with patch.object(self.fetcher.session, 'get', side_effect=ConnectionError("down")):
+            repo, tags = self.fetcher._fetch_repo_section()
+
+        self.assertEqual(repo['tona'], 0.478)
+        self.assertEqual(tags, {'gc_on': 'fallback', 'gc_1w': 'fallback', 'gc_1m': 'fallback', 'tona': 'live'})
+
+
+if __name__ == "__main__":
+    unittest.main()
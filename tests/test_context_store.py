@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for pipeline context snapshots
+Tests that source data is stored once across runs, snapshots read back
+as saved, and pruning removes old runs and only the blobs they alone used
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pipeline.context import PipelineContext
+from pipeline.context_store import BLOB_DIR, HAS_ZSTD, ContextStore
+
+
+def run_context(usdjpy: float) -> PipelineContext:
+    context = PipelineContext()
+    context.timestamp = datetime(2025, 9, 15, 6, 30)
+    context.raw_data = {
+        'calendar': {'today': [{'event': f"Event {i}", 'date': datetime(2025, 9, 15, i % 24)} for i in range(300)]},
+        'fx': {'USD/JPY': usdjpy}
+    }
+    context.enhanced_data = {'fx_again': {'USD/JPY': usdjpy}}
+    context.title = f"Yen at {usdjpy}"
+    return context
+
+
+class TestContextStore(unittest.TestCase):
+    """Test suite for ContextStore"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _blobs(self):
+        return sorted(name for _, _, files in os.walk(os.path.join(self.directory, BLOB_DIR)) for name in files)
+
+    def test_save_and_load(self):
+        """Test unchanged sources are shared between runs and snapshots load back as saved"""
+        store = ContextStore(self.directory)
+        first = store.save(run_context(147.2).to_dict(), datetime(2025, 9, 15, 6, 30))
+        self.assertEqual(len(self._blobs()), 2)  # The calendar and one FX blob shared with enhanced_data
+        second = store.save(run_context(147.9).to_dict(), datetime(2025, 9, 16, 6, 30))
+        self.assertEqual(len(self._blobs()), 3)
+        self.assertTrue(second.endswith('pipeline_context_20250916_063000.json.gz'))
+
+        context = run_context(147.9).to_dict()
+        expected = json.loads(json.dumps(context, default=str))
+        self.assertEqual(store.load(second), expected)
+        self.assertEqual(store.load(first)['raw_data']['fx'], {'USD/JPY': 147.2})
+        self.assertLess(os.path.getsize(second), len(json.dumps(context, default=str)) / 20)
+
+    def test_prune(self):
+        """Test old snapshots are deleted by count and age, with the blobs only they used"""
+        legacy = os.path.join(self.directory, 'pipeline_context_20250901_063000.json')
+        with open(legacy, 'w') as f:
+            json.dump({'title': 'Before compaction'}, f)
+        store = ContextStore(self.directory, keep_runs=2, keep_days=30)
+        for day, rate in ((14, 147.0), (15, 147.2), (16, 147.9)):
+            store.save(run_context(rate).to_dict(), datetime(2025, 9, day, 6, 30))
+
+        self.assertEqual(store.prune(now=datetime(2025, 9, 17)), ['pipeline_context_20250901_063000.json',
+                                                                  'pipeline_context_20250914_063000.json.gz'])
+        self.assertEqual(store.snapshots(), ['pipeline_context_20250915_063000.json.gz',
+                                             'pipeline_context_20250916_063000.json.gz'])
+        self.assertEqual(len(self._blobs()), 3)  # The shared calendar survives
+        store.load(os.path.join(self.directory, 'pipeline_context_20250915_063000.json.gz'))
+
+        self.assertEqual(store.prune(now=datetime(2025, 10, 16)), ['pipeline_context_20250915_063000.json.gz'])
+        self.assertEqual(len(self._blobs()), 2)
+        snapshot = os.path.join(self.directory, 'pipeline_context_20250916_063000.json.gz')
+        self.assertEqual(store.load(snapshot)['title'], 'Yen at 147.9')
+        self.assertEqual(store.prune(now=datetime(2025, 10, 16)), [])
+
+    def test_zstd_falls_back_to_gzip(self):
+        """Test an unavailable zstd setting still saves snapshots"""
+        if HAS_ZSTD:
+            store = ContextStore(self.directory, compression='zstd')
+            self.assertEqual(store.compression, 'zstd')
+        else:
+            with self.assertLogs('pipeline.context_store', level='WARNING'):
+                store = ContextStore(self.directory, compression='zstd')
+            self.assertEqual(store.compression, 'gzip')
+        path = store.save(run_context(147.2).to_dict())
+        self.assertEqual(store.load(path)['raw_data']['fx'], {'USD/JPY': 147.2})
+        with self.assertRaises(ValueError):
+            ContextStore(self.directory, compression='lz4')
+
+
+if __name__ == "__main__":
+    unittest.main()
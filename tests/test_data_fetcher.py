@@ -9,13 +9,17 @@ import os
 import tempfile
 import json
 from unittest.mock import patch, Mock, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 import sys
 
+import pandas as pd
+
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from core.data_fetcher import DataFetcher
+from core.data_fetcher import DataFetcher, SourceUnavailable
+from core.news_engine import NewsStore
+from core.rolling_stats import RollingStats
 
 
 class TestDataFetcher(unittest.TestCase):
@@ -258,6 +262,24 @@ class TestDataFetcher(unittest.TestCase):
         self.assertIn('timestamp', result)
         self.assertIsInstance(result, dict)
     
+    def test_parse_tona_rate_from_table(self):
+        """Test the table fallback finds TONA when no text pattern matches"""
+        response = Mock()
+        response.text = """
+        <html><body>
+        <p>無担保コールレート（翌日物）</p>
+        <table>
+            <tr><th>日付</th><th>無担保コールO/N</th></tr>
+            <tr><td>9月16日</td><td>0.477</td></tr>
+        </table>
+        </body></html>
+        """
+        self.assertEqual(self.fetcher._parse_tona_rate(response), {'tona': 0.477})
+        
+        response.text = "<html><body><table><tr><td>無担保コール</td><td>N/A</td></tr></table></body></html>"
+        with self.assertRaises(SourceUnavailable):
+            self.fetcher._parse_tona_rate(response)
+    
     @patch('core.data_fetcher.DataFetcher.fetch_fred_fx')
     @patch('core.data_fetcher.DataFetcher.fetch_fred_yields')
     @patch('core.data_fetcher.DataFetcher.fetch_jgb_curve')
@@ -400,6 +422,75 @@ class TestDataFetcher(unittest.TestCase):
             # Test cache load
             loaded_data = self.fetcher._load_cache('test', 'test_cache.json')
             self.assertEqual(loaded_data['test_key'], 'test_value')
+    
+    def test_curve_changes_label_their_span(self):
+        """Test curve changes are d/d against the last business day, and dated against older snapshots"""
+        yields = {'ust_2y': 3.5, 'ust_10y': 4.1, 'jgb_2y': 0.9, 'jgb_10y': 1.6}
+        tags = dict.fromkeys(yields, 'live')
+        last_business_day = (datetime.now() - pd.tseries.offsets.BDay(1)).strftime('%Y-%m-%d')
+        week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.fetcher.cache_dirs['macro'] = temp_dir
+            for previous_day, label in ((last_business_day, 'd/d'), (week_ago, f"since {week_ago}")):
+                self.fetcher._save_cache({previous_day: dict(yields, ust_10y=4.0)}, 'macro', 'yield_history.json')
+                curves = self.fetcher._curve_section(yields, tags)
+                self.assertEqual(curves['change_label'], label)
+                self.assertAlmostEqual(curves['changes']['levels']['ust']['10y'], 10.0)
+    
+    def test_news_cursors_per_consumer(self):
+        """Test the brief and the weekly report each see their own new headlines, committed after output"""
+        self.fetcher.news_store = NewsStore(path=None)
+        self.fetcher.news_store.add('boj_news', [{'title': 'Outlook report released'}])
+        with patch.object(self.fetcher.news_engine, 'poll', return_value={}):
+            _, _, headlines, pending = self.fetcher._news_section('weekly_report')
+            self.assertTrue(headlines[0]['new'])
+            self.fetcher.commit_news_cursor({'news_cursor': pending})
+
+            _, _, headlines, pending = self.fetcher._news_section('morning_brief')
+            self.assertTrue(headlines[0]['new'])  # Not taken by the weekly report
+            # Not committed (the brief failed), so the next brief still sees it as new
+            _, _, headlines, pending = self.fetcher._news_section('morning_brief')
+            self.assertTrue(headlines[0]['new'])
+            self.fetcher.commit_news_cursor({'news_cursor': pending})
+            _, _, headlines, _ = self.fetcher._news_section('morning_brief')
+            self.assertFalse(headlines[0]['new'])
+    
+    def test_refresh_morning_brief_data(self):
+        """Test pre-fetched data gets fresh FX and repo values, bypassing their cache"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.fetcher.cache_dirs['fx'] = temp_dir
+            self.fetcher._save_cache({'USD/JPY': 146.0}, 'fx', 'alpha_fx_rates.json')
+            
+            def fetch_fx():
+                self.fetcher.source_status['alpha_fx'] = 'live'
+                return self.fetcher._load_cache('fx', 'alpha_fx_rates.json') or {'USD/JPY': 147.5}
+            
+            usdjpy = RollingStats(window=5)
+            for day, close in enumerate((145.0, 146.0, 145.5, 146.5), 1):
+                usdjpy.update(close, f'2025-09-0{day}')
+            history = {'series': {}, 'stats': {'USD/JPY': usdjpy}}
+            
+            prefetched = {'fx': {'USD/JPY': 146.0}, 'repo': {'tona': 0.45}, 'macro': {}, 'yields': {'jgb_10y': 1.5},
+                          'fx_stats': {'USD/JPY': usdjpy.snapshot(146.0)}}
+            with patch.object(self.fetcher, 'fetch_fx_rates_alpha', side_effect=fetch_fx), \
+                 patch.object(self.fetcher, 'fetch_fx_history', return_value=history) as fetch_history, \
+                 patch.object(self.fetcher, 'fetch_repo_rates', return_value={'gc_on': 0.49}), \
+                 patch.object(self.fetcher, 'fetch_tona_rate', return_value={'tona': 0.48}):
+                result = self.fetcher.refresh_morning_brief_data(prefetched, ['fx', 'repo'])
+            
+            # FX statistics are rescored against the refreshed spot, from the stored history only
+            fetch_history.assert_called_once()
+            self.assertEqual(result['fx_stats']['USD/JPY'], usdjpy.snapshot(147.5))
+            self.assertEqual(result['fx_stats']['USD/JPY']['level'], 147.5)
+            
+            self.assertEqual(result['fx'], {'USD/JPY': 147.5})
+            self.assertEqual(result['repo'], {'gc_on': 0.49, 'tona': 0.48})
+            self.assertEqual(result['yields'], {'jgb_10y': 1.5})
+            self.assertIn('sentiment_score', result)
+            self.assertIn('refreshed_at', result)
+            
+            # Outside the refresh the cache is used as before
+            self.assertEqual(fetch_fx(), {'USD/JPY': 146.0})
 
 
 class TestDataValidation(unittest.TestCase):
@@ -299,6 +299,33 @@ class TestEconomicCalendar(unittest.TestCase):
             self.assertLessEqual(event_date, now_naive, 
                                 f"Event {event.event_name} should be in past")
     
+    def test_fred_events_range_lookup(self):
+        """Test FRED releases are sliced from the sorted date index for both file formats"""
+        fred_calendar = {
+            "2025-09-12": [{"release_name": "Consumer Price Index", "time_local": "08:30 ET",
+                            "importance": 5, "category": "inflation", "source": "FRED"}],
+            "2025-09-05": [{"release_name": "Employment Situation", "time_local": "08:30 ET",
+                            "importance": 5, "category": "employment", "source": "FRED"}],
+            "2025-10-03": [{"release_name": "Employment Situation", "time_local": "08:30 ET",
+                            "importance": 5, "category": "employment", "source": "FRED"}]
+        }
+        fred_file = os.path.join(self.test_dir, 'fred_economic_releases.json')
+        start_date = datetime(2025, 9, 5, 6, 0)
+        end_date = datetime(2025, 9, 30)
+
+        for file_data in (fred_calendar, EconomicCalendar._build_fred_index(fred_calendar)):
+            with open(fred_file, 'w') as f:
+                json.dump(file_data, f)
+            calendar = EconomicCalendar(data_dir=self.test_dir,
+                                        config_path=os.path.join(self.test_dir, 'test_config.yaml'))
+
+            events = calendar.get_fred_events(start_date, end_date)
+            self.assertEqual([e.event_name for e in events],
+                             ["Employment Situation", "Consumer Price Index"])
+            # Events keep the start time of day, as the day-by-day walk did
+            self.assertEqual(events[1].date, datetime(2025, 9, 12, 6, 0))
+            self.assertEqual(calendar.get_fred_events(end_date, start_date), [])
+
     def test_high_importance_filtering(self):
         """Test filtering of high importance events"""
         # Create test events with different importance levels
@@ -337,7 +364,39 @@ class TestEconomicCalendar(unittest.TestCase):
         self.assertEqual(event_dict['time'], '12:00 JST')  # Uses time_local
         self.assertEqual(event_dict['importance'], 5)
         self.assertEqual(event_dict['currency'], 'JPY')
-    
+
+    def test_economic_event_immutable_and_memoized(self):
+        """Test EconomicEvent is frozen, interns strings and memoizes serialization"""
+        def make_event():
+            return EconomicEvent(
+                date=datetime(2025, 9, 19, 3, 0, 0),
+                time_local="12:00 JST",
+                event_name="BOJ Policy Decision",
+                country="".join(["Ja", "pan"]),
+                currency="JPY",
+                importance=5,
+                category="monetary_policy",
+                source="Bank of Japan"
+            )
+
+        event, other = make_event(), make_event()
+
+        with self.assertRaises(AttributeError):
+            event.importance = 1
+        self.assertFalse(hasattr(event, '__dict__'))
+
+        # Low-cardinality strings are shared between events
+        self.assertIs(event.country, other.country)
+
+        # Serialized forms are computed once and reused
+        self.assertIs(event.to_dict(), event.to_dict())
+        self.assertEqual(json.loads(event.to_json()), event.to_dict())
+
+        # Caches do not affect equality or hashing
+        event.to_dict()
+        self.assertEqual(event, other)
+        self.assertEqual(hash(event), hash(other))
+
     def test_calendar_summary(self):
         """Test get_calendar_summary method structure"""
         summary = self.calendar.get_calendar_summary(days_ahead=7)
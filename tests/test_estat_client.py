@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the e-Stat client
+Tests streamed decoding of VALUE arrays, NEXT_KEY pagination, incremental
+pulls by @time and the metadata cache
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+import requests
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.estat_client import EStatClient, EStatError, iter_stats_values
+
+META = {'GET_META_INFO': {
+    'RESULT': {'STATUS': 0},
+    'METADATA_INF': {
+        'TABLE_INF': {'TITLE': {'@no': '1', '$': '東京都区部 消費者物価指数'}, 'UPDATED_DATE': '2025-08-29'},
+        'CLASS_INF': {'CLASS_OBJ': [
+            {'@id': 'cat01', '@name': '品目', 'CLASS': [{'@code': '0001', '@name': '総合'}]},
+            {'@id': 'time', '@name': '時間軸', 'CLASS': {'@code': '2025000808', '@name': '2025年8月'}}
+        ]}
+    }
+}}
+
+
+def stats_page(times, next_key=None, status=0):
+    values = [{'@cat01': '0001', '@area': '13A01', '@time': t, '@unit': '2020年=100', '$': str(v)}
+              for t, v in times]
+    result_inf = {'TOTAL_NUMBER': len(values)}
+    if next_key:
+        result_inf['NEXT_KEY'] = next_key
+    return {'GET_STATS_DATA': {
+        'RESULT': {'STATUS': status, 'ERROR_MSG': '正常に終了しました。'},
+        'STATISTICAL_DATA': {'RESULT_INF': result_inf, 'DATA_INF': {'VALUE': values}}
+    }}
+
+
+def make_response(document) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    response._content_consumed = True
+    response.encoding = 'utf-8'
+    return response
+
+
+class FakeSession:
+    """Answers getMetaInfo with META and getStatsData with queued pages, recording params"""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.stats_params = []
+        self.meta_calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        if url.endswith('getMetaInfo'):
+            self.meta_calls += 1
+            return make_response(META)
+        self.stats_params.append(params)
+        return make_response(self.pages.pop(0))
+
+
+class TestStatsValueStream(unittest.TestCase):
+    """Test suite for iter_stats_values"""
+
+    def chunks(self, document, size):
+        text = json.dumps(document, ensure_ascii=False)
+        return (text[i:i + size] for i in range(0, len(text), size))
+
+    def test_values_decoded_across_chunk_boundaries(self):
+        """Test every value is decoded whatever the chunk size, and the header is read"""
+        document = stats_page([(f'2025000{m}0{m}', 100 + m) for m in range(1, 8)], next_key=8)
+        for size in (3, 17, 1 << 16):
+            page = {}
+            values = list(iter_stats_values(self.chunks(document, size), page))
+            self.assertEqual([v['$'] for v in values], [str(100 + m) for m in range(1, 8)])
+            self.assertEqual((page['status'], page['next_key'], page['total']), (0, 8, 7))
+
+    def test_single_value_and_errors(self):
+        """Test a bare VALUE object is decoded and error statuses raise"""
+        document = stats_page([('2025000808', 109.7)])
+        document['GET_STATS_DATA']['STATISTICAL_DATA']['DATA_INF']['VALUE'] = \
+            document['GET_STATS_DATA']['STATISTICAL_DATA']['DATA_INF']['VALUE'][0]
+        self.assertEqual(len(list(iter_stats_values(self.chunks(document, 5), {}))), 1)
+
+        error = {'GET_STATS_DATA': {'RESULT': {'STATUS': 100, 'ERROR_MSG': '認証に失敗しました。'}}}
+        with self.assertRaisesRegex(EStatError, '認証'):
+            list(iter_stats_values(self.chunks(error, 5), {}))
+
+
+class TestEStatClient(unittest.TestCase):
+    """Test suite for EStatClient"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def client(self, session):
+        return EStatClient(session, 'test-app-id', cache_dir=self.temp_dir.name, page_size=2, chunk_size=7)
+
+    def test_pagination_and_incremental_pull(self):
+        """Test NEXT_KEY is followed, later pulls start at the latest @time, and metadata is cached"""
+        session = FakeSession([
+            stats_page([('2025000606', 108.9), ('2025000707', 109.4)], next_key=3),
+            stats_page([('2025000808', 109.6)])
+        ])
+        dataset = self.client(session).fetch_dataset('0003427113', 'Tokyo CPI')
+
+        self.assertEqual([p['startPosition'] for p in session.stats_params], [1, 3])
+        now = datetime.now()
+        self.assertEqual(session.stats_params[0]['cdTimeFrom'], f"{now.year - 2}{now.month:02d}")  # 24 months back
+        self.assertEqual((dataset['latest_value'], dataset['latest_time']), (109.6, '2025000808'))
+        self.assertEqual(dataset['title'], '東京都区部 消費者物価指数')
+        self.assertEqual(dataset['values'][0]['time_name'], '2025年8月')
+        self.assertEqual(dataset['values'][0]['category_name'], '総合')
+
+        # August is revised and September published; earlier months come from the cache
+        session = FakeSession([stats_page([('2025000808', 109.7), ('2025000909', 110.1)])])
+        dataset = self.client(session).fetch_dataset('0003427113', 'Tokyo CPI')
+
+        self.assertEqual(session.stats_params[0]['cdTimeFrom'], '2025000808')
+        self.assertEqual(session.meta_calls, 0)
+        self.assertEqual([(v['time'], v['value']) for v in dataset['values']], [
+            ('2025000909', 110.1), ('2025000808', 109.7), ('2025000707', 109.4), ('2025000606', 108.9)
+        ])
+
+    def test_first_pull_window(self):
+        """Test the first pull is bounded to initial_months and 0 asks for the whole table"""
+        session = FakeSession([stats_page([('2025000808', 109.6)])])
+        client = self.client(session)
+        client.initial_months = 3
+        client.fetch_dataset('0003427113', 'Tokyo CPI', filters={'cdCat01': '0001'})
+        now = datetime.now()
+        months = now.year * 12 + now.month - 4
+        self.assertEqual(session.stats_params[0]['cdTimeFrom'], f"{months // 12}{months % 12 + 1:02d}")
+        self.assertEqual(session.stats_params[0]['cdCat01'], '0001')
+
+        session = FakeSession([stats_page([('2025000808', 109.6)])])
+        client = self.client(session)
+        client.initial_months = 0
+        client.fetch_dataset('0003355266', 'Machinery Orders')
+        self.assertNotIn('cdTimeFrom', session.stats_params[0])
+
+    def test_fetch_many_reports_failures(self):
+        """Test one failing table does not lose the others"""
+        session = FakeSession([
+            stats_page([('2025000808', 109.6)]),
+            {'GET_STATS_DATA': {'RESULT': {'STATUS': 100, 'ERROR_MSG': 'invalid statsDataId'}}}
+        ])
+        client = self.client(session)
+        client.max_workers = 1  # Keep the queued pages in order
+        results, errors = client.fetch_many({
+            'tokyo_cpi': {'stats_data_id': '0003427113', 'name': 'Tokyo CPI'},
+            'bogus': {'stats_data_id': '0000000000'}
+        })
+        self.assertEqual(list(results), ['tokyo_cpi'])
+        self.assertIn('invalid statsDataId', errors['bogus'])
+
+
+if __name__ == "__main__":
+    unittest.main()
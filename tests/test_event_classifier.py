@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the event classifier
+Tests category priority, importance scales, bond auction detection and that
+each source keeps its own keyword rules
+"""
+
+import unittest
+import random
+import re
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.economic_calendar import EconomicCalendar
+from scrapers.event_classifier import BASIC_RULES, FRED_RULES, SELENIUM_RULES, EventClassifier, KeywordRules
+
+
+def brute_force_classify(rules: KeywordRules, event_name: str) -> tuple:
+    """Reference implementation: one substring test per keyword, as the scrapers used to do"""
+    text = event_name if rules.case_sensitive else event_name.lower()
+
+    def found(keyword):
+        if keyword in rules.whole_words:
+            return re.search(r'(?<![^\W_])' + re.escape(keyword) + r'(?![^\W_])', text) is not None
+        return keyword in text
+
+    category = next((cat for keyword, cat in rules.categories if found(keyword)), 'economic')
+    is_bond_auction = any(found(keyword) for keyword in rules.auction)
+    if any(found(keyword) for keyword in rules.high):
+        importance = 5
+    elif any(found(keyword) for keyword in rules.medium) or is_bond_auction:
+        importance = 3
+    else:
+        importance = 1
+    return category, importance, is_bond_auction
+
+
+class TestEventClassifier(unittest.TestCase):
+    """Test suite for EventClassifier"""
+
+    def setUp(self):
+        """Set up the basic scraper's classifier"""
+        self.classifier = EventClassifier()
+
+    def test_common_events(self):
+        """Test classification of typical calendar events"""
+        self.assertEqual(tuple(self.classifier.classify('Non Farm Payrolls')), ('employment', 5, False))
+        self.assertEqual(tuple(self.classifier.classify('Fed Interest Rate Decision')), ('monetary_policy', 5, False))
+        self.assertEqual(tuple(self.classifier.classify('10-Year Note Auction')), ('fixed_income', 3, True))
+        self.assertEqual(tuple(self.classifier.classify('Housing Starts')), ('housing', 3, False))
+        self.assertEqual(tuple(self.classifier.classify('Initial Jobless Claims')), ('economic', 1, False))
+
+    def test_overlapping_keywords(self):
+        """Test keywords nested inside longer keywords are still detected"""
+        selenium = EventClassifier(SELENIUM_RULES)
+        # 'fed' is a prefix of 'federal funds', 'employment' sits inside 'unemployment'
+        self.assertEqual(selenium.classify('Federal Funds Rate').importance, 5)
+        self.assertEqual(self.classifier.classify('UNEMPLOYMENT RATE').category, 'employment')
+        self.assertTrue(selenium.classify('Inflation-Linked Gilt Syndication').is_bond_auction)
+
+    def test_whole_words(self):
+        """Test short auction keywords only match as separate words"""
+        selenium = EventClassifier(SELENIUM_RULES, high_importance=5, medium_importance=4, default_importance=4)
+        self.assertTrue(selenium.classify('France 10-Year OAT Auction').is_bond_auction)
+        self.assertTrue(selenium.classify('UK Gilt Tap').is_bond_auction)
+        self.assertFalse(selenium.classify('Fed Tapering Remarks').is_bond_auction)
+        self.assertFalse(selenium.classify('Budget Bloat Review').is_bond_auction)
+        self.assertTrue(selenium.classify('EU Floating Rate Note').is_bond_auction)
+
+    def test_importance_scale(self):
+        """Test per-source importance scales"""
+        high_impact = EventClassifier(SELENIUM_RULES, high_importance=5, medium_importance=4, default_importance=4)
+        self.assertEqual(high_impact.classify('CPI YoY').importance, 5)
+        self.assertEqual(high_impact.classify('Retail Sales MoM').importance, 4)
+        self.assertEqual(high_impact.classify('Machinery Orders').importance, 4)
+
+    def test_sources_keep_their_rules(self):
+        """Test each source's keywords only apply to that source"""
+        basic = self.classifier
+        self.assertEqual(tuple(basic.classify('Building Permits')), ('economic', 1, False))
+        self.assertFalse(basic.classify('JGB Tap').is_bond_auction)
+        self.assertEqual(basic.classify('Fed Funds Target').importance, 5)  # 'fed fund' is high here
+        selenium = EventClassifier(SELENIUM_RULES, high_importance=5, medium_importance=4, default_importance=4)
+        self.assertEqual(selenium.classify('Core Inflation Rate YoY').category, 'inflation')
+        self.assertEqual(selenium.classify('Inflation Expectations').importance, 4)  # Only 'inflation rate' is high
+
+    def test_fred_releases_unchanged(self):
+        """Test FRED releases are classified as before the shared classifier"""
+        with tempfile.TemporaryDirectory() as data_dir:
+            calendar = EconomicCalendar(data_dir=data_dir)
+            expected = {
+                'H.15 Selected Interest Rates': ('economic', 3, '08:30 ET'),
+                'Interest Rate Spreads': ('economic', 3, '08:30 ET'),
+                'Daily Treasury Inflation-Indexed Securities': ('economic', 3, '08:30 ET'),
+                'Treasury International Capital': ('economic', 3, '08:30 ET'),
+                'Monthly Treasury Statement': ('economic', 3, '08:30 ET'),
+                'Federal Reserve Bank of St. Louis Financial Stress Index': ('economic', 3, '08:30 ET'),
+                'Consumer Price Index': ('inflation', 5, '08:30 ET'),
+                'Employment Situation': ('employment', 5, '08:30 ET'),
+                'Gross Domestic Product': ('growth', 5, '08:30 ET'),
+                'Industrial Production and Capacity Utilization': ('manufacturing', 4, '08:30 ET'),
+                'Advance Monthly Sales for Retail and Food Services': ('retail', 4, '08:30 ET'),
+                'New Residential Construction': ('economic', 3, '08:30 ET'),
+                'FOMC Press Release': ('monetary_policy', 5, '14:00 ET'),
+                'Federal Funds Data': ('monetary_policy', 5, '14:00 ET'),
+                'Unemployment Insurance Weekly Claims Report': ('economic', 3, '08:30 ET'),
+                'Job Openings and Labor Turnover Survey': ('economic', 3, '08:30 ET'),
+                'ADP National Employment Report': ('employment', 5, '08:30 ET'),
+                'Retail Employment and CPI': ('inflation', 5, '08:30 ET')
+            }
+            for name, outcome in expected.items():
+                self.assertEqual(calendar._classify_fred_release(name), outcome, name)
+
+    def test_matches_brute_force(self):
+        """Test the single-pass scanner agrees with per-keyword scans for every source"""
+        rng = random.Random(42)
+        for rules in (BASIC_RULES, SELENIUM_RULES, FRED_RULES):
+            classifier = EventClassifier(rules)
+            keywords = [keyword for keyword, _ in rules.categories] + rules.auction + rules.high + rules.medium
+            fragments = keywords + ['rate', 'yoy', 'confed', 'un', 'bil', 'b', 'ering', '-', ' ', 'x', 'Fed']
+            for _ in range(2000):
+                name = ''.join(rng.choice(fragments) for _ in range(rng.randint(1, 5)))
+                self.assertEqual(tuple(classifier.classify(name)), brute_force_classify(rules, name), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
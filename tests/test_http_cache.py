@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for conditional HTTP fetching
+Tests validators are sent back, and that 304s and unchanged bodies reuse the
+previous parsed result without parsing again
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+import requests
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.http_cache import ConditionalHTTPCache
+
+URL = 'https://www.tokyotanshi.co.jp/market_report/daily_d.html'
+
+
+def make_response(status: int, body: str = '', headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    response.url = URL
+    return response
+
+
+class FakeSession:
+    """Returns queued responses and records request headers"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+class TestConditionalHTTPCache(unittest.TestCase):
+    """Test suite for ConditionalHTTPCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.temp_dir.name, 'validators.json')
+        self.parse_calls = 0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def parse_rates(self, response):
+        self.parse_calls += 1
+        return {'gc_on': float(response.text)}
+
+    def test_not_modified_reuses_result(self):
+        """Test validators are sent back and a 304 skips parsing"""
+        session = FakeSession([
+            make_response(200, '0.477', {'ETag': '"abc"', 'Last-Modified': 'Thu, 11 Sep 2025 06:00:00 GMT'}),
+            make_response(304)
+        ])
+        cache = ConditionalHTTPCache(session, self.store_path)
+
+        first = cache.get_parsed(URL, self.parse_rates, timeout=15)
+        first['timestamp'] = 'mutated by caller'
+        second = cache.get_parsed(URL, self.parse_rates, timeout=15)
+
+        self.assertEqual(second, {'gc_on': 0.477})
+        self.assertEqual(self.parse_calls, 1)
+        self.assertEqual(session.sent_headers[0], {})
+        self.assertEqual(session.sent_headers[1], {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Thu, 11 Sep 2025 06:00:00 GMT'
+        })
+
+    def test_unchanged_body_and_persistence(self):
+        """Test a server without validators still skips parsing an identical body, across restarts"""
+        cache = ConditionalHTTPCache(FakeSession([make_response(200, '0.477')]), self.store_path)
+        cache.get_parsed(URL, self.parse_rates)
+
+        restarted = ConditionalHTTPCache(FakeSession([make_response(200, '0.477'), make_response(200, '0.481')]),
+                                         self.store_path)
+        self.assertEqual(restarted.get_parsed(URL, self.parse_rates), {'gc_on': 0.477})
+        self.assertEqual((self.parse_calls, restarted.unchanged), (1, 1))
+
+        self.assertEqual(restarted.get_parsed(URL, self.parse_rates), {'gc_on': 0.481})
+        self.assertEqual(self.parse_calls, 2)
+
+    def test_parse_failure_not_stored(self):
+        """Test a page that fails to parse is parsed again next time"""
+        session = FakeSession([make_response(200, 'maintenance'), make_response(200, 'maintenance')])
+        cache = ConditionalHTTPCache(session, self.store_path)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get_parsed(URL, self.parse_rates)
+        self.assertEqual(self.parse_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MP3 frame handling
+Tests header parsing, frame iteration, frame-level concatenation and
+probing duration from headers
+"""
+
+import unittest
+import io
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.mp3 import (
+    GTTS_FRAME_BYTES,
+    GTTS_FRAME_HEADER,
+    Mp3FormatError,
+    concat_frames,
+    concat_to_file,
+    iter_frames,
+    parse_header,
+    probe,
+    silence
+)
+
+
+def tone_frame(header: bytes, fill: int) -> bytes:
+    """A frame with recognisable (non-silent) payload"""
+    length = parse_header(header).length
+    return header + bytes([fill]) * (length - 4)
+
+
+def xing_frame() -> bytes:
+    """A gTTS-format frame carrying a Xing tag after the 9-byte side info"""
+    frame = bytearray(GTTS_FRAME_HEADER + bytes(GTTS_FRAME_BYTES - 4))
+    frame[13:17] = b'Xing'
+    return bytes(frame)
+
+
+class TestMp3(unittest.TestCase):
+    """Test suite for MP3 frame helpers"""
+
+    def test_parse_header(self):
+        """Test gTTS and MPEG-1 headers decode to the right frame sizes"""
+        gtts = parse_header(GTTS_FRAME_HEADER)
+        self.assertEqual((gtts.version, gtts.layer, gtts.bitrate, gtts.sample_rate, gtts.channels),
+                         (2, 3, 32, 24000, 1))
+        self.assertEqual((gtts.samples, gtts.length), (576, 96))
+
+        # MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo, padded
+        mpeg1 = parse_header(bytes([0xFF, 0xFB, 0x92, 0x00]))
+        self.assertEqual((mpeg1.bitrate, mpeg1.sample_rate, mpeg1.channels, mpeg1.length), (128, 44100, 2, 418))
+        self.assertIsNone(parse_header(b'ID3\x04'))
+
+    def test_iter_frames_skips_tags(self):
+        """Test ID3v2, Xing and ID3v1 tags are not returned as audio"""
+        id3v2 = b'ID3\x04\x00\x00\x00\x00\x00\x05' + b'hello'
+        audio = tone_frame(GTTS_FRAME_HEADER, 1) + tone_frame(GTTS_FRAME_HEADER, 2)
+        id3v1 = b'TAG' + bytes(125)
+
+        frames = [bytes(frame) for _, frame in iter_frames(id3v2 + xing_frame() + audio + id3v1)]
+        self.assertEqual(frames, [tone_frame(GTTS_FRAME_HEADER, 1), tone_frame(GTTS_FRAME_HEADER, 2)])
+
+    def test_concat_inserts_silence(self):
+        """Test clips are joined in order with pre-encoded pauses"""
+        clip_a = xing_frame() + tone_frame(GTTS_FRAME_HEADER, 1) * 10
+        clip_b = tone_frame(GTTS_FRAME_HEADER, 2) * 5
+
+        out = io.BytesIO()
+        result = concat_frames([clip_a, clip_b], out, pauses_ms=[0, 240])
+
+        expected = tone_frame(GTTS_FRAME_HEADER, 1) * 10 + silence(240) + tone_frame(GTTS_FRAME_HEADER, 2) * 5
+        self.assertEqual(out.getvalue(), expected)
+        self.assertAlmostEqual(result.duration, 25 * 576 / 24000)
+
+        # Clip spans exclude the pause: 10 frames, 10 silent frames, 5 frames
+        frame_seconds = 576 / 24000
+        self.assertEqual(result.clip_spans, [(0.0, 10 * frame_seconds), (20 * frame_seconds, 25 * frame_seconds)])
+
+    def test_concat_rejects_mixed_formats(self):
+        """Test clips with a different sample rate are not spliced, and no partial file is left"""
+        mpeg1 = tone_frame(bytes([0xFF, 0xFB, 0x90, 0xC0]), 3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, 'brief.mp3')
+            with self.assertRaises(Mp3FormatError):
+                concat_to_file([tone_frame(GTTS_FRAME_HEADER, 1), mpeg1], output_path)
+            self.assertEqual(os.listdir(temp_dir), [])
+
+
+    def test_probe_duration(self):
+        """Test duration comes from the Xing frame count, the size of a CBR stream, or a header walk"""
+        gtts_64k = bytes([0xFF, 0xF3, 0x84, 0xC0])
+        id3v2 = b'ID3\x04\x00\x00\x00\x00\x00\x05' + b'hello'
+        xing = bytearray(xing_frame())
+        xing[17:25] = (1).to_bytes(4, 'big') + (250).to_bytes(4, 'big')  # Frame count flag, 250 frames
+        files = {
+            'cbr.mp3': id3v2 + tone_frame(GTTS_FRAME_HEADER, 1) * 100 + b'TAG' + bytes(125),
+            'xing.mp3': bytes(xing) + tone_frame(GTTS_FRAME_HEADER, 1) * 10,
+            'vbr.mp3': (tone_frame(GTTS_FRAME_HEADER, 1) + tone_frame(gtts_64k, 2)) * 10
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            info = {}
+            for name, data in files.items():
+                with open(os.path.join(temp_dir, name), 'wb') as f:
+                    f.write(data)
+                info[name] = probe(os.path.join(temp_dir, name))
+            with open(os.path.join(temp_dir, 'empty.mp3'), 'wb') as f:
+                f.write(bytes(1000))
+            with self.assertRaises(Mp3FormatError):
+                probe(os.path.join(temp_dir, 'empty.mp3'))
+
+        self.assertAlmostEqual(info['cbr.mp3'].duration, 100 * 576 / 24000)
+        self.assertEqual((info['cbr.mp3'].bytes, info['cbr.mp3'].bitrate), (len(files['cbr.mp3']), 32))
+        self.assertAlmostEqual(info['xing.mp3'].duration, 250 * 576 / 24000)
+        self.assertAlmostEqual(info['vbr.mp3'].duration, 20 * 576 / 24000)
+        self.assertEqual(info['vbr.mp3'].bitrate, 48)
+
+
+if __name__ == "__main__":
+    unittest.main()
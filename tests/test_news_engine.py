@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the news ingestion engine
+Tests de-duplication across sources, cursors, the store bound, and per-source
+polling intervals
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.news_engine import NewsEngine, NewsStore, normalize_url
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNewsStore(unittest.TestCase):
+    """Test suite for NewsStore"""
+
+    def test_normalize_url(self):
+        """Test tracking parameters, fragments and trailing slashes are ignored"""
+        self.assertEqual(
+            normalize_url('HTTPS://www.Reuters.com/markets/boj-holds/?utm_source=rss&id=7#top'),
+            normalize_url('https://www.reuters.com/markets/boj-holds?id=7')
+        )
+
+    def test_duplicates_merged_across_sources(self):
+        """Test the same story from two sources is stored once"""
+        store = NewsStore(path=None)
+        added = store.add('reuters_news', [
+            {'title': 'BOJ keeps rates steady, signals patience on hikes', 'link': 'https://reuters.com/a'}
+        ])
+        self.assertEqual(len(added), 1)
+
+        added = store.add('nikkei_news', [
+            {'title': 'BOJ keeps rates steady, signals patience on hikes - Nikkei Asia', 'link': 'https://asia.nikkei.com/b'},
+            {'title': 'Yen slides past 150 as exporters sell', 'link': 'https://asia.nikkei.com/c'}
+        ])
+        self.assertEqual([item['title'] for item in added], ['Yen slides past 150 as exporters sell'])
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.latest(5, source='nikkei_news')[1]['sources'], ['reuters_news', 'nikkei_news'])
+
+    def test_cursor_returns_only_new_items(self):
+        """Test since() returns items added after the cursor, and the store persists cursors"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'news.json')
+            store = NewsStore(path=path)
+            store.add('boj_news', [{'title': 'Outlook report released'}, {'title': 'Minutes of the meeting'}])
+            items, cursor = store.since(store.cursor('brief'))
+            self.assertEqual(len(items), 2)
+            store.set_cursor('brief', cursor)
+            store.save()
+
+            restarted = NewsStore(path=path)
+            restarted.add('boj_news', [{'title': 'Minutes of the meeting'}, {'title': 'JGB purchase schedule'}])
+            items, _ = restarted.since(restarted.cursor('brief'))
+            self.assertEqual([item['title'] for item in items], ['JGB purchase schedule'])
+
+    def test_store_is_bounded(self):
+        """Test the oldest items are evicted beyond max_items"""
+        store = NewsStore(path=None, max_items=3)
+        store.add('reuters_news', [{'title': f'Headline number {word}'} for word in ('one', 'two', 'three', 'four')])
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.latest(3)[-1]['title'], 'Headline number two')
+        # Evicted words are no longer matched as duplicates
+        self.assertEqual(len(store.add('reuters_news', [{'title': 'Headline number one'}])), 1)
+
+
+class TestNewsEngine(unittest.TestCase):
+    """Test suite for NewsEngine"""
+
+    def test_sources_polled_on_their_own_intervals(self):
+        """Test only due sources are polled and failures are reported"""
+        clock = FakeClock()
+        calls = {'fast': 0, 'slow': 0}
+
+        def fetch(name):
+            def run():
+                calls[name] += 1
+                if name == 'slow' and calls[name] > 1:
+                    raise ConnectionError("down")
+                return [{'title': f'{name} story {calls[name]}'}]
+            return run
+
+        engine = NewsEngine(NewsStore(path=None), clock=clock)
+        engine.add_source('fast', fetch('fast'), interval_minutes=10)
+        engine.add_source('slow', fetch('slow'), interval_minutes=30)
+
+        self.assertEqual(engine.poll(), {'fast': 'live', 'slow': 'live'})
+        clock.now = 11 * 60
+        self.assertEqual(engine.poll(), {'fast': 'live', 'slow': 'cached'})
+        clock.now = 31 * 60
+        self.assertEqual(engine.poll(), {'fast': 'live', 'slow': 'failed'})
+        self.assertEqual(calls, {'fast': 3, 'slow': 2})
+        self.assertEqual(len(engine.store), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit tests for page rendering
+Tests the Markdown renderer, the compiled templates, and HTML pages for
+pipeline reports, including re-rendering an archive of past reports
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.rendering import get_environment, render, render_markdown
+from generators.weekly_report import WeeklyReportGenerator
+
+REPORT = """# Yen Holds the Line
+
+**Date:** September 15, 2025
+
+## Executive Summary
+
+USD/JPY at 147.2 <span title="Dollar-yen">ℹ️</span>, rates & spreads steady.
+See [FRED](https://fred.stlouisfed.org/?a=1&b=2).
+
+## Key Findings
+
+1. Spread **narrowed** 5bp
+2. Vol *subdued*
+
+| Pair | Level |
+|------|------:|
+| USD/JPY | 147.2 |
+
+---
+*Disclaimer: informational only.*
+"""
+
+
+class TestMarkdown(unittest.TestCase):
+    """Test suite for render_markdown"""
+
+    def test_blocks_and_inline(self):
+        """Test headings, lists, tables, rules, emphasis, links and glossary tooltips render"""
+        html = str(render_markdown(REPORT))
+        self.assertIn('<h1>Yen Holds the Line</h1>', html)
+        self.assertIn('<p><strong>Date:</strong> September 15, 2025</p>', html)
+        self.assertIn('<span title="Dollar-yen">ℹ️</span>, rates &amp; spreads steady.', html)
+        self.assertIn('<a href="https://fred.stlouisfed.org/?a=1&amp;b=2">FRED</a>', html)
+        self.assertIn('<ol>\n<li>Spread <strong>narrowed</strong> 5bp</li>\n<li>Vol <em>subdued</em></li>\n</ol>', html)
+        self.assertIn('<tr><th>Pair</th><th>Level</th></tr>\n<tr><td>USD/JPY</td><td>147.2</td></tr>', html)
+        self.assertIn('<hr>\n<p><em>Disclaimer: informational only.</em></p>', html)
+
+    def test_escaping(self):
+        """Test stray '<', '&' and underscores in words are left as text, and code spans are literal"""
+        html = str(render_markdown("USD/JPY < 150 & fx_rates.usd_jpy `a*b*c`"))
+        self.assertEqual(html, '<p>USD/JPY &lt; 150 &amp; fx_rates.usd_jpy <code>a*b*c</code></p>')
+
+
+    def test_raw_html_is_escaped(self):
+        """Test inline HTML other than tooltips is escaped and script links are dropped"""
+        html = str(render_markdown("<script>alert(1)</script> <img src=x onerror=alert(1)>"))
+        self.assertEqual(html, '<p>&lt;script&gt;alert(1)&lt;/script&gt; &lt;img src=x onerror=alert(1)&gt;</p>')
+        html = str(render_markdown('<span title="a &amp; b" onclick="x()">i</span> '
+                                   '<span title="<b>*z*</b>">i</span> `<span title="c">i</span>`'))
+        self.assertIn('&lt;span title="a &amp; b" onclick="x()"&gt;i&lt;/span&gt;', html)  # Other attributes: text
+        self.assertIn('<span title="&lt;b&gt;*z*&lt;/b&gt;">i</span>', html)
+        self.assertIn('<code>&lt;span title="c"&gt;i&lt;/span&gt;</code>', html)
+        for url in ('javascript:alert%281%29', 'JavaScript:x', 'java&#115;cript:x', 'data:text/html,x'):
+            self.assertEqual(str(render_markdown(f"[x]({url})")), '<p>x</p>', url)
+        self.assertEqual(str(render_markdown("[x](mailto:a@b.jp) [y](archive.html)")),
+                         '<p><a href="mailto:a@b.jp">x</a> <a href="archive.html">y</a></p>')
+
+
+class TestTemplates(unittest.TestCase):
+    """Test suite for templates and report pages"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        with open('config.yaml', 'w') as f:
+            yaml.safe_dump({
+                'api_keys': {'openai': 'YOUR_OPENAI_API_KEY'},
+                'data': {'fx_history': {'window_days': 20}},
+                'output': {'weekly_report': {'chart_height': 500, 'chart_mode': 'lazy'}}
+            }, f)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def test_environment_is_shared(self):
+        """Test templates compile once per process and the index escapes its links"""
+        self.assertIs(get_environment(), get_environment())
+        template = get_environment().get_template('index.html')
+        self.assertIs(get_environment().get_template('index.html'), template)
+        html = render('index.html', root='', updated='now', morning=[], weekly=[
+            {'page': 'report_20250915.html', 'title': 'Week of Sep 15 <draft>', 'label': 'September 15, 2025'}])
+        self.assertIn('href="report_20250915.html"><strong>Week of Sep 15 &lt;draft&gt;</strong>', html)
+
+    def test_pipeline_report_and_rerender(self):
+        """Test a pipeline report renders with its charts, and re-rendering only rebuilds pages it can"""
+        generator = WeeklyReportGenerator('config.yaml')
+        generator.output_dir = 'reports'
+        history = {'USD/JPY': [['2025-08-%02d' % day, 146.0 + day / 10] for day in range(1, 31)]}
+        html = generator._generate_html_wrapper(REPORT, {'history': history, 'curves': {}}, 'report_20250915')
+
+        self.assertIn('<title>Yen Holds the Line - ', html)
+        self.assertLess(html.index('<h2>Executive Summary</h2>'), html.index('class="chart-container"'))
+        self.assertLess(html.index('class="chart-container"'), html.index('<h2>Key Findings</h2>'))
+        self.assertIn('data-src="charts/report_20250915_fx_history.json.gz"', html)
+        self.assertEqual(len(generator.chart_assets), 2)
+
+        self.assertIn('<meta name="yensense-render" content="markdown_report; charts=lazy">', html)
+
+        marker = '<meta name="yensense-render" content="markdown_report; charts={}">'
+        pages = {
+            'report_20250915': marker.format('lazy') + '<p>Old template</p>',    # Charts relinked from files
+            'report_20250908': '<p>Old template</p>',                            # Other layout: left alone
+            'report_20250901': marker.format('inline') + '<p>Old template</p>',  # Inline charts: left alone
+            'report_20250825': None                                              # No page yet
+        }
+        for name, page in pages.items():
+            if page is not None:
+                with open(f'reports/{name}.html', 'w') as f:
+                    f.write(page)
+            with open(f'reports/{name}.md', 'w') as f:
+                f.write(REPORT)
+        changed = generator.rerender_archive()
+        self.assertEqual(changed, ['reports/report_20250825.html', 'reports/report_20250915.html'])
+        with open('reports/report_20250915.html') as f:
+            self.assertIn('data-src="charts/report_20250915_fx_history.json.gz"', f.read())
+        with open('reports/report_20250825.html') as f:
+            self.assertIn('Chart data unavailable', f.read())
+        for name in ('report_20250908', 'report_20250901'):
+            with open(f'reports/{name}.html') as f:
+                self.assertEqual(f.read(), pages[name])
+        self.assertEqual(generator.rerender_archive(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
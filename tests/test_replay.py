@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for historical replay
+Tests the snapshot archive, the LLM response cache, point-in-time data
+access (nothing after the as-of time is visible) and a replay over a range
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+from unittest.mock import patch
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.ai_analyst_base import AIAnalystBase
+from core.data_fetcher import SourceUnavailable
+from core.llm_cache import LLMResponseCache
+from core.point_in_time import PointInTimeDataFetcher
+from core.snapshot_archive import SnapshotArchive
+from pipeline.replay import run_replay
+
+
+class ReplayTestCase(unittest.TestCase):
+    """Temporary working directory with a config, an FX history and two archived snapshots"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        with open('config.yaml', 'w') as f:
+            yaml.safe_dump({
+                'api_keys': {'fred': 'test_fred_key', 'openai': 'YOUR_OPENAI_API_KEY'},
+                'data': {'cache_expiry_hours': 24, 'retry_attempts': 1, 'fx_history': {'window_days': 3}},
+                'scraping': {'user_agent': 'test_agent'},
+                'schedule': {'weekly_report_time': '06:30'}
+            }, f)
+
+        os.makedirs('data/input/fx')
+        closes = [['2025-09-0%d' % day, 146.0 + day] for day in (1, 2, 3, 4, 5)]
+        with open('data/input/fx/fx_history.json', 'w') as f:
+            json.dump({'series': {'USD/JPY': closes}, 'stats': {}}, f)
+
+        self.archive = SnapshotArchive()
+        self.archive.save({'fx_rates': {'USD/JPY': 148.0}, 'macro_data': {}, 'sentiment_score': 40},
+                          datetime(2025, 9, 2, 6, 0))
+        self.archive.save({'fx_rates': {'USD/JPY': 150.0}, 'macro_data': {}, 'sentiment_score': 30},
+                          datetime(2025, 9, 4, 6, 0))
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+
+class TestSnapshotsAndCache(ReplayTestCase):
+    """Test suite for SnapshotArchive and LLMResponseCache"""
+
+    def test_latest_snapshot_at_or_before(self):
+        """Test the newest snapshot not after as_of is returned"""
+        self.assertIsNone(self.archive.latest(datetime(2025, 9, 2, 5, 59)))
+        fetched_at, data = self.archive.latest(datetime(2025, 9, 3, 23, 0))
+        self.assertEqual(fetched_at, datetime(2025, 9, 2, 6, 0))
+        self.assertEqual(data['fx_rates']['USD/JPY'], 148.0)
+        self.assertEqual(self.archive.latest(datetime(2025, 9, 4, 6, 0))[1]['sentiment_score'], 30)
+
+    def test_cached_response_skips_api(self):
+        """Test a cached prompt is answered from disk and a new one is stored"""
+        analyst = AIAnalystBase('config.yaml')
+        analyst.use_ai, analyst.api_key = True, 'test'
+        analyst.response_cache = LLMResponseCache()
+        reply = {'choices': [{'message': {'content': ' Yen firmer. '}}]}
+        with patch('requests.post') as post:
+            post.return_value.status_code = 200
+            post.return_value.json.return_value = reply
+            self.assertEqual(analyst._call_openai('Summarize'), 'Yen firmer.')
+            self.assertEqual(analyst._call_openai('Summarize'), 'Yen firmer.')
+            analyst._call_openai('Summarize', max_completion_tokens=50)
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(analyst.response_cache.hits, 1)
+
+
+class TestPointInTime(ReplayTestCase):
+    """Test suite for PointInTimeDataFetcher and run_replay"""
+
+    def test_no_data_after_as_of(self):
+        """Test the snapshot, closes and statistics are all from before the as-of time"""
+        fetcher = PointInTimeDataFetcher('config.yaml', as_of=datetime(2025, 9, 4, 6, 30))
+        with patch('requests.Session.get') as get:
+            data = fetcher.fetch_all_data()
+            with self.assertRaises(SourceUnavailable):
+                fetcher.fetch_fred_fx()
+        get.assert_not_called()
+
+        self.assertEqual(data['snapshot_time'], '2025-09-04T06:00:00')
+        self.assertEqual(data['archived_sentiment_score'], 30)
+        self.assertEqual([day for day, _ in data['history']['USD/JPY']], ['2025-09-01', '2025-09-02', '2025-09-03'])
+        self.assertEqual(data['fx_stats']['USD/JPY']['as_of'], '2025-09-03')
+        self.assertEqual(data['fx_stats']['USD/JPY']['mean'], 148.0)
+
+    def test_replay_range(self):
+        """Test weekdays are replayed in order, dates before the first snapshot skipped, and results saved"""
+        result = run_replay('config.yaml', date(2025, 9, 1), date(2025, 9, 7), max_workers=1)
+        self.assertEqual(result['skipped'], ['2025-09-01T06:30:00'])
+        self.assertEqual([run['as_of'][:10] for run in result['runs']],
+                         ['2025-09-02', '2025-09-03', '2025-09-04', '2025-09-05'])
+        self.assertEqual(result['runs'][0]['snapshot_time'], '2025-09-02T06:00:00')
+        self.assertEqual(result['summary']['sentiment_score']['count'], 4)
+        self.assertTrue(os.path.exists(result['path']))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Unit tests for rolling FX statistics
+Tests the incremental statistics against full recomputes, state round-trips,
+incremental history updates and the regime-aware sentiment score
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+import yaml
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.data_fetcher import DataFetcher
+from core.rolling_stats import RollingStats, regime, summarize_stats
+
+
+def _prices(n, seed=7):
+    rng = np.random.default_rng(seed)
+    return 145 * np.exp(np.cumsum(rng.normal(0, 0.006, n)))
+
+
+class TestRollingStats(unittest.TestCase):
+    """Test suite for RollingStats"""
+
+    def test_matches_full_recompute(self):
+        """Test each incremental update agrees with statistics recomputed over the window"""
+        prices = _prices(300)
+        stats = RollingStats(window=20)
+        for i, price in enumerate(prices):
+            stats.update(price)
+            window = prices[max(0, i - 19):i + 1]
+            self.assertAlmostEqual(stats.mean, window.mean(), places=8)
+            if i >= 1:
+                self.assertAlmostEqual(stats.std, window.std(ddof=1), places=6)
+                self.assertAlmostEqual(stats.drawdown(), min(0.0, (price / window.max() - 1) * 100), places=8)
+            if i >= 2:
+                returns = np.diff(np.log(prices[max(0, i - 20):i + 1]))
+                self.assertAlmostEqual(stats.realized_vol, returns.std(ddof=1) * np.sqrt(252) * 100, places=6)
+
+        returns = np.diff(np.log(prices))
+        ewma = returns[0] ** 2
+        for r in returns[1:]:
+            ewma = 0.94 * ewma + 0.06 * r * r
+        self.assertAlmostEqual(stats.ewma_vol, np.sqrt(ewma * 252) * 100, places=8)
+        self.assertAlmostEqual(stats.momentum, (prices[-1] / prices[-20] - 1) * 100, places=8)
+
+    def test_state_round_trip(self):
+        """Test a restored state continues exactly like the original"""
+        prices = _prices(120)
+        original = RollingStats(window=30)
+        for price in prices[:100]:
+            original.update(price)
+        restored = RollingStats.from_state(original.to_state())
+        for price in prices[100:]:
+            original.update(price)
+            restored.update(price)
+        self.assertEqual(original.snapshot(), restored.snapshot())
+
+    def test_snapshot_scores_current_spot(self):
+        """Test a spot level is scored against the window without being added"""
+        stats = RollingStats(window=5)
+        for date, price in zip(('d1', 'd2', 'd3', 'd4', 'd5'), (100.0, 102.0, 104.0, 102.0, 100.0)):
+            stats.update(price, date)
+        snap = stats.snapshot(current=96.0)
+        self.assertEqual(snap['level'], 96.0)
+        self.assertEqual(snap['as_of'], 'd5')
+        self.assertEqual(snap['zscore'], round((96.0 - 101.6) / np.std([100, 102, 104, 102, 100], ddof=1), 2))
+        self.assertEqual(snap['drawdown_pct'], round((96.0 / 104.0 - 1) * 100, 2))
+        self.assertEqual(stats.count, 5)
+        self.assertEqual(regime(snap), 'stretched low')
+        self.assertTrue(summarize_stats({'USD/JPY': snap})[0].startswith('USD/JPY 96.00: z -3.4 vs 5d mean 101.60'))
+
+
+class TestFXHistory(unittest.TestCase):
+    """Test suite for DataFetcher.fetch_fx_history and the sentiment score"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        with open('config.yaml', 'w') as f:
+            yaml.safe_dump({
+                'api_keys': {'fred': 'test_fred_key'},
+                'data': {'cache_expiry_hours': 24, 'retry_attempts': 1, 'fx_history': {'window_days': 3}},
+                'scraping': {'user_agent': 'test_agent'}
+            }, f)
+        self.fetcher = DataFetcher('config.yaml')
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def test_incremental_update(self):
+        """Test only closes after the stored ones are requested and applied"""
+        first = {
+            'USD/JPY': {'2025-09-01': 147.0, '2025-09-02': 148.0, '2025-09-03': 149.0},
+            'EUR/JPY': {'2025-09-01': 171.0, '2025-09-02': 172.0},
+            'DXY': {'2025-09-01': 120.0}
+        }
+        with patch.object(self.fetcher, '_fetch_fx_closes', return_value=first):
+            history = self.fetcher.fetch_fx_history()
+        self.assertEqual(history['stats']['USD/JPY'].last, 149.0)
+        self.assertEqual(history['series']['EUR/JPY'], [['2025-09-01', 171.0], ['2025-09-02', 172.0]])
+
+        # Expired cache: the update starts at the oldest last date and skips what is stored
+        second = {
+            'USD/JPY': {'2025-09-03': 149.0, '2025-09-04': 150.0},
+            'EUR/JPY': {'2025-09-02': 172.0, '2025-09-03': 173.0},
+            'DXY': {}
+        }
+        with self.fetcher.bypass_cache(['fx']), \
+                patch.object(self.fetcher, '_fetch_fx_closes', return_value=second) as fetch:
+            history = self.fetcher.fetch_fx_history()
+        fetch.assert_called_once_with('2025-09-01')
+        usdjpy = history['stats']['USD/JPY']
+        self.assertEqual(usdjpy.count, 4)
+        self.assertAlmostEqual(usdjpy.mean, 149.0)
+        self.assertEqual([date for date, _ in history['series']['USD/JPY']],
+                         ['2025-09-01', '2025-09-02', '2025-09-03', '2025-09-04'])
+
+        # Within the cache expiry nothing is requested
+        with patch.object(self.fetcher, '_fetch_fx_closes') as fetch:
+            self.assertEqual(self.fetcher.fetch_fx_history()['stats']['EUR/JPY'].last, 173.0)
+        fetch.assert_not_called()
+
+    def test_sentiment_follows_regime(self):
+        """Test the FX factor uses the z-score and drawdown when statistics are available"""
+        fx = {'USD/JPY': 155.0}
+        self.assertEqual(self.fetcher.calculate_sentiment_score(fx, {'japan_cpi': 105.5}), 40)
+        in_range = {'USD/JPY': {'zscore': 0.2, 'drawdown_pct': -0.5}}
+        self.assertEqual(self.fetcher.calculate_sentiment_score(fx, {'japan_cpi': 105.5}, in_range), 49)
+        selloff = {'USD/JPY': {'zscore': -2.6, 'drawdown_pct': -4.0}}
+        self.assertEqual(self.fetcher.calculate_sentiment_score(fx, {'japan_cpi': 105.5}, selloff), 65)
+
+
+if __name__ == "__main__":
+    unittest.main()
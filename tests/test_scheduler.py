@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the job scheduler
+Tests next firing times (weekdays, DST) and that jobs run in worker threads
+without blocking each other or overlapping themselves
+"""
+
+import unittest
+import asyncio
+import sys
+import os
+import threading
+import time
+from datetime import datetime, time as dtime
+from zoneinfo import ZoneInfo
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.scheduler import AsyncScheduler, ScheduledJob, next_fire_time
+
+
+TOKYO = ZoneInfo('Asia/Tokyo')
+NEW_YORK = ZoneInfo('America/New_York')
+
+
+class TestNextFireTime(unittest.TestCase):
+    """Test suite for next_fire_time"""
+
+    def test_daily(self):
+        """Test a daily job fires later today, or tomorrow once the time has passed"""
+        before = datetime(2025, 9, 10, 6, 0, tzinfo=TOKYO)
+        self.assertEqual(next_fire_time(before, dtime(6, 30), TOKYO), datetime(2025, 9, 10, 6, 30, tzinfo=TOKYO))
+
+        exactly = datetime(2025, 9, 10, 6, 30, tzinfo=TOKYO)
+        self.assertEqual(next_fire_time(exactly, dtime(6, 30), TOKYO), datetime(2025, 9, 11, 6, 30, tzinfo=TOKYO))
+
+    def test_weekly(self):
+        """Test a weekly job waits for its weekday, given a time in another zone"""
+        # Wednesday 2025-09-10 12:00 UTC -> next Monday 06:30 JST
+        now = datetime(2025, 9, 10, 12, 0, tzinfo=ZoneInfo('UTC'))
+        fire = next_fire_time(now, dtime(6, 30), TOKYO, weekday=0)
+        self.assertEqual(fire, datetime(2025, 9, 15, 6, 30, tzinfo=TOKYO))
+
+    def test_dst(self):
+        """Test firing times keep their wall-clock time across DST changes"""
+        # Spring forward (2025-03-09): 06:30 EDT is 10:30 UTC, the day before it was 11:30 UTC
+        before = next_fire_time(datetime(2025, 3, 8, 6, 0, tzinfo=NEW_YORK), dtime(6, 30), NEW_YORK)
+        after = next_fire_time(before, dtime(6, 30), NEW_YORK)
+        self.assertEqual(before.astimezone(ZoneInfo('UTC')).hour, 11)
+        self.assertEqual(after.astimezone(ZoneInfo('UTC')).hour, 10)
+        self.assertEqual((after.hour, after.minute), (6, 30))
+
+        # 02:30 does not exist that day
+        gap = next_fire_time(datetime(2025, 3, 9, 0, 0, tzinfo=NEW_YORK), dtime(2, 30), NEW_YORK)
+        self.assertEqual((gap.day, gap.hour, gap.minute), (9, 3, 30))
+
+
+class TestAsyncScheduler(unittest.TestCase):
+    """Test suite for AsyncScheduler"""
+
+    def setUp(self):
+        self.scheduler = AsyncScheduler(TOKYO, max_workers=2)
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def test_jobs_do_not_block_each_other(self):
+        """Test a short job finishes while a long one is still running, and the long one never overlaps"""
+        release = threading.Event()
+        finished = []
+
+        def long_job():
+            release.wait(5)
+            finished.append('long')
+
+        def short_job():
+            finished.append('short')
+
+        weekly = ScheduledJob('weekly', long_job, dtime(6, 30), weekday=0)
+        daily = ScheduledJob('daily', short_job, dtime(6, 30))
+
+        async def scenario():
+            long_run = asyncio.ensure_future(self.scheduler.run_job(weekly))
+            await asyncio.sleep(0.05)
+            self.assertTrue(weekly.running)
+
+            self.assertTrue(await self.scheduler.run_job(daily))
+            self.assertEqual(finished, ['short'])
+            self.assertFalse(await self.scheduler.run_job(weekly))
+
+            release.set()
+            await long_run
+
+        asyncio.run(scenario())
+        self.assertEqual(finished, ['short', 'long'])
+        self.assertEqual((weekly.runs, weekly.skipped), (1, 1))
+
+    def test_fires_at_exact_time(self):
+        """Test the run loop fires a job at its scheduled time, not on a polling tick"""
+        fired = []
+        target = datetime.fromtimestamp(int(time.time()) + 2, TOKYO)
+        self.scheduler.every_day('brief', target.strftime('%H:%M'), lambda: None)
+        job = self.scheduler.jobs['brief']
+        job.at = target.time()  # Second precision for the test
+        job.func = lambda: (fired.append(time.time()), self.scheduler.stop())
+
+        asyncio.run(asyncio.wait_for(self.scheduler.run(), 10))
+
+        self.assertEqual(len(fired), 1)
+        self.assertLess(abs(fired[0] - target.timestamp()), 0.5)
+
+    def test_prepare_runs_ahead_of_job(self):
+        """Test the prepare step starts lead time before firing and its result is handed to the job"""
+        events = []
+        target = datetime.fromtimestamp(int(time.time()) + 3, TOKYO)
+
+        def prefetch():
+            events.append(('prepare', time.time()))
+            return {'fx': 147.0}
+
+        def brief(data):
+            events.append(('run', time.time(), data))
+            self.scheduler.stop()
+
+        job = self.scheduler.every_day('brief', '00:00', brief, prepare=prefetch, lead_minutes=2 / 60)
+        job.at = target.time()
+
+        asyncio.run(asyncio.wait_for(self.scheduler.run(), 10))
+
+        (_, prepared_at), (_, ran_at, data) = events
+        self.assertLess(abs(prepared_at - (target.timestamp() - 2)), 0.5)
+        self.assertLess(abs(ran_at - target.timestamp()), 0.5)
+        self.assertEqual(data, {'fx': 147.0})
+
+    def test_failed_prepare(self):
+        """Test a job whose prepare step failed still runs, without prepared data"""
+        received = []
+        job = ScheduledJob('brief', received.append, dtime(6, 30), prepare=lambda: 1 / 0, lead_seconds=900)
+
+        async def scenario():
+            prepared = asyncio.ensure_future(self.scheduler.prepare_job(job))
+            await self.scheduler.run_job(job, prepared)
+
+        asyncio.run(scenario())
+        self.assertEqual(received, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
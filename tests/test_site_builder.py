@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the static site builder
+Tests that publishing copies only changed files, regenerates pages only
+when the published artifacts change, lists everything in the index,
+archive pages and feed, and reads podcast metadata once per file
+"""
+
+import json
+import unittest
+import os
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from datetime import time
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.mp3 import probe, silence
+from generators.site_builder import PAGES, SiteBuilder, classify
+
+ITUNES = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
+PSC = '{http://podlove.org/simple-chapters}'
+
+
+class TestSiteBuilder(unittest.TestCase):
+    """Test suite for SiteBuilder"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.docs = os.path.join(self.temp_dir.name, 'docs')
+        self.output = os.path.join(self.temp_dir.name, 'output')
+        os.makedirs(self.docs)
+        os.makedirs(os.path.join(self.output, 'charts'))
+        with open(os.path.join(self.docs, 'morning_brief_20250910.mp3'), 'wb') as f:
+            f.write(silence(1200))  # Published before the manifest existed
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _source(self, name: str, content) -> str:
+        path = os.path.join(self.output, name)
+        with open(path, 'wb' if isinstance(content, bytes) else 'w') as f:
+            f.write(content)
+        return path
+
+    def _builder(self) -> SiteBuilder:
+        return SiteBuilder(self.docs, base_url='https://example.github.io/yensense', publish_time=time(6, 30))
+
+    def _mtimes(self):
+        return {page: os.stat(os.path.join(self.docs, page)).st_mtime_ns for page in PAGES + ('archive/2025-09.html',)}
+
+    def test_classify(self):
+        """Test artifacts are typed from their file names"""
+        self.assertEqual(classify('report_20250915.html'), {'kind': 'weekly', 'date': '2025-09-15', 'role': 'page'})
+        self.assertEqual(classify('morning_brief_20250915_mobile.mp3')['role'], 'alternate')
+        self.assertEqual(classify('morning_brief_20250915.chapters.json')['role'], 'chapters')
+        self.assertEqual(classify('charts/report_20250915_fx_history.json.gz'), {'kind': 'asset'})
+
+    def test_push_pending_until_marked(self):
+        """Test published changes stay pending across runs until a push succeeds"""
+        report = self._source('report_20250915.html', '<html>report</html>')
+        self._builder().publish([(report, 'report_20250915.html')])
+        site = self._builder()  # Next run after a failed push: nothing new, but still to deploy
+        self.assertEqual(site.publish([(report, 'report_20250915.html')]), {'copied': [], 'pages': []})
+        self.assertTrue(site.push_pending)
+
+        site.mark_pushed()
+        site = self._builder()
+        site.publish([(report, 'report_20250915.html')])
+        self.assertFalse(site.push_pending)
+
+    def test_incremental_publish(self):
+        """Test only changed files are copied and pages are rewritten only when their content changes"""
+        report = self._source('report_20250915.html', '<html>report</html>')
+        chart = self._source('charts/report_20250915_fx_history.json.gz', 'chart')
+        first = self._builder().publish([(report, 'report_20250915.html'),
+                                         (chart, 'charts/report_20250915_fx_history.json.gz')],
+                                        {'report_20250915.html': {'title': 'Yen Holds the Line'}})
+        self.assertEqual(first['copied'], ['report_20250915.html', 'charts/report_20250915_fx_history.json.gz'])
+        self.assertEqual(sorted(first['pages']), ['archive.html', 'archive/2025-09.html', 'feed.xml', 'index.html'])
+
+        with open(os.path.join(self.docs, 'index.html')) as f:
+            index = f.read()
+        self.assertIn('href="report_20250915.html"><strong>Yen Holds the Line</strong>', index)
+        self.assertIn('href="morning_brief_20250910.mp3"', index)  # Indexed from the existing files
+
+        mtimes = self._mtimes()
+        again = self._builder().publish([(report, 'report_20250915.html')])
+        self.assertEqual(again, {'copied': [], 'pages': []})
+        self.assertEqual(self._mtimes(), mtimes)
+
+        brief = self._source('morning_brief_20250916.txt',
+                             'YenSense AI Morning Brief\n\nGood morning. The yen held at 147 overnight.')
+        audio = self._source('morning_brief_20250916_mobile.mp3', silence(2400))
+        segment = self._source('morning_brief_20250916_fx.mp3', silence(480))
+        chapters = self._source('morning_brief_20250916.chapters.json', json.dumps(
+            {'version': '1.2.0', 'chapters': [{'startTime': 0, 'title': 'Rates'},
+                                              {'startTime': 1.25, 'title': 'FX & Repo'}]}))
+        update = self._builder().publish([(brief, 'morning_brief_20250916.txt'),
+                                          (audio, 'morning_brief_20250916_mobile.mp3'),
+                                          (segment, 'morning_brief_20250916_fx.mp3'),
+                                          (chapters, 'morning_brief_20250916.chapters.json')],
+                                         {'morning_brief_20250916_mobile.mp3': {'role': 'audio'},
+                                          'morning_brief_20250916_fx.mp3': {'role': 'segment'}})
+        self.assertEqual(len(update['copied']), 4)
+        self.assertEqual(sorted(update['pages']), ['archive.html', 'archive/2025-09.html', 'feed.xml', 'index.html'])
+        with open(os.path.join(self.docs, 'archive/2025-09.html')) as f:
+            month = f.read()
+        self.assertIn('<h2>Morning Briefs, September 2025</h2>', month)
+        self.assertIn('href="../morning_brief_20250916_mobile.mp3">Listen</a>', month)
+
+        # A brief in a new month leaves September's page alone, earlier MP3s are not read again,
+        # and without audio it is not an episode, so the feed stays as it is
+        october = self._source('morning_brief_20251001.txt', 'Good morning')
+        with patch('generators.site_builder.probe', wraps=probe) as probed:
+            pages = self._builder().publish([(october, 'morning_brief_20251001.txt'),
+                                             (audio, 'morning_brief_20250916_mobile.mp3')])['pages']
+        self.assertEqual(sorted(pages), ['archive.html', 'archive/2025-10.html', 'index.html'])
+        probed.assert_not_called()
+
+        channel = ET.parse(os.path.join(self.docs, 'feed.xml')).getroot().find('channel')
+        self.assertEqual(channel.find(f'{ITUNES}category').get('text'), 'Business')
+        items = channel.findall('item')
+        self.assertEqual([item.find('title').text for item in items],
+                         ['Morning Brief - September 16, 2025', 'Morning Brief - September 10, 2025'])
+        enclosure = items[0].find('enclosure').attrib
+        self.assertEqual(enclosure['url'], 'https://example.github.io/yensense/morning_brief_20250916_mobile.mp3')
+        self.assertEqual(enclosure['length'], str(os.path.getsize(audio)))
+        self.assertEqual(items[0].find('pubDate').text, 'Tue, 16 Sep 2025 06:30:00 +0000')
+        self.assertEqual(items[0].find(f'{ITUNES}duration').text, '00:00:02')
+        self.assertEqual(items[0].find('description').text, 'Good morning. The yen held at 147 overnight.')
+        self.assertEqual([(c.get('start'), c.get('title')) for c in items[0].iter(f'{PSC}chapter')],
+                         [('00:00:00.000', 'Rates'), ('00:00:01.250', 'FX & Repo')])
+        self.assertEqual(items[0].find('{https://podcastindex.org/namespace/1.0}chapters').get('url'),
+                         'https://example.github.io/yensense/morning_brief_20250916.chapters.json')
+        self.assertIsNone(items[1].find('description'))
+        self.assertEqual(items[1].find(f'{ITUNES}duration').text, '00:00:01')  # Probed when first indexed
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for timezone handling
+Tests DST-correct conversions and Trading Economics date/time parsing
+"""
+
+import unittest
+import sys
+import os
+from datetime import date, datetime
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.timezones import (
+    get_zone,
+    local_to_utc,
+    parse_event_date,
+    parse_event_time,
+    parse_trading_economics_datetime,
+    utc_to_local_display
+)
+
+
+class TestTimezones(unittest.TestCase):
+    """Test suite for shared timezone helpers"""
+
+    def test_zone_objects_are_cached(self):
+        """Test zone lookups reuse the same ZoneInfo object"""
+        self.assertIs(get_zone('ET'), get_zone('ET'))
+        self.assertEqual(str(get_zone('JST')), 'Asia/Tokyo')
+        self.assertEqual(str(get_zone('NOT_A_ZONE')), 'UTC')
+
+    def test_us_dst(self):
+        """Test 08:30 ET maps to 12:30 UTC in summer and 13:30 UTC in winter"""
+        self.assertEqual(local_to_utc(datetime(2025, 7, 11, 8, 30), 'ET'), datetime(2025, 7, 11, 12, 30))
+        self.assertEqual(local_to_utc(datetime(2025, 12, 5, 8, 30), 'ET'), datetime(2025, 12, 5, 13, 30))
+
+    def test_eu_dst(self):
+        """Test CET follows European summer time"""
+        self.assertEqual(local_to_utc(datetime(2025, 7, 24, 14, 15), 'CET'), datetime(2025, 7, 24, 12, 15))
+        self.assertEqual(local_to_utc(datetime(2025, 1, 30, 14, 15), 'CET'), datetime(2025, 1, 30, 13, 15))
+
+    def test_utc_to_local_display(self):
+        """Test display strings use the seasonal offset"""
+        self.assertEqual(utc_to_local_display(datetime(2025, 9, 17, 18, 0), 'ET'), '14:00 ET')
+        self.assertEqual(utc_to_local_display(datetime(2025, 12, 10, 19, 0), 'ET'), '14:00 ET')
+        self.assertEqual(utc_to_local_display(datetime(2025, 9, 19, 3, 0), 'JST'), '12:00 JST')
+
+    def test_parse_dates(self):
+        """Test Trading Economics date header formats"""
+        self.assertEqual(parse_event_date('Thursday September 11 2025'), date(2025, 9, 11))
+        self.assertEqual(parse_event_date('Sep 11, 2025'), date(2025, 9, 11))
+        now = datetime(2025, 9, 10, 20, 0)  # Already Sep 11 in Tokyo
+        self.assertEqual(parse_event_date('Today', 'JST', now=now), date(2025, 9, 11))
+        self.assertEqual(parse_event_date('Tomorrow', 'UTC', now=now), date(2025, 9, 11))
+        with self.assertRaises(ValueError):
+            parse_event_date('Calendar')
+
+    def test_parse_times(self):
+        """Test 12-hour and 24-hour time cells"""
+        self.assertEqual(parse_event_time('08:30 AM'), (8, 30))
+        self.assertEqual(parse_event_time('12:15 AM'), (0, 15))
+        self.assertEqual(parse_event_time('2:00PM'), (14, 0))
+        self.assertEqual(parse_event_time('14:00'), (14, 0))
+        self.assertIsNone(parse_event_time('TBD'))
+        self.assertIsNone(parse_event_time(''))
+
+    def test_parse_trading_economics_datetime(self):
+        """Test combined parsing converts to naive UTC"""
+        self.assertEqual(
+            parse_trading_economics_datetime('Friday July 11 2025', '08:30 AM', 'ET'),
+            datetime(2025, 7, 11, 12, 30)
+        )
+        # Missing times default to 09:00 local
+        self.assertEqual(
+            parse_trading_economics_datetime('Friday September 19 2025', '', 'JST'),
+            datetime(2025, 9, 19, 0, 0)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
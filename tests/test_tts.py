@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TTS synthesis
+Uses the local stand-in backend, so no network access is needed
+"""
+
+import unittest
+import tempfile
+import threading
+import time
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from generators.mp3 import GTTS_FRAME_BYTES, GTTS_FRAME_HEADER, silence
+from generators.tts import (
+    AdaptiveTokenBucket,
+    ClipRequest,
+    LocalTTSBackend,
+    TTSClipCache,
+    TTSThrottled,
+    synthesize_clips
+)
+
+
+class EchoBackend:
+    """Backend that returns the text itself, with a delay inversely related to position"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text, tld='com', lang='en'):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05 / (1 + len(text)))
+        with self._lock:
+            self.active -= 1
+        return f"{tld}:{text}".encode()
+
+
+class TestTTS(unittest.TestCase):
+    """Test suite for parallel TTS synthesis"""
+
+    def test_silence_frames(self):
+        """Test encoded silence is whole gTTS-format frames"""
+        audio = silence(500)
+        self.assertEqual(len(audio) % GTTS_FRAME_BYTES, 0)
+        self.assertEqual(len(audio) // GTTS_FRAME_BYTES, 21)  # 24 ms frames, rounded up
+        self.assertEqual(audio[:4], GTTS_FRAME_HEADER)
+
+    def test_results_keep_clip_order(self):
+        """Test clips run concurrently but come back in request order"""
+        backend = EchoBackend()
+        clips = [ClipRequest('x' * i, tld) for i, tld in enumerate(['com', 'co.uk', 'ca', 'com.au', 'com'])]
+        limiter = AdaptiveTokenBucket(rate=100, burst=5)
+
+        results = synthesize_clips(backend, clips, limiter, max_workers=5)
+
+        self.assertEqual(results, [f"{clip.tld}:{clip.text}".encode() for clip in clips])
+        self.assertGreater(backend.peak, 1)
+
+    def test_backs_off_only_when_throttled(self):
+        """Test throttled requests are retried and the limiter rate drops"""
+        backend = LocalTTSBackend(max_requests_per_second=20)
+        limiter = AdaptiveTokenBucket(rate=50, burst=6, rate_step=0)
+
+        results = synthesize_clips(backend, [ClipRequest('word ' * i) for i in range(1, 7)], limiter, max_workers=6)
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(audio.startswith(GTTS_FRAME_HEADER) for audio in results))
+        self.assertGreater(backend.throttled, 0)
+        self.assertEqual(limiter.throttle_events, backend.throttled)
+        self.assertLess(limiter.rate, 50)
+
+    def test_gives_up_after_max_attempts(self):
+        """Test persistent throttling is surfaced to the caller"""
+        class AlwaysThrottled:
+            def synthesize(self, text, tld='com', lang='en'):
+                raise TTSThrottled("429")
+
+        limiter = AdaptiveTokenBucket(rate=1000, burst=10, min_rate=1000)
+        with self.assertRaises(TTSThrottled):
+            synthesize_clips(AlwaysThrottled(), [ClipRequest('hi')], limiter, max_attempts=3)
+        self.assertEqual(limiter.throttle_events, 3)
+
+    def test_cache_skips_repeat_synthesis(self):
+        """Test an unchanged brief needs zero TTS calls on re-run"""
+        clips = [ClipRequest('Good morning.'), ClipRequest('Rates rose.', 'co.uk'), ClipRequest('Good morning.')]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            backend = LocalTTSBackend()
+            first = synthesize_clips(backend, clips, cache=TTSClipCache(cache_dir))
+            self.assertEqual(backend.calls, 2)  # Repeated clip synthesized once
+
+            # Fresh cache instance reads the same directory (new process)
+            cache = TTSClipCache(cache_dir)
+            second = synthesize_clips(backend, clips, cache=cache)
+            self.assertEqual(backend.calls, 2)
+            self.assertEqual(second, first)
+            self.assertEqual(cache.hits, 2)
+
+            # Same text with another voice is a different clip
+            synthesize_clips(backend, [ClipRequest('Rates rose.', 'ca')], cache=cache)
+            self.assertEqual(backend.calls, 3)
+
+    def test_cache_lru_eviction(self):
+        """Test least recently used clips are evicted over the size cap"""
+        clip_a, clip_b, clip_c = ClipRequest('a'), ClipRequest('b'), ClipRequest('c')
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TTSClipCache(cache_dir, max_bytes=250)
+            cache.put(clip_a, b'a' * 100)
+            cache.put(clip_b, b'b' * 100)
+            self.assertEqual(cache.get(clip_a), b'a' * 100)  # a is now most recent
+            cache.put(clip_c, b'c' * 100)
+
+            self.assertIsNone(cache.get(clip_b))
+            self.assertEqual(cache.get(clip_a), b'a' * 100)
+            self.assertEqual(cache.get(clip_c), b'c' * 100)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
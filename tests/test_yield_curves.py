@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for yield curve analytics
+Tests tenor parsing, interpolation, and the spreads, slopes, butterflies and
+day-over-day changes (all in bp)
+"""
+
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.yield_curves import analyze_curves, curve_points, interpolate, summarize_curves
+
+YIELDS = {
+    'ust_3m': 4.20, 'ust_2y': 3.60, 'ust_5y': 3.65, 'ust_10y': 4.05, 'ust_30y': 4.68,
+    'jgb_40y': 3.425, 'jgb_30y': 3.19, 'jgb_20y': 2.63, 'jgb_10y': 1.625, 'jgb_5y': 1.165, 'jgb_2y': 0.875,
+    'tdb_1y': 0.70, 'tdb_3m': 0.50, 'data_date': '2025/09/01',
+    'bund_2y': 2.02, 'bund_5y': 2.31, 'bund_10y': 2.71, 'bund_30y': 3.30,
+    'timestamp': '2025-09-02T06:00:00'
+}
+
+
+class TestYieldCurves(unittest.TestCase):
+    """Test suite for the yield curve module"""
+
+    def test_curve_points(self):
+        """Test keys are grouped by market, TDBs join the JGB curve and non-yield keys are skipped"""
+        curves = curve_points(YIELDS)
+        tenors, rates = curves['jgb']
+        np.testing.assert_allclose(tenors, [0.25, 1, 2, 5, 10, 20, 30, 40])
+        self.assertEqual(rates[0], 0.50)
+        self.assertEqual(set(curves), {'ust', 'jgb', 'bund'})
+
+    def test_interpolation_is_monotone(self):
+        """Test the cubic never overshoots between points and nothing is extrapolated"""
+        tenors = np.array([2.0, 5.0, 10.0, 30.0])
+        rates = np.array([0.875, 1.165, 1.625, 3.19])
+        grid = np.linspace(1, 40, 400)
+        pchip = interpolate(tenors, rates, grid)
+        inside = ~np.isnan(pchip)
+        self.assertTrue(np.isnan(pchip[grid < 2]).all() and np.isnan(pchip[grid > 30]).all())
+        self.assertTrue((np.diff(pchip[inside]) >= 0).all())
+        np.testing.assert_allclose(interpolate(tenors, rates, tenors), rates)
+        np.testing.assert_allclose(interpolate(tenors, rates, np.array([7.5]), method='linear'), [1.395])
+
+    def test_spreads_slopes_and_flies_in_bp(self):
+        """Test derived measures are in basis points"""
+        analytics = analyze_curves(YIELDS)
+        self.assertAlmostEqual(analytics['spreads']['ust_jgb']['10y'], 242.5)
+        self.assertAlmostEqual(analytics['spreads']['bund_jgb']['2y'], 114.5)
+        self.assertAlmostEqual(analytics['slopes']['jgb']['2s10s'], 75.0)
+        self.assertAlmostEqual(analytics['slopes']['ust']['5s30s'], 103.0)
+        self.assertAlmostEqual(analytics['butterflies']['bund']['2s5s10s'], -11.0)
+        self.assertIsNone(analytics['levels']['bund']['3m'])
+        self.assertNotIn('changes', analytics)
+
+    def test_day_over_day_changes(self):
+        """Test changes against the previous curve, and that they reach the summary"""
+        previous = dict(YIELDS, jgb_10y=1.600, ust_10y=4.10)
+        analytics = analyze_curves(YIELDS, previous)
+        changes = analytics['changes']
+        self.assertAlmostEqual(changes['levels']['jgb']['10y'], 2.5)
+        self.assertAlmostEqual(changes['spreads']['ust_jgb']['10y'], -7.5)
+        self.assertAlmostEqual(changes['slopes']['ust']['2s10s'], -5.0)
+
+        summary = summarize_curves(analytics)
+        self.assertIn("UST-JGB spread: 2Y +272.5bp (+0.0bp d/d), 10Y +242.5bp (-7.5bp d/d), 30Y +149.0bp (+0.0bp d/d)",
+                      summary)
+        self.assertEqual(summary[-1], "10Y moves d/d: UST -5.0bp, Bund +0.0bp, JGB +2.5bp")
+
+        stale = summarize_curves(analyze_curves(YIELDS, previous, change_label='since 2025-09-10'))
+        self.assertEqual(stale[-1], "10Y moves since 2025-09-10: UST -5.0bp, Bund +0.0bp, JGB +2.5bp")
+        self.assertIn("10Y +242.5bp (-7.5bp since 2025-09-10)", "\n".join(stale))
+
+
+if __name__ == "__main__":
+    unittest.main()